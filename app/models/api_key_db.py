@@ -4,7 +4,6 @@ APIキーデータベースストア - SQLite永続化版
 
 import logging
 import secrets
-import sqlite3
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -36,9 +35,10 @@ class APIKeyDBStore:
 
     @contextmanager
     def get_connection(self):
-        """データベース接続のコンテキストマネージャ"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """データベース接続のコンテキストマネージャ（リクエスト中はプール接続を共有）"""
+        from modules.db import get_request_connection
+
+        conn = get_request_connection(self.db_path)
         try:
             yield conn
             conn.commit()
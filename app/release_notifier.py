@@ -24,9 +24,10 @@ import signal
 import sys
 import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # 環境変数を.envファイルから読み込み
 from dotenv import load_dotenv
@@ -40,10 +41,24 @@ sys.path.insert(0, str(project_root))
 from modules import get_config
 from modules.db import DatabaseManager
 from modules.email_scheduler import EmailScheduler
+from modules.event_bus import publish_event
 from modules.logger import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# 収集ソースごとのデフォルト設定（collection.sources.<name> で上書き可能）
+# timeout_seconds: ソース単位の収集タイムアウト
+# HTTP のレート制限はソース単位ではなく、送信先ホストごとに modules.http_client で掛ける
+DEFAULT_SOURCE_SETTINGS = {
+    "anilist": {"enabled": True, "timeout_seconds": 180},
+    "manga_rss": {"enabled": True, "timeout_seconds": 120},
+    "bookwalker": {"enabled": True, "timeout_seconds": 90},
+    "danime": {"enabled": True, "timeout_seconds": 90},
+}
+
+# ソース単位の収集結果: (取得アイテム, 所要時間[秒], 発生した例外, 保存後に記録する状態)
+SourceResult = Tuple[Optional[List[Dict[str, Any]]], float, Optional[Exception], Any]
+
 
 class ReleaseNotifierSystem:
     """アニメ・マンガ情報配信システムメインクラス"""
@@ -93,6 +108,8 @@ class ReleaseNotifierSystem:
 
         # モジュール初期化（遅延インポートで循環参照を回避）
         self._collectors = None
+        # 保存が済んだら各コレクターに記録させる状態（RSS の取り込み済みエントリーなど）
+        self._pending_feed_updates: Dict[str, Any] = {}
         self._mailer = None
         self._calendar = None
         self._filter = None
@@ -121,16 +138,27 @@ class ReleaseNotifierSystem:
             from modules.calendar_integration import GoogleCalendarManager
             from modules.filter_logic import ContentFilter
             from modules.mailer import EmailTemplateGenerator, GmailNotifier
-            from modules.manga_rss import MangaRSSCollector
+            from modules.manga_rss import (
+                BookWalkerRSSCollector,
+                DAnimeRSSCollector,
+                MangaRSSCollector,
+            )
 
             # 設定を辞書形式で渡す
             config_dict = self.config._config_data if hasattr(self.config, "_config_data") else {}
 
-            self._collectors = {
-                "anilist": AniListCollector(config_dict),
-                "manga_rss": MangaRSSCollector(self.config),
+            collector_factories = {
+                "anilist": lambda: AniListCollector(config_dict),
+                "manga_rss": lambda: MangaRSSCollector(self.config),
+                "bookwalker": lambda: BookWalkerRSSCollector(self.config),
+                "danime": lambda: DAnimeRSSCollector(self.config),
                 # 'syoboi': syoboi_calendar.SyoboiCollector(self.config)  # 将来実装
             }
+            self._collectors = {
+                name: factory()
+                for name, factory in collector_factories.items()
+                if self._get_source_settings(name).get("enabled", True)
+            }
             self._filter = ContentFilter(self.config)
             self._mailer = GmailNotifier(self.config)
             self._calendar = GoogleCalendarManager(self.config)
@@ -138,71 +166,203 @@ class ReleaseNotifierSystem:
 
             self.logger.info("すべてのモジュールを初期化しました")
 
-    def collect_information(self) -> List[Dict[str, Any]]:
+    def _get_source_settings(self, source_name: str) -> Dict[str, Any]:
         """
-        各種ソースから情報収集 - Phase 2 Performance Optimized
+        収集ソースの設定を取得（デフォルト値に collection.sources.<name> を上書き）
+
+        Args:
+            source_name (str): ソース名
 
         Returns:
-            List[Dict[str, Any]]: 収集した作品・リリース情報のリスト
+            Dict[str, Any]: enabled / timeout_seconds を含む設定
         """
-        self.logger.info("📡 情報収集を開始します... (Phase 2 最適化版)")
-        self._import_modules()
+        settings = dict(DEFAULT_SOURCE_SETTINGS.get(source_name, {}))
+        settings.setdefault("enabled", True)
+        settings.setdefault("timeout_seconds", 120)
 
-        # Phase 2: Performance monitoring integration
+        overrides = self.config.get_value(f"collection.sources.{source_name}", {}) or {}
+        if isinstance(overrides, dict):
+            settings.update(overrides)
+
+        return settings
+
+    def _collect_from_source(self, source_name: str, collector) -> SourceResult:
+        """
+        単一ソースから収集（ワーカースレッドから呼ばれるため例外は戻り値で返す）
+
+        collect_with_updates() を持つコレクターは、保存後に記録する状態も
+        一緒に受け取る（その収集結果を保存できた場合だけ commit_feed_updates() に渡す）。
+
+        Args:
+            source_name (str): ソース名
+            collector: collect() を持つコレクター
+
+        Returns:
+            SourceResult: (取得アイテム, 所要時間[秒], 発生した例外, 保存後に記録する状態)
+        """
+        started_at = time.time()
+        try:
+            collect_with_updates = getattr(collector, "collect_with_updates", None)
+            if collect_with_updates is not None:
+                items, updates = collect_with_updates()
+            else:
+                items, updates = collector.collect(), None
+            return items, time.time() - started_at, None, updates
+        except Exception as e:
+            return None, time.time() - started_at, e, None
+
+    def _record_source_result(
+        self,
+        source_name: str,
+        items: Optional[List[Dict[str, Any]]],
+        duration: float,
+        error: Optional[Exception],
+    ) -> None:
+        """ソース単位の収集結果をログ・統計・モニタリングに記録"""
         from modules.monitoring import add_monitoring_alert, record_api_performance
 
-        all_items = []
-        collection_start_time = time.time()
+        service_name = source_name.replace("_", "")
+        publish_event(
+            "collection.source_completed",
+            {
+                "source": source_name,
+                "duration_seconds": duration,
+                "items": len(items) if items else 0,
+                "error": str(error) if error is not None else None,
+            },
+        )
 
-        for source_name, collector in self._collectors.items():
-            source_start_time = time.time()
-            try:
-                self.logger.info(f"  {source_name} から情報収集中...")
+        if error is not None:
+            self.logger.error(f"  {source_name} でエラーが発生: {error} (時間: {duration:.2f}秒)")
+            self.statistics["errors"] += 1
+
+            # Performance monitoring for errors
+            record_api_performance(service_name, duration, False)
+            add_monitoring_alert(f"データ収集エラー: {source_name} - {error}", "ERROR")
+            return
+
+        if items:
+            self.logger.info(
+                f"  {source_name}: {len(items)} 件の情報を取得 (時間: {duration:.2f}秒)"
+            )
+            self.statistics["processed_sources"] += 1
+            record_api_performance(service_name, duration, True)
+        else:
+            self.logger.warning(
+                f"  {source_name}: データが取得できませんでした (時間: {duration:.2f}秒)"
+            )
+            record_api_performance(service_name, duration, False)
+
+    def _collect_sequentially(self, collectors: Dict[str, Any]) -> Dict[str, SourceResult]:
+        """各ソースを順番に収集（collection.concurrent = false 時）"""
+        results = {}
+        for source_name, collector in collectors.items():
+            self.logger.info(f"  {source_name} から情報収集中...")
+            results[source_name] = self._collect_from_source(source_name, collector)
+        return results
+
+    def _collect_concurrently(self, collectors: Dict[str, Any]) -> Dict[str, SourceResult]:
+        """
+        全ソースを並行して収集
 
-                if source_name == "anilist":
-                    items = collector.collect()
-                else:
-                    items = collector.collect()
+        ソースごとに timeout_seconds を監視し、期限切れのソースは結果を待たずに
+        タイムアウトとして扱う（他のソースの結果には影響しない）。
 
-                source_duration = time.time() - source_start_time
+        実行中のスレッドは止められないため、タイムアウトしたソースの collect() は
+        バックグラウンドで最後まで走り続け、コレクターの状態も更新し続ける。
+        その戻り値（保存後に記録する状態を含む）は捨てるので、収集結果にも
+        保存後の記録にも使われない。
+        """
+        max_workers = self.config.get_value("collection.max_workers", len(collectors))
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(int(max_workers), len(collectors))),
+            thread_name_prefix="collector",
+        )
 
-                if items:
-                    self.logger.info(
-                        f"  {source_name}: {len(items)} 件の情報を取得 (時間: {source_duration:.2f}秒)"
-                    )
-                    all_items.extend(items)
-                    self.statistics["processed_sources"] += 1
+        results = {}
+        futures = {}
+        started_at = {}
+        deadlines = {}
 
-                    # Performance monitoring
-                    record_api_performance(source_name.replace("_", ""), source_duration, True)
-                else:
-                    self.logger.warning(
-                        f"  {source_name}: データが取得できませんでした (時間: {source_duration:.2f}秒)"
+        try:
+            for source_name, collector in collectors.items():
+                self.logger.info(f"  {source_name} から情報収集中... (並行)")
+                timeout = self._get_source_settings(source_name).get("timeout_seconds", 120)
+                future = executor.submit(self._collect_from_source, source_name, collector)
+                futures[future] = source_name
+                started_at[future] = time.time()
+                deadlines[future] = started_at[future] + timeout
+
+            pending = set(futures)
+            while pending:
+                now = time.time()
+                expired = {future for future in pending if deadlines[future] <= now}
+                for future in expired:
+                    # ワーカー待ちのまま期限が来たものだけが取り消せる（実行中は止まらない）
+                    future.cancel()
+                    source_name = futures[future]
+                    elapsed = now - started_at[future]
+                    results[source_name] = (
+                        None,
+                        elapsed,
+                        TimeoutError(f"{source_name} の収集がタイムアウトしました"),
+                        None,
                     )
-                    record_api_performance(source_name.replace("_", ""), source_duration, False)
+                pending -= expired
+                if not pending:
+                    break
+
+                next_deadline = min(deadlines[future] for future in pending)
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, next_deadline - now),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    results[futures[future]] = future.result()
+        finally:
+            # タイムアウトしたソースのスレッドは待たずに制御を戻す（スレッドは走り続ける）
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                # Adaptive rate limiting based on performance
-                if source_duration > 5.0:
-                    self.logger.info(
-                        f"  {source_name} のレスポンスが遅いため、長めの待機時間を設定"
-                    )
-                    time.sleep(3)  # Longer wait for slow services
-                else:
-                    time.sleep(1)  # Normal rate limiting
+        return results
 
-            except Exception as e:
-                source_duration = time.time() - source_start_time
-                self.logger.error(
-                    f"  {source_name} でエラーが発生: {e} (時間: {source_duration:.2f}秒)"
-                )
-                self.statistics["errors"] += 1
+    def collect_information(self) -> List[Dict[str, Any]]:
+        """
+        各種ソースから情報収集 - Phase 2 Performance Optimized
+
+        collection.concurrent が有効（デフォルト）の場合、全ソースを並行実行する。
+        各ソースは独自のタイムアウトを持つ。
 
-                # Performance monitoring for errors
-                record_api_performance(source_name.replace("_", ""), source_duration, False)
-                add_monitoring_alert(f"データ収集エラー: {source_name} - {e}", "ERROR")
+        Returns:
+            List[Dict[str, Any]]: 収集した作品・リリース情報のリスト
+        """
+        self.logger.info("📡 情報収集を開始します... (Phase 2 最適化版)")
+        self._import_modules()
 
-                if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(traceback.format_exc())
+        # Phase 2: Performance monitoring integration
+        from modules.monitoring import add_monitoring_alert
+
+        all_items = []
+        collection_start_time = time.time()
+        self._pending_feed_updates = {}
+
+        if self.config.get_value("collection.concurrent", True) and len(self._collectors) > 1:
+            results = self._collect_concurrently(self._collectors)
+        else:
+            results = self._collect_sequentially(self._collectors)
+
+        # 結果はソースの登録順に結合（並行実行でも出力順を安定させる）
+        for source_name in self._collectors:
+            items, duration, error, updates = results[source_name]
+            self._record_source_result(source_name, items, duration, error)
+            if error is not None and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "".join(traceback.format_exception(type(error), error, error.__traceback__))
+                )
+            if items:
+                all_items.extend(items)
+            if error is None and updates is not None:
+                self._pending_feed_updates[source_name] = updates
 
         total_collection_time = time.time() - collection_start_time
         self.logger.info(
@@ -266,50 +426,56 @@ class ReleaseNotifierSystem:
 
         new_releases = []
 
-        for item in items:
-            try:
-                # 作品の取得または作成
-                work_id = self.db.get_or_create_work(
-                    title=item.get("title", ""),
-                    title_kana=item.get("title_kana"),
-                    title_en=item.get("title_en"),
-                    work_type=item.get("type", "unknown"),
-                    official_url=item.get("official_url"),
-                )
+        try:
+            # 作品IDキャッシュを実行ごとに1回だけ作品テーブルから構築
+            self.db.warm_work_cache()
 
-                if work_id:
-                    # リリース情報の保存
-                    release_id = self.db.create_release(
-                        work_id=work_id,
-                        release_type=item.get(
-                            "release_type",
-                            "episode" if item.get("type") == "anime" else "volume",
-                        ),
-                        number=item.get("number"),
-                        platform=item.get("platform"),
-                        release_date=item.get("release_date"),
-                        source=item.get("source"),
-                        source_url=item.get("source_url"),
-                    )
+            # 作品の解決とリリース登録を1トランザクションで一括実行
+            created = self.db.bulk_upsert_works_and_releases(items)
+        except Exception as e:
+            self.logger.error(f"データベース一括保存エラー: {e}")
+            self.statistics["errors"] += 1
+            # 保存できなかった収集結果は記録しない（次回に同じエントリーを再取得する）
+            self._pending_feed_updates = {}
+            return new_releases
 
-                    if release_id:
-                        # 新しいリリースとして追加
-                        release_info = item.copy()
-                        release_info["release_id"] = release_id
-                        release_info["work_id"] = work_id
-                        new_releases.append(release_info)
-                        self.statistics["new_releases"] += 1
+        self._commit_collected_entries()
 
-                if item.get("is_new_work", False):
-                    self.statistics["new_works"] += 1
+        for entry in created:
+            # 新しいリリースとして追加
+            release_info = items[entry["index"]].copy()
+            release_info["release_id"] = entry["release_id"]
+            release_info["work_id"] = entry["work_id"]
+            new_releases.append(release_info)
+            self.statistics["new_releases"] += 1
 
-            except Exception as e:
-                self.logger.error(f"データベース保存エラー: {e}")
-                self.statistics["errors"] += 1
+        self.statistics["new_works"] += sum(1 for item in items if item.get("is_new_work", False))
 
         self.logger.info(f"💾 データベース保存完了: {len(new_releases)} 件の新しいリリース")
+
+        publish_event(
+            "releases.saved",
+            {
+                "new_releases": len(new_releases),
+                "new_works": self.statistics["new_works"],
+                "processed_items": len(items),
+            },
+        )
         return new_releases
 
+    def _commit_collected_entries(self) -> None:
+        """保存が完了したので、今回の収集結果に対応する状態を各コレクターに記録させる"""
+        pending, self._pending_feed_updates = self._pending_feed_updates, {}
+        for name, updates in pending.items():
+            collector = (self._collectors or {}).get(name)
+            commit = getattr(collector, "commit_feed_updates", None)
+            if commit is None:
+                continue
+            try:
+                commit(updates)
+            except Exception as e:
+                self.logger.warning(f"取り込み済みエントリーの記録に失敗しました ({name}): {e}")
+
     def send_notifications(
         self, new_releases: List[Dict[str, Any]], force_send: bool = False
     ) -> bool:
@@ -513,7 +679,7 @@ class ReleaseNotifierSystem:
   📉 エラー率: {error_rate:.1f}%
 
 💾 データベース統計:
-  総作品数: {self.db.get_work_stats().get('total', 0)}
+  総作品数: {self.db.get_work_stats().get('total_works', 0)}
   総リリース数: {self.db.get_work_stats().get('total_releases', 0)}
   未通知数: {len(self.db.get_unnotified_releases(100))}
 
@@ -563,6 +729,8 @@ class ReleaseNotifierSystem:
         Returns:
             bool: 正常に完了した場合True
         """
+        success = False
+        publish_event("collection.run_started", {"dry_run": self.dry_run})
         try:
             # ステップ1: 情報収集
             raw_items = self.collect_information()
@@ -608,6 +776,37 @@ class ReleaseNotifierSystem:
                 self.logger.debug(traceback.format_exc())
             return False
         finally:
+            publish_event(
+                "collection.run_finished",
+                {
+                    "success": success,
+                    "duration_seconds": (datetime.now() - self.start_time).total_seconds(),
+                    "statistics": dict(self.statistics),
+                },
+            )
+
+            # 書き込みが一段落したところで WAL をチェックポイント（読み取り側は待たせない）
+            try:
+                if hasattr(self, "db") and self.db:
+                    self.db.maybe_checkpoint_wal()
+            except Exception as e:
+                self.logger.warning(f"WALチェックポイントに失敗しました: {e}")
+
+            # 共有 HTTP クライアントの利用状況（ホスト別リクエスト数・接続の再利用数）
+            try:
+                from modules.http_client import get_http_stats
+
+                http_stats = get_http_stats()
+                requests_by_host = {
+                    host: stats["requests"] for host, stats in http_stats["hosts"].items()
+                }
+                self.logger.info(
+                    f"HTTP統計: 接続 {http_stats['connections']}, "
+                    f"ホスト別リクエスト数 {requests_by_host}"
+                )
+            except Exception as e:
+                self.logger.warning(f"HTTP統計の取得に失敗しました: {e}")
+
             # リソースのクリーンアップ
             try:
                 if hasattr(self, "db") and self.db:
@@ -4,7 +4,6 @@
 統計情報、セキュリティアラート、ロック中アカウント、監査ログの可視化
 """
 
-import sqlite3
 from datetime import datetime
 from functools import wraps
 
@@ -14,6 +13,8 @@ from flask_login import current_user, login_required
 # ブループリント定義
 admin_dash_bp = Blueprint("admin_dashboard", __name__, url_prefix="/admin")
 
+DB_PATH = "db.sqlite3"
+
 
 # 管理者権限チェックデコレーター
 def admin_required(f):
@@ -29,10 +30,10 @@ def admin_required(f):
 
 # データベース接続ヘルパー
 def get_db_connection():
-    """データベース接続を取得"""
-    conn = sqlite3.connect("db.sqlite3")
-    conn.row_factory = sqlite3.Row
-    return conn
+    """データベース接続を取得（リクエスト単位でプールから共有）"""
+    from modules.db import get_request_connection
+
+    return get_request_connection(DB_PATH)
 
 
 # 統計情報取得関数
@@ -109,8 +109,11 @@ def api_audit_logs():
     """
     監査ログAPI（JSON）
     フロントエンドからのAJAXリクエスト用
+
+    cursor に前回応答の pagination.next_cursor を渡すと続きを取得する。
     """
     from modules.audit_log import audit_logger
+    from modules.pagination import cached_total, decode_cursor, encode_cursor
 
     # フィルタパラメータ取得
     event_type = request.args.get("event_type")
@@ -134,18 +137,39 @@ def api_audit_logs():
     if search_query:
         filters["search"] = search_query
 
-    # ログ取得
-    logs = audit_logger.get_logs(limit=limit)
+    try:
+        cursor_values = decode_cursor(request.args.get("cursor"), 2)
+        before = None
+        if cursor_values is not None:
+            before = (datetime.fromisoformat(cursor_values[0]), int(cursor_values[1]))
+    except (TypeError, ValueError) as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    # ログ取得（1件多く取得して続きの有無を判定）
+    logs = audit_logger.get_logs(limit=limit + 1, before=before)
+    has_more = len(logs) > limit
+    logs = logs[:limit]
+
+    next_cursor = None
+    if has_more and logs:
+        next_cursor = encode_cursor([logs[-1].timestamp.isoformat(), logs[-1].id])
+
+    # 総件数は短時間キャッシュ（UI表示用）
+    total = cached_total(
+        ("audit_logs", id(audit_logger)),
+        lambda: audit_logger.get_statistics()["total_logs"],
+    )
 
     return jsonify(
         {
             "success": True,
             "data": [log.to_dict() for log in logs],
             "pagination": {
-                "total": len(logs),
+                "total": total,
                 "limit": limit,
                 "offset": offset,
-                "has_more": False,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
             },
         }
     )
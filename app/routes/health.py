@@ -26,19 +26,18 @@ def check_database_connection() -> dict:
         cursor = conn.execute("SELECT 1")
         cursor.fetchone()
 
-        # Get basic stats
-        cursor = conn.execute("SELECT COUNT(*) FROM works")
-        works_count = cursor.fetchone()[0]
+        # Get basic stats (trigger-maintained counters, no table scans)
+        from modules.db import read_stats_counters
 
-        cursor = conn.execute("SELECT COUNT(*) FROM releases")
-        releases_count = cursor.fetchone()[0]
+        counts = read_stats_counters(conn)
 
         conn.close()
 
         return {
             "status": "healthy",
-            "works_count": works_count,
-            "releases_count": releases_count,
+            "works_count": counts["works_total"],
+            "releases_count": counts["releases_total"],
+            "unnotified_releases_count": counts["releases_unnotified"],
         }
     except sqlite3.Error as e:
         return {"status": "unhealthy", "error": str(e)}
@@ -245,6 +244,10 @@ def prometheus_metrics():
         metrics.append("# TYPE mangaanime_releases_total gauge")
         metrics.append(f'mangaanime_releases_total {db_status["releases_count"]}')
 
+        metrics.append("# HELP mangaanime_releases_unnotified Number of releases not yet notified")
+        metrics.append("# TYPE mangaanime_releases_unnotified gauge")
+        metrics.append(f'mangaanime_releases_unnotified {db_status["unnotified_releases_count"]}')
+
     response_text = "\n".join(metrics) + "\n"
 
     from flask import Response
@@ -17,10 +17,10 @@ DB_PATH = "db.sqlite3"
 
 
 def get_db_connection():
-    """データベース接続を取得"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """データベース接続を取得（リクエスト単位でプールから共有）"""
+    from modules.db import get_request_connection
+
+    return get_request_connection(DB_PATH)
 
 
 @watchlist_bp.route("/")
@@ -75,12 +75,53 @@ def watchlist_page():
 @watchlist_bp.route("/api/list", methods=["GET"])
 @login_required
 def get_watchlist_api():
-    """ウォッチリストをJSON形式で取得（API）"""
+    """ウォッチリストをJSON形式で取得（API）
+
+    クエリパラメータ search を指定するとタイトル（かな・英語含む）で絞り込み、
+    全文検索インデックスの関連度順で返す。
+    limit を指定するとカーソル方式で分割取得でき、続きは応答の next_cursor を
+    cursor に渡して取得する。
+    """
     try:
+        from modules.db import build_title_search
+        from modules.pagination import decode_cursor, encode_cursor, keyset_condition
+
+        search = request.args.get("search", "")
+        limit = request.args.get("limit", type=int)
+
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        query = """
+        title_search = build_title_search(conn, search, alias="works")
+        sort_keys = [("w.created_at", True), ("w.id", True)]
+        if title_search["rank"]:
+            sort_keys.insert(0, (title_search["rank"], False))
+        order_by = ", ".join(f"{key} {'DESC' if desc else 'ASC'}" for key, desc in sort_keys)
+
+        # JOIN 側のパラメータが WHERE より先に来る
+        if title_search["join"]:
+            params = title_search["params"] + [current_user.id]
+        else:
+            params = [current_user.id] + title_search["params"]
+
+        where = f"w.user_id = ?{title_search['where']}"
+        try:
+            cursor_values = decode_cursor(request.args.get("cursor"), len(sort_keys))
+        except ValueError as e:
+            conn.close()
+            return jsonify({"success": False, "error": str(e)}), 400
+        if cursor_values is not None:
+            condition, condition_params = keyset_condition(sort_keys, cursor_values)
+            where += f" AND {condition}"
+            params.extend(condition_params)
+
+        limit_clause = ""
+        if limit and limit > 0:
+            limit_clause = "LIMIT ?"
+            params.append(limit + 1)
+
+        select_keys = ", ".join(f"{key} AS sort_key_{i}" for i, (key, _) in enumerate(sort_keys))
+        query = f"""
         SELECT
             w.id,
             w.work_id,
@@ -91,16 +132,23 @@ def get_watchlist_api():
             works.title_kana,
             works.title_en,
             works.type,
-            works.official_url
+            works.official_url,
+            {select_keys}
         FROM watchlist w
-        JOIN works ON w.work_id = works.id
-        WHERE w.user_id = ?
-        ORDER BY w.created_at DESC
+        JOIN works ON w.work_id = works.id{title_search["join"]}
+        WHERE {where}
+        ORDER BY {order_by}
+        {limit_clause}
         """
 
-        cursor.execute(query, (current_user.id,))
+        cursor.execute(query, params)
         rows = cursor.fetchall()
 
+        next_cursor = None
+        if limit_clause and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1][f"sort_key_{i}"] for i in range(len(sort_keys))])
+
         watchlist = []
         for row in rows:
             watchlist.append(
@@ -122,7 +170,14 @@ def get_watchlist_api():
 
         conn.close()
 
-        return jsonify({"success": True, "watchlist": watchlist, "count": len(watchlist)})
+        return jsonify(
+            {
+                "success": True,
+                "watchlist": watchlist,
+                "count": len(watchlist),
+                "next_cursor": next_cursor,
+            }
+        )
 
     except Exception as e:
         logger.error(f"ウォッチリスト取得エラー（API）: {str(e)}")
@@ -2,8 +2,6 @@
 Database utility functions for the Flask web application.
 """
 
-import sqlite3
-
 # Default database path
 DATABASE_PATH = "db.sqlite3"
 
@@ -12,13 +10,15 @@ def get_db_connection(db_path: str = None):
     """
     Get database connection with row factory for dict-like access.
 
+    The connection comes from the shared pool and is bound to the current
+    request (see modules.db.get_request_connection); close() is safe to call.
+
     Args:
         db_path: Optional path to database file
 
     Returns:
-        sqlite3.Connection with Row factory
+        Pooled sqlite3 connection with Row factory
     """
-    path = db_path or DATABASE_PATH
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    return conn
+    from modules.db import get_request_connection
+
+    return get_request_connection(db_path or DATABASE_PATH)
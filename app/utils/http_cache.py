@@ -0,0 +1,103 @@
+"""
+読み取り専用 JSON API のレスポンスキャッシュ
+
+ダッシュボードは複数タブから同じAPIをポーリングするが、データが変わるのは
+収集処理がコミットしたときだけである。そこでレスポンスを
+(エンドポイント, クエリ引数) 単位でメモリにキャッシュし、データバージョン
+（modules.db.read_data_version。works / releases / calendar_events の変更で
+トリガーが加算する）が変わったときだけ作り直す。
+
+ETag はデータバージョンから作るため、If-None-Match が一致すれば
+SQL を一切実行せずに 304 を返せる。
+"""
+
+import functools
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Hashable, Tuple
+
+from flask import current_app, make_response, request
+
+from modules.cache import MemoryCache
+
+# キャッシュ保持時間（秒）。無効化はデータバージョンで行うため上限として使う
+RESPONSE_CACHE_TTL = 3600
+
+_response_cache = MemoryCache(max_size=512, default_ttl=RESPONSE_CACHE_TTL)
+
+
+def cache_state(version: int) -> Tuple[int, str]:
+    """データバージョンと日付（UTC）の組。SQLite の date('now') は UTC 基準"""
+    return version, datetime.now(timezone.utc).date().isoformat()
+
+
+def make_etag(key: Hashable, state: Hashable) -> str:
+    """キャッシュキーと cache_state から ETag の値を作る"""
+    return hashlib.sha256(repr((key, state)).encode("utf-8")).hexdigest()[:32]
+
+
+def cached_json_response(db_path: Callable[[], str]):
+    """
+    JSON API のレスポンスをデータバージョン単位でキャッシュするデコレータ
+
+    200 の JSON レスポンスのみキャッシュする。SQLite の date('now') を使う
+    エンドポイントがあるため、日付（UTC）が変わった場合も作り直す。
+
+    Args:
+        db_path: リクエスト時にデータベースパスを返す関数
+
+    Usage:
+        @app.route("/api/stats")
+        @cached_json_response(lambda: DATABASE_PATH)
+        def api_stats():
+            ...
+    """
+
+    def decorator(view: Callable):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            from modules.db import get_reader_connection, read_data_version
+
+            path = db_path()
+            version = read_data_version(get_reader_connection(path))
+            if version is None:
+                return view(*args, **kwargs)
+
+            key = (
+                request.endpoint,
+                path,
+                tuple(sorted(request.args.items(multi=True))),
+                tuple(sorted(kwargs.items())),
+            )
+            state = cache_state(version)
+            etag = make_etag(key, state)
+
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+                cache_status = "REVALIDATED"
+            else:
+                cached = _response_cache.get(key)
+                if cached is not None and cached[0] == state:
+                    response = current_app.response_class(cached[1], mimetype=cached[2])
+                    cache_status = "HIT"
+                else:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200 or not response.is_json:
+                        return response
+                    _response_cache.set(key, (state, response.get_data(), response.mimetype))
+                    cache_status = "MISS"
+
+            response.set_etag(etag, weak=True)
+            # ブラウザには保存させつつ、毎回 If-None-Match で再検証させる
+            response.headers["Cache-Control"] = "no-cache"
+            response.headers["X-Cache"] = cache_status
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def clear_response_cache():
+    """レスポンスキャッシュを破棄"""
+    _response_cache.clear()
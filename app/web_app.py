@@ -8,14 +8,24 @@ viewing releases, and configuring the system.
 import json
 import logging
 import os
-import sqlite3
 import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import requests
-from flask import Flask, flash, jsonify, make_response, redirect, render_template, request, url_for
+from flask import (
+    Flask,
+    Response,
+    flash,
+    g,
+    jsonify,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
 
 # プロジェクトルートをPythonパスに追加
 project_root = Path(__file__).parent.parent
@@ -345,10 +355,43 @@ CACHE_DURATION = 30  # seconds
 
 
 def get_db_connection():
-    """Get database connection with row factory for dict-like access"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get database connection with row factory for dict-like access
+
+    Returns the pooled, tuned (WAL/mmap/cache_size) connection bound to the
+    current request; conn.close() is a no-op and the connection goes back to
+    the pool when the app context ends.
+    """
+    from modules.db import get_request_connection
+
+    return get_request_connection(DATABASE_PATH)
+
+
+def get_db_read_connection():
+    """Get the connection for read-only pages and APIs
+
+    Same as get_db_connection() unless DB_READER_MODE selects a read-only pool
+    ("readonly") or a periodically refreshed snapshot copy ("snapshot").
+    Never write through it.
+    """
+    from modules.db import get_reader_connection
+
+    return get_reader_connection(DATABASE_PATH)
+
+
+def json_response_cache(view):
+    """Cache a read-only JSON endpoint per data version and answer If-None-Match with 304"""
+    from app.utils.http_cache import cached_json_response
+
+    return cached_json_response(lambda: DATABASE_PATH)(view)
+
+
+@app.teardown_appcontext
+def close_db_connections(exc):
+    """Return request-scoped database connections to the pool"""
+    if "_pooled_db_connections" in g:
+        from modules.db import close_request_connections
+
+        close_request_connections(exc)
 
 
 def load_config():
@@ -524,7 +567,9 @@ def test_api_connections():
 @app.route("/")
 def dashboard():
     """Main dashboard showing recent releases"""
-    conn = get_db_connection()
+    from modules.db import read_stats_counters
+
+    conn = get_db_read_connection()
 
     # Get recent releases (last 7 days) with proper title display
     recent_releases = conn.execute("""
@@ -550,19 +595,14 @@ def dashboard():
         LIMIT 50
     """).fetchall()
 
-    # Get statistics
+    # Get statistics (trigger-maintained counters, no table scans)
+    counts = read_stats_counters(conn)
     stats = {
-        "total_works": conn.execute("SELECT COUNT(*) FROM works").fetchone()[0],
-        "total_releases": conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0],
-        "pending_notifications": conn.execute(
-            "SELECT COUNT(*) FROM releases WHERE notified = 0"
-        ).fetchone()[0],
-        "anime_count": conn.execute('SELECT COUNT(*) FROM works WHERE type = "anime"').fetchone()[
-            0
-        ],
-        "manga_count": conn.execute('SELECT COUNT(*) FROM works WHERE type = "manga"').fetchone()[
-            0
-        ],
+        "total_works": counts["works_total"],
+        "total_releases": counts["releases_total"],
+        "pending_notifications": counts["releases_unnotified"],
+        "anime_count": counts["works_anime"],
+        "manga_count": counts["works_manga"],
     }
 
     conn.close()
@@ -584,58 +624,74 @@ def releases():
     platform = request.args.get("platform", "all")
     search = request.args.get("search", "")
 
-    conn = get_db_connection()
-
-    # Build query with filters - proper title display
-    query = """
-        SELECT w.title as title, w.title as original_title,
-               w.type, r.release_type, r.number, r.platform,
-               r.release_date, r.source_url, r.notified, r.created_at
-        FROM releases r
-        JOIN works w ON r.work_id = w.id
-        WHERE 1=1
-    """
-    params = []
-
-    if work_type != "all":
-        query += " AND w.type = ?"
-        params.append(work_type)
+    from modules.db import build_title_search, read_data_version
+    from modules.pagination import cached_total, decode_cursor, encode_cursor, keyset_condition
 
-    if platform != "all":
-        query += " AND r.platform = ?"
-        params.append(platform)
+    conn = get_db_read_connection()
 
-    if search:
-        query += " AND (w.title LIKE ? OR w.title_kana LIKE ?)"
-        params.extend([f"%{search}%", f"%{search}%"])
-
-    query += " ORDER BY r.release_date DESC LIMIT ? OFFSET ?"
-    params.extend([per_page, (page - 1) * per_page])
-
-    releases_data = conn.execute(query, params).fetchall()
-
-    # Get total count for pagination - Build separate count query
-    count_query = """
-        SELECT COUNT(*)
+    # Filters are built once and shared by the page query and the count query
+    title_search = build_title_search(conn, search, columns=("title", "title_kana"))
+    from_clause = f"""
         FROM releases r
-        JOIN works w ON r.work_id = w.id
-        WHERE 1=1
+        JOIN works w ON r.work_id = w.id{title_search["join"]}
+        WHERE 1=1{title_search["where"]}
     """
-    count_params = []
+    filter_params = list(title_search["params"])
 
     if work_type != "all":
-        count_query += " AND w.type = ?"
-        count_params.append(work_type)
+        from_clause += " AND w.type = ?"
+        filter_params.append(work_type)
 
     if platform != "all":
-        count_query += " AND r.platform = ?"
-        count_params.append(platform)
-
-    if search:
-        count_query += " AND (w.title LIKE ? OR w.title_kana LIKE ?)"
-        count_params.extend([f"%{search}%", f"%{search}%"])
+        from_clause += " AND r.platform = ?"
+        filter_params.append(platform)
+
+    # Search results are ranked by relevance, then by release date.
+    # r.id makes the order total so the cursor can resume exactly.
+    sort_keys = [("r.release_date", True), ("r.id", True)]
+    if title_search["rank"]:
+        sort_keys.insert(0, (title_search["rank"], False))
+    order_by = ", ".join(f"{key} {'DESC' if desc else 'ASC'}" for key, desc in sort_keys)
+
+    # Keyset pagination: "next" links carry the last row's sort key so deep
+    # pages don't rescan every earlier row. Page-number jumps still use OFFSET.
+    try:
+        cursor_values = decode_cursor(request.args.get("cursor"), len(sort_keys))
+    except ValueError:
+        cursor_values = None
+
+    page_clause = from_clause
+    page_params = list(filter_params)
+    if cursor_values is not None:
+        condition, condition_params = keyset_condition(sort_keys, cursor_values)
+        page_clause += f" AND {condition}"
+        page_params.extend(condition_params)
+        offset = 0
+    else:
+        offset = (page - 1) * per_page
 
-    total_count = conn.execute(count_query, count_params).fetchone()[0]
+    select_keys = ", ".join(f"{key} AS sort_key_{i}" for i, (key, _) in enumerate(sort_keys))
+    query = f"""
+        SELECT w.title as title, w.title as original_title,
+               w.type, r.release_type, r.number, r.platform,
+               r.release_date, r.source_url, r.notified, r.created_at,
+               {select_keys}
+        {page_clause}
+        ORDER BY {order_by} LIMIT ? OFFSET ?
+    """
+    releases_data = conn.execute(query, page_params + [per_page + 1, offset]).fetchall()
+
+    next_cursor = None
+    if len(releases_data) > per_page:
+        releases_data = releases_data[:per_page]
+        last = releases_data[-1]
+        next_cursor = encode_cursor([last[f"sort_key_{i}"] for i in range(len(sort_keys))])
+
+    total_count = cached_total(
+        ("releases", DATABASE_PATH, from_clause, tuple(filter_params)),
+        lambda: conn.execute(f"SELECT COUNT(*) {from_clause}", filter_params).fetchone()[0],
+        version=read_data_version(conn),
+    )
 
     # Get available platforms for filter
     platforms = [
@@ -654,6 +710,7 @@ def releases():
         releases=releases_data,
         current_page=page,
         total_pages=total_pages,
+        next_cursor=next_cursor,
         work_type=work_type,
         platform=platform,
         search=search,
@@ -666,6 +723,8 @@ def calendar():
     """Calendar view of releases"""
     from calendar import monthrange
 
+    from modules.calendar_data import get_month_releases
+
     month = request.args.get("month", datetime.now().month, type=int)
     year = request.args.get("year", datetime.now().year, type=int)
 
@@ -675,63 +734,19 @@ def calendar():
     # 月の最初の日
     first_day = datetime(year, month, 1)
 
-    # Get releases and calendar events for the specified month
-    conn = get_db_connection()
-
-    # First try to get from calendar_events (synced data)
-    calendar_events = conn.execute(
-        """
-        SELECT ce.event_title as title, w.title as original_title,
-               w.type, r.release_type, r.number, r.platform,
-               ce.event_date as release_date, r.source_url
-        FROM calendar_events ce
-        JOIN works w ON ce.work_id = w.id
-        LEFT JOIN releases r ON ce.release_id = r.id
-        WHERE strftime('%Y', ce.event_date) = ?
-        AND strftime('%m', ce.event_date) = ?
-        ORDER BY ce.event_date, w.title
-    """,
-        [str(year), f"{month:02d}"],
-    ).fetchall()
-
-    # If no calendar events, fallback to releases table
-    if not calendar_events:
-        releases_data = conn.execute(
-            """
-            SELECT w.title as title, w.title as original_title,
-                   w.type, r.release_type, r.number, r.platform,
-                   r.release_date, r.source_url
-            FROM releases r
-            JOIN works w ON r.work_id = w.id
-            WHERE strftime('%Y', r.release_date) = ?
-            AND strftime('%m', r.release_date) = ?
-            ORDER BY r.release_date, w.title
-        """,
-            [str(year), f"{month:02d}"],
-        ).fetchall()
-    else:
-        releases_data = calendar_events
-
+    # Get releases and calendar events for the specified month (cached per month)
+    conn = get_db_read_connection()
+    month_data = get_month_releases(conn, year, month, cache_key=DATABASE_PATH)
     conn.close()
 
-    # Organize releases by date
-    releases_by_date = {}
-    total_releases = 0
-    for release in releases_data:
-        date_str = release["release_date"]
-        if date_str not in releases_by_date:
-            releases_by_date[date_str] = []
-        releases_by_date[date_str].append(dict(release))
-        total_releases += 1
-
     return render_template(
         "calendar.html",
-        releases_by_date=releases_by_date,
+        releases_by_date=month_data["releases_by_date"],
         current_month=month,
         current_year=year,
         first_weekday=first_weekday,
         days_in_month=days_in_month,
-        total_releases=total_releases,
+        total_releases=month_data["total"],
     )
 
 
@@ -816,15 +831,15 @@ def config():
 @app.route("/logs")
 def logs():
     """System logs and status page"""
+    from modules.log_tail import read_tail
+
     log_file = "logs/system.log"
     logs_data = []
 
     if os.path.exists(log_file):
         try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                # Get last 100 lines
-                logs_data = [line.strip() for line in lines[-100:]]
+            # Get last 100 lines without reading the whole file
+            logs_data, _ = read_tail(log_file, 100)
         except Exception as e:
             logs_data = [f"Error reading log file: {str(e)}"]
     else:
@@ -841,41 +856,29 @@ def logs():
     return render_template("logs.html", logs=logs_data, status=status)
 
 
+_realtime_log_reader = None
+
+
 @app.route("/api/realtime-logs")
 def api_realtime_logs():
     """API endpoint for real-time log data"""
+    from modules.log_tail import decode_log_cursor, encode_log_cursor
+
     limit = request.args.get("limit", 50, type=int)
     level_filter = request.args.get("level", "all")
 
-    # Get logs from multiple log files
-    log_files = ["logs/app.log", "logs/system.log", "logs/backup.log"]
-
-    all_logs = []
-
-    for log_file in log_files:
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                    for line in lines[-100:]:  # Get last 100 from each file
-                        line = line.strip()
-                        if line:
-                            # Parse log entry
-                            log_entry = parse_log_entry(line)
-                            if log_entry and (
-                                level_filter == "all" or log_entry["level"].lower() == level_filter
-                            ):
-                                all_logs.append(log_entry)
-            except Exception as e:
-                logger.error(f"Error reading log file {log_file}: {e}")
+    # Last 100 entries from each file, parsed once and kept between polls
+    reader = get_realtime_log_reader()
+    try:
+        since = decode_log_cursor(request.args.get("since"), len(reader.paths))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    # Sort by timestamp and get recent entries
-    all_logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-    recent_logs = all_logs[:limit]
+    recent_logs, positions = reader.read(limit=limit, level=level_filter, since=since)
 
     # Add some current system status logs
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    if not recent_logs:
+    if not recent_logs and since is None:
         # Add system status logs if no logs found
         recent_logs = [
             {
@@ -898,49 +901,37 @@ def api_realtime_logs():
             },
         ]
 
-    return jsonify(recent_logs)
+    # Pass back as ?since= to receive only lines appended after this poll
+    response = jsonify(recent_logs)
+    response.headers["X-Log-Cursor"] = encode_log_cursor(positions)
+    return response
 
 
-def parse_log_entry(log_line):
-    """Parse a log line into structured data"""
-    import re
+def get_realtime_log_reader():
+    """Shared tail reader for the log files shown by /api/realtime-logs"""
+    global _realtime_log_reader
+    if _realtime_log_reader is None:
+        from modules.log_tail import LogTailReader
 
-    # Try to match common log patterns
-    patterns = [
-        r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s*-\s*\w*\s*-\s*(\w+)\s*-\s*(.*)",
-        r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]\s*(\w+):\s*(.*)",
-        r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?(\w+):\s*(.*)",
-    ]
+        _realtime_log_reader = LogTailReader(
+            ["logs/app.log", "logs/system.log", "logs/backup.log"], max_entries=100
+        )
+    return _realtime_log_reader
 
-    for pattern in patterns:
-        match = re.match(pattern, log_line)
-        if match:
-            timestamp = match.group(1)
-            level = match.group(2).upper()
-            message = match.group(3)
 
-            return {
-                "timestamp": timestamp,
-                "level": level,
-                "message": message,
-                "formatted": f"[{timestamp}] {level}: {message}",
-            }
+def parse_log_entry(log_line):
+    """Parse a log line into structured data"""
+    from modules.log_tail import parse_log_line
 
-    # If no pattern matches, return the raw line
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    return {
-        "timestamp": current_time,
-        "level": "INFO",
-        "message": log_line,
-        "formatted": f"[{current_time}] INFO: {log_line}",
-    }
+    return parse_log_line(log_line)
 
 
 @app.route("/api/releases/recent")
+@json_response_cache
 def api_recent_releases():
     """API endpoint for recent releases (AJAX) with proper title display"""
     try:
-        conn = get_db_connection()
+        conn = get_db_read_connection()
         releases = conn.execute("""
             SELECT w.title, w.title_kana, w.type, r.release_type, r.number, r.platform,
                    r.release_date, r.notified
@@ -964,10 +955,11 @@ def api_recent_releases():
 
 
 @app.route("/api/releases/upcoming")
+@json_response_cache
 def api_upcoming_releases():
     """API endpoint for upcoming releases with proper title display"""
     try:
-        conn = get_db_connection()
+        conn = get_db_read_connection()
         releases = conn.execute("""
             SELECT w.id, w.title, w.title_kana, w.type,
                    r.id as release_id, r.release_type, r.number, r.platform,
@@ -998,17 +990,21 @@ def admin():
 
 
 @app.route("/api/stats")
+@json_response_cache
 def api_stats():
     """API endpoint for dashboard statistics"""
-    conn = get_db_connection()
+    from modules.db import read_stats_counters
+
+    conn = get_db_read_connection()
+    counts = read_stats_counters(conn)
     stats = {
-        "total_works": conn.execute("SELECT COUNT(*) FROM works").fetchone()[0],
-        "total_releases": conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0],
-        "pending_notifications": conn.execute(
-            "SELECT COUNT(*) FROM releases WHERE notified = 0"
-        ).fetchone()[0],
+        "total_works": counts["works_total"],
+        "total_releases": counts["releases_total"],
+        "pending_notifications": counts["releases_unnotified"],
+        # Range on the raw column so idx_releases_date is used
         "today_releases": conn.execute(
-            "SELECT COUNT(*) FROM releases WHERE date(release_date) = date('now')"
+            "SELECT COUNT(*) FROM releases "
+            "WHERE release_date >= date('now') AND release_date < date('now', '+1 day')"
         ).fetchone()[0],
     }
     conn.close()
@@ -1490,6 +1486,7 @@ def api_collection_status():
 
 
 @app.route("/api/works")
+@json_response_cache
 def api_works():
     """API endpoint for works data with filtering and pagination"""
     # Get query parameters
@@ -1504,100 +1501,104 @@ def api_works():
     page = int(request.args.get("page", 1))
     per_page = 25
 
-    conn = get_db_connection()
+    from modules.db import build_title_search, read_data_version
+    from modules.pagination import cached_total, decode_cursor, encode_cursor, keyset_condition
 
-    # Build base query with proper title display
-    query = """
-        SELECT w.id, w.title, w.title_kana, w.title_en, w.type, w.official_url,
-               GROUP_CONCAT(DISTINCT r.platform) as platforms,
-               MIN(r.release_date) as next_release_date,
-               COUNT(r.id) as release_count
-        FROM works w
+    conn = get_db_read_connection()
+
+    # Filters are built once and shared by the page query and the count query
+    title_search = build_title_search(conn, search)
+    from_clause = f"""
+        FROM works w{title_search["join"]}
         LEFT JOIN releases r ON w.id = r.work_id
-        WHERE 1=1
+        WHERE 1=1{title_search["where"]}
     """
-    params = []
-
-    # Apply filters
-    if search:
-        query += " AND (w.title LIKE ? OR w.title_kana LIKE ? OR w.title_en LIKE ?)"
-        params.extend([f"%{search}%", f"%{search}%", f"%{search}%"])
+    filter_params = list(title_search["params"])
 
     if work_type:
-        query += " AND w.type = ?"
-        params.append(work_type)
+        from_clause += " AND w.type = ?"
+        filter_params.append(work_type)
 
     if platform:
-        query += " AND r.platform = ?"
-        params.append(platform)
+        from_clause += " AND r.platform = ?"
+        filter_params.append(platform)
 
     if start_date:
-        query += " AND r.release_date >= ?"
-        params.append(start_date)
+        from_clause += " AND r.release_date >= ?"
+        filter_params.append(start_date)
 
     if end_date:
-        query += " AND r.release_date <= ?"
-        params.append(end_date)
+        from_clause += " AND r.release_date <= ?"
+        filter_params.append(end_date)
 
-    # Add GROUP BY
-    query += " GROUP BY w.id, w.title, w.title_kana, w.title_en, w.type, w.official_url"
+    # Add sorting (search results default to relevance order).
+    # Every sort ends with w.id so the order is total and a cursor can resume it.
+    if "sort" not in request.args and title_search["rank"]:
+        sort = "relevance"
 
-    # Add sorting
-    if sort == "newest":
-        query += " ORDER BY MAX(r.created_at) DESC"
+    if sort == "relevance" and title_search["rank"]:
+        sort_keys = [(title_search["rank"], False), ("w.id", False)]
     elif sort == "oldest":
-        query += " ORDER BY MIN(r.created_at) ASC"
+        sort_keys = [("w.created_at", False), ("w.id", False)]
     elif sort == "title_asc":
-        query += " ORDER BY w.title ASC"
+        sort_keys = [("w.title", False), ("w.id", False)]
     elif sort == "title_desc":
-        query += " ORDER BY w.title DESC"
+        sort_keys = [("w.title", True), ("w.id", True)]
     else:
-        query += " ORDER BY MAX(r.created_at) DESC"
-
-    # Add pagination
-    offset = (page - 1) * per_page
-    query += f" LIMIT {per_page} OFFSET {offset}"
+        sort_keys = [("w.created_at", True), ("w.id", True)]
+    order_by = ", ".join(f"{key} {'DESC' if desc else 'ASC'}" for key, desc in sort_keys)
 
-    works = conn.execute(query, params).fetchall()
+    # Keyset pagination with ?cursor=<next_cursor>; ?page= still works via OFFSET
+    try:
+        cursor_values = decode_cursor(request.args.get("cursor"), len(sort_keys))
+    except ValueError as e:
+        conn.close()
+        return jsonify({"error": str(e)}), 400
+
+    page_clause = from_clause
+    page_params = list(filter_params)
+    if cursor_values is not None:
+        condition, condition_params = keyset_condition(sort_keys, cursor_values)
+        page_clause += f" AND {condition}"
+        page_params.extend(condition_params)
+        offset = 0
+    else:
+        offset = (page - 1) * per_page
 
-    # Get total count for pagination - Build separate count query
-    count_query = """
-        SELECT COUNT(DISTINCT w.id)
-        FROM works w
-        LEFT JOIN releases r ON w.id = r.work_id
-        WHERE 1=1
+    select_keys = ", ".join(f"{key} AS sort_key_{i}" for i, (key, _) in enumerate(sort_keys))
+    query = f"""
+        SELECT w.id, w.title, w.title_kana, w.title_en, w.type, w.official_url,
+               GROUP_CONCAT(DISTINCT r.platform) as platforms,
+               MIN(r.release_date) as next_release_date,
+               COUNT(r.id) as release_count,
+               {select_keys}
+        {page_clause}
+        GROUP BY w.id, w.title, w.title_kana, w.title_en, w.type, w.official_url
+        ORDER BY {order_by}
+        LIMIT {per_page + 1} OFFSET {offset}
     """
-    count_params = []
 
-    # Apply same filters as main query
-    if search:
-        count_query += " AND (w.title LIKE ? OR w.title_kana LIKE ? OR w.title_en LIKE ?)"
-        count_params.extend([f"%{search}%", f"%{search}%", f"%{search}%"])
+    works = conn.execute(query, page_params).fetchall()
 
-    if work_type:
-        count_query += " AND w.type = ?"
-        count_params.append(work_type)
+    next_cursor = None
+    if len(works) > per_page:
+        works = works[:per_page]
+        next_cursor = encode_cursor([works[-1][f"sort_key_{i}"] for i in range(len(sort_keys))])
 
-    if platform:
-        count_query += " AND r.platform = ?"
-        count_params.append(platform)
-
-    if start_date:
-        count_query += " AND r.release_date >= ?"
-        count_params.append(start_date)
-
-    if end_date:
-        count_query += " AND r.release_date <= ?"
-        count_params.append(end_date)
-
-    total_count = conn.execute(count_query, count_params).fetchone()[0]
+    total_count = cached_total(
+        ("api_works", DATABASE_PATH, from_clause, tuple(filter_params)),
+        lambda: conn.execute(
+            f"SELECT COUNT(DISTINCT w.id) {from_clause}", filter_params
+        ).fetchone()[0],
+        version=read_data_version(conn),
+    )
 
     conn.close()
 
     # Format works data
     works_data = []
     for work in works:
-        work_dict = dict(work)
+        work_dict = {key: work[key] for key in work.keys() if not key.startswith("sort_key_")}
         work_dict["platforms"] = work_dict["platforms"].split(",") if work_dict["platforms"] else []
         work_dict["quality_score"] = 85  # Mock quality score
         work_dict["genres"] = ["Action", "Adventure"]  # Mock genres
@@ -1611,6 +1612,7 @@ def api_works():
             "filtered": len(works_data),
             "totalPages": (total_count + per_page - 1) // per_page,
             "currentPage": page,
+            "next_cursor": next_cursor,
         }
     )
 
@@ -1618,7 +1620,7 @@ def api_works():
 @app.route("/api/works/<int:work_id>")
 def api_work_detail(work_id):
     """API endpoint for individual work details"""
-    conn = get_db_connection()
+    conn = get_db_read_connection()
 
     work = conn.execute(
         """
@@ -2045,13 +2047,35 @@ def debug():
     return render_template("debug.html")
 
 
+# Seconds between keep-alive comments on idle event streams
+SSE_HEARTBEAT_SECONDS = 15
+
+
+@app.route("/api/collection-events")
 @app.route("/ws/collection-status")
 def websocket_collection_status():
-    """Fallback endpoint for collection status (replaces WebSocket for now)"""
-    # Return regular JSON response instead of WebSocket error
-    return (
-        jsonify({"status": "ok", "message": "Real-time updates available via API polling"}),
-        200,
+    """Server-sent event stream of collection progress, source timings and new releases
+
+    Events come from the in-process event bus (modules.event_bus) that
+    CollectionManager and ReleaseNotifierSystem publish to. Reconnecting
+    clients send Last-Event-ID and get the recent events they missed.
+    """
+    from modules.event_bus import format_sse, get_event_bus
+
+    last_event_id = request.headers.get("Last-Event-ID", type=int)
+
+    def stream():
+        # Subscribe inside the generator so the subscription is closed when the client goes away
+        with get_event_bus().subscribe(last_event_id=last_event_id) as subscription:
+            yield f"retry: {SSE_HEARTBEAT_SECONDS * 1000}\n\n"
+            while True:
+                event = subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+                yield format_sse(event) if event else ": keep-alive\n\n"
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -2434,10 +2458,9 @@ def api_test_configuration():
 @app.route("/api/generate-ics", methods=["POST"])
 def generate_ics():
     """選択されたリリースからiCalendarファイルを生成"""
-    import uuid
     from datetime import datetime as dt
 
-    from flask import Response
+    from modules.ics_feed import render_calendar
 
     try:
         data = request.get_json()
@@ -2446,56 +2469,8 @@ def generate_ics():
         if not releases:
             return jsonify({"error": "登録するリリースがありません"}), 400
 
-        # iCalendar形式のファイル生成
-        ics_content = ["BEGIN:VCALENDAR"]
-        ics_content.append("VERSION:2.0")
-        ics_content.append("PRODID:-//MangaAnime Info System//Calendar//JP")
-        ics_content.append("CALSCALE:GREGORIAN")
-        ics_content.append("METHOD:PUBLISH")
-        ics_content.append("X-WR-CALNAME:アニメ・マンガリリース予定")
-        ics_content.append("X-WR-TIMEZONE:Asia/Tokyo")
-
-        for release in releases:
-            # イベントID生成
-            event_uid = str(uuid.uuid4())
-
-            # タイトル生成
-            type_icon = "🎬" if release.get("type") == "anime" else "📚"
-            type_label = "アニメ" if release.get("type") == "anime" else "マンガ"
-            release_text = "話" if release.get("release_type") == "episode" else "巻"
-
-            title = f"{type_icon}【{type_label}】{release.get('title', '')} 第{release.get('number', '')}{release_text} | {release.get('platform', '')}"
-
-            # 詳細情報
-            description = f"作品: {release.get('title', '')}\\n"
-            description += f"タイプ: {type_label}\\n"
-            description += f"{release_text}: 第{release.get('number', '')}{release_text}\\n"
-            description += f"配信プラットフォーム: {release.get('platform', '')}\\n"
-            if release.get("source_url"):
-                description += f"ソースURL: {release.get('source_url')}\\n"
-            description += "\\n---\\n自動登録: MangaAnime情報配信システム"
-
-            # 日付（YYYYMMDD形式）
-            release_date = release.get("release_date", "")
-            date_str = release_date.replace("-", "")
-
-            # イベント作成
-            ics_content.append("BEGIN:VEVENT")
-            ics_content.append(f"UID:{event_uid}")
-            ics_content.append(f'DTSTAMP:{dt.now().strftime("%Y%m%dT%H%M%SZ")}')
-            ics_content.append(f"DTSTART;VALUE=DATE:{date_str}")
-            ics_content.append(f"DTEND;VALUE=DATE:{date_str}")
-            ics_content.append(f"SUMMARY:{title}")
-            ics_content.append(f"DESCRIPTION:{description}")
-            ics_content.append(f'LOCATION:{release.get("platform", "")}')
-            ics_content.append("STATUS:CONFIRMED")
-            ics_content.append("TRANSP:TRANSPARENT")
-            ics_content.append("END:VEVENT")
-
-        ics_content.append("END:VCALENDAR")
-
-        # レスポンス生成
-        ics_text = "\r\n".join(ics_content)
+        # iCalendar形式のファイル生成（UID はリリースから決まるため再インポートしても重複しない）
+        ics_text = "".join(render_calendar(releases))
 
         return Response(
             ics_text,
@@ -2510,6 +2485,55 @@ def generate_ics():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/calendar/feed.ics")
+def calendar_feed():
+    """購読用iCalendarフィード（type / platform / work_id / days_back / days_ahead で絞り込み）
+
+    VEVENT は DB カーソルから1件ずつ生成してストリーミングし、送信し終えた
+    フィードはデータバージョン単位でキャッシュする。ETag による条件付きGETに対応。
+    """
+    from app.utils.http_cache import cache_state, make_etag
+    from modules.db import get_reader_pool, read_data_version
+    from modules.ics_feed import FeedFilter, get_cached_feed, iter_feed, stream_and_cache_feed
+
+    try:
+        feed_filter = FeedFilter.from_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    db_path = DATABASE_PATH
+    version = read_data_version(get_db_read_connection())
+
+    def render():
+        # ストリーミング中はリクエストの接続ではなくプールから専用に借りる
+        pool = get_reader_pool(db_path)
+        conn = pool.acquire()
+        try:
+            yield from iter_feed(conn, feed_filter)
+        finally:
+            pool.release(conn)
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Content-Disposition": "inline; filename=anime_manga_releases.ics",
+    }
+    if version is None:
+        return Response(render(), mimetype="text/calendar", headers=headers)
+
+    key = (db_path, feed_filter)
+    state = cache_state(version)
+    etag = make_etag(key, state)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304, headers=headers)
+    else:
+        body = get_cached_feed(key, state)
+        if body is None:
+            body = stream_and_cache_feed(key, state, render())
+        response = Response(body, mimetype="text/calendar", headers=headers)
+    response.set_etag(etag)
+    return response
+
+
 @app.route("/api/notification-status")
 def api_notification_status():
     """通知・カレンダー連携の実行状況を返すAPIエンドポイント（notification_history使用）"""
@@ -3968,6 +3992,7 @@ def api_calendar_sync():
 
 
 @app.route("/api/calendar/events")
+@json_response_cache
 def api_calendar_events():
     """Get calendar events with optional filtering"""
     try:
@@ -3976,7 +4001,7 @@ def api_calendar_events():
         end_date = request.args.get("end_date")  # YYYY-MM-DD
         limit = request.args.get("limit", type=int, default=100)
 
-        conn = get_db_connection()
+        conn = get_db_read_connection()
         try:
             query = """
                 SELECT ce.id, ce.work_id, ce.release_id, ce.event_title,
@@ -4032,10 +4057,11 @@ def api_calendar_events():
 
 
 @app.route("/api/calendar/stats")
+@json_response_cache
 def api_calendar_stats():
     """Get calendar statistics"""
     try:
-        conn = get_db_connection()
+        conn = get_db_read_connection()
         try:
             stats = {
                 "total_events": conn.execute(
@@ -4079,51 +4105,39 @@ def api_calendar_monthly():
     try:
         months = request.args.get("months", type=int, default=3)
 
-        conn = get_db_connection()
+        conn = get_db_read_connection()
         try:
-            from collections import defaultdict
             from datetime import datetime
 
+            from modules.calendar_data import get_month_releases
+
             # Calculate date range
             today = datetime.now().date()
+            today_str = today.isoformat()
             start_date = today.replace(day=1)  # First day of current month
 
-            # Get events for the next N months
-            events = conn.execute(
-                """
-                SELECT ce.id, ce.event_title, ce.event_date, ce.description,
-                       w.title as work_title, w.type as work_type,
-                       r.release_type, r.number, r.platform
-                FROM calendar_events ce
-                JOIN works w ON ce.work_id = w.id
-                LEFT JOIN releases r ON ce.release_id = r.id
-                WHERE ce.event_date >= date('now')
-                  AND ce.event_date <= date('now', '+' || ? || ' months')
-                ORDER BY ce.event_date ASC
-            """,
-                (months,),
-            ).fetchall()
-
-            # Group events by year-month
-            monthly_data = defaultdict(list)
-            for event in events:
-                event_date = datetime.strptime(event["event_date"], "%Y-%m-%d").date()
-                month_key = event_date.strftime("%Y-%m")
-
-                monthly_data[month_key].append(
+            def month_events(year, month):
+                """Synced calendar events from today onwards, served from the month cache"""
+                month_data = get_month_releases(conn, year, month, cache_key=DATABASE_PATH)
+                if month_data["source"] != "calendar_events":
+                    return []
+                return [
                     {
                         "id": event["id"],
-                        "title": event["event_title"],
-                        "date": event["event_date"],
-                        "day": event_date.day,
-                        "work_title": event["work_title"],
-                        "work_type": event["work_type"],
+                        "title": event["title"],
+                        "date": event["release_date"],
+                        "day": int(event["release_date"][8:10]),
+                        "work_title": event["original_title"],
+                        "work_type": event["type"],
                         "release_type": event["release_type"],
                         "number": event["number"],
                         "platform": event["platform"],
                         "description": event["description"],
                     }
-                )
+                    for date_str in sorted(month_data["releases_by_date"])
+                    if date_str >= today_str
+                    for event in month_data["releases_by_date"][date_str]
+                ]
 
             # Create result with month information
             result = []
@@ -4148,14 +4162,15 @@ def api_calendar_monthly():
                     "12月",
                 ][month]
 
+                events = month_events(year, month)
                 result.append(
                     {
                         "year": year,
                         "month": month,
                         "month_key": month_key,
                         "month_name": month_name_ja,
-                        "events": monthly_data.get(month_key, []),
-                        "event_count": len(monthly_data.get(month_key, [])),
+                        "events": events,
+                        "event_count": len(events),
                     }
                 )
 
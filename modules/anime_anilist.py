@@ -23,6 +23,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
 
 from .db import get_db
+from .http_client import RetryPolicy, configure_rate_limit, get_http_client
 from .models import AniListWork, DataSource
 
 
@@ -124,6 +125,12 @@ class AniListClient:
     Provides methods to query anime data from AniList API with proper
     rate limiting (90 requests per minute), circuit breaker pattern,
     and comprehensive error handling.
+
+    Requests go through the shared HTTP client (modules.http_client), so
+    AniList uses the same pooled session, per-host token bucket and retry
+    policy as the other API collectors and shows up in get_http_stats().
+    The client holds the shared session from its first request; use it as
+    an async context manager or call close() when done.
     """
 
     API_URL = "https://graphql.anilist.co"
@@ -141,6 +148,10 @@ class AniListClient:
     MIN_RATE_LIMIT = 30  # Minimum requests per minute during throttling
     MAX_BURST_SIZE = 10  # Maximum burst requests allowed
 
+    # Paged queries
+    PAGE_SIZE = 50  # AniList max perPage
+    PAGE_CONCURRENCY = 3  # Pages in flight at once (each still waits for the host bucket)
+
     def __init__(self, timeout: int = 30, retry_attempts: int = 3, retry_delay: int = 5):
         """
         Initialize AniList client with enhanced reliability features.
@@ -155,9 +166,12 @@ class AniListClient:
         self.retry_delay = retry_delay
         self.logger = logging.getLogger(__name__)
 
-        # Rate limiting
+        # Rate limiting: the per-host bucket is shared with every other
+        # client of the shared HTTP client, and retries on 429/5xx honour
+        # Retry-After there. request_timestamps only feeds the stats below.
+        self.rate_limiter = configure_rate_limit(self.API_URL, self.RATE_LIMIT, self.MAX_BURST_SIZE)
+        self.retry_policy = RetryPolicy(max_retries=max(retry_attempts - 1, 0), backoff=retry_delay)
         self.request_timestamps = []
-        self.rate_limit_lock = asyncio.Lock()
 
         # Adaptive rate limiting
         self.current_rate_limit = self.RATE_LIMIT
@@ -180,67 +194,55 @@ class AniListClient:
         self.total_response_time = 0.0
         self.last_request_time = None
 
-    async def _enforce_rate_limit(self):
-        """Enforce enhanced rate limiting with adaptive delays and dynamic adjustment."""
-        async with self.rate_limit_lock:
-            now = time.time()
-
-            # Adaptive rate limit adjustment
-            self._adjust_rate_limit_if_needed()
-
-            # Remove timestamps older than rate window
-            self.request_timestamps = [
-                ts for ts in self.request_timestamps if now - ts < self.RATE_WINDOW
-            ]
-
-            # Check if we're approaching the current rate limit
-            current_requests = len(self.request_timestamps)
-            effective_limit = min(self.current_rate_limit, self.RATE_LIMIT)
-
-            # Burst protection: detect rapid requests
-            recent_requests = [
-                ts for ts in self.request_timestamps if now - ts < 10
-            ]  # Last 10 seconds
-            if len(recent_requests) >= self.MAX_BURST_SIZE:
-                burst_delay = 2.0  # 2 second cooldown for burst protection
-                self.logger.debug(f"Burst protection: sleeping {burst_delay}s")
-                await asyncio.sleep(burst_delay)
-                now = time.time()
-
-            # Adaptive throttling: slow down as we approach the limit
-            if current_requests >= effective_limit * self.BURST_THRESHOLD:
-                throttle_factor = (current_requests - effective_limit * self.BURST_THRESHOLD) / (
-                    effective_limit * (1 - self.BURST_THRESHOLD)
-                )
-                adaptive_delay = min(throttle_factor * 3, 5)  # Max 5 second delay
-                if adaptive_delay > 0:
-                    self.logger.debug(
-                        f"Adaptive throttling: sleeping {adaptive_delay:.1f}s (current limit: {effective_limit})"
-                    )
-                    await asyncio.sleep(adaptive_delay)
-                    now = time.time()
-
-            # Hard limit enforcement
-            if current_requests >= effective_limit:
-                if self.request_timestamps:
-                    sleep_time = self.RATE_WINDOW - (now - self.request_timestamps[0]) + 1
-                    self.logger.info(
-                        f"Rate limit reached ({effective_limit}/min), sleeping for {sleep_time:.1f} seconds"
-                    )
-                    await asyncio.sleep(sleep_time)
+        # Pooled session of the shared HTTP client, held from the first
+        # request on the running event loop until close()
+        self.http = get_http_client()
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
 
-                    # Clean up old timestamps again
-                    now = time.time()
-                    self.request_timestamps = [
-                        ts for ts in self.request_timestamps if now - ts < self.RATE_WINDOW
-                    ]
+    async def __aenter__(self) -> "AniListClient":
+        await self._hold_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _hold_session(self):
+        """
+        Keep the shared session open on the running event loop until close().
+
+        A session is bound to the event loop it was created on, so a new one
+        is held when the client is reused from another asyncio.run() call.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            if self._session_loop is not None:
+                self.logger.debug("Event loop changed, holding a new shared HTTP session")
+            self._session_loop = loop
+            await self.http.acquire()
+
+    async def close(self):
+        """Release the shared HTTP session held by this client."""
+        loop, self._session_loop = self._session_loop, None
+        if loop is None:
+            return
+
+        try:
+            if loop is asyncio.get_running_loop():
+                await self.http.release()
+        except Exception as e:
+            self.logger.debug(f"Error while releasing AniList session: {e}")
 
-            # Record this request
-            self.request_timestamps.append(now)
-            self.last_request_time = now
+    def _record_request_time(self):
+        """Record a request for the rate limiting statistics."""
+        now = time.time()
+        self.request_timestamps = [
+            ts for ts in self.request_timestamps if now - ts < self.RATE_WINDOW
+        ]
+        self.request_timestamps.append(now)
+        self.last_request_time = now
 
     def _adjust_rate_limit_if_needed(self):
-        """Dynamically adjust rate limit based on error patterns."""
+        """Dynamically adjust the shared AniList rate limit based on error patterns."""
         now = time.time()
 
         # Only adjust if cooldown period has passed
@@ -275,10 +277,17 @@ class AniListClient:
                 self.last_rate_adjustment = now
                 self.consecutive_successes = 0
 
+        self.rate_limiter = configure_rate_limit(
+            self.API_URL, self.current_rate_limit, self.MAX_BURST_SIZE
+        )
+
     async def _make_request(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make GraphQL request to AniList API with circuit breaker and enhanced error handling.
 
+        The request goes through the shared HTTP client, which waits for the
+        AniList host's token bucket and retries connection errors and 429/5xx.
+
         Args:
             query: GraphQL query string
             variables: Query variables
@@ -295,88 +304,144 @@ class AniListClient:
         if not self.circuit_breaker.can_execute():
             raise CircuitBreakerOpen("Circuit breaker is open")
 
-        await self._enforce_rate_limit()
+        self._adjust_rate_limit_if_needed()
+        await self._hold_session()
 
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
         request_start_time = time.time()
-        last_exception = None
+        self._record_request_time()
 
-        for attempt in range(self.retry_attempts):
-            try:
-                connector = aiohttp.TCPConnector(
-                    limit=10,
-                    limit_per_host=5,
-                    ttl_dns_cache=300,
-                    use_dns_cache=True,
-                )
+        try:
+            response = await self.http.post(
+                self.API_URL, json=payload, timeout=self.timeout, retry=self.retry_policy
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.error_count += 1
+            self.consecutive_errors += 1
+            self.consecutive_successes = 0
+            api_error = AniListAPIError(
+                f"Request failed after {self.retry_policy.max_retries + 1} attempts: {e}"
+            )
+            self.circuit_breaker.record_failure(api_error)
+            raise api_error from e
 
-                timeout = aiohttp.ClientTimeout(
-                    total=self.timeout, connect=10, sock_read=self.timeout - 10
-                )
+        response_time = time.time() - request_start_time
+        self.total_response_time += response_time
+        self.request_count += 1
 
-                async with aiohttp.ClientSession(
-                    connector=connector,
-                    timeout=timeout,
-                    headers={"User-Agent": "MangaAnimeNotifier/1.0"},
-                ) as session:
-                    async with session.post(self.API_URL, json=payload) as response:
-                        response_time = time.time() - request_start_time
-                        self.total_response_time += response_time
-                        self.request_count += 1
-
-                        data = await response.json()
-
-                        if response.status == 429:
-                            rate_limit_error = RateLimitExceeded("Rate limit exceeded")
-                            self.circuit_breaker.record_failure(rate_limit_error)
-                            raise rate_limit_error
-
-                        if response.status != 200:
-                            api_error = AniListAPIError(f"HTTP {response.status}: {data}")
-                            self.circuit_breaker.record_failure(api_error)
-                            raise api_error
-
-                        if "errors" in data:
-                            api_error = AniListAPIError(f"GraphQL errors: {data['errors']}")
-                            self.circuit_breaker.record_failure(api_error)
-                            raise api_error
-
-                        # Success - record it
-                        self.circuit_breaker.record_success()
-                        self.consecutive_errors = 0
-                        self.consecutive_successes += 1
-
-                        if response_time > 5.0:
-                            self.logger.warning(f"Slow AniList API response: {response_time:.2f}s")
-
-                        return data.get("data", {})
-
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                last_exception = e
-                self.error_count += 1
-                self.consecutive_errors += 1
-                self.consecutive_successes = 0
-                self.logger.warning(f"Request attempt {attempt + 1} failed: {e}")
-
-                if attempt < self.retry_attempts - 1:
-                    # Exponential backoff with jitter
-                    backoff_delay = min(self.retry_delay * (2**attempt), 30)
-                    jitter = backoff_delay * 0.1 * (0.5 - time.time() % 1)  # ±10% jitter
-                    await asyncio.sleep(backoff_delay + jitter)
-                else:
-                    api_error = AniListAPIError(
-                        f"Request failed after {self.retry_attempts} attempts: {e}"
-                    )
-                    self.circuit_breaker.record_failure(api_error)
-                    raise api_error
+        if response.status == 429:
+            rate_limit_error = RateLimitExceeded("Rate limit exceeded")
+            self.circuit_breaker.record_failure(rate_limit_error)
+            raise rate_limit_error
+
+        if response.status != 200:
+            api_error = AniListAPIError(f"HTTP {response.status}: {response.text()}")
+            self.circuit_breaker.record_failure(api_error)
+            raise api_error
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            api_error = AniListAPIError(f"Invalid JSON response: {e}")
+            self.circuit_breaker.record_failure(api_error)
+            raise api_error
+
+        if "errors" in data:
+            api_error = AniListAPIError(f"GraphQL errors: {data['errors']}")
+            self.circuit_breaker.record_failure(api_error)
+            raise api_error
+
+        # Success - record it
+        self.circuit_breaker.record_success()
+        self.consecutive_errors = 0
+        self.consecutive_successes += 1
+
+        if response_time > 5.0:
+            self.logger.warning(f"Slow AniList API response: {response_time:.2f}s")
+
+        return data.get("data", {})
+
+    async def _fetch_pages(
+        self,
+        query: str,
+        variables: Optional[Dict] = None,
+        max_pages: int = 5,
+        per_page: int = PAGE_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch up to max_pages pages of a Page/media query and merge them in page order.
+
+        Page 1 is fetched first. Its pageInfo decides how many more pages are
+        needed, and those pages are then requested concurrently (at most
+        PAGE_CONCURRENCY in flight). Every request still waits for the
+        AniList token bucket, so the per-minute budget is respected. Paging
+        stops at the first page with hasNextPage == false or an empty media
+        list. If a later page fails, the pages before it are returned.
+
+        The query must accept $page and $perPage and should select
+        pageInfo { hasNextPage lastPage }. Without pageInfo, paging continues
+        until an empty page or max_pages.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables (page/perPage are filled in)
+            max_pages: Maximum number of pages to fetch
+            per_page: Page size
+
+        Returns:
+            Merged media list
+
+        Raises:
+            AniListAPIError: The first page could not be fetched
+        """
+        base_variables = dict(variables or {})
 
-        # Should never reach here, but just in case
-        api_error = AniListAPIError(f"Unexpected error in request handling: {last_exception}")
-        self.circuit_breaker.record_failure(api_error)
-        raise api_error
+        async def fetch_page(page: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+            data = await self._make_request(
+                query, {**base_variables, "page": page, "perPage": per_page}
+            )
+            page_data = data.get("Page") or {}
+            return page_data.get("media") or [], page_data.get("pageInfo") or {}
+
+        def is_last(media: List[Dict[str, Any]], page_info: Dict[str, Any]) -> bool:
+            return not media or page_info.get("hasNextPage") is False
+
+        first_media, first_info = await fetch_page(1)
+        pages: Dict[int, List[Dict[str, Any]]] = {1: first_media}
+        last_page = 1 if is_last(first_media, first_info) else max_pages
+        if first_info.get("lastPage"):
+            last_page = min(last_page, first_info["lastPage"])
+
+        if last_page > 1:
+            semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+
+            async def fetch_remaining(page: int):
+                nonlocal last_page
+                async with semaphore:
+                    # An earlier page may already have reported the end
+                    if page > last_page:
+                        return
+                    try:
+                        media, page_info = await fetch_page(page)
+                    except Exception as e:
+                        self.logger.error(f"Failed to fetch page {page}: {e}")
+                        last_page = min(last_page, page - 1)
+                        return
+                pages[page] = media
+                if is_last(media, page_info):
+                    last_page = min(last_page, page)
+
+            await asyncio.gather(*(fetch_remaining(page) for page in range(2, last_page + 1)))
+
+        merged = []
+        for page in range(1, last_page + 1):
+            if page not in pages:
+                break
+            merged.extend(pages[page])
+        return merged
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """
@@ -672,8 +737,12 @@ class AniListClient:
             List of AniListWork objects from the specified studio
         """
         graphql_query = """
-        query ($search: String, $perPage: Int) {
-            Page(perPage: $perPage) {
+        query ($search: String, $page: Int, $perPage: Int) {
+            Page(page: $page, perPage: $perPage) {
+                pageInfo {
+                    hasNextPage
+                    lastPage
+                }
                 media(search: $search, type: ANIME) {
                     id
                     title {
@@ -716,11 +785,13 @@ class AniListClient:
         """
 
         try:
-            data = await self._make_request(
-                graphql_query, {"search": studio_name, "perPage": min(limit, 50)}
+            media_list = await self._fetch_pages(
+                graphql_query,
+                {"search": studio_name},
+                max_pages=-(-limit // self.PAGE_SIZE),
+                per_page=min(limit, self.PAGE_SIZE),
             )
-
-            media_list = data.get("Page", {}).get("media", [])
+            media_list = media_list[:limit]
             results = []
 
             for media_data in media_list:
@@ -761,8 +832,12 @@ class AniListClient:
             List of AniListWork objects of the specified genre
         """
         graphql_query = """
-        query ($genre: String, $perPage: Int, $seasonYear: Int) {
-            Page(perPage: $perPage) {
+        query ($genre: String, $page: Int, $perPage: Int, $seasonYear: Int) {
+            Page(page: $page, perPage: $perPage) {
+                pageInfo {
+                    hasNextPage
+                    lastPage
+                }
                 media(genre: $genre, type: ANIME, seasonYear: $seasonYear) {
                     id
                     title {
@@ -807,12 +882,13 @@ class AniListClient:
         """
 
         try:
-            data = await self._make_request(
+            media_list = await self._fetch_pages(
                 graphql_query,
-                {"genre": genre, "perPage": min(limit, 50), "seasonYear": year},
+                {"genre": genre, "seasonYear": year},
+                max_pages=-(-limit // self.PAGE_SIZE),
+                per_page=min(limit, self.PAGE_SIZE),
             )
-
-            media_list = data.get("Page", {}).get("media", [])
+            media_list = media_list[:limit]
             results = []
 
             for media_data in media_list:
@@ -941,6 +1017,10 @@ class AniListClient:
         graphql_query = """
         query ($page: Int, $perPage: Int) {
             Page(page: $page, perPage: $perPage) {
+                pageInfo {
+                    hasNextPage
+                    lastPage
+                }
                 media(status: RELEASING, type: ANIME) {
                     id
                     title {
@@ -964,55 +1044,46 @@ class AniListClient:
         """
 
         upcoming_releases = []
-        page = 1
         max_pages = 5  # Limit to avoid excessive requests
 
-        while page <= max_pages:
-            try:
-                data = await self._make_request(graphql_query, {"page": page, "perPage": 50})
-                media_list = data.get("Page", {}).get("media", [])
-
-                if not media_list:
-                    break
-
-                cutoff_time = datetime.now().timestamp() + (days_ahead * 24 * 3600)
-
-                for media in media_list:
-                    next_episode = media.get("nextAiringEpisode")
-                    if not next_episode:
-                        continue
+        try:
+            media_list = await self._fetch_pages(graphql_query, max_pages=max_pages)
+        except Exception as e:
+            self.logger.error(f"Failed to get upcoming releases page 1: {e}")
+            media_list = []
 
-                    airing_at = next_episode.get("airingAt")
-                    if not airing_at or airing_at > cutoff_time:
-                        continue
+        cutoff_time = datetime.now().timestamp() + (days_ahead * 24 * 3600)
 
-                    title = (
-                        media.get("title", {}).get("english")
-                        or media.get("title", {}).get("romaji")
-                        or "Unknown"
-                    )
+        for media in media_list:
+            next_episode = media.get("nextAiringEpisode")
+            if not next_episode:
+                continue
 
-                    upcoming_releases.append(
-                        {
-                            "anilist_id": media.get("id"),
-                            "title": title,
-                            "episode_number": next_episode.get("episode"),
-                            "airing_at": airing_at,
-                            "airing_date": datetime.fromtimestamp(airing_at).date(),
-                            "site_url": media.get("siteUrl"),
-                            "streaming_platforms": [
-                                ep.get("site")
-                                for ep in media.get("streamingEpisodes", [])
-                                if ep.get("site")
-                            ],
-                        }
-                    )
+            airing_at = next_episode.get("airingAt")
+            if not airing_at or airing_at > cutoff_time:
+                continue
 
-                page += 1
+            title = (
+                media.get("title", {}).get("english")
+                or media.get("title", {}).get("romaji")
+                or "Unknown"
+            )
 
-            except Exception as e:
-                self.logger.error(f"Failed to get upcoming releases page {page}: {e}")
-                break
+            upcoming_releases.append(
+                {
+                    "anilist_id": media.get("id"),
+                    "title": title,
+                    "episode_number": next_episode.get("episode"),
+                    "airing_at": airing_at,
+                    "airing_date": datetime.fromtimestamp(airing_at).date(),
+                    "site_url": media.get("siteUrl"),
+                    "streaming_platforms": [
+                        ep.get("site")
+                        for ep in media.get("streamingEpisodes", [])
+                        if ep.get("site")
+                    ],
+                }
+            )
 
         # Sort by airing time
         upcoming_releases.sort(key=lambda x: x["airing_at"])
@@ -1108,6 +1179,10 @@ class AniListCollector:
         self.ng_genres = filter_config.get("ng_genres", [])
         self.exclude_tags = filter_config.get("exclude_tags", [])
 
+    async def close(self):
+        """Release the AniList client's HTTP session."""
+        await self.client.close()
+
     def _should_filter_work(self, anilist_work: AniListWork) -> bool:
         """
         Check if work should be filtered out based on NG keywords.
@@ -1268,7 +1343,10 @@ class AniListCollector:
         """
 
         async def _run():
-            await self.run_collection()
+            try:
+                await self.run_collection()
+            finally:
+                await self.close()
 
             # For now, return empty list as a placeholder
             # In a full implementation, this would return actual collected data
@@ -1381,8 +1459,8 @@ class AniListSession:
         return self.collector
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        # Cleanup if needed
-        pass
+        if self.collector is not None:
+            await self.collector.close()
 
 
 # Synchronous wrapper function for non-async environments
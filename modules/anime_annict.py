@@ -3,7 +3,7 @@
 Annict REST API v1 integration module for anime data collection.
 
 This module provides:
-- Annict REST API client with rate limiting
+- Annict REST API client (shared HTTP client with per-host rate limiting)
 - Anime data retrieval and normalization
 - Program/broadcast schedule information
 - Episode tracking
@@ -16,7 +16,6 @@ Rate Limits: 60 requests per minute (recommended)
 import asyncio
 import json
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 from datetime import datetime
@@ -24,6 +23,7 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from .http_client import RetryPolicy, configure_rate_limit, get_http_client
 from .models import DataSource, WorkType
 
 
@@ -31,26 +31,6 @@ class AnnictAPIError(Exception):
     """Custom exception for Annict API errors."""
 
 
-class RateLimiter:
-    """Simple rate limiter for API requests."""
-
-    def __init__(self, requests_per_minute: int = 60):
-        self.requests_per_minute = requests_per_minute
-        self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0
-
-    async def wait(self):
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-
 class AnnictAPIClient:
     """Annict REST API v1 client with rate limiting and error handling."""
 
@@ -60,8 +40,16 @@ class AnnictAPIClient:
         self.access_token = config.get("access_token") or config.get("api_key", "")
         self.timeout = config.get("timeout_seconds", 30)
         self.rate_limit_config = config.get("rate_limit", {})
-        self.rate_limiter = RateLimiter(self.rate_limit_config.get("requests_per_minute", 60))
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = configure_rate_limit(
+            self.base_url,
+            self.rate_limit_config.get("requests_per_minute", 60),
+            self.rate_limit_config.get("burst"),
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=self.rate_limit_config.get("max_retries", 3),
+            backoff=self.rate_limit_config.get("retry_delay_seconds", 5),
+        )
+        self.http = get_http_client()
         self.logger = logging.getLogger(__name__)
 
         if not self.access_token:
@@ -70,26 +58,21 @@ class AnnictAPIClient:
             )
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "User-Agent": "MangaAnime-Info-Delivery-System/1.0",
-        }
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout), headers=headers
-        )
+        """Async context manager entry (shares the pooled HTTP session)."""
+        await self.http.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.http.release()
 
     async def _make_request(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
-        Make a request to Annict API with rate limiting.
+        Make a request to Annict API through the shared HTTP client.
+
+        Rate limiting and retries on 429/5xx are handled by the client.
 
         Args:
             endpoint: API endpoint (e.g., '/works', '/programs')
@@ -101,30 +84,33 @@ class AnnictAPIClient:
         Raises:
             AnnictAPIError: If request fails
         """
-        await self.rate_limiter.wait()
-
         url = f"{self.base_url}{endpoint}"
 
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 401:
-                    raise AnnictAPIError(
-                        "Invalid access token. Please check your Annict API credentials."
-                    )
-                elif response.status == 404:
-                    raise AnnictAPIError(f"Endpoint not found: {endpoint}")
-                elif response.status != 200:
-                    error_text = await response.text()
-                    raise AnnictAPIError(
-                        f"API request failed with status {response.status}: {error_text}"
-                    )
-
-                data = await response.json()
-                return data
-
-        except aiohttp.ClientError as e:
+            response = await self.http.get(
+                url,
+                params=params,
+                headers={"Authorization": f"Bearer {self.access_token}"},
+                timeout=self.timeout,
+                retry=self.retry_policy,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise AnnictAPIError(f"Network error: {str(e)}")
 
+        if response.status == 401:
+            raise AnnictAPIError("Invalid access token. Please check your Annict API credentials.")
+        elif response.status == 404:
+            raise AnnictAPIError(f"Endpoint not found: {endpoint}")
+        elif response.status != 200:
+            raise AnnictAPIError(
+                f"API request failed with status {response.status}: {response.text()}"
+            )
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise AnnictAPIError(f"Invalid JSON response: {str(e)}")
+
     async def get_current_season_works(
         self,
         season: Optional[str] = None,
@@ -3,7 +3,7 @@
 Kitsu API integration module for anime and manga data collection.
 
 This module provides:
-- Kitsu REST API client with rate limiting
+- Kitsu REST API client (shared HTTP client with per-host rate limiting)
 - Anime and manga data retrieval and normalization
 - Streaming platform information extraction
 - Error handling and retry logic
@@ -15,14 +15,14 @@ Rate Limits: 90 requests per minute
 
 import asyncio
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
 
 import aiohttp
 
+from .http_client import RetryPolicy, configure_rate_limit, get_http_client
 from .models import DataSource, WorkType
 
 
@@ -30,26 +30,6 @@ class KitsuAPIError(Exception):
     """Custom exception for Kitsu API errors."""
 
 
-class RateLimiter:
-    """Simple rate limiter for API requests."""
-
-    def __init__(self, requests_per_minute: int = 90):
-        self.requests_per_minute = requests_per_minute
-        self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0
-
-    async def wait(self):
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-
 class KitsuAPIClient:
     """Kitsu API client with rate limiting and error handling."""
 
@@ -57,19 +37,58 @@ class KitsuAPIClient:
         self.base_url = config.get("base_url", "https://kitsu.io/api/edge")
         self.timeout = config.get("timeout_seconds", 30)
         self.rate_limit_config = config.get("rate_limit", {})
-        self.rate_limiter = RateLimiter(self.rate_limit_config.get("requests_per_minute", 90))
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = configure_rate_limit(
+            self.base_url,
+            self.rate_limit_config.get("requests_per_minute", 90),
+            self.rate_limit_config.get("burst"),
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=self.rate_limit_config.get("max_retries", 3),
+            backoff=self.rate_limit_config.get("retry_delay_seconds", 5),
+        )
+        self.http = get_http_client()
         self.logger = logging.getLogger(__name__)
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        """Async context manager entry (shares the pooled HTTP session)."""
+        await self.http.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.http.release()
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET a Kitsu endpoint through the shared HTTP client.
+
+        Rate limiting and retries on 429/5xx are handled by the client.
+
+        Raises:
+            KitsuAPIError: If the request fails
+        """
+        try:
+            response = await self.http.get(
+                f"{self.base_url}{path}",
+                params=params,
+                timeout=self.timeout,
+                retry=self.retry_policy,
+            )
+        except asyncio.TimeoutError:
+            self.logger.error("Kitsu API request timeout")
+            raise KitsuAPIError("Request timeout")
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Kitsu API request error: {str(e)}")
+            raise KitsuAPIError(f"Request failed: {str(e)}")
+
+        if response.status != 200:
+            self.logger.error(f"Kitsu API error: {response.status} - {response.text()}")
+            raise KitsuAPIError(f"API request failed with status {response.status}")
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise KitsuAPIError(f"Invalid JSON response: {str(e)}")
 
     async def get_seasonal_anime(
         self, season: str, year: int, limit: int = 20
@@ -85,8 +104,6 @@ class KitsuAPIClient:
         Returns:
             List of anime data dictionaries
         """
-        await self.rate_limiter.wait()
-
         # Calculate season dates
         season_start, season_end = self._get_season_dates(season, year)
 
@@ -97,27 +114,8 @@ class KitsuAPIClient:
             "sort": "-startDate",
         }
 
-        try:
-            async with self.session.get(f"{self.base_url}/anime", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_anime_list(data.get("data", []))
-                elif response.status == 429:
-                    self.logger.warning("Rate limit exceeded, waiting...")
-                    await asyncio.sleep(5)
-                    return await self.get_seasonal_anime(season, year, limit)
-                else:
-                    self.logger.error(
-                        f"Kitsu API error: {response.status} - {await response.text()}"
-                    )
-                    raise KitsuAPIError(f"API request failed with status {response.status}")
-
-        except asyncio.TimeoutError:
-            self.logger.error("Kitsu API request timeout")
-            raise KitsuAPIError("Request timeout")
-        except Exception as e:
-            self.logger.error(f"Kitsu API request error: {str(e)}")
-            raise KitsuAPIError(f"Request failed: {str(e)}")
+        data = await self._get("/anime", params)
+        return self._normalize_anime_list(data.get("data", []))
 
     async def get_trending_anime(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -129,24 +127,10 @@ class KitsuAPIClient:
         Returns:
             List of anime data dictionaries
         """
-        await self.rate_limiter.wait()
-
         params = {"page[limit]": limit, "sort": "-userCount"}
 
-        try:
-            async with self.session.get(
-                f"{self.base_url}/trending/anime", params=params
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_anime_list(data.get("data", []))
-                else:
-                    self.logger.error(f"Kitsu API error: {response.status}")
-                    raise KitsuAPIError(f"API request failed with status {response.status}")
-
-        except Exception as e:
-            self.logger.error(f"Kitsu API request error: {str(e)}")
-            raise KitsuAPIError(f"Request failed: {str(e)}")
+        data = await self._get("/trending/anime", params)
+        return self._normalize_anime_list(data.get("data", []))
 
     async def get_manga_updates(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -158,22 +142,10 @@ class KitsuAPIClient:
         Returns:
             List of manga data dictionaries
         """
-        await self.rate_limiter.wait()
-
         params = {"page[limit]": limit, "sort": "-updatedAt"}
 
-        try:
-            async with self.session.get(f"{self.base_url}/manga", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_manga_list(data.get("data", []))
-                else:
-                    self.logger.error(f"Kitsu API error: {response.status}")
-                    raise KitsuAPIError(f"API request failed with status {response.status}")
-
-        except Exception as e:
-            self.logger.error(f"Kitsu API request error: {str(e)}")
-            raise KitsuAPIError(f"Request failed: {str(e)}")
+        data = await self._get("/manga", params)
+        return self._normalize_manga_list(data.get("data", []))
 
     def _normalize_anime_list(self, anime_list: List[Dict]) -> List[Dict[str, Any]]:
         """Normalize anime data from Kitsu API format."""
@@ -16,7 +16,6 @@ API Documentation: https://docs.cal.syoboi.jp/spec/
 import asyncio
 import json
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 from dataclasses import dataclass, field
@@ -25,6 +24,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from .http_client import RetryPolicy, configure_rate_limit, get_http_client
 from .models import DataSource, Release, ReleaseType, Work, WorkType
 
 
@@ -76,6 +76,10 @@ class SyoboiCalendarClient:
     - Channel and time information
     - Automatic rate limiting
     - Error recovery with retry logic
+
+    Requests go through the shared HTTP client, so connections to
+    cal.syoboi.jp are pooled and kept alive. Use the client as an async
+    context manager to keep the pooled session open across several calls.
     """
 
     BASE_URL = "https://cal.syoboi.jp"
@@ -105,9 +109,10 @@ class SyoboiCalendarClient:
 
         self.logger = logging.getLogger(__name__)
 
-        # Rate limiting
-        self.request_times: List[float] = []
-        self.min_request_interval = 60.0 / requests_per_minute
+        # Rate limiting and retries (shared per host across clients)
+        self.rate_limiter = configure_rate_limit(self.BASE_URL, requests_per_minute)
+        self.retry_policy = RetryPolicy(max_retries=max_retries, backoff=retry_delay)
+        self.http = get_http_client()
 
         # Request statistics
         self.request_count = 0
@@ -119,91 +124,55 @@ class SyoboiCalendarClient:
             f"timeout={timeout}s, rate_limit={requests_per_minute}/min"
         )
 
-    async def _wait_for_rate_limit(self):
-        """Wait if necessary to respect rate limits."""
-        now = time.time()
-
-        # Clean up old request times
-        self.request_times = [t for t in self.request_times if now - t < 60]
-
-        # Check if rate limit reached
-        if len(self.request_times) >= self.requests_per_minute:
-            oldest_request = min(self.request_times)
-            wait_time = 60 - (now - oldest_request)
-
-            if wait_time > 0:
-                self.logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-                now = time.time()
+    async def __aenter__(self) -> "SyoboiCalendarClient":
+        """Keep the pooled HTTP session open while the client is in use."""
+        await self.http.acquire()
+        return self
 
-        # Record this request
-        self.request_times.append(now)
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.http.release()
 
-    async def _make_request(
-        self, endpoint: str, params: Dict[str, Any], retries: int = 0
-    ) -> Dict[str, Any]:
+    async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make API request with retry logic.
 
+        Rate limiting and exponential backoff are handled by the shared HTTP client.
+
         Args:
             endpoint: API endpoint path
             params: Query parameters
-            retries: Current retry attempt
 
         Returns:
             API response as dictionary
         """
-        await self._wait_for_rate_limit()
-
         url = f"{self.BASE_URL}{endpoint}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-                    self.request_count += 1
-
-                    if response.status == 200:
-                        content_type = response.headers.get("Content-Type", "")
-
-                        if "json" in content_type:
-                            data = await response.json()
-                        else:
-                            # Try to parse as JSON anyway
-                            text = await response.text()
-                            try:
-                                data = json.loads(text)
-                            except json.JSONDecodeError:
-                                # Return raw text in a dict
-                                data = {"raw_text": text}
-
-                        return data
-
-                    elif response.status == 429:  # Too Many Requests
-                        raise SyoboiRateLimitError("Rate limit exceeded")
-
-                    else:
-                        error_text = await response.text()
-                        raise SyoboiAPIError(
-                            f"API request failed: {response.status} - {error_text}"
-                        )
-
+            response = await self.http.get(
+                url, params=params, timeout=self.timeout, retry=self.retry_policy
+            )
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.error_count += 1
+            raise SyoboiAPIError(f"Request failed after {self.max_retries} retries: {e}")
 
-            if retries < self.max_retries:
-                wait_time = self.retry_delay * (2**retries)  # Exponential backoff
-                self.logger.warning(
-                    f"Request failed (attempt {retries + 1}/{self.max_retries}): {e}. "
-                    f"Retrying in {wait_time}s..."
-                )
-                await asyncio.sleep(wait_time)
-                return await self._make_request(endpoint, params, retries + 1)
+        self.request_count += 1
 
-            raise SyoboiAPIError(f"Request failed after {self.max_retries} retries: {e}")
+        if response.status == 200:
+            if "json" in response.headers.get("Content-Type", ""):
+                return response.json()
+
+            # Try to parse as JSON anyway
+            text = response.text()
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                # Return raw text in a dict
+                return {"raw_text": text}
+
+        elif response.status == 429:  # Too Many Requests
+            raise SyoboiRateLimitError("Rate limit exceeded")
+
+        raise SyoboiAPIError(f"API request failed: {response.status} - {response.text()}")
 
     async def get_recent_programs(
         self, days_ahead: int = 7, channels: Optional[List[str]] = None
@@ -517,8 +486,8 @@ async def fetch_syoboi_programs(days_ahead: int = 7, timeout: int = 15) -> List[
     Returns:
         List of broadcast programs
     """
-    client = SyoboiCalendarClient(timeout=timeout)
-    return await client.get_recent_programs(days_ahead)
+    async with SyoboiCalendarClient(timeout=timeout) as client:
+        return await client.get_recent_programs(days_ahead)
 
 
 async def search_syoboi_anime(title: str, timeout: int = 15) -> List[BroadcastProgram]:
@@ -532,8 +501,8 @@ async def search_syoboi_anime(title: str, timeout: int = 15) -> List[BroadcastPr
     Returns:
         List of matching programs
     """
-    client = SyoboiCalendarClient(timeout=timeout)
-    return await client.search_program_by_title(title)
+    async with SyoboiCalendarClient(timeout=timeout) as client:
+        return await client.search_program_by_title(title)
 
 
 async def fetch_syoboi_works_and_releases(
@@ -549,8 +518,8 @@ async def fetch_syoboi_works_and_releases(
     Returns:
         Tuple of (works, releases)
     """
-    client = SyoboiCalendarClient(timeout=timeout)
-    return await client.fetch_and_convert(days_ahead)
+    async with SyoboiCalendarClient(timeout=timeout) as client:
+        return await client.fetch_and_convert(days_ahead)
 
 
 # Synchronous wrapper for non-async contexts
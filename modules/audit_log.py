@@ -9,7 +9,7 @@ logger = logging.getLogger(__name__)
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class AuditEventType(Enum):
@@ -119,10 +119,18 @@ class AuditLogger:
         event_type: Optional[AuditEventType] = None,
         user_id: Optional[str] = None,
         success: Optional[bool] = None,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[AuditLog]:
-        """ログを取得（フィルタ可能）"""
+        """ログを取得（フィルタ可能）
+
+        before に (timestamp, id) を渡すと、それより古いログだけを返す
+        （前ページ最終行を起点にしたカーソル方式のページング用）。
+        """
         filtered_logs = self._logs
 
+        if before is not None:
+            filtered_logs = [log for log in filtered_logs if (log.timestamp, log.id) < before]
+
         # フィルタ適用
         if event_type:
             filtered_logs = [log for log in filtered_logs if log.event_type == event_type]
@@ -133,8 +141,8 @@ class AuditLogger:
         if success is not None:
             filtered_logs = [log for log in filtered_logs if log.success == success]
 
-        # 最新順でlimit件を返す
-        return sorted(filtered_logs, key=lambda x: x.timestamp, reverse=True)[:limit]
+        # 最新順でlimit件を返す（同時刻はID降順）
+        return sorted(filtered_logs, key=lambda x: (x.timestamp, x.id), reverse=True)[:limit]
 
     def get_recent_failures(
         self, username: Optional[str] = None, limit: int = 10
@@ -10,9 +10,10 @@ logger = logging.getLogger(__name__)
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from modules.audit_log import AuditEventType, AuditLog
+from modules.pagination import keyset_condition
 
 
 class AuditLoggerDB:
@@ -79,11 +80,23 @@ class AuditLoggerDB:
         event_type: Optional[AuditEventType] = None,
         user_id: Optional[str] = None,
         success: Optional[bool] = None,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[AuditLog]:
-        """ログを取得（フィルタ可能）"""
+        """ログを取得（フィルタ可能）
+
+        before に (timestamp, id) を渡すと、それより古いログだけを返す
+        （前ページ最終行を起点にしたカーソル方式のページング用）。
+        """
         query = "SELECT * FROM audit_logs WHERE 1=1"
         params = []
 
+        if before is not None:
+            condition, condition_params = keyset_condition(
+                [("timestamp", True), ("id", True)], [before[0].isoformat(" "), before[1]]
+            )
+            query += f" AND {condition}"
+            params.extend(condition_params)
+
         if event_type:
             query += " AND event_type = ?"
             params.append(event_type.value)
@@ -96,7 +109,7 @@ class AuditLoggerDB:
             query += " AND success = ?"
             params.append(1 if success else 0)
 
-        query += " ORDER BY timestamp DESC LIMIT ?"
+        query += " ORDER BY timestamp DESC, id DESC LIMIT ?"
         params.append(limit)
 
         with self.get_connection() as conn:
@@ -252,6 +252,7 @@ class BackendValidator:
         with db.get_connection() as conn:
             conn.execute("DELETE FROM releases WHERE id = ?", (release_id,))
             conn.execute("DELETE FROM works WHERE id = ?", (work_id,))
+        db.invalidate_work_cache(work_id)
 
         return {
             "work_created": True,
@@ -290,6 +291,7 @@ class BackendValidator:
         with db.get_connection() as conn:
             for work_id in work_ids:
                 conn.execute("DELETE FROM works WHERE id = ?", (work_id,))
+        db.invalidate_work_cache()
 
         return {
             "operations_count": operations,
@@ -334,6 +336,7 @@ class BackendValidator:
         with db.get_connection() as conn:
             conn.execute("DELETE FROM releases WHERE work_id = ?", (work_id,))
             conn.execute("DELETE FROM works WHERE id = ?", (work_id,))
+        db.invalidate_work_cache(work_id)
 
         return {
             "database_stats": stats,
@@ -376,40 +379,38 @@ class BackendValidator:
 
     async def _test_anilist_connectivity(self) -> Dict[str, Any]:
         """Test AniList API connectivity."""
-        client = AniListClient(timeout=10, retry_attempts=1)
-
-        try:
-            # Simple query that should return results
-            anime_list = await client.search_anime(query="Naruto", limit=1)
+        async with AniListClient(timeout=10, retry_attempts=1) as client:
+            try:
+                # Simple query that should return results
+                anime_list = await client.search_anime(query="Naruto", limit=1)
 
-            perf_stats = client.get_performance_stats()
+                perf_stats = client.get_performance_stats()
 
-            return {
-                "api_accessible": True,
-                "results_count": len(anime_list),
-                "performance_stats": perf_stats,
-            }
-        except Exception as e:
-            # API might be down or blocked, but we can still test client functionality
-            return {
-                "api_accessible": False,
-                "error_handled": True,
-                "error_type": type(e).__name__,
-            }
+                return {
+                    "api_accessible": True,
+                    "results_count": len(anime_list),
+                    "performance_stats": perf_stats,
+                }
+            except Exception as e:
+                # API might be down or blocked, but we can still test client functionality
+                return {
+                    "api_accessible": False,
+                    "error_handled": True,
+                    "error_type": type(e).__name__,
+                }
 
     async def _test_anilist_rate_limiting(self) -> Dict[str, Any]:
         """Test AniList rate limiting functionality."""
-        client = AniListClient(timeout=5, retry_attempts=1)
-
         start_time = time.time()
         request_count = self.test_config["anilist"]["test_queries"]
 
-        for i in range(request_count):
-            try:
-                await client.search_anime(query=f"Test{i}", limit=1)
-                await asyncio.sleep(0.1)  # Small delay between requests
-            except Exception:
-                pass  # Expected for rate limiting tests
+        async with AniListClient(timeout=5, retry_attempts=1) as client:
+            for i in range(request_count):
+                try:
+                    await client.search_anime(query=f"Test{i}", limit=1)
+                    await asyncio.sleep(0.1)  # Small delay between requests
+                except Exception:
+                    pass  # Expected for rate limiting tests
 
         total_time = time.time() - start_time
         perf_stats = client.get_performance_stats()
@@ -432,15 +433,16 @@ class BackendValidator:
         failure_count = 0
         circuit_breaker_triggered = False
 
-        for i in range(10):
-            try:
-                await client._make_request("{ __typename }")  # Simple query
-                await asyncio.sleep(0.05)
-            except CircuitBreakerOpen:
-                circuit_breaker_triggered = True
-                break
-            except Exception:
-                failure_count += 1
+        async with client:
+            for i in range(10):
+                try:
+                    await client._make_request("{ __typename }")  # Simple query
+                    await asyncio.sleep(0.05)
+                except CircuitBreakerOpen:
+                    circuit_breaker_triggered = True
+                    break
+                except Exception:
+                    failure_count += 1
 
         perf_stats = client.get_performance_stats()
 
@@ -815,6 +817,7 @@ class BackendValidator:
         for work_id in created_work_ids:
             with db.get_connection() as conn:
                 conn.execute("DELETE FROM works WHERE id = ?", (work_id,))
+        db.invalidate_work_cache()
 
         return {
             "integration_results": results,
@@ -892,6 +895,7 @@ class BackendValidator:
             with db.get_connection() as conn:
                 conn.execute("DELETE FROM releases WHERE work_id = ?", (work_id,))
                 conn.execute("DELETE FROM works WHERE id = ?", (work_id,))
+        db.invalidate_work_cache()
 
         return {
             "input_items": len(mock_anime_data),
@@ -19,11 +19,12 @@ import hashlib
 import json
 import logging
 import pickle
+import threading
 
 logger = logging.getLogger(__name__)
 import time
 from collections import OrderedDict
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, Optional
 
 try:
     import redis.asyncio as aioredis
@@ -31,68 +32,85 @@ try:
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
-    logging.warning("redis package not installed. Using memory cache fallback.")
+    # 実際に接続を試みる CacheManager.connect() で警告するため、import 時は debug に留める
+    logger.debug("redis package not installed. Using memory cache fallback.")
 
 
 class MemoryCache:
     """
     メモリベースのLRUキャッシュ（Redis未接続時のフォールバック）
+
+    スレッドセーフ。上限を超えた場合は最も古いエントリを1件ずつ追い出す。
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = None):
         """
         初期化
 
         Args:
             max_size: 最大キャッシュサイズ
+            default_ttl: set() で ttl 未指定時に使うTTL（秒、None で無期限）
         """
         self.cache: OrderedDict = OrderedDict()
         self.max_size = max_size
+        self.default_ttl = default_ttl
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """キャッシュから取得"""
-        if key not in self.cache:
-            self.misses += 1
-            return None
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
 
-        value, expire_time = self.cache[key]
+            value, expire_time = entry
 
-        # TTL チェック
-        if expire_time and time.time() > expire_time:
-            del self.cache[key]
-            self.misses += 1
-            return None
+            # TTL チェック
+            if expire_time and time.time() > expire_time:
+                del self.cache[key]
+                self.misses += 1
+                return None
 
-        # LRU: 最近使用したものを末尾に移動
-        self.cache.move_to_end(key)
-        self.hits += 1
-        return value
+            # LRU: 最近使用したものを末尾に移動
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return value
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
         """キャッシュに設定"""
+        ttl = ttl if ttl is not None else self.default_ttl
         expire_time = time.time() + ttl if ttl else None
 
-        if key in self.cache:
-            self.cache.move_to_end(key)
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
 
-        self.cache[key] = (value, expire_time)
+            self.cache[key] = (value, expire_time)
 
-        # 最大サイズを超えたら最も古いものを削除
-        if len(self.cache) > self.max_size:
-            self.cache.popitem(last=False)
+            # 最大サイズを超えたら最も古いものを削除
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+                self.evictions += 1
 
-    def delete(self, key: str):
+    def delete(self, key: Hashable):
         """キャッシュから削除"""
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            self.cache.pop(key, None)
 
     def clear(self):
         """全キャッシュクリア"""
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
+        with self._lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     def get_stats(self) -> Dict[str, Any]:
         """キャッシュ統計"""
@@ -105,6 +123,7 @@ class MemoryCache:
             "max_size": self.max_size,
             "hits": self.hits,
             "misses": self.misses,
+            "evictions": self.evictions,
             "hit_rate": f"{hit_rate:.2f}%",
         }
 
@@ -0,0 +1,123 @@
+"""
+カレンダー表示用の月別リリースデータ
+
+カレンダー画面と月別APIが使う「日付ごとのリリース一覧」を組み立てる。
+
+- month_range: 年月を半開区間 [月初, 翌月初) の日付文字列に変換
+  （strftime で列を加工しないため event_date / release_date のインデックスが効く）
+- get_month_releases: 1か月分の releases_by_date を (年, 月) 単位でキャッシュして返す。
+  キャッシュはデータバージョン（modules.db.read_data_version）が変わると破棄されるため、
+  収集処理が別プロセスで書き込んだ場合も次の参照で作り直される
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from modules.cache import MemoryCache
+from modules.db import read_data_version
+
+# 保持する月数。前後の月を行き来する程度なら十分
+MONTH_CACHE_SIZE = 48
+
+_month_cache = MemoryCache(max_size=MONTH_CACHE_SIZE, default_ttl=24 * 3600)
+
+# calendar_events（同期済みイベント）を優先し、無ければ releases から組み立てる
+_CALENDAR_EVENTS_QUERY = """
+    SELECT ce.id, ce.release_id, ce.event_title AS title, w.title AS original_title,
+           w.type, r.release_type, r.number, r.platform,
+           ce.event_date AS release_date, r.source_url, ce.description
+    FROM calendar_events ce
+    JOIN works w ON ce.work_id = w.id
+    LEFT JOIN releases r ON ce.release_id = r.id
+    WHERE ce.event_date >= ? AND ce.event_date < ?
+    ORDER BY ce.event_date, w.title
+"""
+
+_RELEASES_QUERY = """
+    SELECT NULL AS id, r.id AS release_id, w.title AS title, w.title AS original_title,
+           w.type, r.release_type, r.number, r.platform,
+           r.release_date, r.source_url, NULL AS description
+    FROM releases r
+    JOIN works w ON r.work_id = w.id
+    WHERE r.release_date >= ? AND r.release_date < ?
+    ORDER BY r.release_date, w.title
+"""
+
+
+def month_range(year: int, month: int) -> Tuple[str, str]:
+    """
+    年月を半開区間の日付文字列に変換
+
+    Args:
+        year: 年
+        month: 月（1〜12）
+
+    Returns:
+        Tuple[str, str]: (月初, 翌月初)。``col >= start AND col < end`` で使う
+    """
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start.isoformat(), end.isoformat()
+
+
+def load_month_releases(conn, year: int, month: int) -> Dict[str, Any]:
+    """
+    1か月分のリリースを日付ごとにまとめる（キャッシュなし）
+
+    Args:
+        conn: データベース接続（row_factory は sqlite3.Row）
+        year: 年
+        month: 月
+
+    Returns:
+        Dict[str, Any]: source（"calendar_events" または "releases"）、
+        releases_by_date（日付 -> リリースのリスト）、total（件数）
+    """
+    bounds = month_range(year, month)
+    source = "calendar_events"
+    rows = conn.execute(_CALENDAR_EVENTS_QUERY, bounds).fetchall()
+    if not rows:
+        source = "releases"
+        rows = conn.execute(_RELEASES_QUERY, bounds).fetchall()
+
+    releases_by_date: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        releases_by_date.setdefault(row["release_date"], []).append(dict(row))
+
+    return {"source": source, "releases_by_date": releases_by_date, "total": len(rows)}
+
+
+def get_month_releases(
+    conn, year: int, month: int, cache_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    1か月分のリリースをキャッシュ付きで取得
+
+    返り値はキャッシュと共有されるため、呼び出し側で変更しないこと。
+
+    Args:
+        conn: データベース接続
+        year: 年
+        month: 月
+        cache_key: データベースを識別するキー（パスなど）。複数DBを扱う場合に指定
+
+    Returns:
+        Dict[str, Any]: load_month_releases と同じ形式
+    """
+    version = read_data_version(conn)
+    if version is None:
+        return load_month_releases(conn, year, month)
+
+    key = (cache_key, year, month)
+    cached = _month_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = load_month_releases(conn, year, month)
+    _month_cache.set(key, (version, data))
+    return data
+
+
+def clear_month_cache():
+    """月別キャッシュを破棄"""
+    _month_cache.clear()
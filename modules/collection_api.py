@@ -24,11 +24,12 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .anime_anilist import AniListCollector
 from .data_normalizer import DataIntegrator, DataQualityAnalyzer, analyze_data_quality
 from .db import get_db
+from .event_bus import publish_event
 from .manga_rss import BookWalkerRSSCollector, DAnimeRSSCollector, MangaRSSCollector
 from .models import Work
 
@@ -432,33 +433,29 @@ class CollectionManager:
         try:
             job.status = CollectionStatus.RUNNING
             self.logger.info(f"Running collection job {job.job_id}")
+            publish_event(
+                "collection.job_started",
+                {
+                    "job_id": job.job_id,
+                    "collection_type": job.collection_type.value,
+                    "sources": job.sources,
+                },
+            )
 
             results = {}
 
             # Run collectors based on job type and sources
             if job.collection_type == CollectionType.ANILIST_ONLY or "anilist" in job.sources:
-                if job.status != CollectionStatus.CANCELLED:
-                    anilist_result = self._run_anilist_collection(job)
-                    results["anilist"] = anilist_result
-                    job.progress += 0.5
+                self._run_source(job, results, "anilist", self._run_anilist_collection, 0.5)
 
             if job.collection_type == CollectionType.RSS_ONLY or "rss" in job.sources:
-                if job.status != CollectionStatus.CANCELLED:
-                    rss_result = self._run_rss_collection(job)
-                    results["rss"] = rss_result
-                    job.progress += 0.3
+                self._run_source(job, results, "rss", self._run_rss_collection, 0.3)
 
             if "bookwalker" in job.sources:
-                if job.status != CollectionStatus.CANCELLED:
-                    bw_result = self._run_bookwalker_collection(job)
-                    results["bookwalker"] = bw_result
-                    job.progress += 0.1
+                self._run_source(job, results, "bookwalker", self._run_bookwalker_collection, 0.1)
 
             if "danime" in job.sources:
-                if job.status != CollectionStatus.CANCELLED:
-                    danime_result = self._run_danime_collection(job)
-                    results["danime"] = danime_result
-                    job.progress += 0.1
+                self._run_source(job, results, "danime", self._run_danime_collection, 0.1)
 
             if job.status == CollectionStatus.CANCELLED:
                 self.logger.info(f"Collection job {job.job_id} was cancelled")
@@ -498,11 +495,78 @@ class CollectionManager:
                 if len(self.job_history) > 100:
                     self.job_history = self.job_history[-50:]
 
+            publish_event(
+                "collection.job_finished",
+                {
+                    "job_id": job.job_id,
+                    "status": job.status.value,
+                    "progress": job.progress,
+                    "collected_items": job.collected_items,
+                    "filtered_items": job.filtered_items,
+                    "errors": job.errors,
+                    "duration_seconds": (
+                        (job.completed_at or datetime.now()) - job.started_at
+                    ).total_seconds(),
+                },
+            )
+
+    def _run_source(
+        self,
+        job: CollectionJob,
+        results: Dict[str, Any],
+        source: str,
+        runner: Callable[[CollectionJob], Dict[str, Any]],
+        weight: float,
+    ):
+        """
+        Run one source of a job and publish its timing and the job progress.
+
+        Args:
+            job: Collection job being run
+            results: Per-source results of the job (updated in place)
+            source: Source name
+            runner: Collection method for the source
+            weight: Progress added when the source finishes
+        """
+        if job.status == CollectionStatus.CANCELLED:
+            return
+
+        source_start = time.time()
+        result = runner(job)
+        results[source] = result
+        job.progress += weight
+
+        publish_event(
+            "collection.source_completed",
+            {
+                "job_id": job.job_id,
+                "source": source,
+                "duration_seconds": time.time() - source_start,
+                "items": result.get("items_collected", result.get("works_collected", 0)),
+                "error": result.get("error"),
+            },
+        )
+        publish_event(
+            "collection.progress",
+            {
+                "job_id": job.job_id,
+                "progress": job.progress,
+                "collected_items": job.collected_items,
+            },
+        )
+
     def _run_anilist_collection(self, job: CollectionJob) -> Dict[str, Any]:
         """Run AniList collection."""
         try:
             self.logger.info(f"Running AniList collection for job {job.job_id}")
-            result = asyncio.run(self.anilist_collector.run_collection())
+
+            async def _collect():
+                try:
+                    return await self.anilist_collector.run_collection()
+                finally:
+                    await self.anilist_collector.close()
+
+            result = asyncio.run(_collect())
 
             job.collected_items += result.get("works_collected", 0)
             job.filtered_items += result.get("works_filtered", 0)
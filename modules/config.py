@@ -91,6 +91,11 @@ class RSSConfig:
     user_agent: str = "MangaAnimeNotifier/1.0 (https://github.com/user/manga-anime-notifier)"
     feeds: List[FeedConfig] = field(default_factory=list)
     max_parallel_workers: int = 5
+    parse_workers: int = 2
+    adaptive_polling: bool = True
+    poll_min_interval_seconds: int = 3600
+    poll_max_interval_seconds: int = 43200
+    poll_max_backoff_seconds: int = 86400
     stats: dict = field(default_factory=dict)
 
     def __post_init__(self):
@@ -11,11 +11,15 @@ This module extends data_normalizer.py with:
 """
 
 import logging
+import math
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import jellyfish  # For phonetic matching (install: pip install jellyfish)
 
@@ -57,6 +61,89 @@ class MergeStrategy:
     merge_metadata: bool = True
 
 
+class _TitleFeatures:
+    """Per-title values computed once and reused for every pair the title is part of."""
+
+    __slots__ = (
+        "text",
+        "lower",
+        "norm",
+        "norm_lower",
+        "is_latin",
+        "_metaphone",
+        "_has_metaphone",
+        "_lower_counts",
+        "_norm_counts",
+    )
+
+    def __init__(self, text: str, norm: str, is_latin: bool):
+        self.text = text
+        self.lower = text.lower()
+        self.norm = norm
+        self.norm_lower = norm.lower()
+        self.is_latin = is_latin
+        self._metaphone: Optional[str] = None
+        self._has_metaphone = False
+        self._lower_counts: Optional[Counter] = None
+        self._norm_counts: Optional[Counter] = None
+
+    @property
+    def metaphone(self) -> Optional[str]:
+        """Metaphone code, or None if jellyfish cannot encode the title."""
+        if not self._has_metaphone:
+            try:
+                self._metaphone = jellyfish.metaphone(self.text)
+            except Exception:
+                self._metaphone = None
+            self._has_metaphone = True
+        return self._metaphone
+
+    @property
+    def lower_counts(self) -> Counter:
+        """Character counts of the lower-cased title."""
+        if self._lower_counts is None:
+            self._lower_counts = Counter(self.lower)
+        return self._lower_counts
+
+    @property
+    def norm_counts(self) -> Counter:
+        """Character counts of the lower-cased normalized title."""
+        if self._norm_counts is None:
+            self._norm_counts = Counter(self.norm_lower)
+        return self._norm_counts
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+# Work-level features: (title, title_en, title_kana)
+_WorkFeatures = Tuple[Optional[_TitleFeatures], Optional[_TitleFeatures], Optional[_TitleFeatures]]
+
+# Process pool worker state for find_duplicates_in_list(processes=...)
+_BULK_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_bulk_worker(detector, works, features, algorithm):
+    """Process pool initializer: receive the shared inputs once per worker."""
+    _BULK_WORKER_STATE.update(
+        detector=detector, works=works, features=features, algorithm=algorithm
+    )
+
+
+def _score_pair_chunk(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int, Any]]:
+    """Score a chunk of candidate pairs inside a pool worker."""
+    detector = _BULK_WORKER_STATE["detector"]
+    works = _BULK_WORKER_STATE["works"]
+    features = _BULK_WORKER_STATE["features"]
+    algorithm = _BULK_WORKER_STATE["algorithm"]
+
+    return detector._score_pairs(works, features, pairs, algorithm)
+
+
 class EnhancedDuplicateDetector:
     """
     Enhanced duplicate work detection with multiple algorithms.
@@ -68,8 +155,12 @@ class EnhancedDuplicateDetector:
     - Phonetic matching (Metaphone, Soundex)
     - Hybrid multi-algorithm approach
     - Confidence scoring
+    - Bulk mode: per-work normalization and candidate indexing for large lists
     """
 
+    # Minimum number of candidate pairs before a process pool is worth its startup cost
+    PROCESS_POOL_MIN_PAIRS = 5000
+
     def __init__(
         self,
         exact_threshold: float = 1.0,
@@ -117,56 +208,82 @@ class EnhancedDuplicateDetector:
         if not title1 or not title2:
             return 0.0
 
+        return self._similarity_from_features(
+            self._title_features(title1), self._title_features(title2), algorithm
+        )
+
+    def _title_features(self, title: Optional[str]) -> Optional[_TitleFeatures]:
+        """Normalize a title once for repeated comparisons."""
+        if not title:
+            return None
+        return _TitleFeatures(
+            title,
+            self.title_normalizer.normalize_title(title, NormalizationLevel.STRICT),
+            self._is_latin_script(title),
+        )
+
+    def _work_features(self, work: Work) -> _WorkFeatures:
+        """Title features for the title fields compared by detect_duplicate."""
+        return (
+            self._title_features(work.title),
+            self._title_features(work.title_en),
+            self._title_features(work.title_kana),
+        )
+
+    def _similarity_from_features(
+        self,
+        features1: Optional[_TitleFeatures],
+        features2: Optional[_TitleFeatures],
+        algorithm: MatchAlgorithm,
+    ) -> float:
+        """Title similarity computed from pre-normalized features."""
+        if features1 is None or features2 is None:
+            return 0.0
+
         if algorithm == MatchAlgorithm.EXACT:
-            return 1.0 if title1 == title2 else 0.0
+            return 1.0 if features1.text == features2.text else 0.0
 
         elif algorithm == MatchAlgorithm.NORMALIZED:
-            norm1 = self.title_normalizer.normalize_title(title1, NormalizationLevel.STRICT)
-            norm2 = self.title_normalizer.normalize_title(title2, NormalizationLevel.STRICT)
-            return 1.0 if norm1 == norm2 else 0.0
+            return 1.0 if features1.norm == features2.norm else 0.0
 
         elif algorithm == MatchAlgorithm.FUZZY:
             # Use Levenshtein distance ratio
-            return SequenceMatcher(None, title1.lower(), title2.lower()).ratio()
+            return SequenceMatcher(None, features1.lower, features2.lower).ratio()
 
         elif algorithm == MatchAlgorithm.PHONETIC:
             # Use phonetic matching (for English/Romaji)
-            try:
-                metaphone1 = jellyfish.metaphone(title1)
-                metaphone2 = jellyfish.metaphone(title2)
-                return 1.0 if metaphone1 == metaphone2 else 0.0
-            except:
+            metaphone1 = features1.metaphone
+            metaphone2 = features2.metaphone
+            if metaphone1 is None or metaphone2 is None:
                 return 0.0
+            return 1.0 if metaphone1 == metaphone2 else 0.0
 
         elif algorithm == MatchAlgorithm.HYBRID:
             # Combine multiple algorithms
             scores = []
 
             # Exact match
-            if title1 == title2:
+            if features1.text == features2.text:
                 return 1.0
 
             # Normalized match
-            norm1 = self.title_normalizer.normalize_title(title1, NormalizationLevel.STRICT)
-            norm2 = self.title_normalizer.normalize_title(title2, NormalizationLevel.STRICT)
-            if norm1 == norm2:
+            if features1.norm == features2.norm:
                 scores.append(1.0)
             else:
                 # Fuzzy on normalized
-                scores.append(SequenceMatcher(None, norm1.lower(), norm2.lower()).ratio())
+                scores.append(
+                    SequenceMatcher(None, features1.norm_lower, features2.norm_lower).ratio()
+                )
 
             # Fuzzy on original
-            scores.append(SequenceMatcher(None, title1.lower(), title2.lower()).ratio())
+            scores.append(SequenceMatcher(None, features1.lower, features2.lower).ratio())
 
             # Phonetic (if applicable)
-            try:
-                if self._is_latin_script(title1) and self._is_latin_script(title2):
-                    metaphone1 = jellyfish.metaphone(title1)
-                    metaphone2 = jellyfish.metaphone(title2)
-                    if metaphone1 == metaphone2:
-                        scores.append(1.0)
-            except:
-                pass
+            if features1.is_latin and features2.is_latin:
+                metaphone1 = features1.metaphone
+                metaphone2 = features2.metaphone
+                if metaphone1 is not None and metaphone2 is not None and metaphone1 == metaphone2:
+                    scores.append(1.0)
 
             # Return weighted average
             if scores:
@@ -205,21 +322,30 @@ class EnhancedDuplicateDetector:
         if work1.work_type != work2.work_type:
             return None
 
+        return self._match_from_features(
+            work1, work2, self._work_features(work1), self._work_features(work2), algorithm
+        )
+
+    def _match_from_features(
+        self,
+        work1: Work,
+        work2: Work,
+        features1: _WorkFeatures,
+        features2: _WorkFeatures,
+        algorithm: MatchAlgorithm,
+    ) -> Optional[DuplicateMatch]:
+        """detect_duplicate body, using title features computed ahead of time."""
         # Calculate title similarity
-        title_sim = self.calculate_title_similarity(work1.title, work2.title, algorithm)
+        title_sim = self._similarity_from_features(features1[0], features2[0], algorithm)
 
         # Check alternate titles if available
         max_title_sim = title_sim
 
-        if work1.title_en and work2.title_en:
-            en_sim = self.calculate_title_similarity(work1.title_en, work2.title_en, algorithm)
-            max_title_sim = max(max_title_sim, en_sim)
-
-        if work1.title_kana and work2.title_kana:
-            kana_sim = self.calculate_title_similarity(
-                work1.title_kana, work2.title_kana, algorithm
-            )
-            max_title_sim = max(max_title_sim, kana_sim)
+        for alt1, alt2 in zip(features1[1:], features2[1:]):
+            if alt1 is not None and alt2 is not None:
+                max_title_sim = max(
+                    max_title_sim, self._similarity_from_features(alt1, alt2, algorithm)
+                )
 
         # Calculate metadata similarity
         metadata_sim = self._calculate_metadata_similarity(work1, work2)
@@ -289,29 +415,293 @@ class EnhancedDuplicateDetector:
         return similarity_score / factors if factors > 0 else 0.0
 
     def find_duplicates_in_list(
-        self, works: List[Work], algorithm: MatchAlgorithm = MatchAlgorithm.HYBRID
+        self,
+        works: List[Work],
+        algorithm: MatchAlgorithm = MatchAlgorithm.HYBRID,
+        bulk: bool = True,
+        processes: Optional[int] = None,
     ) -> List[DuplicateMatch]:
         """
         Find all duplicates in a list of works.
 
+        In bulk mode each work is normalized once and only candidate pairs
+        that can reach fuzzy_threshold are scored. The result is the same as
+        comparing every pair.
+
         Args:
             works: List of works to check
             algorithm: Matching algorithm
+            bulk: Use per-work normalization and candidate indexing
+            processes: Worker processes for scoring candidates (None/1 = in-process)
 
         Returns:
             List of duplicate matches
         """
-        duplicates = []
+        if not bulk:
+            duplicates = []
+
+            for i in range(len(works)):
+                for j in range(i + 1, len(works)):
+                    match = self.detect_duplicate(works[i], works[j], algorithm)
+                    if match:
+                        duplicates.append(match)
+
+            self.logger.info(f"Found {len(duplicates)} duplicate pairs in {len(works)} works")
+            return duplicates
+
+        features = [self._work_features(work) for work in works]
+        pairs = self._candidate_pairs(works, features, algorithm)
 
-        for i in range(len(works)):
-            for j in range(i + 1, len(works)):
-                match = self.detect_duplicate(works[i], works[j], algorithm)
-                if match:
-                    duplicates.append(match)
+        if processes is None or processes <= 1 or len(pairs) < self.PROCESS_POOL_MIN_PAIRS:
+            scored = self._score_pairs(works, features, pairs, algorithm)
+        else:
+            scored = self._score_pairs_in_pool(works, features, pairs, algorithm, processes)
+
+        duplicates = [match for _, _, match in sorted(scored, key=lambda item: item[:2])]
 
-        self.logger.info(f"Found {len(duplicates)} duplicate pairs in {len(works)} works")
+        self.logger.info(
+            f"Found {len(duplicates)} duplicate pairs in {len(works)} works "
+            f"({len(pairs)} candidate pairs scored)"
+        )
         return duplicates
 
+    def _candidate_pairs(
+        self, works: List[Work], features: List[_WorkFeatures], algorithm: MatchAlgorithm
+    ) -> List[Tuple[int, int]]:
+        """
+        Build the sorted list of index pairs (i < j) that may reach fuzzy_threshold.
+
+        Metadata similarity contributes at most 0.3 to confidence, so a pair
+        needs a title similarity of at least (fuzzy_threshold - 0.3) / 0.7 on
+        one of its title fields. Pairs are blocked by work type, then:
+        - exact / normalized / phonetic scores are found by grouping on the key
+        - fuzzy ratios are found by a prefix-filter join on character tokens,
+          using the SequenceMatcher upper bound 2 * common / (len1 + len2)
+        """
+        # Small margin so that floating point rounding never drops a boundary pair
+        min_title_sim = (self.fuzzy_threshold - 0.3) / 0.7 - 1e-9
+
+        by_type: Dict[Any, List[int]] = defaultdict(list)
+        for index, work in enumerate(works):
+            by_type[work.work_type].append(index)
+
+        pairs: Set[Tuple[int, int]] = set()
+        for indices in by_type.values():
+            if min_title_sim <= 0:
+                pairs.update(
+                    (indices[a], indices[b])
+                    for a in range(len(indices))
+                    for b in range(a + 1, len(indices))
+                )
+                continue
+
+            for field in range(3):
+                field_items = [
+                    (index, features[index][field])
+                    for index in indices
+                    if features[index][field] is not None
+                ]
+                pairs.update(self._field_candidate_pairs(field_items, algorithm, min_title_sim))
+
+        return sorted(pairs)
+
+    def _field_candidate_pairs(
+        self,
+        items: List[Tuple[int, _TitleFeatures]],
+        algorithm: MatchAlgorithm,
+        min_title_sim: float,
+    ) -> Set[Tuple[int, int]]:
+        """Candidate pairs for one title field within one work type."""
+        pairs: Set[Tuple[int, int]] = set()
+
+        if algorithm == MatchAlgorithm.EXACT:
+            pairs.update(self._group_pairs(items, lambda f: f.text))
+        elif algorithm == MatchAlgorithm.NORMALIZED:
+            pairs.update(self._group_pairs(items, lambda f: f.norm))
+        elif algorithm == MatchAlgorithm.PHONETIC:
+            pairs.update(self._group_pairs(items, lambda f: f.metaphone))
+        elif algorithm == MatchAlgorithm.FUZZY:
+            pairs.update(self._prefix_filter_pairs(items, min_title_sim))
+        elif algorithm == MatchAlgorithm.HYBRID:
+            # Equal normalized titles (including exact matches) score 1.0 directly
+            pairs.update(self._group_pairs(items, lambda f: f.norm))
+            # A phonetic match adds a 1.0 score
+            pairs.update(self._group_pairs(items, lambda f: f.metaphone if f.is_latin else None))
+            # Otherwise mean(normalized ratio, original ratio) >= min_title_sim
+            # requires the original ratio to be at least 2 * min_title_sim - 1
+            pairs.update(self._prefix_filter_pairs(items, 2 * min_title_sim - 1))
+
+        return pairs
+
+    @staticmethod
+    def _group_pairs(items: List[Tuple[int, _TitleFeatures]], key) -> Set[Tuple[int, int]]:
+        """All pairs of items sharing the same (non-None) key."""
+        groups: Dict[Any, List[int]] = defaultdict(list)
+        for index, title_features in items:
+            value = key(title_features)
+            if value is not None:
+                groups[value].append(index)
+
+        pairs = set()
+        for members in groups.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    pairs.add((members[a], members[b]))
+        return pairs
+
+    @staticmethod
+    def _prefix_filter_pairs(
+        items: List[Tuple[int, _TitleFeatures]], min_ratio: float
+    ) -> Set[Tuple[int, int]]:
+        """
+        Pairs whose lower-cased titles may have SequenceMatcher ratio >= min_ratio.
+
+        ratio <= 2 * common / (len1 + len2), where common is the size of the
+        character multiset intersection. For a title of length n this forces
+        common >= min_ratio * n / (2 - min_ratio), so two qualifying titles must
+        share a token within their rarest-first prefixes (prefix filtering).
+        """
+        if min_ratio <= 0:
+            indices = [index for index, _ in items]
+            return {
+                (indices[a], indices[b])
+                for a in range(len(indices))
+                for b in range(a + 1, len(indices))
+            }
+
+        token_lists = []
+        frequency: Counter = Counter()
+        for index, title_features in items:
+            occurrences: Counter = Counter()
+            tokens = []
+            for ch in title_features.lower:
+                occurrences[ch] += 1
+                tokens.append((ch, occurrences[ch]))
+            token_lists.append((index, tokens))
+            frequency.update(tokens)
+
+        inverted: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        pairs = set()
+        for index, tokens in token_lists:
+            tokens.sort(key=lambda token: (frequency[token], token))
+            required = max(1, math.ceil(min_ratio * len(tokens) / (2 - min_ratio) - 1e-9))
+            for token in tokens[: len(tokens) - required + 1]:
+                postings = inverted[token]
+                for other in postings:
+                    pairs.add((other, index) if other < index else (index, other))
+                postings.append(index)
+        return pairs
+
+    def _score_pairs(
+        self,
+        works: List[Work],
+        features: List[_WorkFeatures],
+        pairs: List[Tuple[int, int]],
+        algorithm: MatchAlgorithm,
+    ) -> List[Tuple[int, int, DuplicateMatch]]:
+        """
+        Score candidate pairs, skipping those whose similarity upper bound
+        cannot reach fuzzy_threshold before running SequenceMatcher.
+        """
+        scored = []
+        for i, j in pairs:
+            work1, work2 = works[i], works[j]
+            metadata_sim = self._calculate_metadata_similarity(work1, work2)
+            title_bound = max(
+                self._similarity_upper_bound(f1, f2, algorithm)
+                for f1, f2 in zip(features[i], features[j])
+            )
+            if title_bound * 0.7 + metadata_sim * 0.3 < self.fuzzy_threshold - 1e-9:
+                continue
+
+            match = self._match_from_features(work1, work2, features[i], features[j], algorithm)
+            if match:
+                scored.append((i, j, match))
+        return scored
+
+    @staticmethod
+    def _ratio_upper_bound(text1: str, text2: str, counts1: Counter, counts2: Counter) -> float:
+        """Upper bound of SequenceMatcher.ratio() (same idea as quick_ratio)."""
+        total = len(text1) + len(text2)
+        if not total:
+            return 1.0
+        if len(counts1) > len(counts2):
+            counts1, counts2 = counts2, counts1
+        common = 0
+        for ch, count in counts1.items():
+            other = counts2.get(ch)
+            if other:
+                common += count if count < other else other
+        return 2.0 * common / total
+
+    def _similarity_upper_bound(
+        self,
+        features1: Optional[_TitleFeatures],
+        features2: Optional[_TitleFeatures],
+        algorithm: MatchAlgorithm,
+    ) -> float:
+        """Cheap upper bound of _similarity_from_features."""
+        if features1 is None or features2 is None:
+            return 0.0
+
+        if algorithm == MatchAlgorithm.FUZZY:
+            return self._ratio_upper_bound(
+                features1.lower, features2.lower, features1.lower_counts, features2.lower_counts
+            )
+
+        if algorithm != MatchAlgorithm.HYBRID:
+            # Key comparisons are already cheap
+            return self._similarity_from_features(features1, features2, algorithm)
+
+        if features1.text == features2.text:
+            return 1.0
+
+        scores = []
+        if features1.norm == features2.norm:
+            scores.append(1.0)
+        else:
+            scores.append(
+                self._ratio_upper_bound(
+                    features1.norm_lower,
+                    features2.norm_lower,
+                    features1.norm_counts,
+                    features2.norm_counts,
+                )
+            )
+        scores.append(
+            self._ratio_upper_bound(
+                features1.lower, features2.lower, features1.lower_counts, features2.lower_counts
+            )
+        )
+        if features1.is_latin and features2.is_latin:
+            metaphone1 = features1.metaphone
+            if metaphone1 is not None and metaphone1 == features2.metaphone:
+                scores.append(1.0)
+        return sum(scores) / len(scores)
+
+    def _score_pairs_in_pool(
+        self,
+        works: List[Work],
+        features: List[_WorkFeatures],
+        pairs: List[Tuple[int, int]],
+        algorithm: MatchAlgorithm,
+        processes: int,
+    ) -> List[Tuple[int, int, DuplicateMatch]]:
+        """Score candidate pairs on a process pool."""
+        workers = min(processes, os.cpu_count() or 1)
+        chunk_size = max(1000, math.ceil(len(pairs) / (workers * 4)))
+        chunks = [pairs[start : start + chunk_size] for start in range(0, len(pairs), chunk_size)]
+
+        scored = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_bulk_worker,
+            initargs=(self, works, features, algorithm),
+        ) as executor:
+            for chunk_result in executor.map(_score_pair_chunk, chunks):
+                scored.extend(chunk_result)
+        return scored
+
 
 class EnhancedDataMerger:
     """
@@ -412,7 +802,10 @@ class EnhancedDataMerger:
         return merged
 
     def deduplicate_works(
-        self, works: List[Work], detector: EnhancedDuplicateDetector
+        self,
+        works: List[Work],
+        detector: EnhancedDuplicateDetector,
+        processes: Optional[int] = None,
     ) -> List[Work]:
         """
         Deduplicate a list of works by detecting and merging duplicates.
@@ -420,6 +813,7 @@ class EnhancedDataMerger:
         Args:
             works: List of works
             detector: Duplicate detector instance
+            processes: Worker processes for duplicate scoring (None = in-process)
 
         Returns:
             Deduplicated list of works
@@ -428,7 +822,7 @@ class EnhancedDataMerger:
             return []
 
         # Find duplicates
-        duplicates = detector.find_duplicates_in_list(works)
+        duplicates = detector.find_duplicates_in_list(works, processes=processes)
 
         # Build merge groups
         merge_groups: Dict[int, Set[int]] = {}
@@ -500,6 +894,7 @@ def deduplicate_works(
     works: List[Work],
     threshold: float = 0.85,
     merge_strategy: Optional[MergeStrategy] = None,
+    processes: Optional[int] = None,
 ) -> List[Work]:
     """
     Deduplicate and merge works.
@@ -508,13 +903,14 @@ def deduplicate_works(
         works: List of works
         threshold: Fuzzy match threshold
         merge_strategy: Merge strategy
+        processes: Worker processes for duplicate scoring (None = in-process)
 
     Returns:
         Deduplicated works
     """
     detector = EnhancedDuplicateDetector(fuzzy_threshold=threshold)
     merger = EnhancedDataMerger(merge_strategy)
-    return merger.deduplicate_works(works, detector)
+    return merger.deduplicate_works(works, detector, processes=processes)
 
 
 def merge_two_works(work1: Work, work2: Work) -> Work:
@@ -13,15 +13,811 @@ Database Schema:
 - releases: Stores episode/volume release information
 """
 
+import atexit
 import hashlib
 import logging
 import os
 import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional
+from urllib.request import pathname2url
+
+
+class _WorkIdCache:
+    """
+    Bounded, thread-safe LRU cache mapping the exact (title, type) to work_id.
+
+    It only memoizes lookups the database would answer the same way, so a
+    cold, warm or partly evicted cache never changes which work a title
+    resolves to.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.warmed = False
+
+    def get(self, title: str, work_type: Optional[str]) -> Optional[int]:
+        """Return the cached work_id, or None on a miss."""
+        key = (title, work_type)
+        with self._lock:
+            work_id = self._entries.get(key)
+            if work_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return work_id
+
+    def put(self, title: str, work_type: Optional[str], work_id: int, overwrite: bool = True):
+        """Store a work_id, evicting the least recently used entry when full."""
+        key = (title, work_type)
+        with self._lock:
+            if key in self._entries:
+                if not overwrite:
+                    return
+                self._entries.move_to_end(key)
+            self._entries[key] = work_id
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard_work(self, work_id: int):
+        """Drop every entry pointing at work_id."""
+        with self._lock:
+            for key in [key for key, value in self._entries.items() if value == work_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.warmed = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics for get_performance_stats."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total > 0 else 0,
+                "evictions": self.evictions,
+                "warmed": self.warmed,
+            }
+
+
+def configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> sqlite3.Connection:
+    """
+    Apply the performance tuning shared by every pooled SQLite connection.
+
+    Read-only connections leave the journal mode to the writers and refuse any
+    write with ``PRAGMA query_only``.
+    """
+    conn.row_factory = sqlite3.Row
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
+        conn.execute("PRAGMA synchronous = NORMAL")  # Balance between performance and safety
+    conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory map
+    return conn
+
+
+class ConnectionPool:
+    """
+    Pool of tuned connections to one SQLite file for short checkouts.
+
+    Used by the web layer, which previously opened (and cold-started the page
+    cache of) a fresh connection per request. Connections keep the default
+    sqlite3 transaction handling so existing commit()/rollback() code behaves
+    as before. An idle connection is discarded if the database file was
+    replaced or removed since it was opened.
+
+    With read_only=True connections are opened with ``mode=ro`` and
+    ``query_only``, so a bug in a read path can never write to the file.
+    """
+
+    def __init__(self, db_path: str, max_idle: int = 5, read_only: bool = False):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.read_only = read_only
+        self._idle: List[tuple] = []
+        self._identities: Dict[int, Optional[tuple]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def _file_identity(self) -> Optional[tuple]:
+        if self.db_path == ":memory:":
+            return None
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection (reused from the pool when possible)."""
+        identity = self._file_identity()
+        with self._lock:
+            while self._idle:
+                conn, conn_identity = self._idle.pop()
+                if identity is not None and conn_identity == identity:
+                    self.hits += 1
+                    self._identities[id(conn)] = conn_identity
+                    return conn
+                self.discarded += 1
+                conn.close()
+            self.misses += 1
+
+        if self.read_only and self.db_path != ":memory:":
+            uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=30.0)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        configure_connection(conn, read_only=self.read_only)
+        with self._lock:
+            self._identities[id(conn)] = self._file_identity()
+        return conn
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection; uncommitted work is rolled back like close()."""
+        with self._lock:
+            identity = self._identities.pop(id(conn), None)
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            conn.close()
+            return
+
+        with self._lock:
+            if identity is not None and len(self._idle) < self.max_idle:
+                self._idle.append((conn, identity))
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "max_idle": self.max_idle,
+                "read_only": self.read_only,
+                "hits": self.hits,
+                "misses": self.misses,
+                "discarded": self.discarded,
+            }
+
+
+_connection_pools: Dict[tuple, ConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+@atexit.register
+def _close_connection_pools():
+    """Close idle pooled connections at exit so SQLite can checkpoint the WAL."""
+    with _connection_pools_lock:
+        pools = list(_connection_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+def get_connection_pool(db_path: str, read_only: bool = False) -> ConnectionPool:
+    """Return the shared (read-write or read-only) ConnectionPool for a database file."""
+    key = (db_path if db_path == ":memory:" else os.path.abspath(db_path), read_only)
+    with _connection_pools_lock:
+        pool = _connection_pools.get(key)
+        if pool is None:
+            pool = _connection_pools[key] = ConnectionPool(db_path, read_only=read_only)
+        return pool
+
+
+class PooledConnection:
+    """
+    sqlite3.Connection proxy whose close() hands the connection back.
+
+    Inside a Flask app context the connection is shared for the whole request,
+    so close() is a no-op and close_request_connections() releases it at
+    teardown. Outside an app context close() returns it to the pool directly.
+    """
+
+    def __init__(self, pool: ConnectionPool, conn: sqlite3.Connection, request_scoped: bool):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_request_scoped", request_scoped)
+
+    def __getattr__(self, name):
+        conn = self._conn
+        if conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    def __enter__(self):
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._conn.__exit__(exc_type, exc, tb)
+
+    def close(self):
+        if not self._request_scoped:
+            self._release()
+
+    def _release(self):
+        conn = self._conn
+        if conn is not None:
+            object.__setattr__(self, "_conn", None)
+            self._pool.release(conn)
+
+
+def get_request_connection(db_path: str) -> PooledConnection:
+    """
+    Get the pooled connection for db_path bound to the current request.
+
+    Repeated calls during one Flask app context return the same connection;
+    call close_request_connections() from teardown_appcontext to release it.
+    Outside an app context each call checks out its own connection.
+    """
+    try:
+        from flask import g, has_app_context
+    except ImportError:  # pragma: no cover - Flask is optional for batch jobs
+        has_app_context = None
+
+    pool = get_connection_pool(db_path)
+    if has_app_context is None or not has_app_context() or db_path == ":memory:":
+        return PooledConnection(pool, pool.acquire(), request_scoped=False)
+
+    return _get_scoped_connection(g, pool, db_path)
+
+
+def _get_scoped_connection(g, pool: ConnectionPool, key: Any) -> PooledConnection:
+    """Return the app context's connection from pool stored under key, checking one out."""
+    connections = g.setdefault("_pooled_db_connections", {})
+    conn = connections.get(key)
+    if conn is None or conn._conn is None:
+        conn = connections[key] = PooledConnection(pool, pool.acquire(), request_scoped=True)
+    return conn
+
+
+def close_request_connections(exc: Optional[BaseException] = None):
+    """Release the current app context's connections (teardown_appcontext hook)."""
+    from flask import g
+
+    connections = g.pop("_pooled_db_connections", None) or {}
+    for conn in connections.values():
+        conn._release()
+
+
+# Reader modes for the web layer's read-only queries (get_reader_connection):
+#
+#   shared   - the request's read-write pooled connection (default)
+#   readonly - a separate pool opened with mode=ro and query_only
+#   snapshot - a read-only pool on a copy of the database taken with the
+#              SQLite backup API and refreshed every refresh_seconds. Web
+#              readers then never pin the live WAL, so checkpoints can always
+#              reset it, at the cost of data up to refresh_seconds old.
+#
+# Selected with DB_READER_MODE / DB_SNAPSHOT_PATH / DB_SNAPSHOT_REFRESH_SECONDS
+# or configure_reader().
+READER_MODES = ("shared", "readonly", "snapshot")
+DEFAULT_SNAPSHOT_REFRESH_SECONDS = 60.0
+
+
+def _read_only_uri(path: str) -> str:
+    return f"file:{pathname2url(os.path.abspath(path))}?mode=ro"
+
+
+class SnapshotReader:
+    """
+    Periodically refreshed read-only copy of a SQLite database.
+
+    refresh() copies the live database into a temporary file with the backup
+    API and renames it over snapshot_path, so a snapshot is never modified in
+    place. Connections still open on the previous copy keep reading it; the
+    read-only pool drops them on their next checkout because the file
+    identity changed. Only one thread refreshes at a time while the others
+    keep reading the current copy.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        snapshot_path: Optional[str] = None,
+        refresh_seconds: float = DEFAULT_SNAPSHOT_REFRESH_SECONDS,
+    ):
+        self.db_path = db_path
+        self.snapshot_path = snapshot_path or f"{db_path}.snapshot"
+        self.refresh_seconds = refresh_seconds
+        self.refreshed_at: Optional[float] = None
+        self.refreshes = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        return (
+            self.refreshed_at is None
+            or time.monotonic() - self.refreshed_at >= self.refresh_seconds
+        )
+
+    def refresh(self) -> bool:
+        """Copy the live database over the snapshot; returns False on failure."""
+        tmp_path = f"{self.snapshot_path}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            src = sqlite3.connect(_read_only_uri(self.db_path), uri=True, timeout=30.0)
+            try:
+                dst = sqlite3.connect(tmp_path)
+                try:
+                    src.backup(dst)
+                    # The copy is only ever replaced, so it needs no -wal/-shm files
+                    dst.execute("PRAGMA journal_mode = DELETE")
+                finally:
+                    dst.close()
+            finally:
+                src.close()
+            os.replace(tmp_path, self.snapshot_path)
+        except (sqlite3.Error, OSError) as e:
+            self.failures += 1
+            logging.getLogger(__name__).warning(f"Database snapshot refresh failed: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+        self.refreshed_at = time.monotonic()
+        self.refreshes += 1
+        return True
+
+    def ensure_fresh(self) -> str:
+        """
+        Return the path readers should open, refreshing a stale snapshot first.
+
+        The first call blocks until a snapshot exists. Later, a stale snapshot
+        is refreshed by whichever thread gets the lock; the others return the
+        current copy immediately. Falls back to the live database path if no
+        snapshot could be taken.
+        """
+        if self.is_stale() and self._lock.acquire(blocking=self.refreshed_at is None):
+            try:
+                if self.is_stale():
+                    self.refresh()
+            finally:
+                self._lock.release()
+        return self.snapshot_path if self.refreshed_at is not None else self.db_path
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "snapshot_path": self.snapshot_path,
+            "refresh_seconds": self.refresh_seconds,
+            "age_seconds": (
+                None if self.refreshed_at is None else time.monotonic() - self.refreshed_at
+            ),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+        }
+
+
+def _reader_settings_from_env() -> Dict[str, Any]:
+    mode = os.getenv("DB_READER_MODE", "shared").strip().lower()
+    try:
+        refresh_seconds = float(
+            os.getenv("DB_SNAPSHOT_REFRESH_SECONDS", DEFAULT_SNAPSHOT_REFRESH_SECONDS)
+        )
+    except ValueError:
+        refresh_seconds = DEFAULT_SNAPSHOT_REFRESH_SECONDS
+    return {
+        "mode": mode if mode in READER_MODES else "shared",
+        "snapshot_path": os.getenv("DB_SNAPSHOT_PATH") or None,
+        "refresh_seconds": refresh_seconds,
+    }
+
+
+_reader_settings: Dict[str, Any] = _reader_settings_from_env()
+_snapshot_readers: Dict[str, SnapshotReader] = {}
+_snapshot_readers_lock = threading.Lock()
+
+
+def configure_reader(
+    mode: str = "shared",
+    snapshot_path: Optional[str] = None,
+    refresh_seconds: float = DEFAULT_SNAPSHOT_REFRESH_SECONDS,
+):
+    """
+    Select how get_reader_connection() serves read-only queries.
+
+    Args:
+        mode: One of READER_MODES
+        snapshot_path: Snapshot file (snapshot mode; default "<db_path>.snapshot")
+        refresh_seconds: Maximum snapshot age before it is refreshed
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in READER_MODES:
+        raise ValueError(f"Unknown reader mode: {mode} (expected one of {READER_MODES})")
+    with _snapshot_readers_lock:
+        _reader_settings.update(
+            mode=mode, snapshot_path=snapshot_path, refresh_seconds=refresh_seconds
+        )
+        _snapshot_readers.clear()
+
+
+def get_reader_mode() -> str:
+    return _reader_settings["mode"]
+
+
+def get_snapshot_reader(db_path: str) -> SnapshotReader:
+    """Return the shared SnapshotReader for a database file."""
+    key = os.path.abspath(db_path)
+    with _snapshot_readers_lock:
+        reader = _snapshot_readers.get(key)
+        if reader is None:
+            reader = _snapshot_readers[key] = SnapshotReader(
+                db_path,
+                snapshot_path=_reader_settings["snapshot_path"],
+                refresh_seconds=_reader_settings["refresh_seconds"],
+            )
+        return reader
+
+
+def get_reader_pool(db_path: str) -> ConnectionPool:
+    """
+    Return the pool read-only queries against db_path should use.
+
+    For checkouts that outlive the request, e.g. a streamed response.
+    """
+    mode = _reader_settings["mode"]
+    if mode == "shared" or db_path == ":memory:":
+        return get_connection_pool(db_path)
+    read_path = get_snapshot_reader(db_path).ensure_fresh() if mode == "snapshot" else db_path
+    return get_connection_pool(read_path, read_only=True)
+
+
+def get_reader_connection(db_path: str) -> PooledConnection:
+    """
+    Get a connection for read-only queries against db_path.
+
+    In "shared" mode this is get_request_connection(db_path). In "readonly"
+    and "snapshot" modes it is a connection from a read-only pool on the live
+    file or on its snapshot, bound to the current request the same way.
+    Writes through it fail with sqlite3.OperationalError.
+    """
+    if _reader_settings["mode"] == "shared" or db_path == ":memory:":
+        return get_request_connection(db_path)
+
+    pool = get_reader_pool(db_path)
+    try:
+        from flask import g, has_app_context
+    except ImportError:  # pragma: no cover - Flask is optional for batch jobs
+        has_app_context = None
+    if has_app_context is None or not has_app_context():
+        return PooledConnection(pool, pool.acquire(), request_scoped=False)
+    return _get_scoped_connection(g, pool, (pool.db_path, "ro"))
+
+
+# Full-text title search over works(title, title_kana, title_en).
+# The trigram tokenizer indexes every 3-character window, so substring search
+# works for CJK titles that have no word separators.
+WORKS_FTS_TABLE = "works_fts"
+WORKS_FTS_COLUMNS = ("title", "title_kana", "title_en")
+WORKS_FTS_MIN_QUERY_LENGTH = 3
+
+_WORKS_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS works_fts_after_insert AFTER INSERT ON works BEGIN
+        INSERT INTO works_fts(rowid, title, title_kana, title_en)
+        VALUES (new.id, new.title, new.title_kana, new.title_en);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS works_fts_after_delete AFTER DELETE ON works BEGIN
+        INSERT INTO works_fts(works_fts, rowid, title, title_kana, title_en)
+        VALUES ('delete', old.id, old.title, old.title_kana, old.title_en);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS works_fts_after_update
+    AFTER UPDATE OF title, title_kana, title_en ON works BEGIN
+        INSERT INTO works_fts(works_fts, rowid, title, title_kana, title_en)
+        VALUES ('delete', old.id, old.title, old.title_kana, old.title_en);
+        INSERT INTO works_fts(rowid, title, title_kana, title_en)
+        VALUES (new.id, new.title, new.title_kana, new.title_en);
+    END
+    """,
+)
+
+
+def ensure_works_fts(conn: sqlite3.Connection) -> bool:
+    """
+    Create the works_fts index and its sync triggers if missing.
+
+    The index is an external-content FTS5 table over works, kept in sync by
+    triggers so every writer (DatabaseManager, web UI, scripts) maintains it.
+    A newly created index is backfilled from the existing rows.
+
+    Returns:
+        True if the index is available, False if this SQLite build lacks
+        FTS5 or the trigram tokenizer (callers fall back to LIKE).
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (WORKS_FTS_TABLE,)
+    ).fetchone()
+    try:
+        if not exists:
+            conn.execute("""
+                CREATE VIRTUAL TABLE works_fts USING fts5(
+                    title, title_kana, title_en,
+                    content='works', content_rowid='id', tokenize='trigram'
+                )
+            """)
+            conn.execute("INSERT INTO works_fts(works_fts) VALUES ('rebuild')")
+        for trigger in _WORKS_FTS_TRIGGERS:
+            conn.execute(trigger)
+    except sqlite3.OperationalError as e:
+        logging.getLogger(__name__).warning(f"Full-text title search unavailable: {e}")
+        return False
+    return True
+
+
+def has_works_fts(conn: sqlite3.Connection) -> bool:
+    """Return True if the works_fts index exists in this database."""
+    return (
+        conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (WORKS_FTS_TABLE,)
+        ).fetchone()
+        is not None
+    )
+
+
+def build_title_search(
+    conn: sqlite3.Connection,
+    search: str,
+    alias: str = "w",
+    columns: tuple = WORKS_FTS_COLUMNS,
+) -> Dict[str, Any]:
+    """
+    Build the SQL fragments for a substring title search on works.
+
+    Queries of at least WORKS_FTS_MIN_QUERY_LENGTH characters use the works_fts
+    index and expose a bm25 rank (lower is better). Shorter queries, or
+    databases without the index, fall back to LIKE. Both branches search
+    the same columns.
+
+    Args:
+        conn: Connection the query will run on
+        search: User-supplied search text
+        alias: Alias of the works table in the calling query
+        columns: works columns to search
+
+    Returns:
+        Dict with "join" (SQL joined after the works table), "where" (SQL
+        appended to the WHERE clause), "params" (parameters for join then
+        where) and "rank" (ORDER BY expression, or None without ranking)
+    """
+    search = (search or "").strip()
+    if not search:
+        return {"join": "", "where": "", "params": [], "rank": None}
+
+    use_fts = len(search) >= WORKS_FTS_MIN_QUERY_LENGTH and set(columns) <= set(WORKS_FTS_COLUMNS)
+    if use_fts and has_works_fts(conn):
+        # Quote as an FTS5 string so the whole query is matched as a substring,
+        # restricted to the requested columns with a column filter
+        match = '"' + search.replace('"', '""') + '"'
+        if tuple(columns) != WORKS_FTS_COLUMNS:
+            match = "{" + " ".join(columns) + "} : " + match
+        # LIMIT -1 keeps SQLite from flattening the subquery into aggregate
+        # queries, where bm25() cannot be evaluated
+        return {
+            "join": (
+                " JOIN (SELECT rowid AS work_id, bm25(works_fts) AS rank"
+                " FROM works_fts WHERE works_fts MATCH ? LIMIT -1) AS title_match"
+                f" ON title_match.work_id = {alias}.id"
+            ),
+            "where": "",
+            "params": [match],
+            "rank": "title_match.rank",
+        }
+
+    pattern = f"%{search}%"
+    like = " OR ".join(f"{alias}.{column} LIKE ?" for column in columns)
+    return {"join": "", "where": f" AND ({like})", "params": [pattern] * len(columns), "rank": None}
+
+
+# Dashboard counters (stats_counters) kept in O(1) by triggers on works and
+# releases, so dashboards and metrics scrapes don't COUNT(*) the tables.
+STATS_COUNTER_NAMES = (
+    "works_total",
+    "works_anime",
+    "works_manga",
+    "releases_total",
+    "releases_unnotified",
+)
+
+_STATS_COUNTER_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_works_after_insert AFTER INSERT ON works BEGIN
+        UPDATE stats_counters SET value = value + 1
+        WHERE name IN ('works_total', 'works_' || new.type);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_works_after_delete AFTER DELETE ON works BEGIN
+        UPDATE stats_counters SET value = value - 1
+        WHERE name IN ('works_total', 'works_' || old.type);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_works_after_update_type
+    AFTER UPDATE OF type ON works BEGIN
+        UPDATE stats_counters
+        SET value = value + IFNULL(name = 'works_' || new.type, 0)
+                          - IFNULL(name = 'works_' || old.type, 0)
+        WHERE name IN ('works_' || old.type, 'works_' || new.type);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_releases_after_insert AFTER INSERT ON releases BEGIN
+        UPDATE stats_counters
+        SET value = value + CASE name
+            WHEN 'releases_total' THEN 1 ELSE IFNULL(new.notified = 0, 0) END
+        WHERE name IN ('releases_total', 'releases_unnotified');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_releases_after_delete AFTER DELETE ON releases BEGIN
+        UPDATE stats_counters
+        SET value = value - CASE name
+            WHEN 'releases_total' THEN 1 ELSE IFNULL(old.notified = 0, 0) END
+        WHERE name IN ('releases_total', 'releases_unnotified');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS stats_releases_after_update_notified
+    AFTER UPDATE OF notified ON releases BEGIN
+        UPDATE stats_counters
+        SET value = value + IFNULL(new.notified = 0, 0) - IFNULL(old.notified = 0, 0)
+        WHERE name = 'releases_unnotified';
+    END
+    """,
+)
+
+
+# Counter bumped on every change to the catalog tables. Caches keyed by it
+# (calendar month buckets, HTTP validators) notice writes from any process.
+DATA_VERSION_COUNTER = "data_version"
+
+_DATA_VERSION_TRIGGERS = tuple(
+    f"""
+    CREATE TRIGGER IF NOT EXISTS data_version_{table}_after_{event.lower()}
+    AFTER {event} ON {table} BEGIN
+        UPDATE stats_counters SET value = value + 1 WHERE name = '{DATA_VERSION_COUNTER}';
+    END
+    """
+    for table in ("works", "releases", "calendar_events")
+    for event in ("INSERT", "UPDATE", "DELETE")
+)
+
+
+def _count_stats(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Count the stats_counters values directly from the tables."""
+    counts = dict.fromkeys(STATS_COUNTER_NAMES, 0)
+    counts["works_total"] = conn.execute("SELECT COUNT(*) FROM works").fetchone()[0]
+    for work_type, count in conn.execute(
+        "SELECT type, COUNT(*) FROM works WHERE type IN ('anime', 'manga') GROUP BY type"
+    ):
+        counts[f"works_{work_type}"] = count
+    counts["releases_total"], counts["releases_unnotified"] = conn.execute(
+        "SELECT COUNT(*), IFNULL(SUM(notified = 0), 0) FROM releases"
+    ).fetchone()
+    return counts
+
+
+def rebuild_stats_counters(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Recount stats_counters from the works and releases tables.
+
+    Use after bulk edits made with triggers disabled or restored backups,
+    or whenever the counters are suspected to have drifted.
+
+    Returns:
+        The rebuilt counter values
+    """
+    counts = _count_stats(conn)
+    conn.executemany(
+        "INSERT INTO stats_counters (name, value) VALUES (?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+        counts.items(),
+    )
+    return counts
+
+
+def ensure_stats_counters(conn: sqlite3.Connection):
+    """Create stats_counters and its triggers, filling it on first creation."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_counters'"
+    ).fetchone()
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS stats_counters (
+            name TEXT PRIMARY KEY NOT NULL,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    for trigger in _STATS_COUNTER_TRIGGERS + _DATA_VERSION_TRIGGERS:
+        conn.execute(trigger)
+    conn.execute(
+        "INSERT OR IGNORE INTO stats_counters (name, value) VALUES (?, 0)",
+        (DATA_VERSION_COUNTER,),
+    )
+    if not exists:
+        rebuild_stats_counters(conn)
+
+
+def read_stats_counters(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Read the dashboard counters.
+
+    Falls back to counting the tables when stats_counters does not exist
+    (a database that DatabaseManager has not initialized yet).
+    """
+    try:
+        rows = conn.execute("SELECT name, value FROM stats_counters").fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+    counts = {name: value for name, value in rows}
+    if not all(name in counts for name in STATS_COUNTER_NAMES):
+        counts = _count_stats(conn)
+    return counts
+
+
+def read_data_version(conn: sqlite3.Connection) -> Optional[int]:
+    """
+    Read the catalog data version.
+
+    Returns:
+        The current version, or None when the database has no version counter
+        (callers should then skip caching)
+    """
+    try:
+        row = conn.execute(
+            "SELECT value FROM stats_counters WHERE name = ?", (DATA_VERSION_COUNTER,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+WAL_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# WAL size at which maybe_checkpoint_wal() escalates from PASSIVE to TRUNCATE
+WAL_TRUNCATE_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# How long a blocking checkpoint may wait for readers before giving up
+WAL_CHECKPOINT_BUSY_TIMEOUT_MS = 1000
 
 
 class DatabaseManager:
@@ -32,13 +828,19 @@ class DatabaseManager:
     transaction handling, data integrity enforcement, and connection pooling.
     """
 
-    def __init__(self, db_path: str = "./db.sqlite3", max_connections: int = 5):
+    def __init__(
+        self,
+        db_path: str = "./db.sqlite3",
+        max_connections: int = 5,
+        work_cache_size: int = 10000,
+    ):
         """
         Initialize database manager with enhanced connection management.
 
         Args:
             db_path: Path to SQLite database file
             max_connections: Maximum number of concurrent connections
+            work_cache_size: Maximum entries in the (title, type) -> work_id cache
         """
         self.db_path = db_path
         self.max_connections = max_connections
@@ -67,6 +869,9 @@ class DatabaseManager:
         self._connection_ages = {}  # Track connection creation times
         self._max_connection_age = 3600  # 1 hour max connection age
 
+        # In-process (title, type) -> work_id cache used by the ingest path
+        self._work_cache = _WorkIdCache(max_size=work_cache_size)
+
         # Ensure database directory exists
         db_dir = os.path.dirname(os.path.abspath(db_path))
         if not os.path.exists(db_dir):
@@ -91,17 +896,9 @@ class DatabaseManager:
             timeout=30.0,
             isolation_level=None,  # Enable autocommit mode for better performance
         )
-        conn.row_factory = sqlite3.Row
-
         # Optimize SQLite settings
         conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
-        conn.execute("PRAGMA synchronous = NORMAL")  # Balance between performance and safety
-        conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-        conn.execute("PRAGMA temp_store = MEMORY")
-        conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory map
-
-        return conn
+        return configure_connection(conn)
 
     @contextmanager
     def get_connection(self):
@@ -243,18 +1040,22 @@ class DatabaseManager:
             self.logger.debug(f"Error closing connection: {e}")
 
     @contextmanager
-    def get_transaction(self):
+    def get_transaction(self, immediate: bool = False):
         """
         Get database connection with explicit transaction management.
 
         Provides ACID transaction guarantees with automatic rollback on failure.
+
+        Args:
+            immediate: Acquire the write lock up front (BEGIN IMMEDIATE) so that
+                reads inside the transaction see no concurrent writers
         """
         start_time = time.time()
 
         with self.get_connection() as conn:
             try:
                 # Begin transaction explicitly
-                conn.execute("BEGIN")
+                conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
                 self._transaction_count += 1
 
                 yield conn
@@ -430,6 +1231,10 @@ class DatabaseManager:
                     )
                     """)
 
+                # Full-text title index and dashboard counters (kept in sync by triggers)
+                ensure_works_fts(conn)
+                ensure_stats_counters(conn)
+
                 conn.commit()
 
                 # Initialize default settings
@@ -526,6 +1331,8 @@ class DatabaseManager:
             work_id = cursor.lastrowid
             conn.commit()
 
+            self._work_cache.put(title, work_type, work_id, overwrite=False)
+
             self.logger.info(f"Created work: {title} (ID: {work_id}, Type: {work_type})")
             return work_id
 
@@ -561,6 +1368,35 @@ class DatabaseManager:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def search_works(
+        self, query: str, work_type: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Search works by title, kana title or English title.
+
+        Uses the works_fts trigram index (ranked by bm25) when the query is
+        long enough, otherwise a LIKE scan.
+
+        Args:
+            query: Substring to search for
+            work_type: Optional 'anime' or 'manga' filter
+            limit: Maximum number of results
+
+        Returns:
+            List of work dictionaries, best match first
+        """
+        with self.get_connection() as conn:
+            search = build_title_search(conn, query)
+            sql = f"SELECT w.* FROM works w{search['join']} WHERE 1=1{search['where']}"
+            params = list(search["params"])
+            if work_type:
+                sql += " AND w.type = ?"
+                params.append(work_type)
+            order = f"{search['rank']}, w.title" if search["rank"] else "w.title"
+            sql += f" ORDER BY {order} LIMIT ?"
+            params.append(limit)
+            return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
     def get_or_create_work(self, title: str, work_type: str, **kwargs) -> int:
         """
         Get existing work or create new one.
@@ -573,12 +1409,52 @@ class DatabaseManager:
         Returns:
             work_id of existing or newly created work
         """
+        cached_id = self._work_cache.get(title, work_type)
+        if cached_id is not None:
+            return cached_id
+
         existing_work = self.get_work_by_title(title, work_type)
         if existing_work:
+            self._work_cache.put(title, work_type, existing_work["id"], overwrite=False)
             return existing_work["id"]
 
         return self.create_work(title, work_type, **kwargs)
 
+    def warm_work_cache(self) -> int:
+        """
+        Load every work into the (title, type) -> work_id cache.
+
+        Intended to be called once per collection run before ingesting items.
+        If the same (title, type) was stored more than once the lowest id wins.
+
+        Returns:
+            Number of works read from the works table
+        """
+        self._work_cache.clear()
+
+        with self.get_connection() as conn:
+            cursor = conn.execute("SELECT id, title, type FROM works ORDER BY id")
+            rows = cursor.fetchall()
+
+        for row in rows:
+            self._work_cache.put(row["title"], row["type"], row["id"], overwrite=False)
+        self._work_cache.warmed = True
+
+        self.logger.info(f"Work cache warmed with {len(rows)} works")
+        return len(rows)
+
+    def invalidate_work_cache(self, work_id: Optional[int] = None):
+        """
+        Invalidate the work_id cache after works were deleted outside this manager.
+
+        Args:
+            work_id: Drop only entries for this work; clear everything when None
+        """
+        if work_id is None:
+            self._work_cache.clear()
+        else:
+            self._work_cache.discard_work(work_id)
+
     def create_release(
         self,
         work_id: int,
@@ -654,6 +1530,184 @@ class DatabaseManager:
                 else:
                     raise
 
+    def bulk_upsert_works_and_releases(self, items: List[Dict[str, Any]]) -> List[Dict[str, int]]:
+        """
+        Resolve works and insert releases for a batch of collected items.
+
+        All works and releases are written in a single transaction using
+        executemany; duplicate releases are skipped with ON CONFLICT DO NOTHING
+        instead of surfacing an IntegrityError per row.
+
+        Args:
+            items: Collected items as produced by the collectors. Work fields:
+                title, type, title_kana, title_en, official_url. Release fields:
+                release_type, number, platform, release_date, source, source_url.
+
+        Returns:
+            List of {"index", "work_id", "release_id"} for newly created releases,
+            where index is the position of the originating item in ``items``
+        """
+        work_keys: Dict[tuple, Dict[str, Any]] = {}
+        release_rows = []
+
+        for index, item in enumerate(items):
+            title = item.get("title") or ""
+            work_type = item.get("type", "unknown")
+            release_type = item.get("release_type", "episode" if work_type == "anime" else "volume")
+            if not title or work_type not in ("anime", "manga"):
+                self.logger.debug(f"Bulk upsert skipped item {index}: invalid work ({title!r})")
+                continue
+            if release_type not in ("episode", "volume"):
+                self.logger.debug(f"Bulk upsert skipped item {index}: invalid release_type")
+                continue
+
+            # Store values exactly as SQLite hands them back so rows can be matched
+            number = item.get("number")
+            release_date = item.get("release_date")
+            if isinstance(release_date, (datetime, date)):
+                release_date = release_date.strftime("%Y-%m-%d")
+
+            work_keys.setdefault((title, work_type), item)
+            release_rows.append(
+                (
+                    index,
+                    (title, work_type),
+                    release_type,
+                    str(number) if number is not None else None,
+                    item.get("platform"),
+                    release_date,
+                    item.get("source"),
+                    item.get("source_url"),
+                )
+            )
+
+        if not release_rows:
+            return []
+
+        created = []
+        new_works: List[tuple] = []
+        try:
+            with self.get_transaction(immediate=True) as conn:
+                created = self._bulk_upsert_in_transaction(conn, work_keys, release_rows, new_works)
+        except Exception:
+            # Cache entries written inside the rolled-back transaction are stale
+            self._work_cache.clear()
+            raise
+
+        self.logger.info(
+            f"Bulk upsert: {len(release_rows)} items, {len(new_works)} new works, "
+            f"{len(created)} new releases"
+        )
+        return created
+
+    def _bulk_upsert_in_transaction(
+        self,
+        conn: sqlite3.Connection,
+        work_keys: Dict[tuple, Dict[str, Any]],
+        release_rows: List[tuple],
+        new_works: List[tuple],
+    ) -> List[Dict[str, int]]:
+        """Body of bulk_upsert_works_and_releases, run inside its transaction."""
+        created = []
+        work_ids = self._resolve_work_ids(conn, list(work_keys))
+
+        missing = [key for key in work_keys if key not in work_ids]
+        if missing:
+            new_works.extend(missing)
+            conn.executemany(
+                """
+                INSERT INTO works (title, title_kana, title_en, type, official_url)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        title,
+                        work_keys[(title, work_type)].get("title_kana"),
+                        work_keys[(title, work_type)].get("title_en"),
+                        work_type,
+                        work_keys[(title, work_type)].get("official_url"),
+                    )
+                    for title, work_type in missing
+                ],
+            )
+            work_ids.update(self._resolve_work_ids(conn, missing))
+
+        # AUTOINCREMENT ids only grow, so rows above this mark are ours
+        # (the IMMEDIATE transaction keeps other writers out)
+        last_release_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM releases").fetchone()[0]
+
+        conn.executemany(
+            """
+            INSERT INTO releases (work_id, release_type, number, platform,
+                                release_date, source, source_url)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT DO NOTHING
+        """,
+            [
+                (work_ids[work_key], release_type, number, platform, day, source, url)
+                for _, work_key, release_type, number, platform, day, source, url in release_rows
+            ],
+        )
+
+        # Map inserted rows back to the items that produced them (in insertion order)
+        pending: Dict[tuple, List[int]] = {}
+        for index, work_key, release_type, number, platform, day, _, _ in release_rows:
+            key = (work_ids[work_key], release_type, number, platform, day)
+            pending.setdefault(key, []).append(index)
+
+        cursor = conn.execute(
+            """
+            SELECT id, work_id, release_type, number, platform, release_date
+            FROM releases WHERE id > ? ORDER BY id
+        """,
+            (last_release_id,),
+        )
+        for row in cursor.fetchall():
+            indexes = pending.get(tuple(row)[1:])
+            if indexes:
+                created.append(
+                    {"index": indexes.pop(0), "work_id": row["work_id"], "release_id": row["id"]}
+                )
+
+        return created
+
+    def _resolve_work_ids(self, conn: sqlite3.Connection, keys: List[tuple]) -> Dict[tuple, int]:
+        """
+        Look up work ids for (title, type) pairs in chunks.
+
+        Args:
+            conn: Connection to query on (inside the caller's transaction)
+            keys: (title, work_type) pairs
+
+        Returns:
+            Mapping of (title, work_type) to the lowest matching work id
+        """
+        work_ids: Dict[tuple, int] = {}
+        for key in keys:
+            cached_id = self._work_cache.get(*key)
+            if cached_id is not None:
+                work_ids[key] = cached_id
+
+        wanted = {key for key in keys if key not in work_ids}
+        titles = sorted({title for title, _ in wanted})
+
+        # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+        chunk_size = 500
+        for start in range(0, len(titles), chunk_size):
+            chunk = titles[start : start + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"SELECT id, title, type FROM works WHERE title IN ({placeholders}) ORDER BY id",
+                chunk,
+            )
+            for row in cursor.fetchall():
+                key = (row["title"], row["type"])
+                if key in wanted and key not in work_ids:
+                    work_ids[key] = row["id"]
+                    self._work_cache.put(row["title"], row["type"], row["id"], overwrite=False)
+
+        return work_ids
+
     def get_unnotified_releases(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get releases that haven't been notified yet.
@@ -711,28 +1765,33 @@ class DatabaseManager:
         """
         Get database statistics.
 
+        Served from the trigger-maintained stats_counters table.
+
         Returns:
             Dictionary with counts of works by type and total releases
         """
         with self.get_connection() as conn:
-            stats = {}
-
-            # Count works by type
-            cursor = conn.execute("""
-                SELECT type, COUNT(*) FROM works GROUP BY type
-            """)
-            for row in cursor.fetchall():
-                stats[f"{row[0]}_works"] = row[1]
+            counts = read_stats_counters(conn)
 
-            # Count total releases
-            cursor = conn.execute("SELECT COUNT(*) FROM releases")
-            stats["total_releases"] = cursor.fetchone()[0]
+        return {
+            "anime_works": counts["works_anime"],
+            "manga_works": counts["works_manga"],
+            "total_works": counts["works_total"],
+            "total_releases": counts["releases_total"],
+            "unnotified_releases": counts["releases_unnotified"],
+        }
 
-            # Count unnotified releases
-            cursor = conn.execute("SELECT COUNT(*) FROM releases WHERE notified = 0")
-            stats["unnotified_releases"] = cursor.fetchone()[0]
+    def rebuild_stats_counters(self) -> Dict[str, int]:
+        """
+        Recount the dashboard counters from works and releases.
 
-            return stats
+        Returns:
+            The rebuilt counter values
+        """
+        with self.get_transaction(immediate=True) as conn:
+            counts = rebuild_stats_counters(conn)
+        self.logger.info(f"Stats counters rebuilt: {counts}")
+        return counts
 
     def cleanup_old_releases(self, days: int = 90) -> int:
         """
@@ -816,6 +1875,8 @@ class DatabaseManager:
             "performance_grade": self._calculate_performance_grade(),
             "connection_ages_tracked": len(self._connection_ages),
             "slow_query_threshold": self._slow_query_threshold,
+            # Work id cache metrics
+            "work_cache": self._work_cache.get_stats(),
         }
 
     def _calculate_health_score(self) -> float:
@@ -1208,21 +2269,42 @@ class DatabaseManager:
                 "notification_type": notification_type or "all",
             }
 
-    def execute_wal_checkpoint(self) -> dict:
+    def execute_wal_checkpoint(
+        self, mode: str = "TRUNCATE", busy_timeout_ms: Optional[int] = None
+    ) -> dict:
         """
         Execute WAL checkpoint to consolidate WAL file into main database.
 
         This should be called periodically to prevent WAL file from growing too large
-        and to ensure data durability.
+        and to ensure data durability. Prefer maybe_checkpoint_wal() for routine
+        calls: RESTART/TRUNCATE wait for active readers to finish.
+
+        Args:
+            mode: One of WAL_CHECKPOINT_MODES
+            busy_timeout_ms: Upper bound on waiting for readers/writers
+                (default: the connection's 30 second timeout)
 
         Returns:
             dict: Checkpoint result with busy, log, and checkpointed page counts
         """
+        mode = mode.upper()
+        if mode not in WAL_CHECKPOINT_MODES:
+            raise ValueError(f"Invalid WAL checkpoint mode: {mode}")
+
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
-                result = cursor.fetchone()
+                previous_timeout = None
+                if busy_timeout_ms is not None:
+                    previous_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+                    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+                try:
+                    cursor = conn.execute(f"PRAGMA wal_checkpoint({mode});")
+                    result = cursor.fetchone()
+                finally:
+                    if previous_timeout is not None:
+                        conn.execute(f"PRAGMA busy_timeout = {int(previous_timeout)}")
                 checkpoint_info = {
+                    "mode": mode,
                     "busy": result[0],
                     "log_pages": result[1],
                     "checkpointed_pages": result[2],
@@ -1230,13 +2312,45 @@ class DatabaseManager:
                     "timestamp": datetime.now().isoformat(),
                 }
                 self.logger.info(
-                    f"WAL checkpoint executed: busy={result[0]}, "
+                    f"WAL checkpoint ({mode}) executed: busy={result[0]}, "
                     f"log={result[1]}, checkpointed={result[2]}"
                 )
                 return checkpoint_info
         except Exception as e:
             self.logger.error(f"WAL checkpoint failed: {e}")
-            return {"success": False, "error": str(e)}
+            return {"mode": mode, "success": False, "error": str(e)}
+
+    def maybe_checkpoint_wal(
+        self,
+        truncate_threshold_bytes: int = WAL_TRUNCATE_THRESHOLD_BYTES,
+        busy_timeout_ms: int = WAL_CHECKPOINT_BUSY_TIMEOUT_MS,
+    ) -> dict:
+        """
+        Checkpoint the WAL without holding up readers.
+
+        A PASSIVE checkpoint copies every frame no reader still needs and never
+        waits. Only once the WAL has outgrown truncate_threshold_bytes (long
+        readers kept earlier checkpoints from completing) is a TRUNCATE
+        attempted, and then with a short busy timeout so it gives up rather
+        than stalling. Call it after a batch of writes, e.g. a collection run.
+
+        Returns:
+            dict: execute_wal_checkpoint() result plus wal_bytes, or
+            {"skipped": True} when there is no WAL to checkpoint
+        """
+        try:
+            wal_bytes = os.path.getsize(f"{self.db_path}-wal")
+        except OSError:
+            wal_bytes = 0
+        if wal_bytes == 0:
+            return {"success": True, "skipped": True, "wal_bytes": 0}
+
+        if wal_bytes < truncate_threshold_bytes:
+            result = self.execute_wal_checkpoint("PASSIVE")
+        else:
+            result = self.execute_wal_checkpoint("TRUNCATE", busy_timeout_ms=busy_timeout_ms)
+        result["wal_bytes"] = wal_bytes
+        return result
 
     def check_integrity(self) -> dict:
         """
@@ -1369,9 +2483,9 @@ class DatabaseManager:
 
     def close_connections(self):
         """Close all database connections and clean up resources."""
-        # Execute WAL checkpoint before closing
+        # Execute WAL checkpoint before closing (bounded so shutdown never waits on readers)
         try:
-            self.execute_wal_checkpoint()
+            self.execute_wal_checkpoint(busy_timeout_ms=WAL_CHECKPOINT_BUSY_TIMEOUT_MS)
         except Exception as e:
             self.logger.warning(f"WAL checkpoint before close failed: {e}")
 
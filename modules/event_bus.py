@@ -0,0 +1,196 @@
+"""
+プロセス内イベントバス
+
+収集ジョブの進捗・ソースごとの所要時間・新着リリース数などを
+購読者（SSE で接続中のダッシュボードなど）へ配信する。
+
+- publish_event: イベントを発行（購読者がいなければほぼ無コスト）
+- EventBus.subscribe: 購読を開始し、Subscription.get() でイベントを受け取る
+- format_sse: イベントを text/event-stream 形式に変換
+
+購読者ごとのキューは上限付きで、遅いクライアントは古いイベントから
+捨てられる（発行側がブロックされることはない）。直近のイベントは
+リングバッファに保持し、再接続時に Last-Event-ID 以降を再送できる。
+
+同一プロセス内の配信のみを扱う。cron などから別プロセスで実行された
+収集処理のイベントはこのバスには届かない。
+"""
+
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """EventBus の購読1件分（スレッドセーフな上限付きキュー）"""
+
+    def __init__(self, bus: "EventBus", max_queue: int):
+        self._bus = bus
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def _put(self, event: Dict[str, Any]):
+        """イベントを追加（満杯なら最も古いイベントを捨てる）"""
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        次のイベントを取得
+
+        Args:
+            timeout: 待機する最大秒数（None なら無期限）
+
+        Returns:
+            Optional[Dict[str, Any]]: イベント。タイムアウトした場合は None
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """購読を終了"""
+        self._bus.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class EventBus:
+    """購読者へイベントをファンアウトするプロセス内バス"""
+
+    def __init__(self, history_size: int = 100):
+        """
+        初期化
+
+        Args:
+            history_size: 再接続時の再送用に保持する直近イベント数
+        """
+        self._subscribers: List[Subscription] = []
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def publish(self, event_type: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        イベントを発行
+
+        Args:
+            event_type: イベント種別（"collection.progress" など）
+            data: JSON シリアライズ可能なペイロード
+
+        Returns:
+            Dict[str, Any]: 発行したイベント（id, type, timestamp, data）
+        """
+        with self._lock:
+            event = {
+                "id": next(self._ids),
+                "type": event_type,
+                "timestamp": time.time(),
+                "data": data or {},
+            }
+            self._history.append(event)
+            self.published += 1
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            subscription._put(event)
+        return event
+
+    def subscribe(self, max_queue: int = 100, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        購読を開始
+
+        Args:
+            max_queue: 未読イベントの上限
+            last_event_id: 再接続時に受け取った最後のイベントID。以降の履歴を先に積む
+
+        Returns:
+            Subscription: 購読（使い終わったら close() すること）
+        """
+        subscription = Subscription(self, max_queue)
+        with self._lock:
+            if last_event_id is not None:
+                for event in self._history:
+                    if event["id"] > last_event_id:
+                        subscription._put(event)
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """購読を解除"""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """バスの統計"""
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "history": len(self._history),
+            }
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """
+    イベントを Server-Sent Events のメッセージに変換
+
+    Args:
+        event: EventBus.publish が返したイベント
+
+    Returns:
+        str: ``id:`` / ``event:`` / ``data:`` 行と空行からなるメッセージ
+    """
+    payload = json.dumps(
+        {"timestamp": event["timestamp"], **event["data"]}, ensure_ascii=False, default=str
+    )
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+
+# グローバルイベントバス
+_event_bus: Optional[EventBus] = None
+_event_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """グローバルイベントバスを取得"""
+    global _event_bus
+    if _event_bus is None:
+        with _event_bus_lock:
+            if _event_bus is None:
+                _event_bus = EventBus()
+    return _event_bus
+
+
+def publish_event(event_type: str, data: Optional[Dict[str, Any]] = None):
+    """
+    グローバルイベントバスにイベントを発行
+
+    発行の失敗で収集処理を止めないよう、例外はログに記録して握りつぶす。
+    """
+    try:
+        get_event_bus().publish(event_type, data)
+    except Exception as e:
+        logger.warning(f"Failed to publish event {event_type}: {e}")
@@ -0,0 +1,452 @@
+"""
+RSS フィードの取得状態の永続化
+
+- FeedStateStore: フィード URL ごとに前回の応答の ETag / Last-Modified を保存する。
+  次回の取得でこれを If-None-Match / If-Modified-Since として送り、
+  304 Not Modified が返ればダウンロード・解析・正規化を丸ごと省略できる。
+  あわせてフィードの健全性（成功・失敗回数、観測した更新間隔、次回ポーリング時刻）も保存する
+- SeenEntryIndex: 取り込み済みエントリーを (フィード URL, エントリーキー) と
+  内容ハッシュで記録する。解析直後に既知のエントリーを落とし、
+  新規・内容が変わったエントリーだけを正規化以降の処理に回す
+
+状態は rss_feed_state / rss_seen_entries テーブル（DatabaseManager と同じ
+SQLite ファイル）に保存する。db_path を省略した場合はメモリ上だけで保持する。
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _header(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    """レスポンスヘッダーの値（文字列でなければ None）"""
+    try:
+        value = headers.get(name)
+    except Exception:
+        return None
+    return value if isinstance(value, str) and value else None
+
+
+# rss_feed_state に保存するフィード健全性のカラムと型
+FEED_HEALTH_COLUMNS = {
+    "success_count": "INTEGER DEFAULT 0",
+    "failure_count": "INTEGER DEFAULT 0",
+    "consecutive_failures": "INTEGER DEFAULT 0",
+    "not_modified_count": "INTEGER DEFAULT 0",
+    "last_success": "DATETIME",
+    "last_failure": "DATETIME",
+    "average_response_time": "REAL DEFAULT 0",
+    "last_changed": "DATETIME",
+    "change_interval": "REAL",
+    "next_poll_at": "DATETIME",
+}
+
+
+class FeedStateStore:
+    """フィード URL ごとの条件付きGET用の検証子（ETag / Last-Modified）と健全性を保持するストア"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス（None ならメモリ上のみ）
+        """
+        self.db_path = db_path
+        self._validators: Dict[str, Dict[str, Optional[str]]] = {}
+        self._health: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if db_path:
+            try:
+                self._ensure_table()
+                self._load()
+            except sqlite3.Error as e:
+                logger.warning(f"フィード状態を読み込めません（メモリ上のみで保持）: {e}")
+                self.db_path = None
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _ensure_table(self):
+        """rss_feed_state テーブルを作成（健全性カラムが無い既存テーブルには追加）"""
+        conn = self._connect()
+        try:
+            health_columns = ",\n".join(
+                f"                    {name} {column_type}"
+                for name, column_type in FEED_HEALTH_COLUMNS.items()
+            )
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS rss_feed_state (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+{health_columns},
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(rss_feed_state)")}
+            for name, column_type in FEED_HEALTH_COLUMNS.items():
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE rss_feed_state ADD COLUMN {name} {column_type}")
+                    logger.info(f"rss_feed_state に {name} カラムを追加しました")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _load(self):
+        """保存済みの検証子と健全性を読み込む"""
+        names = list(FEED_HEALTH_COLUMNS)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT feed_url, etag, last_modified, {', '.join(names)} FROM rss_feed_state"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        with self._lock:
+            for feed_url, etag, last_modified, *health in rows:
+                self._validators[feed_url] = {"etag": etag, "last_modified": last_modified}
+                self._health[feed_url] = dict(zip(names, health))
+
+    def get_validators(self, feed_url: str) -> Dict[str, Optional[str]]:
+        """
+        保存済みの検証子を取得
+
+        Returns:
+            Dict[str, Optional[str]]: etag, last_modified（未保存なら None）
+        """
+        with self._lock:
+            validators = self._validators.get(feed_url)
+        return dict(validators) if validators else {"etag": None, "last_modified": None}
+
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """条件付きGETのリクエストヘッダー（検証子が無ければ空）"""
+        validators = self.get_validators(feed_url)
+        headers = {}
+        if validators["etag"]:
+            headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def save_validators(
+        self, feed_url: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> bool:
+        """
+        検証子を保存（変化が無ければ書き込まない）
+
+        Returns:
+            bool: 値が変わった場合 True
+        """
+        validators = {"etag": etag or None, "last_modified": last_modified or None}
+        with self._lock:
+            if self._validators.get(feed_url, {"etag": None, "last_modified": None}) == validators:
+                return False
+            self._validators[feed_url] = validators
+
+        if self.db_path:
+            try:
+                conn = self._connect()
+                try:
+                    conn.execute(
+                        """
+                        INSERT INTO rss_feed_state (feed_url, etag, last_modified, updated_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(feed_url) DO UPDATE SET
+                            etag = excluded.etag,
+                            last_modified = excluded.last_modified,
+                            updated_at = excluded.updated_at
+                        """,
+                        (feed_url, validators["etag"], validators["last_modified"]),
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"フィード状態の保存に失敗しました ({feed_url}): {e}")
+        return True
+
+    def get_health(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        """
+        保存済みの健全性を取得
+
+        Returns:
+            Optional[Dict[str, Any]]: FEED_HEALTH_COLUMNS の値（日時は ISO 形式の文字列）。
+            未保存なら None
+        """
+        with self._lock:
+            record = self._health.get(feed_url)
+        return dict(record) if record else None
+
+    def save_health(self, feed_url: str, record: Mapping[str, Any]):
+        """
+        健全性を保存
+
+        Args:
+            feed_url: フィードURL
+            record: FEED_HEALTH_COLUMNS のキーを持つ辞書（日時は ISO 形式の文字列）
+        """
+        names = list(FEED_HEALTH_COLUMNS)
+        values = {name: record.get(name) for name in names}
+        with self._lock:
+            self._health[feed_url] = values
+
+        if not self.db_path:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    f"""
+                    INSERT INTO rss_feed_state (feed_url, {', '.join(names)}, updated_at)
+                    VALUES (?, {', '.join('?' * len(names))}, CURRENT_TIMESTAMP)
+                    ON CONFLICT(feed_url) DO UPDATE SET
+                        {', '.join(f'{name} = excluded.{name}' for name in names)},
+                        updated_at = excluded.updated_at
+                    """,
+                    (feed_url, *(values[name] for name in names)),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"フィードの健全性の保存に失敗しました ({feed_url}): {e}")
+
+    def validators_from_response(
+        self, feed_url: str, headers: Mapping[str, Any], not_modified: bool = False
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        レスポンスヘッダーから保存すべき検証子を求める（保存はしない）
+
+        200 では応答の値で置き換える（無ければ消す）。304 ではヘッダーが
+        省略されることがあるため、含まれている値だけを更新する。
+
+        Args:
+            feed_url: フィードURL
+            headers: レスポンスヘッダー（requests / aiohttp どちらでも可）
+            not_modified: 304 応答の場合 True
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: (etag, last_modified)
+        """
+        etag = _header(headers, "ETag")
+        last_modified = _header(headers, "Last-Modified")
+        if not_modified:
+            current = self.get_validators(feed_url)
+            etag = etag or current["etag"]
+            last_modified = last_modified or current["last_modified"]
+        return etag, last_modified
+
+    def update_from_response(
+        self, feed_url: str, headers: Mapping[str, Any], not_modified: bool = False
+    ) -> bool:
+        """
+        レスポンスヘッダーから検証子を更新
+
+        取得したエントリーの保存が済んでから呼ぶこと（保存前に更新すると、
+        次回は 304 が返って未保存のエントリーを再取得できない）。
+
+        Returns:
+            bool: 値が変わった場合 True
+        """
+        return self.save_validators(
+            feed_url, *self.validators_from_response(feed_url, headers, not_modified)
+        )
+
+
+# 取り込み済みエントリーの保持日数。これより古い記録は削除する
+SEEN_ENTRY_RETENTION_DAYS = 180
+
+# 内容ハッシュに含めるエントリーのフィールド
+_ENTRY_CONTENT_FIELDS = ("title", "link", "summary", "published", "updated")
+
+
+def entry_fingerprint(entry: Mapping[str, Any]) -> Tuple[str, str]:
+    """
+    フィードエントリーのキーと内容ハッシュを作る
+
+    キーは id（guid）、無ければ link、どちらも無ければ内容ハッシュ。
+    内容ハッシュはタイトル・リンク・概要・日付から作るため、同じ guid の
+    エントリーが書き換えられた場合も検出できる。
+
+    Returns:
+        Tuple[str, str]: (エントリーキー, 内容ハッシュ)
+    """
+    # FeedParserDict.get は欠けたキーを別名で補う（updated -> published など）ため、
+    # 実際にエントリーに含まれる値だけを見る
+    get = dict.get if isinstance(entry, dict) else type(entry).get
+    content = "\x1f".join(str(get(entry, field) or "") for field in _ENTRY_CONTENT_FIELDS)
+    content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    key = get(entry, "id") or get(entry, "link") or f"sha1:{content_hash}"
+    return str(key), content_hash
+
+
+class SeenEntryIndex:
+    """フィードごとの取り込み済みエントリーの索引"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        初期化
+
+        Args:
+            db_path: データベースファイルパス（None ならメモリ上のみ）
+        """
+        self.db_path = db_path
+        # feed_url -> {entry_key: content_hash}（フィード単位で必要になった時に読み込む）
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+        if db_path:
+            try:
+                self._ensure_table()
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"取り込み済みエントリーの索引を使えません（メモリ上のみで保持）: {e}"
+                )
+                self.db_path = None
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def _ensure_table(self):
+        """rss_seen_entries テーブルを作成"""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rss_seen_entries (
+                    feed_url TEXT NOT NULL,
+                    entry_key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    seen_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (feed_url, entry_key)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_rss_seen_entries_seen_at
+                ON rss_seen_entries(seen_at)
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _feed_entries(self, feed_url: str) -> Dict[str, str]:
+        """フィードの取り込み済みエントリー（呼び出し側で self._lock を保持すること）"""
+        entries = self._entries.get(feed_url)
+        if entries is None:
+            entries = {}
+            if self.db_path:
+                try:
+                    conn = self._connect()
+                    try:
+                        entries = dict(
+                            conn.execute(
+                                "SELECT entry_key, content_hash FROM rss_seen_entries"
+                                " WHERE feed_url = ?",
+                                (feed_url,),
+                            ).fetchall()
+                        )
+                    finally:
+                        conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(
+                        f"取り込み済みエントリーの読み込みに失敗しました ({feed_url}): {e}"
+                    )
+            self._entries[feed_url] = entries
+        return entries
+
+    def filter_new(
+        self, feed_url: str, entries: Iterable[Mapping[str, Any]]
+    ) -> Tuple[List[Mapping[str, Any]], List[Tuple[str, str, str]]]:
+        """
+        未取り込み（新規または内容が変わった）エントリーだけを残す
+
+        索引は更新しない。取り込みが終わったら返された marks を mark_seen() に渡す。
+
+        Returns:
+            Tuple: (新しいエントリーのリスト, marks)。marks は
+            (feed_url, entry_key, content_hash) のリスト
+        """
+        new_entries = []
+        marks = []
+        batch_keys = set()
+        with self._lock:
+            seen = self._feed_entries(feed_url)
+            for entry in entries:
+                key, content_hash = entry_fingerprint(entry)
+                if seen.get(key) == content_hash or (key, content_hash) in batch_keys:
+                    continue
+                batch_keys.add((key, content_hash))
+                new_entries.append(entry)
+                marks.append((feed_url, key, content_hash))
+        return new_entries, marks
+
+    def mark_seen(self, marks: Sequence[Tuple[str, str, str]]) -> int:
+        """
+        エントリーを取り込み済みとして記録
+
+        Returns:
+            int: 記録した件数
+        """
+        if not marks:
+            return 0
+
+        with self._lock:
+            for feed_url, key, content_hash in marks:
+                self._feed_entries(feed_url)[key] = content_hash
+
+        if self.db_path:
+            try:
+                conn = self._connect()
+                try:
+                    conn.executemany(
+                        """
+                        INSERT INTO rss_seen_entries (feed_url, entry_key, content_hash, seen_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(feed_url, entry_key) DO UPDATE SET
+                            content_hash = excluded.content_hash,
+                            seen_at = excluded.seen_at
+                        """,
+                        marks,
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"取り込み済みエントリーの保存に失敗しました: {e}")
+        return len(marks)
+
+    def prune(self, retention_days: int = SEEN_ENTRY_RETENTION_DAYS) -> int:
+        """
+        保持期間を過ぎた記録を削除（フィードから消えたエントリーの掃除）
+
+        Returns:
+            int: 削除した件数
+        """
+        if not self.db_path:
+            return 0
+        try:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    "DELETE FROM rss_seen_entries WHERE seen_at < datetime('now', ?)",
+                    (f"-{int(retention_days)} days",),
+                )
+                conn.commit()
+                deleted = cursor.rowcount
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"取り込み済みエントリーの削除に失敗しました: {e}")
+            return 0
+
+        if deleted:
+            with self._lock:
+                self._entries.clear()
+        return deleted
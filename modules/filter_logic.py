@@ -12,8 +12,6 @@ Enhanced features (統合版):
 - Audit logging for filtered content
 """
 
-import difflib
-import hashlib
 import json
 import logging
 import re
@@ -24,6 +22,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from .cache import MemoryCache
+from .keyword_matcher import FuzzyKeywordIndex, KeywordAutomaton
 from .models import AniListWork, RSSFeedItem, Work
 
 # === Enhanced Filter Classes (統合: filter_logic_enhanced.py より移植) ===
@@ -104,6 +104,8 @@ class ContentFilter:
         config_manager,
         enable_fuzzy_matching: bool = True,
         similarity_threshold: float = 0.8,
+        result_cache_size: int = 5000,
+        result_cache_ttl: Optional[float] = 3600,
     ):
         """
         Enhanced フィルターの初期化
@@ -112,6 +114,8 @@ class ContentFilter:
             config_manager: 設定管理インスタンス
             enable_fuzzy_matching: ファジィマッチングを有効にするか
             similarity_threshold: ファジィマッチングの類似度閾値 (0.0-1.0)
+            result_cache_size: テキスト判定結果キャッシュの最大件数
+            result_cache_ttl: テキスト判定結果キャッシュのTTL（秒、None で無期限）
         """
         self.config = config_manager
         self.logger = logging.getLogger(__name__)
@@ -129,6 +133,15 @@ class ContentFilter:
         # Performance optimization: pre-compile keyword patterns for faster matching
         self.compiled_keyword_patterns = self._compile_keyword_patterns()
 
+        # 全NGキーワードを1回の走査で照合する Aho-Corasick オートマトン
+        self.keyword_automaton = KeywordAutomaton(self.compiled_keyword_patterns)
+
+        # ファジィマッチング用インデックス（キーワード変更時に破棄し、次回利用時に再構築）
+        self._fuzzy_index: Optional[FuzzyKeywordIndex] = None
+
+        # テキスト判定結果の LRU/TTL キャッシュ（キーワード変更時にクリア）
+        self._filter_cache = MemoryCache(max_size=result_cache_size, default_ttl=result_cache_ttl)
+
         # Performance tracking
         self.filter_call_count = 0
         self.total_filter_time = 0.0
@@ -301,11 +314,6 @@ class ContentFilter:
 
         return FilterResult(is_filtered=False)
 
-    @lru_cache(maxsize=1000)
-    def _get_text_hash(self, text: str) -> str:
-        """Generate hash for text caching."""
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
     def _check_text_content_optimized(self, text: str, context: str) -> FilterResult:
         """
         Optimized テキストコンテンツをチェック with caching and performance improvements
@@ -323,25 +331,17 @@ class ContentFilter:
         start_time = time.time()
         self.filter_call_count += 1
 
-        # Check cache first
-        text_hash = self._get_text_hash(text + context)
-        cached_result = getattr(self, "_filter_cache", {}).get(text_hash)
-        if cached_result:
+        # Check cache first (tuple key: no concatenation or hashing of the text)
+        cache_key = (context, text)
+        cached_result = self._filter_cache.get(cache_key)
+        if cached_result is not None:
             self.cache_hits += 1
             return cached_result
 
         result = self._check_text_content(text, context)
 
-        # Cache the result
-        if not hasattr(self, "_filter_cache"):
-            self._filter_cache = {}
-        self._filter_cache[text_hash] = result
-
-        # Limit cache size to prevent memory issues
-        if len(self._filter_cache) > 5000:
-            # Remove oldest half of cache entries
-            cache_items = list(self._filter_cache.items())
-            self._filter_cache = dict(cache_items[2500:])
+        # Cache the result (LRU eviction and TTL are handled by MemoryCache)
+        self._filter_cache.set(cache_key, result)
 
         self.total_filter_time += time.time() - start_time
         return result
@@ -360,11 +360,8 @@ class ContentFilter:
         if not text:
             return FilterResult(is_filtered=False)
 
-        # Fast exact matching using compiled patterns
-        matched_keywords = []
-        for keyword, pattern in self.compiled_keyword_patterns.items():
-            if pattern.search(text):
-                matched_keywords.append(keyword)
+        # Fast exact matching: single pass over the text for all keywords
+        matched_keywords = self.keyword_automaton.find_all(text)
 
         # If no exact matches and fuzzy matching is enabled, try fuzzy matching
         if not matched_keywords and self.enable_fuzzy_matching:
@@ -398,22 +395,18 @@ class ContentFilter:
         Returns:
             List of matched keywords
         """
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyKeywordIndex(keyword.lower() for keyword in self.ng_keywords)
+
         fuzzy_matches = []
         text_words = text.lower().split()
 
-        for keyword in self.ng_keywords:
-            keyword_lower = keyword.lower()
-
-            # Check each word in the text for fuzzy similarity
-            for word in text_words:
-                if len(word) >= 3:  # Only check words of reasonable length
-                    similarity = difflib.SequenceMatcher(None, word, keyword_lower).ratio()
-                    if similarity >= self.similarity_threshold:
-                        fuzzy_matches.append(f"{keyword} (fuzzy: {similarity:.2f})")
-                        self.logger.debug(
-                            f"Fuzzy match: '{word}' ~ '{keyword}' (similarity: {similarity:.2f})"
-                        )
-                        break
+        # Only candidate pairs that can reach the threshold are compared with difflib
+        for keyword, word, similarity in self._fuzzy_index.find_matches(
+            text_words, self.similarity_threshold
+        ):
+            fuzzy_matches.append(f"{keyword} (fuzzy: {similarity:.2f})")
+            self.logger.debug(f"Fuzzy match: '{word}' ~ '{keyword}' (similarity: {similarity:.2f})")
 
         return fuzzy_matches
 
@@ -524,6 +517,7 @@ class ContentFilter:
             "exclude_tags_count": len(self.exclude_tags),
             "custom_patterns_count": len(self.custom_patterns),
             "compiled_patterns_count": len(self.compiled_keyword_patterns),
+            "automaton_keywords_count": len(self.keyword_automaton),
             "fuzzy_matching_enabled": self.enable_fuzzy_matching,
             "similarity_threshold": self.similarity_threshold,
             "performance": {
@@ -532,7 +526,8 @@ class ContentFilter:
                 "average_filter_time": avg_filter_time,
                 "cache_hits": self.cache_hits,
                 "cache_hit_rate": cache_hit_rate,
-                "cache_size": len(getattr(self, "_filter_cache", {})),
+                "cache_size": len(self._filter_cache),
+                "result_cache": self._filter_cache.get_stats(),
             },
         }
 
@@ -541,11 +536,12 @@ class ContentFilter:
         Optimize filter performance by recompiling patterns and clearing old cache.
         """
         # Clear old cache
-        if hasattr(self, "_filter_cache"):
-            self._filter_cache.clear()
+        self._filter_cache.clear()
 
         # Recompile patterns
         self.compiled_keyword_patterns = self._compile_keyword_patterns()
+        self.keyword_automaton = KeywordAutomaton(self.compiled_keyword_patterns)
+        self._fuzzy_index = None
 
         # Reset performance counters
         self.filter_call_count = 0
@@ -569,10 +565,11 @@ class ContentFilter:
                 escaped = re.escape(keyword.lower().strip())
                 pattern = re.compile(f"\\b{escaped}\\b", re.IGNORECASE | re.UNICODE)
                 self.compiled_keyword_patterns[keyword.lower().strip()] = pattern
+                self.keyword_automaton.add(keyword.lower().strip())
+                self._fuzzy_index = None
 
                 # Clear cache to ensure new keyword takes effect
-                if hasattr(self, "_filter_cache"):
-                    self._filter_cache.clear()
+                self._filter_cache.clear()
 
                 self.logger.info(f"Added dynamic NG keyword: '{keyword}'")
             except re.error as e:
@@ -589,10 +586,11 @@ class ContentFilter:
         if keyword_lower in self.ng_keywords:
             self.ng_keywords.discard(keyword_lower)
             self.compiled_keyword_patterns.pop(keyword_lower, None)
+            self.keyword_automaton.remove(keyword_lower)
+            self._fuzzy_index = None
 
             # Clear cache
-            if hasattr(self, "_filter_cache"):
-                self._filter_cache.clear()
+            self._filter_cache.clear()
 
             self.logger.info(f"Removed dynamic NG keyword: '{keyword}'")
 
@@ -606,10 +604,11 @@ class ContentFilter:
         """
         self.ng_keywords = self._normalize_keywords(keywords)
         self.compiled_keyword_patterns = self._compile_keyword_patterns()
+        self.keyword_automaton = KeywordAutomaton(self.compiled_keyword_patterns)
+        self._fuzzy_index = None
 
         # Clear cache to ensure new keywords take effect
-        if hasattr(self, "_filter_cache"):
-            self._filter_cache.clear()
+        self._filter_cache.clear()
 
         self.logger.info(f"Set NG keywords: {keywords}")
 
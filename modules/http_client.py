@@ -0,0 +1,489 @@
+"""
+API 収集器で共有する非同期 HTTP クライアント
+
+- SharedHttpClient: イベントループごとに1つの aiohttp セッションを持ち、全ての収集器が
+  同じ接続プール（ホスト単位の同時接続数、keep-alive、DNS キャッシュ、gzip / brotli）を使う。
+  収集器は `async with get_http_client():` の間セッションを共有し、最後の利用者が
+  抜けた時に閉じる
+- TokenBucket / configure_rate_limit: ホストごとのトークンバケット。プロセス全体で
+  共有するため、別々のクライアントから同じ API を呼んでもレート制限を超えない
+- RetryPolicy: 接続エラー・タイムアウト・429 / 5xx を指数バックオフで再試行する
+  （Retry-After があればそれに従う）
+- get_http_stats: ホストごとのリクエスト数・再試行・待機時間と、接続の新規作成・再利用数
+
+応答本文は読み切ってから接続をプールに戻し、HttpResponse として返す。
+"""
+
+import asyncio
+import importlib.util
+import json
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_USER_AGENT = "MangaAnime-Info-Delivery-System/1.0"
+
+# 接続プールの既定値
+DEFAULT_CONNECTION_LIMIT = 30
+DEFAULT_LIMIT_PER_HOST = 6
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+DEFAULT_DNS_CACHE_TTL = 300
+
+# 再試行する HTTP ステータス
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _brotli_available() -> bool:
+    """aiohttp が brotli の展開に使うライブラリがあるか"""
+    return any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+
+
+ACCEPT_ENCODING = "gzip, deflate, br" if _brotli_available() else "gzip, deflate"
+
+
+def host_of(url_or_host: str) -> str:
+    """URL（またはホスト名）からホスト名を取り出す（小文字）"""
+    if "://" in url_or_host:
+        return (urlsplit(url_or_host).hostname or "").lower()
+    return url_or_host.lower()
+
+
+class TokenBucket:
+    """
+    ホスト単位のトークンバケット
+
+    トークンは requests_per_minute の速さで burst 個まで貯まる。取得時に足りなければ
+    不足分が貯まるまで待つ。待ち時間は予約した時点で確定するため、同時に呼ばれても
+    順番に間隔が空く。スレッド・イベントループをまたいで共有できる。
+    """
+
+    def __init__(self, requests_per_minute: float, burst: Optional[int] = None):
+        self.requests_per_minute = float(requests_per_minute)
+        self.rate = self.requests_per_minute / 60.0
+        self.capacity = max(1, int(burst or 1))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """トークンを1つ予約し、使えるまでの待ち時間（秒）を返す"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def reconfigure(self, requests_per_minute: float, burst: Optional[int] = None):
+        """
+        速度と上限をその場で変更する
+
+        それまでの速度で貯まった分を反映してから新しい上限で切り詰める。トークンが
+        負（Retry-After などで待ち中）の場合は、残りの待ち時間が変わらないよう新しい
+        速度で換算して引き継ぐ。
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            rate = float(requests_per_minute) / 60.0
+            if tokens < 0:
+                tokens = tokens / self.rate * rate
+            self.requests_per_minute = float(requests_per_minute)
+            self.rate = rate
+            self.capacity = max(1, int(burst or 1))
+            self.tokens = min(float(self.capacity), tokens)
+            self.updated = now
+
+    def defer(self, seconds: float):
+        """次の取得を seconds 秒後まで遅らせる（429 の Retry-After を全利用者に反映）"""
+        with self._lock:
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+    async def acquire(self) -> float:
+        """トークンを取得（必要なら待つ）。待った秒数を返す"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def configure_rate_limit(
+    url_or_host: str, requests_per_minute: float, burst: Optional[int] = None
+) -> TokenBucket:
+    """
+    ホストのレート制限を設定
+
+    既存のバケットがあれば同じオブジェクトを返す。設定が変わった場合も作り直さず
+    TokenBucket.reconfigure で更新するため、Retry-After による待ちは引き継がれる。
+
+    Args:
+        url_or_host: API のベース URL またはホスト名
+        requests_per_minute: 1分あたりのリクエスト数
+        burst: 連続で送ってよいリクエスト数（省略時は 1 = 一定間隔）
+    """
+    host = host_of(url_or_host)
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(host)
+        if bucket is None:
+            bucket = TokenBucket(requests_per_minute, burst)
+            _rate_limiters[host] = bucket
+        elif (bucket.requests_per_minute, bucket.capacity) != (
+            float(requests_per_minute),
+            max(1, int(burst or 1)),
+        ):
+            bucket.reconfigure(requests_per_minute, burst)
+        return bucket
+
+
+def get_rate_limiter(url_or_host: str) -> Optional[TokenBucket]:
+    """ホストのレート制限（未設定なら None）"""
+    with _rate_limiters_lock:
+        return _rate_limiters.get(host_of(url_or_host))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """再試行の方針"""
+
+    max_retries: int = 2
+    backoff: float = 1.0  # 初回の待ち時間（秒）。以降は倍々
+    max_backoff: float = 60.0
+    retry_statuses: frozenset = RETRY_STATUSES
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """attempt 回目（0 始まり）の失敗後の待ち時間"""
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                try:
+                    seconds = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    seconds = None
+            if seconds is not None:
+                return min(max(seconds, 0.0), self.max_backoff)
+        return min(self.backoff * (2**attempt), self.max_backoff)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+@dataclass
+class HttpResponse:
+    """読み切った HTTP 応答"""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    url: str
+    encoding: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.text())
+
+
+class _HttpStats:
+    """ホストごとのリクエスト統計と接続の利用状況"""
+
+    HOST_COUNTERS = ("requests", "errors", "retries", "bytes", "rate_limit_wait", "elapsed")
+    CONNECTION_COUNTERS = ("created", "reused", "dns_cache_hits", "dns_cache_misses")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hosts: Dict[str, Dict[str, Any]] = {}
+            self.connections = dict.fromkeys(self.CONNECTION_COUNTERS, 0)
+
+    def record(self, host: str, status: Optional[int] = None, **counters: float):
+        with self._lock:
+            stats = self.hosts.setdefault(
+                host, {**dict.fromkeys(self.HOST_COUNTERS, 0), "statuses": {}}
+            )
+            for name, value in counters.items():
+                stats[name] += value
+            if status is not None:
+                stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+
+    def record_connection(self, name: str):
+        with self._lock:
+            self.connections[name] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            hosts = {
+                host: {**stats, "statuses": dict(stats["statuses"])}
+                for host, stats in self.hosts.items()
+            }
+            return {"hosts": hosts, "connections": dict(self.connections)}
+
+
+_stats = _HttpStats()
+
+
+class _LoopSession:
+    """イベントループ1つ分のセッションと利用者数"""
+
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.leases = 0
+
+
+class SharedHttpClient:
+    """
+    収集器で共有する非同期 HTTP クライアント
+
+    aiohttp のセッションはイベントループに結び付くため、ループごとに1つ作る。
+    `async with client:` の間はセッションを保持し、最後の利用者が抜けた時に閉じる。
+    その外で request() を呼んだ場合はそのリクエストの間だけセッションを開く。
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._loops: "weakref.WeakKeyDictionary[Any, _LoopSession]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> "SharedHttpClient":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
+
+    def _loop_session(self) -> _LoopSession:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None:
+                state = self._loops[loop] = _LoopSession()
+            return state
+
+    async def acquire(self):
+        """現在のイベントループでセッションの利用を始める"""
+        self._loop_session().leases += 1
+
+    async def release(self):
+        """利用を終える（最後の利用者ならセッションを閉じる）"""
+        state = self._loop_session()
+        state.leases = max(0, state.leases - 1)
+        if state.leases == 0:
+            await self._close(state)
+
+    async def close(self):
+        """現在のイベントループのセッションを利用者数に関係なく閉じる"""
+        state = self._loop_session()
+        state.leases = 0
+        await self._close(state)
+
+    @staticmethod
+    async def _close(state: _LoopSession):
+        session, state.session = state.session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """接続の新規作成・再利用と DNS キャッシュの利用を統計に記録する"""
+        trace_config = aiohttp.TraceConfig()
+
+        def counter(name):
+            async def _record(session, context, params):
+                _stats.record_connection(name)
+
+            return _record
+
+        trace_config.on_connection_create_end.append(counter("created"))
+        trace_config.on_connection_reuseconn.append(counter("reused"))
+        trace_config.on_dns_cache_hit.append(counter("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(counter("dns_cache_misses"))
+        return trace_config
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """現在のイベントループのセッション（無ければ作成）"""
+        state = self._loop_session()
+        if state.session is None or state.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,
+            )
+            state.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": self.user_agent, "Accept-Encoding": ACCEPT_ENCODING},
+                trace_configs=[self._trace_config()],
+            )
+        return state.session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+    ) -> HttpResponse:
+        """
+        リクエストを送って応答を読み切る
+
+        ホストにレート制限が設定されていればトークンを取得してから送る。
+        接続エラー・タイムアウトと retry.retry_statuses の応答は再試行する。
+
+        Returns:
+            HttpResponse: 最後の応答（再試行しきった 429 / 5xx もそのまま返す）
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: 再試行しても接続できなかった場合
+        """
+        policy = retry or DEFAULT_RETRY_POLICY
+        host = host_of(url)
+        kwargs: Dict[str, Any] = {"params": params, "json": json, "headers": headers}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async with self:
+            attempt = 0
+            while True:
+                bucket = get_rate_limiter(host)
+                if bucket is not None:
+                    waited = await bucket.acquire()
+                    if waited:
+                        _stats.record(host, rate_limit_wait=waited)
+
+                start = time.monotonic()
+                try:
+                    async with self.get_session().request(method, url, **kwargs) as response:
+                        body = await response.read()
+                        result = HttpResponse(
+                            status=response.status,
+                            headers=response.headers,
+                            body=body,
+                            url=str(response.url),
+                            encoding=response.charset,
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    _stats.record(host, requests=1, errors=1, elapsed=time.monotonic() - start)
+                    if attempt >= policy.max_retries:
+                        raise
+                    delay = policy.delay(attempt)
+                    logger.warning(
+                        f"{method} {url} failed ({type(e).__name__}: {e}), "
+                        f"retrying in {delay:.1f}s ({attempt + 1}/{policy.max_retries})"
+                    )
+                else:
+                    _stats.record(
+                        host,
+                        status=result.status,
+                        requests=1,
+                        bytes=len(body),
+                        elapsed=time.monotonic() - start,
+                    )
+                    if result.status not in policy.retry_statuses or attempt >= policy.max_retries:
+                        return result
+                    delay = policy.delay(attempt, result.headers.get("Retry-After"))
+                    logger.warning(
+                        f"{method} {url} returned {result.status}, "
+                        f"retrying in {delay:.1f}s ({attempt + 1}/{policy.max_retries})"
+                    )
+                    if result.status == 429 and bucket is not None:
+                        # 同じホストへの他のリクエストもまとめて待たせる
+                        bucket.defer(delay)
+                        delay = 0
+
+                attempt += 1
+                _stats.record(host, retries=1)
+                if delay:
+                    await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("POST", url, **kwargs)
+
+    def open_sessions(self) -> int:
+        """開いているセッション数（イベントループ数）"""
+        with self._lock:
+            return sum(
+                1
+                for state in self._loops.values()
+                if state.session is not None and not state.session.closed
+            )
+
+
+_client: Optional[SharedHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> SharedHttpClient:
+    """プロセス共有の HTTP クライアント"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SharedHttpClient()
+        return _client
+
+
+def get_http_stats() -> Dict[str, Any]:
+    """
+    HTTP 利用状況の統計
+
+    Returns:
+        Dict[str, Any]: hosts（ホストごとのリクエスト数・エラー・再試行・転送量・
+        レート制限の待ち時間・ステータス別件数）、connections（接続の新規作成・
+        再利用数、DNS キャッシュのヒット・ミス）、rate_limits（ホストごとの 1分あたり上限）、
+        open_sessions
+    """
+    stats = _stats.snapshot()
+    with _rate_limiters_lock:
+        stats["rate_limits"] = {
+            host: bucket.requests_per_minute for host, bucket in _rate_limiters.items()
+        }
+    stats["open_sessions"] = get_http_client().open_sessions()
+    return stats
+
+
+def reset_http_stats():
+    """統計をリセット"""
+    _stats.reset()
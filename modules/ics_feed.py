@@ -0,0 +1,285 @@
+"""
+iCalendar（ICS）フィード生成
+
+カレンダーアプリから購読できる ICS フィードと、選択したリリースの
+ICS エクスポートで共通に使う VEVENT の組み立て処理。
+
+- release_uid: リリースIDから安定した UID を作る（更新時にカレンダー側で差分を取れる）
+- render_event: リリース1件を VEVENT に変換（RFC 5545 のエスケープと75オクテット折り返し）
+- FeedFilter / iter_feed: 絞り込み条件に合うリリースを DB カーソルから1件ずつ VEVENT にして返す
+- get_cached_feed / stream_and_cache_feed: 生成済みフィードをデータバージョン単位でキャッシュ
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from modules.cache import MemoryCache
+
+ICS_PRODID = "-//MangaAnime Info System//Calendar//JP"
+
+# UID のドメイン部。フィードとエクスポートで同じ値を使う
+UID_DOMAIN = "mangaanime-info"
+
+CALENDAR_NAME = "アニメ・マンガリリース予定"
+
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+# フィードが返す期間の上限（日）
+MAX_FEED_DAYS = 366
+
+_feed_cache = MemoryCache(max_size=32, default_ttl=24 * 3600)
+
+
+def escape_text(value: Any) -> str:
+    """TEXT 値のエスケープ（RFC 5545 3.3.11）"""
+    text = "" if value is None else str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """
+    コンテンツ行を75オクテットごとに折り返す（RFC 5545 3.1）
+
+    マルチバイト文字の途中では分割しない。
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+
+    parts = []
+    current = ""
+    size = 0
+    limit = 75
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append(current)
+            # 継続行は先頭の空白1オクテットを含めて75オクテット
+            current, size, limit = "", 0, 74
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def release_uid(release: Mapping[str, Any]) -> str:
+    """
+    リリースの UID を作る
+
+    リリースIDがあればそれを使い、無ければ releases テーブルの一意キーに当たる
+    (作品名, 種類, 番号, プラットフォーム, 日付) のハッシュを使う。
+    どちらも同じリリースに対して常に同じ値になる。
+    """
+    release_id = release.get("release_id")
+    if release_id:
+        return f"release-{release_id}@{UID_DOMAIN}"
+
+    natural_key = "\x1f".join(
+        str(release.get(field) or "")
+        for field in ("original_title", "release_type", "number", "platform", "release_date")
+    )
+    if not release.get("original_title"):
+        natural_key = f"{release.get('title') or ''}\x1f{natural_key}"
+    digest = hashlib.sha256(natural_key.encode("utf-8")).hexdigest()[:24]
+    return f"release-{digest}@{UID_DOMAIN}"
+
+
+def _format_dtstamp(created_at: Optional[str]) -> str:
+    """created_at（SQLite の CURRENT_TIMESTAMP = UTC）を DTSTAMP 形式に変換"""
+    if created_at:
+        try:
+            return datetime.fromisoformat(str(created_at)).strftime("%Y%m%dT%H%M%SZ")
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def calendar_header(name: str = CALENDAR_NAME) -> str:
+    """VCALENDAR の開始部分"""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{ICS_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+        "X-WR-TIMEZONE:Asia/Tokyo",
+    ]
+    return "".join(f"{fold_line(line)}\r\n" for line in lines)
+
+
+def render_event(release: Mapping[str, Any]) -> str:
+    """
+    リリース1件を VEVENT に変換
+
+    Args:
+        release: title, type, release_type, number, platform, release_date,
+            source_url を持つリリース（release_id, created_at は任意）
+
+    Returns:
+        str: CRLF 区切りの VEVENT（末尾の CRLF を含む）
+    """
+    is_anime = release.get("type") == "anime"
+    type_icon = "🎬" if is_anime else "📚"
+    type_label = "アニメ" if is_anime else "マンガ"
+    release_text = "話" if release.get("release_type") == "episode" else "巻"
+    title = release.get("title") or ""
+    number = release.get("number") or ""
+    platform = release.get("platform") or ""
+
+    summary = f"{type_icon}【{type_label}】{title} 第{number}{release_text} | {platform}"
+
+    description = [
+        f"作品: {title}",
+        f"タイプ: {type_label}",
+        f"{release_text}: 第{number}{release_text}",
+        f"配信プラットフォーム: {platform}",
+    ]
+    if release.get("source_url"):
+        description.append(f"ソースURL: {release['source_url']}")
+    description.extend(["", "---", "自動登録: MangaAnime情報配信システム"])
+
+    # 終日イベントの DTEND は翌日（排他的）
+    start = str(release.get("release_date") or "")[:10]
+    try:
+        end = (date.fromisoformat(start) + timedelta(days=1)).strftime("%Y%m%d")
+    except ValueError:
+        end = start.replace("-", "")
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{release_uid(release)}",
+        f"DTSTAMP:{_format_dtstamp(release.get('created_at'))}",
+        f"DTSTART;VALUE=DATE:{start.replace('-', '')}",
+        f"DTEND;VALUE=DATE:{end}",
+        f"SUMMARY:{escape_text(summary)}",
+        f"DESCRIPTION:{escape_text(chr(10).join(description))}",
+        f"LOCATION:{escape_text(platform)}",
+        "STATUS:CONFIRMED",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+    return "".join(f"{fold_line(line)}\r\n" for line in lines)
+
+
+def render_calendar(releases: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """VCALENDAR 全体をチャンク単位で返す"""
+    yield calendar_header()
+    for release in releases:
+        yield render_event(release)
+    yield CALENDAR_FOOTER
+
+
+@dataclass(frozen=True)
+class FeedFilter:
+    """購読フィードの絞り込み条件（キャッシュキーにもなる）"""
+
+    work_type: Optional[str] = None
+    platform: Optional[str] = None
+    work_ids: Tuple[int, ...] = ()
+    days_back: int = 30
+    days_ahead: int = 90
+
+    @classmethod
+    def from_args(cls, args) -> "FeedFilter":
+        """
+        クエリ引数（type, platform, work_id（複数可）, days_back, days_ahead）から作成
+
+        Raises:
+            ValueError: 値が不正な場合
+        """
+        work_type = args.get("type") or None
+        if work_type not in (None, "anime", "manga"):
+            raise ValueError(f"Invalid type: {work_type}")
+
+        try:
+            work_ids = tuple(sorted({int(value) for value in args.getlist("work_id")}))
+            days_back = int(args.get("days_back", cls.days_back))
+            days_ahead = int(args.get("days_ahead", cls.days_ahead))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid feed parameter: {e}") from e
+        if not (0 <= days_back <= MAX_FEED_DAYS and 0 <= days_ahead <= MAX_FEED_DAYS):
+            raise ValueError(f"days_back and days_ahead must be between 0 and {MAX_FEED_DAYS}")
+
+        return cls(
+            work_type=work_type,
+            platform=args.get("platform") or None,
+            work_ids=work_ids,
+            days_back=days_back,
+            days_ahead=days_ahead,
+        )
+
+    def to_sql(self) -> Tuple[str, List[Any]]:
+        """WHERE 条件とパラメータ（release_date は半開区間で比較）"""
+        conditions = ["r.release_date >= date('now', ?)", "r.release_date < date('now', ?)"]
+        params: List[Any] = [f"-{self.days_back} days", f"+{self.days_ahead + 1} days"]
+        if self.work_type:
+            conditions.append("w.type = ?")
+            params.append(self.work_type)
+        if self.platform:
+            conditions.append("r.platform = ?")
+            params.append(self.platform)
+        if self.work_ids:
+            conditions.append(f"r.work_id IN ({', '.join('?' * len(self.work_ids))})")
+            params.extend(self.work_ids)
+        return " AND ".join(conditions), params
+
+
+def iter_feed(conn, feed_filter: FeedFilter) -> Iterator[str]:
+    """
+    絞り込み条件に合うリリースの VCALENDAR をチャンク単位で返す
+
+    結果は fetchall せずカーソルから1行ずつ読むため、件数が多くても
+    メモリ上に全件を持たない。
+    """
+    where, params = feed_filter.to_sql()
+    cursor = conn.execute(
+        f"""
+        SELECT r.id AS release_id, w.title, w.type, r.release_type, r.number,
+               r.platform, r.release_date, r.source_url, r.created_at
+        FROM releases r
+        JOIN works w ON r.work_id = w.id
+        WHERE {where}
+        ORDER BY r.release_date, r.id
+        """,
+        params,
+    )
+    try:
+        yield from render_calendar(dict(row) for row in cursor)
+    finally:
+        cursor.close()
+
+
+def get_cached_feed(key: Hashable, state: Hashable) -> Optional[bytes]:
+    """キャッシュ済みのフィードを取得（state が変わっていれば None）"""
+    cached = _feed_cache.get(key)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+    return None
+
+
+def stream_and_cache_feed(key: Hashable, state: Hashable, chunks: Iterable[str]) -> Iterator[bytes]:
+    """
+    フィードをストリーミングしながら、最後まで送れたらキャッシュに保存
+
+    クライアントが途中で切断した場合は保存しない。
+    """
+    rendered = []
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        rendered.append(data)
+        yield data
+    _feed_cache.set(key, (state, b"".join(rendered)))
+
+
+def clear_feed_cache():
+    """フィードキャッシュを破棄"""
+    _feed_cache.clear()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+NGキーワード照合モジュール
+
+ContentFilter から利用するキーワード照合エンジン。
+
+- KeywordAutomaton: Aho-Corasick オートマトンによる全NGキーワードの一括照合。
+  テキストを1回走査するだけで全キーワードの出現を検出し、
+  従来の ``re.compile(rf"\\b{keyword}\\b", re.IGNORECASE | re.UNICODE)`` と
+  同じ単語境界判定を行う（日本語は Unicode の \\w 扱いになる点も含めて同一）。
+- FuzzyKeywordIndex: ファジィマッチング用の候補絞り込みインデックス。
+  長さバケットと文字インデックスで明らかに閾値に届かない組み合わせを除外し、
+  残った組み合わせだけ difflib.SequenceMatcher で類似度を計算する。
+"""
+
+from collections import Counter, deque
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """re の Unicode \\w と同じ判定（英数字 + アンダースコア）"""
+    return ch.isalnum() or ch == "_"
+
+
+def _fold_case(text: str) -> str:
+    """
+    位置を保ったまま小文字化する
+
+    str.lower() は一部の文字（例: 'İ'）で長さが変わるため、その場合のみ
+    1文字ずつ変換して元テキストとのインデックス対応を維持する。
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick オートマトンによる NG キーワード照合器
+
+    キーワードの追加・削除はトライへの差分更新で行い、失敗リンクは次回の
+    照合時にまとめて再計算する。削除済みノードが増えすぎた場合のみ全再構築する。
+    """
+
+    def __init__(self, keywords: Optional[Iterable[str]] = None):
+        self._reset()
+        for keyword in keywords or []:
+            self.add(keyword)
+
+    def _reset(self):
+        # ノードは並列リストで保持（dict-of-objects より高速・省メモリ）
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[str]] = [None]
+        self._dict_link: List[int] = [0]
+        self._order: Dict[str, int] = {}
+        self._sequence = 0
+        self._dead_nodes = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, keyword: str) -> bool:
+        return _fold_case(keyword) in self._order
+
+    @property
+    def keywords(self) -> List[str]:
+        """登録済みキーワード（登録順）"""
+        return sorted(self._order, key=self._order.get)
+
+    def add(self, keyword: str) -> bool:
+        """
+        キーワードを追加
+
+        Args:
+            keyword: 追加するキーワード
+
+        Returns:
+            bool: 新規に追加された場合True
+        """
+        keyword = _fold_case(keyword or "")
+        if not keyword or keyword in self._order:
+            return False
+
+        node = 0
+        for ch in keyword:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._dict_link.append(0)
+                self._goto[node][ch] = next_node
+            node = next_node
+
+        if self._output[node] is None and node != 0:
+            # 以前削除されたキーワードのノードを再利用
+            self._dead_nodes = max(0, self._dead_nodes - len(keyword))
+        self._output[node] = keyword
+        self._order[keyword] = self._sequence
+        self._sequence += 1
+        self._dirty = True
+        return True
+
+    def remove(self, keyword: str) -> bool:
+        """
+        キーワードを削除
+
+        Args:
+            keyword: 削除するキーワード
+
+        Returns:
+            bool: 削除された場合True
+        """
+        keyword = _fold_case(keyword or "")
+        if keyword not in self._order:
+            return False
+
+        node = 0
+        for ch in keyword:
+            node = self._goto[node][ch]
+        self._output[node] = None
+        del self._order[keyword]
+        self._dead_nodes += len(keyword)
+        self._dirty = True
+
+        # 不要ノードがトライの半分を超えたら作り直す
+        if self._dead_nodes > len(self._goto) // 2:
+            remaining = self.keywords
+            self._reset()
+            for word in remaining:
+                self.add(word)
+        return True
+
+    def _build_links(self):
+        """失敗リンクと出力リンク（辞書サフィックスリンク）を BFS で計算"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+
+                fail = self._fail[child]
+                self._dict_link[child] = (
+                    fail if self._output[fail] is not None else (self._dict_link[fail])
+                )
+
+        self._dirty = False
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        テキスト中に単語境界付きで出現するキーワードを全て返す
+
+        Args:
+            text: 照合対象テキスト
+
+        Returns:
+            List[str]: 一致したキーワード（登録順、重複なし）
+        """
+        if not text or not self._order:
+            return []
+        if self._dirty:
+            self._build_links()
+
+        folded = _fold_case(text)
+        length = len(folded)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        dict_link = self._dict_link
+
+        found = set()
+        node = 0
+        for index, ch in enumerate(folded):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            match_node = node if output[node] is not None else dict_link[node]
+            while match_node:
+                keyword = output[match_node]
+                if keyword not in found and self._has_word_boundaries(
+                    folded, index + 1 - len(keyword), index + 1, length
+                ):
+                    found.add(keyword)
+                match_node = dict_link[match_node]
+
+        return sorted(found, key=self._order.get)
+
+    @staticmethod
+    def _has_word_boundaries(text: str, start: int, end: int, length: int) -> bool:
+        """text[start:end] の両端が \\b 相当の境界か判定"""
+        before = start > 0 and _is_word_char(text[start - 1])
+        if before == _is_word_char(text[start]):
+            return False
+        after = end < length and _is_word_char(text[end])
+        return after != _is_word_char(text[end - 1])
+
+
+class FuzzyKeywordIndex:
+    """
+    NG キーワードのファジィマッチング用インデックス
+
+    SequenceMatcher.ratio() は 2*M/T（M: 一致文字数、T: 両文字列長の合計）で、
+    M は短い方の長さ・文字の多重集合の共通部分の大きさを超えない。
+    この上限値が閾値未満の組み合わせは ratio() を計算せずに除外するため、
+    判定結果は全組み合わせを比較した場合と完全に一致する。
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self._keywords: List[str] = []
+        self._char_counts: Dict[str, Counter] = {}
+        self._by_length: Dict[int, List[str]] = {}
+        self._by_char: Dict[str, set] = {}
+
+        for keyword in keywords:
+            if keyword in self._char_counts:
+                continue
+            self._keywords.append(keyword)
+            self._char_counts[keyword] = Counter(keyword)
+            self._by_length.setdefault(len(keyword), []).append(keyword)
+            for ch in set(keyword):
+                self._by_char.setdefault(ch, set()).add(keyword)
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def _candidates(self, word: str, threshold: float) -> List[str]:
+        """長さと共通文字数の上限で閾値に届き得るキーワードを抽出"""
+        word_length = len(word)
+
+        if threshold <= 0:
+            # 閾値0以下なら全キーワードが一致扱い
+            return self._keywords
+
+        # 共通文字が1つもなければ ratio は0
+        sharing = set()
+        for ch in set(word):
+            sharing.update(self._by_char.get(ch, ()))
+        if not sharing:
+            return []
+
+        word_counts = Counter(word)
+        candidates = []
+        for length, keywords in self._by_length.items():
+            total = word_length + length
+            if 2.0 * min(word_length, length) / total < threshold:
+                continue
+            for keyword in keywords:
+                if keyword not in sharing:
+                    continue
+                common = sum((word_counts & self._char_counts[keyword]).values())
+                if 2.0 * common / total >= threshold:
+                    candidates.append(keyword)
+        return candidates
+
+    def find_matches(
+        self, words: Iterable[str], threshold: float, min_word_length: int = 3
+    ) -> List[Tuple[str, str, float]]:
+        """
+        各キーワードについて閾値以上の類似度を持つ最初の単語を探す
+
+        Args:
+            words: 照合対象の単語列（出現順）
+            threshold: 類似度閾値 (0.0-1.0)
+            min_word_length: 照合対象とする最小単語長
+
+        Returns:
+            List[Tuple[str, str, float]]: (キーワード, 単語, 類似度) のリスト（キーワード登録順）
+        """
+        best: Dict[str, Tuple[str, float]] = {}
+        seen_words = set()
+
+        for word in words:
+            if len(word) < min_word_length or word in seen_words:
+                continue
+            seen_words.add(word)
+
+            for keyword in self._candidates(word, threshold):
+                if keyword in best:
+                    continue
+                similarity = SequenceMatcher(None, word, keyword).ratio()
+                if similarity >= threshold:
+                    best[keyword] = (word, similarity)
+
+            if len(best) == len(self._keywords):
+                break
+
+        return [
+            (keyword, best[keyword][0], best[keyword][1])
+            for keyword in self._keywords
+            if keyword in best
+        ]
@@ -0,0 +1,304 @@
+"""
+ログファイルの末尾読み取り
+
+ログ画面・リアルタイムログAPI向けに、巨大なログファイルを全件読み込まずに
+末尾の行だけを取得する。
+
+- read_tail: ファイル末尾からブロック単位で逆方向にシークして最後の N 行を取得
+- read_since: 前回のオフセット以降に追記された行だけを取得
+- LogTailReader: 複数ファイルのオフセットと解析済みエントリを保持し、
+  ポーリングごとに追記分だけを解析。ファイル間はタイムスタンプでヒープマージする
+- encode_log_cursor / decode_log_cursor: 各ファイルの読み取り位置を
+  「前回以降の追記分だけ」を取得するためのカーソルに変換
+
+オフセットは常に行の終端（改行の直後）を指す。書き込み途中の末尾行は
+改行が書かれるまで読み取らない。
+"""
+
+import heapq
+import os
+import re
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from modules.pagination import decode_cursor, encode_cursor
+
+# 逆方向シーク時に1回で読むバイト数
+TAIL_BLOCK_SIZE = 64 * 1024
+
+# 前回から大きく伸びたファイルは追記分を全部読まず、末尾だけ読み直す
+MAX_INCREMENTAL_BYTES = 4 * 1024 * 1024
+
+LOG_LINE_PATTERNS = (
+    re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s*-\s*\w*\s*-\s*(\w+)\s*-\s*(.*)"),
+    re.compile(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]\s*(\w+):\s*(.*)"),
+    re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?(\w+):\s*(.*)"),
+)
+
+
+def parse_log_line(log_line: str) -> Dict[str, str]:
+    """
+    ログ1行を構造化データに変換
+
+    Args:
+        log_line: ログの1行（改行なし）
+
+    Returns:
+        Dict[str, str]: timestamp, level, message, formatted。
+        どの形式にも一致しない行は現在時刻の INFO として扱う
+    """
+    for pattern in LOG_LINE_PATTERNS:
+        match = pattern.match(log_line)
+        if match:
+            timestamp = match.group(1)
+            level = match.group(2).upper()
+            message = match.group(3)
+            return {
+                "timestamp": timestamp,
+                "level": level,
+                "message": message,
+                "formatted": f"[{timestamp}] {level}: {message}",
+            }
+
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return {
+        "timestamp": current_time,
+        "level": "INFO",
+        "message": log_line,
+        "formatted": f"[{current_time}] INFO: {log_line}",
+    }
+
+
+def _split_lines(data: bytes, start: int) -> List[Tuple[str, int]]:
+    """改行区切りのバイト列を (行, 行終端のオフセット) のリストに変換（空行は除く）"""
+    lines = []
+    offset = start
+    for raw in data.split(b"\n"):
+        offset += len(raw) + 1
+        line = raw.decode("utf-8", errors="replace").strip()
+        if line:
+            lines.append((line, offset))
+    return lines
+
+
+def _read_tail(path: str, count: int, block_size: int) -> Tuple[List[Tuple[str, int]], int]:
+    """read_tail の本体。行ごとの終端オフセットも返す"""
+    batches: List[List[Tuple[str, int]]] = []
+    found = 0
+    end = None  # 最後の完結行の終端オフセット
+    head = b""  # 読んだ範囲の先頭から最初の改行までの切れ端
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # 空行は数えないため、空でない完結行が count 行揃うまで戻る
+        while pos > 0 and (found < count or end is None):
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            data = f.read(size)
+            if end is None:
+                # 末尾の書きかけの行は読まない
+                last_newline = data.rfind(b"\n")
+                if last_newline == -1:
+                    continue
+                end = pos + last_newline + 1
+                data = data[:last_newline]
+            else:
+                data += head
+
+            body_start = 0
+            if pos > 0:
+                # ブロック境界で切れた先頭行は次のブロックと合わせて読む
+                first_newline = data.find(b"\n")
+                if first_newline == -1:
+                    head = data
+                    continue
+                head, body_start = data[:first_newline], first_newline + 1
+            lines = _split_lines(data[body_start:], pos + body_start)
+            batches.append(lines)
+            found += len(lines)
+
+    if end is None:
+        return [], pos
+    lines = [line for batch in reversed(batches) for line in batch]
+    return lines[-count:] if count else [], end
+
+
+def _read_since(path: str, offset: int) -> Tuple[List[Tuple[str, int]], int]:
+    """read_since の本体。行ごとの終端オフセットも返す"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    last_newline = data.rfind(b"\n")
+    if last_newline == -1:
+        return [], offset
+    return _split_lines(data[:last_newline], offset), offset + last_newline + 1
+
+
+def read_tail(path: str, count: int, block_size: int = TAIL_BLOCK_SIZE) -> Tuple[List[str], int]:
+    """
+    ファイル末尾の行を取得
+
+    Args:
+        path: ファイルパス
+        count: 取得する最大行数（空行は数えない）
+        block_size: 逆方向シーク時のブロックサイズ
+
+    Returns:
+        Tuple[List[str], int]: 古い順の行と、最後の完結行の終端オフセット
+    """
+    lines, offset = _read_tail(path, count, block_size)
+    return [line for line, _ in lines], offset
+
+
+def read_since(path: str, offset: int) -> Tuple[List[str], int]:
+    """
+    オフセット以降に追記された完結行を取得
+
+    Args:
+        path: ファイルパス
+        offset: 前回 read_tail / read_since が返したオフセット
+
+    Returns:
+        Tuple[List[str], int]: 追記された行と、新しいオフセット
+    """
+    lines, offset = _read_since(path, offset)
+    return [line for line, _ in lines], offset
+
+
+def encode_log_cursor(positions: Sequence[Optional[List[int]]]) -> str:
+    """LogTailReader.read が返した positions を不透明なカーソル文字列に変換"""
+    return encode_cursor(positions)
+
+
+def decode_log_cursor(cursor: Optional[str], size: int) -> Optional[List[Optional[List[int]]]]:
+    """
+    encode_log_cursor のカーソルを positions に戻す
+
+    Args:
+        cursor: カーソル文字列（空なら None を返す）
+        size: 読み取り対象のファイル数
+
+    Raises:
+        ValueError: カーソルが壊れている、または形式が合わない場合
+    """
+    positions = decode_cursor(cursor, size)
+    if positions is None:
+        return None
+    for position in positions:
+        if position is None:
+            continue
+        if (
+            not isinstance(position, list)
+            or len(position) != 2
+            or not all(isinstance(value, int) and value >= 0 for value in position)
+        ):
+            raise ValueError(f"Invalid log cursor: {cursor}")
+    return positions
+
+
+class _FileState:
+    """LogTailReader が1ファイルごとに保持する状態"""
+
+    def __init__(self, file_id: int, offset: int, max_entries: int):
+        self.file_id = file_id
+        self.offset = offset
+        # (行終端のオフセット, 解析済みエントリ) を古い順に保持
+        self.entries: Deque[Tuple[int, Dict[str, str]]] = deque(maxlen=max_entries)
+
+
+class LogTailReader:
+    """
+    複数ログファイルの末尾をキャッシュしながら読むリーダー
+
+    ファイルごとにオフセットと解析済みエントリを保持し、ポーリングのたびに
+    追記された行だけを読み・解析する。ローテーション（inode の変化）や
+    切り詰め（サイズがオフセット未満）を検出した場合は末尾から読み直す。
+    """
+
+    def __init__(self, paths: Iterable[str], max_entries: int = 100):
+        """
+        初期化
+
+        Args:
+            paths: 読み取るログファイルのパス
+            max_entries: ファイルごとに保持するエントリ数
+        """
+        self.paths = list(paths)
+        self.max_entries = max_entries
+        self._files: Dict[str, _FileState] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self, path: str) -> Optional[_FileState]:
+        """ファイルの追記分を取り込む（存在しなければ None）"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._files.pop(path, None)
+            return None
+
+        state = self._files.get(path)
+        if (
+            state is None
+            or state.file_id != stat.st_ino
+            or stat.st_size < state.offset
+            or stat.st_size - state.offset > MAX_INCREMENTAL_BYTES
+        ):
+            lines, offset = _read_tail(path, self.max_entries, TAIL_BLOCK_SIZE)
+            state = _FileState(stat.st_ino, offset, self.max_entries)
+            self._files[path] = state
+        elif stat.st_size > state.offset:
+            lines, state.offset = _read_since(path, state.offset)
+        else:
+            return state
+
+        state.entries.extend((end, parse_log_line(line)) for line, end in lines)
+        return state
+
+    def read(
+        self,
+        limit: int = 50,
+        level: str = "all",
+        since: Optional[Sequence[Any]] = None,
+    ) -> Tuple[List[Dict[str, str]], List[Optional[List[int]]]]:
+        """
+        全ファイルの新しいエントリをタイムスタンプの降順で取得
+
+        Args:
+            limit: 最大件数
+            level: ログレベル（小文字）。"all" なら絞り込まない
+            since: 前回返した positions。指定するとそれ以降に追記された行のみ返す
+
+        Returns:
+            Tuple: (エントリのリスト, positions)。positions はファイルごとの
+            [inode, オフセット]（ファイルが無ければ None）で、次回の since に渡す
+        """
+        streams = []
+        positions: List[Optional[List[int]]] = []
+        with self._lock:
+            for index, path in enumerate(self.paths):
+                state = self._refresh(path)
+                if state is None:
+                    positions.append(None)
+                    continue
+                positions.append([state.file_id, state.offset])
+
+                start = 0
+                if since is not None and index < len(since) and since[index]:
+                    since_id, since_offset = since[index]
+                    if since_id == state.file_id:
+                        start = since_offset
+
+                entries = [
+                    entry
+                    for end, entry in state.entries
+                    if end > start and (level == "all" or entry["level"].lower() == level)
+                ]
+                # 解析できない行には現在時刻が入るため、マージ前にファイル内で整列しておく
+                entries.sort(key=lambda entry: entry["timestamp"], reverse=True)
+                streams.append(entries)
+
+        merged = heapq.merge(*streams, key=lambda entry: entry["timestamp"], reverse=True)
+        return list(islice(merged, max(limit, 0))), positions
@@ -3,7 +3,7 @@
 MangaDex API integration module for manga data collection.
 
 This module provides:
-- MangaDex REST API client with rate limiting
+- MangaDex REST API client (shared HTTP client with per-host rate limiting)
 - Manga data retrieval and normalization
 - Chapter updates tracking
 - Error handling and retry logic
@@ -16,14 +16,14 @@ Rate Limits: 40 requests per minute (5 bursts allowed)
 import asyncio
 import json
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 import aiohttp
 
+from .http_client import RetryPolicy, configure_rate_limit, get_http_client
 from .models import DataSource, WorkType
 
 
@@ -31,26 +31,6 @@ class MangaDexAPIError(Exception):
     """Custom exception for MangaDex API errors."""
 
 
-class RateLimiter:
-    """Rate limiter for MangaDex API (40 requests per minute)."""
-
-    def __init__(self, requests_per_minute: int = 40):
-        self.requests_per_minute = requests_per_minute
-        self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0
-
-    async def wait(self):
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-
 class MangaDexAPIClient:
     """MangaDex API client with rate limiting and error handling."""
 
@@ -58,19 +38,58 @@ class MangaDexAPIClient:
         self.base_url = config.get("base_url", "https://api.mangadex.org")
         self.timeout = config.get("timeout_seconds", 30)
         self.rate_limit_config = config.get("rate_limit", {})
-        self.rate_limiter = RateLimiter(self.rate_limit_config.get("requests_per_minute", 40))
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = configure_rate_limit(
+            self.base_url,
+            self.rate_limit_config.get("requests_per_minute", 40),
+            self.rate_limit_config.get("burst"),
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=self.rate_limit_config.get("max_retries", 3),
+            backoff=self.rate_limit_config.get("retry_delay_seconds", 10),
+        )
+        self.http = get_http_client()
         self.logger = logging.getLogger(__name__)
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        """Async context manager entry (shares the pooled HTTP session)."""
+        await self.http.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.http.release()
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET a MangaDex endpoint through the shared HTTP client.
+
+        Rate limiting and retries on 429/5xx are handled by the client.
+
+        Raises:
+            MangaDexAPIError: If the request fails
+        """
+        try:
+            response = await self.http.get(
+                f"{self.base_url}{path}",
+                params=params,
+                timeout=self.timeout,
+                retry=self.retry_policy,
+            )
+        except asyncio.TimeoutError:
+            self.logger.error("MangaDex API request timeout")
+            raise MangaDexAPIError("Request timeout")
+        except aiohttp.ClientError as e:
+            self.logger.error(f"MangaDex API request error: {str(e)}")
+            raise MangaDexAPIError(f"Request failed: {str(e)}")
+
+        if response.status != 200:
+            self.logger.error(f"MangaDex API error: {response.status} - {response.text()}")
+            raise MangaDexAPIError(f"API request failed with status {response.status}")
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise MangaDexAPIError(f"Invalid JSON response: {str(e)}")
 
     async def get_recent_manga(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -82,8 +101,6 @@ class MangaDexAPIClient:
         Returns:
             List of manga data dictionaries
         """
-        await self.rate_limiter.wait()
-
         params = {
             "limit": min(limit, 100),
             "order[updatedAt]": "desc",
@@ -94,27 +111,8 @@ class MangaDexAPIClient:
             ],  # Exclude erotica and pornographic
         }
 
-        try:
-            async with self.session.get(f"{self.base_url}/manga", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_manga_list(data.get("data", []))
-                elif response.status == 429:
-                    self.logger.warning("Rate limit exceeded, waiting...")
-                    await asyncio.sleep(10)
-                    return await self.get_recent_manga(limit)
-                else:
-                    self.logger.error(
-                        f"MangaDex API error: {response.status} - {await response.text()}"
-                    )
-                    raise MangaDexAPIError(f"API request failed with status {response.status}")
-
-        except asyncio.TimeoutError:
-            self.logger.error("MangaDex API request timeout")
-            raise MangaDexAPIError("Request timeout")
-        except Exception as e:
-            self.logger.error(f"MangaDex API request error: {str(e)}")
-            raise MangaDexAPIError(f"Request failed: {str(e)}")
+        data = await self._get("/manga", params)
+        return self._normalize_manga_list(data.get("data", []))
 
     async def get_latest_chapters(self, limit: int = 100, hours: int = 24) -> List[Dict[str, Any]]:
         """
@@ -127,8 +125,6 @@ class MangaDexAPIClient:
         Returns:
             List of chapter data dictionaries
         """
-        await self.rate_limiter.wait()
-
         # Calculate time range
         now = datetime.utcnow()
         since = now - timedelta(hours=hours)
@@ -143,18 +139,8 @@ class MangaDexAPIClient:
             "createdAtSince": created_at_since,
         }
 
-        try:
-            async with self.session.get(f"{self.base_url}/chapter", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_chapter_list(data.get("data", []))
-                else:
-                    self.logger.error(f"MangaDex API error: {response.status}")
-                    raise MangaDexAPIError(f"API request failed with status {response.status}")
-
-        except Exception as e:
-            self.logger.error(f"MangaDex API request error: {str(e)}")
-            raise MangaDexAPIError(f"Request failed: {str(e)}")
+        data = await self._get("/chapter", params)
+        return self._normalize_chapter_list(data.get("data", []))
 
     async def search_manga(self, title: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -167,8 +153,6 @@ class MangaDexAPIClient:
         Returns:
             List of manga data dictionaries
         """
-        await self.rate_limiter.wait()
-
         params = {
             "title": title,
             "limit": min(limit, 100),
@@ -176,18 +160,8 @@ class MangaDexAPIClient:
             "contentRating[]": ["safe", "suggestive"],
         }
 
-        try:
-            async with self.session.get(f"{self.base_url}/manga", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_manga_list(data.get("data", []))
-                else:
-                    self.logger.error(f"MangaDex API error: {response.status}")
-                    raise MangaDexAPIError(f"API request failed with status {response.status}")
-
-        except Exception as e:
-            self.logger.error(f"MangaDex API request error: {str(e)}")
-            raise MangaDexAPIError(f"Request failed: {str(e)}")
+        data = await self._get("/manga", params)
+        return self._normalize_manga_list(data.get("data", []))
 
     def _normalize_manga_list(self, manga_list: List[Dict]) -> List[Dict[str, Any]]:
         """Normalize manga data from MangaDex API format."""
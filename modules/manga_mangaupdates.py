@@ -3,7 +3,7 @@
 MangaUpdates API integration module for manga release information.
 
 This module provides:
-- MangaUpdates REST API client with rate limiting
+- MangaUpdates REST API client (shared HTTP client with per-host rate limiting)
 - Manga release data retrieval and normalization
 - Series information tracking
 - Error handling and retry logic
@@ -16,13 +16,13 @@ Rate Limits: 30 requests per minute
 import asyncio
 import json
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from .http_client import RetryPolicy, configure_rate_limit, get_http_client
 from .models import DataSource, WorkType
 
 
@@ -30,26 +30,6 @@ class MangaUpdatesAPIError(Exception):
     """Custom exception for MangaUpdates API errors."""
 
 
-class RateLimiter:
-    """Rate limiter for MangaUpdates API (30 requests per minute)."""
-
-    def __init__(self, requests_per_minute: int = 30):
-        self.requests_per_minute = requests_per_minute
-        self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0
-
-    async def wait(self):
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self.last_request_time = time.time()
-
-
 class MangaUpdatesAPIClient:
     """MangaUpdates API client with rate limiting and error handling."""
 
@@ -57,25 +37,66 @@ class MangaUpdatesAPIClient:
         self.base_url = config.get("base_url", "https://api.mangaupdates.com/v1")
         self.timeout = config.get("timeout_seconds", 30)
         self.rate_limit_config = config.get("rate_limit", {})
-        self.rate_limiter = RateLimiter(self.rate_limit_config.get("requests_per_minute", 30))
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = configure_rate_limit(
+            self.base_url,
+            self.rate_limit_config.get("requests_per_minute", 30),
+            self.rate_limit_config.get("burst"),
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=self.rate_limit_config.get("max_retries", 3),
+            backoff=self.rate_limit_config.get("retry_delay_seconds", 10),
+        )
+        self.http = get_http_client()
         self.logger = logging.getLogger(__name__)
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "MangaAnime-Info-Delivery-System/1.0",
-        }
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout), headers=headers
-        )
+        """Async context manager entry (shares the pooled HTTP session)."""
+        await self.http.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.http.release()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call a MangaUpdates endpoint through the shared HTTP client.
+
+        Rate limiting and retries on 429/5xx are handled by the client.
+
+        Raises:
+            MangaUpdatesAPIError: If the request fails
+        """
+        try:
+            response = await self.http.request(
+                method,
+                f"{self.base_url}{path}",
+                params=params,
+                json=json_body,
+                timeout=self.timeout,
+                retry=self.retry_policy,
+            )
+        except asyncio.TimeoutError:
+            self.logger.error("MangaUpdates API request timeout")
+            raise MangaUpdatesAPIError("Request timeout")
+        except aiohttp.ClientError as e:
+            self.logger.error(f"MangaUpdates API request error: {str(e)}")
+            raise MangaUpdatesAPIError(f"Request failed: {str(e)}")
+
+        if response.status != 200:
+            self.logger.error(f"MangaUpdates API error: {response.status} - {response.text()}")
+            raise MangaUpdatesAPIError(f"API request failed with status {response.status}")
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise MangaUpdatesAPIError(f"Invalid JSON response: {str(e)}")
 
     async def get_latest_releases(self, page: int = 1, per_page: int = 50) -> List[Dict[str, Any]]:
         """
@@ -88,31 +109,10 @@ class MangaUpdatesAPIClient:
         Returns:
             List of release data dictionaries
         """
-        await self.rate_limiter.wait()
-
         params = {"page": page, "perpage": min(per_page, 100)}
 
-        try:
-            async with self.session.get(f"{self.base_url}/releases", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_releases(data.get("results", []))
-                elif response.status == 429:
-                    self.logger.warning("Rate limit exceeded, waiting...")
-                    await asyncio.sleep(10)
-                    return await self.get_latest_releases(page, per_page)
-                else:
-                    self.logger.error(
-                        f"MangaUpdates API error: {response.status} - {await response.text()}"
-                    )
-                    raise MangaUpdatesAPIError(f"API request failed with status {response.status}")
-
-        except asyncio.TimeoutError:
-            self.logger.error("MangaUpdates API request timeout")
-            raise MangaUpdatesAPIError("Request timeout")
-        except Exception as e:
-            self.logger.error(f"MangaUpdates API request error: {str(e)}")
-            raise MangaUpdatesAPIError(f"Request failed: {str(e)}")
+        data = await self._request("GET", "/releases", params=params)
+        return self._normalize_releases(data.get("results", []))
 
     async def search_series(self, query: str, page: int = 1) -> List[Dict[str, Any]]:
         """
@@ -125,24 +125,10 @@ class MangaUpdatesAPIClient:
         Returns:
             List of series data dictionaries
         """
-        await self.rate_limiter.wait()
-
         search_data = {"search": query, "page": page, "perpage": 25}
 
-        try:
-            async with self.session.post(
-                f"{self.base_url}/series/search", json=search_data
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_series(data.get("results", []))
-                else:
-                    self.logger.error(f"MangaUpdates API error: {response.status}")
-                    raise MangaUpdatesAPIError(f"API request failed with status {response.status}")
-
-        except Exception as e:
-            self.logger.error(f"MangaUpdates API request error: {str(e)}")
-            raise MangaUpdatesAPIError(f"Request failed: {str(e)}")
+        data = await self._request("POST", "/series/search", json_body=search_data)
+        return self._normalize_series(data.get("results", []))
 
     async def get_series_info(self, series_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -154,20 +140,11 @@ class MangaUpdatesAPIClient:
         Returns:
             Series data dictionary or None
         """
-        await self.rate_limiter.wait()
-
         try:
-            async with self.session.get(f"{self.base_url}/series/{series_id}") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._normalize_series_detail(data)
-                else:
-                    self.logger.error(f"MangaUpdates API error: {response.status}")
-                    return None
-
-        except Exception as e:
-            self.logger.error(f"MangaUpdates API request error: {str(e)}")
+            data = await self._request("GET", f"/series/{series_id}")
+        except MangaUpdatesAPIError:
             return None
+        return self._normalize_series_detail(data)
 
     def _normalize_releases(self, releases: List[Dict]) -> List[Dict[str, Any]]:
         """Normalize release data from MangaUpdates API format."""
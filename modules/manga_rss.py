@@ -50,18 +50,48 @@ class _NullDB:
 db = _NullDB()
 
 
+import threading
 import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import aiohttp
 import feedparser
 import requests
 
+from .feed_state import FeedStateStore, SeenEntryIndex
+from .http_client import RetryPolicy, SharedHttpClient, get_http_client
 from .models import DataSource, ReleaseType, RSSFeedItem, WorkType
 
+# 非同期収集でフィードの解析・正規化を行うスレッド数の既定値
+DEFAULT_PARSE_WORKERS = 2
+
+# 適応ポーリングの既定値（秒）。更新間隔の推定値の半分を、最短・最長の範囲に収めて次回の間隔とする
+DEFAULT_POLL_MIN_INTERVAL = 3600
+DEFAULT_POLL_MAX_INTERVAL = 12 * 3600
+# 連続失敗時の待機時間の上限
+DEFAULT_POLL_MAX_BACKOFF = 24 * 3600
+# 予定時刻のこの秒数前までは期限とみなす（定期実行の時刻のずれを吸収）
+POLL_DUE_TOLERANCE = 300
+
+# 更新間隔の指数移動平均で新しい観測値に掛ける重み
+CHANGE_INTERVAL_WEIGHT = 0.3
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """保存値（ISO 形式の文字列）を datetime に変換"""
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
 
 @dataclass
 class FeedHealth:
@@ -75,7 +105,21 @@ class FeedHealth:
     last_response_time: float = 0.0
     average_response_time: float = 0.0
     consecutive_failures: int = 0
+    not_modified_count: int = 0
     is_healthy: bool = True
+    last_changed: Optional[datetime] = None
+    change_interval: Optional[float] = None  # 観測した更新間隔（秒、指数移動平均）
+    next_poll_at: Optional[datetime] = None
+
+    @property
+    def total_requests(self) -> int:
+        """取得を試みた回数"""
+        return self.success_count + self.failure_count
+
+    @property
+    def total_failures(self) -> int:
+        """失敗した回数"""
+        return self.failure_count
 
     def record_success(self, response_time: float):
         """成功を記録"""
@@ -92,6 +136,11 @@ class FeedHealth:
 
         self.is_healthy = True
 
+    def record_not_modified(self, response_time: float):
+        """304（更新なし）を記録。取得自体は成功しているため成功として扱う"""
+        self.record_success(response_time)
+        self.not_modified_count += 1
+
     def record_failure(self):
         """失敗を記録"""
         self.failure_count += 1
@@ -102,6 +151,89 @@ class FeedHealth:
         if self.consecutive_failures >= 3:
             self.is_healthy = False
 
+    def record_change(self, when: Optional[datetime] = None):
+        """新しいエントリーを観測したことを記録し、更新間隔の推定値を更新"""
+        when = when or datetime.now()
+        if self.last_changed and when > self.last_changed:
+            observed = (when - self.last_changed).total_seconds()
+            if self.change_interval is None:
+                self.change_interval = observed
+            else:
+                self.change_interval = (
+                    CHANGE_INTERVAL_WEIGHT * observed
+                    + (1 - CHANGE_INTERVAL_WEIGHT) * self.change_interval
+                )
+        self.last_changed = when
+
+    def schedule_next_poll(
+        self,
+        min_interval: float = DEFAULT_POLL_MIN_INTERVAL,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        max_backoff: float = DEFAULT_POLL_MAX_BACKOFF,
+        now: Optional[datetime] = None,
+    ) -> datetime:
+        """
+        次回のポーリング時刻を決める
+
+        失敗が続いている場合は最短間隔から倍々に延ばす（上限 max_backoff）。
+        それ以外は更新間隔の推定値（観測した平均と、最後の更新からの経過時間の
+        大きい方）の半分を最短・最長の範囲に収める。更新の少ないフィードほど間隔が延びる。
+        """
+        now = now or datetime.now()
+        if self.consecutive_failures:
+            delay = min(min_interval * 2 ** (self.consecutive_failures - 1), max_backoff)
+        else:
+            estimates = [self.change_interval or 0]
+            if self.last_changed:
+                estimates.append((now - self.last_changed).total_seconds())
+            estimate = max(estimates)
+            delay = max(min_interval, min(estimate / 2, max_interval)) if estimate else min_interval
+        self.next_poll_at = now + timedelta(seconds=delay)
+        return self.next_poll_at
+
+    def is_due(self, now: Optional[datetime] = None, tolerance: float = 0) -> bool:
+        """ポーリングの時刻になっているか"""
+        if self.next_poll_at is None:
+            return True
+        now = now or datetime.now()
+        return self.next_poll_at - timedelta(seconds=tolerance) <= now
+
+    def to_record(self) -> Dict[str, Any]:
+        """保存用の辞書（FeedStateStore.save_health に渡す）"""
+        return {
+            "success_count": self.success_count,
+            "failure_count": self.failure_count,
+            "consecutive_failures": self.consecutive_failures,
+            "not_modified_count": self.not_modified_count,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_failure": self.last_failure.isoformat() if self.last_failure else None,
+            "average_response_time": self.average_response_time,
+            "last_changed": self.last_changed.isoformat() if self.last_changed else None,
+            "change_interval": self.change_interval,
+            "next_poll_at": self.next_poll_at.isoformat() if self.next_poll_at else None,
+        }
+
+    @classmethod
+    def from_record(cls, url: str, record: Optional[Dict[str, Any]]) -> "FeedHealth":
+        """保存済みの辞書から復元（record が None なら初期状態）"""
+        if not record:
+            return cls(url=url)
+        consecutive_failures = int(record.get("consecutive_failures") or 0)
+        return cls(
+            url=url,
+            success_count=int(record.get("success_count") or 0),
+            failure_count=int(record.get("failure_count") or 0),
+            last_success=_to_datetime(record.get("last_success")),
+            last_failure=_to_datetime(record.get("last_failure")),
+            average_response_time=float(record.get("average_response_time") or 0.0),
+            consecutive_failures=consecutive_failures,
+            not_modified_count=int(record.get("not_modified_count") or 0),
+            is_healthy=consecutive_failures < 3,
+            last_changed=_to_datetime(record.get("last_changed")),
+            change_interval=record.get("change_interval"),
+            next_poll_at=_to_datetime(record.get("next_poll_at")),
+        )
+
     def get_success_rate(self) -> float:
         """成功率を取得"""
         total = self.success_count + self.failure_count
@@ -122,6 +254,53 @@ class FeedHealth:
         return max(0.0, min(1.0, score))
 
 
+@dataclass
+class PendingFeedUpdates:
+    """
+    1回の収集で得た、保存後に記録するフィードの状態
+
+    collect_with_updates() が収集結果と一緒に返す。収集したアイテムを保存し終えたら
+    commit_feed_updates() に渡す。渡さなければ何も記録されず、次回も同じエントリーを
+    取得・処理する（タイムアウトで捨てた収集や、保存に失敗した収集の分）。
+    """
+
+    marks: List[Tuple[str, str, str]] = field(default_factory=list)
+    validators: Dict[str, Tuple[Optional[str], Optional[str]]] = field(default_factory=dict)
+    polled: Set[str] = field(default_factory=set)  # 取得を試みたフィード
+    changed: Dict[str, datetime] = field(default_factory=dict)  # 新しいエントリーを観測した時刻
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add_marks(self, marks: List[Tuple[str, str, str]]):
+        """取り込み済みにするエントリー（feed_url, entry_key, content_hash）を追加"""
+        with self._lock:
+            self.marks.extend(marks)
+
+    def set_validators(self, feed_url: str, etag: Optional[str], last_modified: Optional[str]):
+        """フィードの ETag / Last-Modified を保存待ちにする"""
+        with self._lock:
+            self.validators[feed_url] = (etag, last_modified)
+
+    def record_poll(self, feed_url: str):
+        """フィードの取得を試みたことを記録（保存時に次回のポーリング時刻を決める）"""
+        with self._lock:
+            self.polled.add(feed_url)
+
+    def record_change(self, feed_url: str, when: Optional[datetime] = None):
+        """フィードに新しいエントリーがあったことを記録（更新間隔の推定に使う）"""
+        with self._lock:
+            self.changed[feed_url] = when or datetime.now()
+
+    def snapshot(self) -> "PendingFeedUpdates":
+        """蓄積した内容の複製"""
+        with self._lock:
+            return PendingFeedUpdates(
+                marks=list(self.marks),
+                validators=dict(self.validators),
+                polled=set(self.polled),
+                changed=dict(self.changed),
+            )
+
+
 class EnhancedRSSParser:
     """強化版RSSパーサー"""
 
@@ -237,6 +416,17 @@ class MangaRSSCollector:
             self.timeout = rss_config.get("timeout_seconds", 20)
             self.user_agent = rss_config.get("user_agent", "MangaAnimeNotifier/1.0")
             self.max_workers = rss_config.get("max_parallel_workers", 5)
+            self.parse_workers = rss_config.get("parse_workers", DEFAULT_PARSE_WORKERS)
+            self.adaptive_polling = rss_config.get("adaptive_polling", True)
+            self.poll_min_interval = rss_config.get(
+                "poll_min_interval_seconds", DEFAULT_POLL_MIN_INTERVAL
+            )
+            self.poll_max_interval = rss_config.get(
+                "poll_max_interval_seconds", DEFAULT_POLL_MAX_INTERVAL
+            )
+            self.poll_max_backoff = rss_config.get(
+                "poll_max_backoff_seconds", DEFAULT_POLL_MAX_BACKOFF
+            )
 
             # 有効なRSSフィードリストを取得
             self.enabled_feeds = self.config.get_enabled_rss_feeds()
@@ -245,14 +435,26 @@ class MangaRSSCollector:
             self.timeout = 20
             self.user_agent = "MangaAnimeNotifier/1.0"
             self.max_workers = 5
+            self.parse_workers = DEFAULT_PARSE_WORKERS
+            self.adaptive_polling = True
+            self.poll_min_interval = DEFAULT_POLL_MIN_INTERVAL
+            self.poll_max_interval = DEFAULT_POLL_MAX_INTERVAL
+            self.poll_max_backoff = DEFAULT_POLL_MAX_BACKOFF
             self.enabled_feeds = self._get_default_feeds()
 
+        # 条件付きGET用の ETag / Last-Modified、フィードの健全性、取り込み済みエントリー
+        # （実行をまたいで保持）
+        state_db_path = self._get_state_db_path()
+        self.feed_state = FeedStateStore(state_db_path)
+        self.seen_entries = SeenEntryIndex(state_db_path)
+
         # Feed health monitoring
-        self.feed_health = {}
+        self.feed_health: Dict[str, FeedHealth] = {}
+        self._feed_health_lock = threading.Lock()
         for feed in self.enabled_feeds:
             url = feed.get("url")
             if url:
-                self.feed_health[url] = FeedHealth(url=url)
+                self._get_feed_health(url)
 
         # Enhanced RSS parser
         self.parser = EnhancedRSSParser()
@@ -260,6 +462,80 @@ class MangaRSSCollector:
         self.logger.info(f"有効なRSSフィード: {len(self.enabled_feeds)} 件")
         self.logger.info(f"並列処理ワーカー数: {self.max_workers}")
 
+    def _get_state_db_path(self) -> Optional[str]:
+        """フィード状態を保存するデータベースのパス（取得できなければ None）"""
+        try:
+            db_path = self.config.get_db_path()
+        except AttributeError:
+            return None
+        return db_path if isinstance(db_path, str) and db_path else None
+
+    def _get_feed_health(self, feed_url: str) -> FeedHealth:
+        """フィードの健全性（未作成なら保存済みの値から復元）"""
+        with self._feed_health_lock:
+            health = self.feed_health.get(feed_url)
+            if health is None:
+                health = FeedHealth.from_record(feed_url, self.feed_state.get_health(feed_url))
+                self.feed_health[feed_url] = health
+            return health
+
+    def _record_feed_success(
+        self,
+        feed_url: str,
+        response_time: float,
+        updates: Optional[PendingFeedUpdates] = None,
+    ):
+        """取得成功を記録（ポーリング予定は保存時に更新）"""
+        self._get_feed_health(feed_url).record_success(response_time)
+        if updates is not None:
+            updates.record_poll(feed_url)
+
+    def _record_feed_failure(self, feed_url: str, updates: Optional[PendingFeedUpdates] = None):
+        """取得失敗を記録（連続失敗に応じた次回のポーリングの遅延は保存時に反映）"""
+        self._get_feed_health(feed_url).record_failure()
+        if updates is not None:
+            updates.record_poll(feed_url)
+
+    def _select_due_feeds(self, feeds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        ポーリングの時刻になったフィードだけを残す
+
+        更新の少ないフィードや失敗が続くフィードは、次回の予定時刻まで
+        取得を見送る（タイムアウト待ちで実行時間を使わないため）。
+        """
+        if not self.adaptive_polling:
+            return feeds
+
+        now = datetime.now()
+        due_feeds = [
+            feed
+            for feed in feeds
+            if not feed.get("url")
+            or self._get_feed_health(feed["url"]).is_due(now, POLL_DUE_TOLERANCE)
+        ]
+        if len(due_feeds) < len(feeds):
+            self.logger.info(
+                f"ポーリング対象: {len(due_feeds)}/{len(feeds)} フィード"
+                f"（{len(feeds) - len(due_feeds)} 件は次回の予定時刻まで見送り）"
+            )
+        return due_feeds
+
+    def _record_not_modified(
+        self,
+        feed_url: str,
+        feed_name: str,
+        headers,
+        response_time: float,
+        updates: Optional[PendingFeedUpdates] = None,
+    ) -> List[Dict[str, Any]]:
+        """304 応答の処理。前回から変化が無いため解析・正規化を省略する"""
+        self._queue_validators(updates, feed_url, headers, not_modified=True)
+        self._get_feed_health(feed_url).record_not_modified(response_time)
+        if updates is not None:
+            updates.record_poll(feed_url)
+        self.logger.info(f"{feed_name}: 更新なし (304, {response_time:.1f}s)")
+        return []
+
     def _get_default_feeds(self) -> List[Dict[str, Any]]:
         """デフォルトのRSSフィード設定を返す（修正版 - 動作確認済みURL）"""
         return [
@@ -329,9 +605,35 @@ class MangaRSSCollector:
         ]
 
     def collect(self) -> List[Dict[str, Any]]:
+        """
+        RSSフィードから情報を収集（取り込み済みの記録・検証子の保存は行わない）
+
+        収集結果を保存する場合は collect_with_updates() と commit_feed_updates() を使う。
+
+        Returns:
+            List[Dict[str, Any]]: 収集した情報のリスト
+        """
+        items, _ = self.collect_with_updates()
+        return items
+
+    def collect_with_updates(self) -> Tuple[List[Dict[str, Any]], PendingFeedUpdates]:
+        """
+        RSSフィードから情報を収集し、保存後に記録するフィードの状態も返す
+
+        Returns:
+            Tuple: (収集した情報のリスト, PendingFeedUpdates)。アイテムを保存し終えたら
+            PendingFeedUpdates を commit_feed_updates() に渡す
+        """
+        updates = PendingFeedUpdates()
+        return self._collect_feeds(updates), updates
+
+    def _collect_feeds(self, updates: PendingFeedUpdates) -> List[Dict[str, Any]]:
         """
         RSSフィードから並列で情報を収集（強化版）
 
+        Args:
+            updates: 保存後に記録するフィードの状態の蓄積先
+
         Returns:
             List[Dict[str, Any]]: 収集した情報のリスト
         """
@@ -348,22 +650,18 @@ class MangaRSSCollector:
             self.logger.warning("有効なマンガRSSフィードが見つかりません")
             return []
 
-        # ヘルシーなフィードを優先
-        healthy_feeds = [
-            feed
-            for feed in manga_feeds
-            if self.feed_health.get(feed.get("url", ""), FeedHealth(url="")).is_healthy
-        ]
-
-        if len(healthy_feeds) < len(manga_feeds):
-            self.logger.info(f"健全なフィード: {len(healthy_feeds)}/{len(manga_feeds)}")
+        # 更新頻度と失敗状況から決めた予定時刻になったフィードだけを取得
+        manga_feeds = self._select_due_feeds(manga_feeds)
+        if not manga_feeds:
+            self.logger.info("ポーリング時刻になったマンガRSSフィードはありません")
+            return []
 
         # 非同期処理でより効率的に収集
         try:
-            all_items = asyncio.run(self._collect_async(manga_feeds))
+            all_items = asyncio.run(self._collect_async(manga_feeds, updates))
         except Exception as e:
             self.logger.error(f"非同期収集でエラー、同期処理にフォールバック: {e}")
-            all_items = self._collect_sync(manga_feeds)
+            all_items = self._collect_sync(manga_feeds, updates)
 
         # 重複除去
         duplicate_detector = DuplicateDetector()
@@ -378,35 +676,27 @@ class MangaRSSCollector:
 
         return unique_items
 
-    async def _collect_async(self, manga_feeds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """非同期並列収集"""
-        connector = aiohttp.TCPConnector(
-            limit=20,  # 全体での同時接続数制限
-            limit_per_host=5,  # ホストごとの同時接続数制限
-            ttl_dns_cache=300,  # DNS キャッシュ
-            use_dns_cache=True,
-            keepalive_timeout=30,
-            enable_cleanup_closed=True,
-        )
-
-        timeout = aiohttp.ClientTimeout(
-            total=60,  # 全体タイムアウト
-            connect=10,  # 接続タイムアウト
-            sock_read=30,  # 読み取りタイムアウト
+    async def _collect_async(
+        self, manga_feeds: List[Dict[str, Any]], updates: Optional[PendingFeedUpdates] = None
+    ) -> List[Dict[str, Any]]:
+        """非同期並列収集（共有 HTTP クライアントの接続プールを使う）"""
+        # 解析・正規化は CPU 処理のためイベントループ外のスレッドで行い、
+        # 他のフィードのダウンロードと重ねる
+        parse_executor = ThreadPoolExecutor(
+            max_workers=max(1, int(self.parse_workers)), thread_name_prefix="rss-parse"
         )
 
-        async with aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers={"User-Agent": self.user_agent},
-        ) as session:
+        async with get_http_client() as http:
             tasks = []
             for feed in manga_feeds:
-                task = self._collect_from_feed_async(session, feed)
+                task = self._collect_from_feed_async(http, feed, parse_executor, updates)
                 tasks.append(task)
 
             # 並列実行（一部失敗しても続行）
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                parse_executor.shutdown(wait=False)
 
             all_items = []
             for i, result in enumerate(results):
@@ -423,14 +713,17 @@ class MangaRSSCollector:
 
             return all_items
 
-    def _collect_sync(self, manga_feeds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _collect_sync(
+        self, manga_feeds: List[Dict[str, Any]], updates: Optional[PendingFeedUpdates] = None
+    ) -> List[Dict[str, Any]]:
         """同期並列収集（フォールバック）"""
         all_items = []
 
         # 並列処理でRSS収集を実行
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_feed = {
-                executor.submit(self._collect_from_feed_safe, feed): feed for feed in manga_feeds
+                executor.submit(self._collect_from_feed_safe, feed, updates): feed
+                for feed in manga_feeds
             }
 
             for future in as_completed(future_to_feed):
@@ -452,9 +745,22 @@ class MangaRSSCollector:
         return all_items
 
     async def _collect_from_feed_async(
-        self, session: aiohttp.ClientSession, feed_info: Dict[str, Any]
+        self,
+        http: SharedHttpClient,
+        feed_info: Dict[str, Any],
+        parse_executor: Optional[ThreadPoolExecutor] = None,
+        updates: Optional[PendingFeedUpdates] = None,
     ) -> List[Dict[str, Any]]:
-        """非同期フィード収集"""
+        """
+        非同期フィード収集
+
+        Args:
+            http: 共有 HTTP クライアント（再試行はフィード設定の retry_count / retry_delay）
+            feed_info: フィード情報辞書
+            parse_executor: 解析・正規化を実行するスレッドプール
+                （None ならイベントループの既定のエグゼキューター）
+            updates: 保存後に記録するフィードの状態の蓄積先（None なら記録しない）
+        """
         feed_name = feed_info.get("name", "Unknown")
         feed_url = feed_info.get("url")
 
@@ -467,65 +773,70 @@ class MangaRSSCollector:
 
             # フィード固有設定を取得
             feed_config = self._get_feed_config(feed_name)
-            feed_config.get("timeout", self.timeout)
             retry_count = feed_config.get("retry_count", 3)
-            retry_delay = feed_config.get("retry_delay", 2)
-
-            for attempt in range(retry_count):
-                try:
-                    self.logger.debug(
-                        f"{feed_name}から非同期収集中... (試行 {attempt + 1}/{retry_count})"
-                    )
-
-                    async with session.get(feed_url) as response:
-                        response.raise_for_status()
-
-                        content = await response.read()
-                        response_time = time.time() - start_time
-
-                        # RSS解析
-                        feed_data = feedparser.parse(content)
-
-                        if feed_data.bozo:
-                            self.logger.warning(
-                                f"{feed_name}RSSフィードの解析に問題があります: {feed_data.bozo_exception}"
-                            )
-
-                        # 成功時の処理
-                        items = self._process_feed_entries(feed_data, feed_name)
+            retry_policy = RetryPolicy(
+                max_retries=max(0, retry_count - 1), backoff=feed_config.get("retry_delay", 2)
+            )
 
-                        # フィードヘルス更新
-                        if feed_url in self.feed_health:
-                            self.feed_health[feed_url].record_success(response_time)
+            self.logger.debug(f"{feed_name}から非同期収集中...")
+            response = await http.get(
+                feed_url,
+                headers={
+                    "User-Agent": self.user_agent,
+                    "Accept": "application/rss+xml, application/xml, text/xml",
+                    "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
+                    **self.feed_state.conditional_headers(feed_url),
+                },
+                timeout=feed_config.get("timeout", self.timeout),
+                retry=retry_policy,
+            )
+            response_time = time.time() - start_time
 
-                        self.logger.debug(
-                            f"{feed_name}から{len(items)}件のアイテムを非同期収集 ({response_time:.1f}s)"
-                        )
-                        return items
+            if response.status == 304:
+                return self._record_not_modified(
+                    feed_url, feed_name, response.headers, response_time, updates
+                )
+            if not response.ok:
+                self.logger.error(f"非同期フィード収集エラー ({feed_name}): HTTP {response.status}")
+                self._record_feed_failure(feed_url, updates)
+                return []
+            if response_time > 5.0:
+                self.logger.warning(f"{feed_name}RSSの応答が遅延しています ({response_time:.1f}s)")
+
+            # RSS解析・正規化（イベントループをブロックしないようスレッドで実行）
+            items = await asyncio.get_running_loop().run_in_executor(
+                parse_executor,
+                self._parse_feed_content,
+                response.body,
+                feed_name,
+                feed_url,
+                updates,
+            )
+            self._queue_validators(updates, feed_url, response.headers)
 
-                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                    self.logger.warning(f"{feed_name} 非同期収集試行 {attempt + 1} 失敗: {e}")
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(retry_delay)
-                        continue
-                    else:
-                        raise
+            # フィードヘルス更新
+            self._record_feed_success(feed_url, response_time, updates)
 
-            return []
+            self.logger.debug(
+                f"{feed_name}から{len(items)}件のアイテムを非同期収集 ({response_time:.1f}s)"
+            )
+            return items
 
         except Exception as e:
             self.logger.error(f"非同期フィード収集エラー ({feed_name}): {e}")
             # Feed health記録
-            if feed_url in self.feed_health:
-                self.feed_health[feed_url].record_failure()
+            self._record_feed_failure(feed_url, updates)
             return []
 
-    def _collect_from_feed_safe(self, feed_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _collect_from_feed_safe(
+        self, feed_info: Dict[str, Any], updates: Optional[PendingFeedUpdates] = None
+    ) -> List[Dict[str, Any]]:
         """
         並列処理対応のフィード収集（エラーハンドリング強化版）
 
         Args:
             feed_info: フィード情報辞書
+            updates: 保存後に記録するフィードの状態の蓄積先
 
         Returns:
             List[Dict[str, Any]]: 収集したアイテムリスト
@@ -538,12 +849,11 @@ class MangaRSSCollector:
             return []
 
         try:
-            return self._collect_from_feed_enhanced(feed_url, feed_name)
+            return self._collect_from_feed_enhanced(feed_url, feed_name, updates)
         except Exception as e:
             self.logger.error(f"フィード収集エラー ({feed_name}): {e}")
             # Feed health記録
-            if feed_url in self.feed_health:
-                self.feed_health[feed_url].record_failure()
+            self._record_feed_failure(feed_url, updates)
             return []
 
     def _deduplicate_items(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -571,133 +881,133 @@ class MangaRSSCollector:
 
         return unique_items
 
-    def _collect_from_feed_enhanced(self, feed_url: str, feed_name: str) -> List[Dict[str, Any]]:
+    def _collect_from_feed_enhanced(
+        self, feed_url: str, feed_name: str, updates: Optional[PendingFeedUpdates] = None
+    ) -> List[Dict[str, Any]]:
         """
-        強化版フィード収集（健全性チェック、日時正規化機能付き）
+        強化版フィード収集（同期版。共有 HTTP クライアントで取得する）
+
+        取得・再試行・304 の扱い・健全性の記録は _collect_from_feed_async と同じ。
 
         Args:
             feed_url: フィードURL
             feed_name: フィード名
+            updates: 保存後に記録するフィードの状態の蓄積先（None なら記録しない）
 
         Returns:
             List[Dict[str, Any]]: 収集したアイテムリスト
         """
-        start_time = time.time()
 
-        # フィード固有設定を取得
-        feed_config = self._get_feed_config(feed_name)
-        timeout = feed_config.get("timeout", self.timeout)
-        retry_count = feed_config.get("retry_count", 3)
-        retry_delay = feed_config.get("retry_delay", 2)
-
-        for attempt in range(retry_count):
-            try:
-                self.logger.info(f"{feed_name}から情報収集中... (試行 {attempt + 1}/{retry_count})")
-
-                # HTTPリクエスト設定（強化版）
-                headers = {
-                    "User-Agent": self.user_agent,
-                    "Accept": "application/rss+xml, application/xml, text/xml",
-                    "Accept-Encoding": "gzip, deflate",
-                    "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
-                    "Connection": "keep-alive",
-                    "Cache-Control": "no-cache",
-                }
-
-                # タイムアウト警告
-                if timeout > 10:
-                    self.logger.info(f"{feed_name}のタイムアウトを{timeout}秒に延長")
-
-                response = requests.get(
-                    feed_url,
-                    headers=headers,
-                    timeout=timeout,
-                    allow_redirects=True,
-                    verify=True,
+        async def _collect():
+            async with get_http_client() as http:
+                return await self._collect_from_feed_async(
+                    http, {"name": feed_name, "url": feed_url}, updates=updates
                 )
 
-                response.raise_for_status()
+        return asyncio.run(_collect())
 
-                # レスポンス時間チェック
-                response_time = time.time() - start_time
-                if response_time > 5.0:
-                    self.logger.warning(
-                        f"{feed_name}RSSの応答が遅延しています ({response_time:.1f}s)"
-                    )
-
-                # RSS解析
-                feed_data = feedparser.parse(response.content)
-
-                if feed_data.bozo:
-                    self.logger.warning(
-                        f"{feed_name}RSSフィードの解析に問題があります: {feed_data.bozo_exception}"
-                    )
-
-                # 成功時の処理
-                items = self._process_feed_entries(feed_data, feed_name)
+    def _get_feed_config(self, feed_name: str) -> Dict[str, Any]:
+        """フィード固有設定を取得"""
+        for feed in self.enabled_feeds:
+            if feed.get("name") == feed_name:
+                return feed
+        return {}
 
-                # フィードヘルス更新
-                if feed_url in self.feed_health:
-                    self.feed_health[feed_url].record_success(response_time)
+    def _parse_feed_content(
+        self,
+        content: bytes,
+        feed_name: str,
+        feed_url: Optional[str] = None,
+        updates: Optional[PendingFeedUpdates] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        フィード本文を解析して正規化済みアイテムに変換
 
-                self.logger.info(
-                    f"{feed_name}から{len(items)}件のアイテムを収集 ({response_time:.1f}s)"
-                )
-                return items
+        CPU 処理のみでI/Oを伴わないため、非同期収集ではスレッドプールで実行する。
+        feed_url を渡すと取り込み済みのエントリーを解析直後に除外し、
+        新しいエントリーを updates に取り込み済み候補として追加する。
+        """
+        feed_data = feedparser.parse(content)
 
-            except requests.exceptions.Timeout:
-                self.logger.error(
-                    f"{feed_name} RSS接続がタイムアウトしました (試行 {attempt + 1}/{retry_count})"
-                )
-                if attempt < retry_count - 1:
-                    self.logger.info(f"{retry_delay}秒後に再試行します...")
-                    time.sleep(retry_delay)
-                    continue
+        if feed_data.bozo:
+            self.logger.warning(
+                f"{feed_name}RSSフィードの解析に問題があります: {feed_data.bozo_exception}"
+            )
 
-            except requests.exceptions.ConnectionError:
-                self.logger.error(
-                    f"{feed_name} RSS接続に失敗しました (試行 {attempt + 1}/{retry_count})"
-                )
-                if attempt < retry_count - 1:
-                    self.logger.info(f"{retry_delay}秒後に再試行します...")
-                    time.sleep(retry_delay)
-                    continue
+        if not feed_url:
+            return self._process_feed_entries(feed_data, feed_name)
+
+        entries, marks = self.seen_entries.filter_new(feed_url, feed_data.entries)
+        skipped = len(feed_data.entries) - len(entries)
+        if skipped:
+            self.logger.debug(f"{feed_name}: 取り込み済みのエントリー {skipped} 件をスキップ")
+        if updates is not None:
+            if entries:
+                # 更新間隔の推定に使う（保存時に反映）
+                updates.record_change(feed_url)
+            updates.add_marks(marks)
+        return self._process_feed_entries(feed_data, feed_name, entries)
+
+    def _queue_validators(
+        self,
+        updates: Optional[PendingFeedUpdates],
+        feed_url: str,
+        headers,
+        not_modified: bool = False,
+    ):
+        """
+        応答の ETag / Last-Modified を保存待ちにする
 
-            except requests.exceptions.HTTPError as e:
-                self.logger.error(f"{feed_name} HTTPエラー: {e} (試行 {attempt + 1}/{retry_count})")
-                if attempt < retry_count - 1:
-                    time.sleep(retry_delay)
-                    continue
+        取得しただけで保存前の検証子を書き込むと、次回は 304 が返り
+        保存されなかったエントリーを二度と取得できなくなる。
+        """
+        if updates is None:
+            return
+        updates.set_validators(
+            feed_url, *self.feed_state.validators_from_response(feed_url, headers, not_modified)
+        )
 
-            except Exception as e:
-                self.logger.error(
-                    f"{feed_name}で予期しないエラー: {e} (試行 {attempt + 1}/{retry_count})"
-                )
-                if attempt < retry_count - 1:
-                    time.sleep(retry_delay)
-                    continue
+    def commit_feed_updates(self, updates: PendingFeedUpdates) -> int:
+        """
+        収集結果の保存後に、フィードの取得状態を記録
 
-        # 全ての試行が失敗した場合
-        self.logger.error(f"{feed_name}から情報を取得できませんでした（{retry_count}回試行後）")
+        - 収集したエントリーを取り込み済みとして記録
+        - フィードの検証子（ETag / Last-Modified）を保存
+        - 更新間隔の推定値を更新し、次回のポーリング時刻を決めて健全性を保存
 
-        # フィードヘルス更新（失敗）
-        if feed_url in self.feed_health:
-            self.feed_health[feed_url].record_failure()
+        collect_with_updates() で収集したアイテムをデータベースに保存し終えた後に、
+        一緒に返された updates を渡す。渡さなければ次回の収集でも同じエントリーを
+        再度取得・処理し、ポーリングの予定も変わらない。
 
-        return []
-
-    def _get_feed_config(self, feed_name: str) -> Dict[str, Any]:
-        """フィード固有設定を取得"""
-        for feed in self.enabled_feeds:
-            if feed.get("name") == feed_name:
-                return feed
-        return {}
+        Returns:
+            int: 記録したエントリー数
+        """
+        pending = updates.snapshot()
+        # 同じ実行で同じフィードを複数回解析した場合は最後の内容を記録
+        marks = list({(mark[0], mark[1]): mark for mark in pending.marks}.values())
+        committed = self.seen_entries.mark_seen(marks)
+        if committed:
+            self.seen_entries.prune()
+        for feed_url, (etag, last_modified) in pending.validators.items():
+            self.feed_state.save_validators(feed_url, etag, last_modified)
+
+        for feed_url in pending.polled:
+            health = self._get_feed_health(feed_url)
+            if feed_url in pending.changed:
+                health.record_change(pending.changed[feed_url])
+            health.schedule_next_poll(
+                self.poll_min_interval, self.poll_max_interval, self.poll_max_backoff
+            )
+            self.feed_state.save_health(feed_url, health.to_record())
+        return committed
 
-    def _process_feed_entries(self, feed_data, feed_name: str) -> List[Dict[str, Any]]:
-        """フィードエントリーの処理"""
+    def _process_feed_entries(
+        self, feed_data, feed_name: str, entries: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """フィードエントリーの処理（entries を省略すると feed_data の全エントリー）"""
         items = []
 
-        for entry in feed_data.entries:
+        for entry in feed_data.entries if entries is None else entries:
             try:
                 rss_item = self._parse_feed_entry_enhanced(entry, feed_name)
                 if rss_item:
@@ -992,17 +1302,77 @@ class MangaRSSCollector:
         """
         return self._normalize_manga_item_enhanced(work_info, rss_item, source_name)
 
+    def get_health_report(self) -> Dict[str, Any]:
+        """Get comprehensive health monitoring report."""
+        healthy_feeds = sum(1 for health in self.feed_health.values() if health.is_healthy)
+        unhealthy_feeds = len(self.feed_health) - healthy_feeds
+
+        total_requests = sum(health.total_requests for health in self.feed_health.values())
+        total_failures = sum(health.total_failures for health in self.feed_health.values())
+
+        avg_response_time = 0
+        if self.feed_health:
+            response_times = [
+                health.average_response_time
+                for health in self.feed_health.values()
+                if health.average_response_time > 0
+            ]
+            if response_times:
+                avg_response_time = sum(response_times) / len(response_times)
+
+        return {
+            "total_feeds": len(self.enabled_feeds),
+            "monitored_feeds": len(self.feed_health),
+            "healthy_feeds": healthy_feeds,
+            "unhealthy_feeds": unhealthy_feeds,
+            "total_requests": total_requests,
+            "total_failures": total_failures,
+            "success_rate": (
+                (total_requests - total_failures) / total_requests if total_requests > 0 else 0
+            ),
+            "average_response_time": avg_response_time,
+            "feed_details": {
+                url: {
+                    "is_healthy": health.is_healthy,
+                    "consecutive_failures": health.consecutive_failures,
+                    "last_success": (
+                        health.last_success.isoformat() if health.last_success else None
+                    ),
+                    "last_failure": (
+                        health.last_failure.isoformat() if health.last_failure else None
+                    ),
+                    "total_requests": health.total_requests,
+                    "total_failures": health.total_failures,
+                    "average_response_time": health.average_response_time,
+                    "change_interval": health.change_interval,
+                    "next_poll_at": (
+                        health.next_poll_at.isoformat() if health.next_poll_at else None
+                    ),
+                }
+                for url, health in self.feed_health.items()
+            },
+        }
+
 
 class DuplicateDetector:
     """
     重複検出・排除システム - Phase 2 Implementation
 
     複数のアルゴリズムを使用して重複を検出し、データ品質を向上させます。
+
+    類似タイトル判定は既出タイトルのバイグラム転置インデックスで候補を絞り込み、
+    候補に対してのみ帯状（banded）の編集距離計算を行う。
     """
 
+    # 類似重複とみなす類似度（1 - 編集距離 / 長い方の長さ）の閾値
+    SIMILARITY_THRESHOLD = 0.85
+
     def __init__(self):
         self.seen_hashes: Set[str] = set()
         self.title_variations: Dict[str, Set[str]] = {}
+        # 正規化タイトルの長さ別バイグラム転置インデックス
+        self._indexed_titles: List[str] = []
+        self._gram_index: Dict[int, Dict[Tuple[str, int], List[int]]] = {}
 
     def remove_duplicates(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -1082,13 +1452,122 @@ class DuplicateDetector:
 
         # 正規化されたタイトルで類似度チェック
         normalized_title = self._normalize_title(title)
+        if not normalized_title:
+            return False
+
+        if normalized_title in self.title_variations:
+            return True
+
+        if len(self._indexed_titles) != len(self.title_variations):
+            self._rebuild_title_index()
+
+        length = len(normalized_title)
+        tokens = self._title_tokens(normalized_title)
+
+        for candidate_length, postings in self._gram_index.items():
+            max_len = max(length, candidate_length)
+            max_distance = self._max_allowed_distance(max_len)
+
+            # 長さの差は編集距離の下限（距離0は完全一致で判定済み）
+            if max_distance == 0 or abs(length - candidate_length) > max_distance:
+                continue
 
-        for existing_normalized in self.title_variations:
-            if self._calculate_title_similarity(normalized_title, existing_normalized) > 0.85:
-                return True
+            # q-gram 補題: 距離 k 以内なら共通バイグラムは max_len - 1 - 2k 以上
+            required = max_len - 1 - 2 * max_distance
+            shared_counts = Counter()
+            for token in tokens:
+                ids = postings.get(token)
+                if ids:
+                    shared_counts.update(ids)
+
+            for title_id, shared in shared_counts.items():
+                if shared < required:
+                    continue
+                candidate = self._indexed_titles[title_id]
+                if self._within_edit_distance(normalized_title, candidate, max_distance):
+                    return True
 
         return False
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _max_allowed_distance(cls, max_len: int) -> int:
+        """類似度が閾値を超える最大の編集距離（_calculate_title_similarity と同じ判定）"""
+        distance = int(max_len * (1.0 - cls.SIMILARITY_THRESHOLD)) + 1
+        while distance > 0 and not 1.0 - (distance / max_len) > cls.SIMILARITY_THRESHOLD:
+            distance -= 1
+        return distance
+
+    @staticmethod
+    def _title_tokens(normalized_title: str) -> List[Tuple[str, int]]:
+        """バイグラムを (バイグラム, 出現回数) のトークンに変換（多重集合を集合として扱うため）"""
+        occurrences: Dict[str, int] = {}
+        tokens = []
+        for i in range(len(normalized_title) - 1):
+            gram = normalized_title[i : i + 2]
+            occurrences[gram] = occurrences.get(gram, 0) + 1
+            tokens.append((gram, occurrences[gram]))
+        return tokens
+
+    def _index_title(self, normalized_title: str):
+        """正規化タイトルを転置インデックスに追加"""
+        title_id = len(self._indexed_titles)
+        self._indexed_titles.append(normalized_title)
+        postings = self._gram_index.setdefault(len(normalized_title), {})
+        for token in self._title_tokens(normalized_title):
+            postings.setdefault(token, []).append(title_id)
+
+    def _rebuild_title_index(self):
+        """title_variations から転置インデックスを作り直す"""
+        self._indexed_titles = []
+        self._gram_index = {}
+        for normalized_title in self.title_variations:
+            self._index_title(normalized_title)
+
+    @staticmethod
+    def _within_edit_distance(title1: str, title2: str, max_distance: int) -> bool:
+        """
+        編集距離が max_distance 以下か判定（対角線から max_distance 幅の帯のみ計算）
+
+        Args:
+            title1: タイトル1
+            title2: タイトル2
+            max_distance: 許容する最大編集距離
+
+        Returns:
+            編集距離が max_distance 以下の場合True
+        """
+        len1, len2 = len(title1), len(title2)
+        if abs(len1 - len2) > max_distance:
+            return False
+
+        limit = max_distance + 1
+        previous = [j if j <= max_distance else limit for j in range(len2 + 1)]
+
+        for i in range(1, len1 + 1):
+            start = max(1, i - max_distance)
+            end = min(len2, i + max_distance)
+            current = [limit] * (len2 + 1)
+            if i <= max_distance:
+                current[0] = i
+            row_min = current[0]
+            char1 = title1[i - 1]
+
+            for j in range(start, end + 1):
+                cost = 0 if char1 == title2[j - 1] else 1
+                value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+                if value > limit:
+                    value = limit
+                current[j] = value
+                if value < row_min:
+                    row_min = value
+
+            if row_min > max_distance:
+                return False
+            previous = current
+
+        return previous[len2] <= max_distance
+
     def _normalize_title(self, title: str) -> str:
         """
         タイトルの正規化
@@ -1173,6 +1652,8 @@ class DuplicateDetector:
 
         if normalized_title not in self.title_variations:
             self.title_variations[normalized_title] = set()
+            if len(self._indexed_titles) == len(self.title_variations) - 1:
+                self._index_title(normalized_title)
 
         self.title_variations[normalized_title].add(title)
 
@@ -1204,7 +1685,7 @@ class BookWalkerRSSCollector(MangaRSSCollector):
         self.bookwalker_base_url = "https://bookwalker.jp"
         self.series_cache = {}  # シリーズ情報キャッシュ
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def _collect_feeds(self, updates: PendingFeedUpdates) -> List[Dict[str, Any]]:
         """BookWalker特化の収集処理"""
         self.logger.info("BookWalkerマンガ情報収集を開始...")
 
@@ -1227,6 +1708,7 @@ class BookWalkerRSSCollector(MangaRSSCollector):
                 }
             ]
 
+        bookwalker_feeds = self._select_due_feeds(bookwalker_feeds)
         all_items = []
 
         for feed_info in bookwalker_feeds:
@@ -1234,7 +1716,7 @@ class BookWalkerRSSCollector(MangaRSSCollector):
             feed_url = feed_info.get("url")
 
             try:
-                items = self._collect_bookwalker_feed(feed_url, feed_name)
+                items = self._collect_bookwalker_feed(feed_url, feed_name, updates)
                 if items:
                     all_items.extend(items)
             except Exception as e:
@@ -1243,10 +1725,12 @@ class BookWalkerRSSCollector(MangaRSSCollector):
 
         return all_items
 
-    def _collect_bookwalker_feed(self, feed_url: str, feed_name: str) -> List[Dict[str, Any]]:
+    def _collect_bookwalker_feed(
+        self, feed_url: str, feed_name: str, updates: Optional[PendingFeedUpdates] = None
+    ) -> List[Dict[str, Any]]:
         """BookWalker専用の収集処理"""
         # 基本のRSS収集を使用
-        items = self._collect_from_feed_enhanced(feed_url, feed_name)
+        items = self._collect_from_feed_enhanced(feed_url, feed_name, updates)
 
         # BookWalker用の後処理
         processed_items = []
@@ -1372,7 +1856,7 @@ class DAnimeRSSCollector(MangaRSSCollector):
         self.danime_base_url = "https://anime.dmkt-sp.jp"
         self.episode_cache = {}  # エピソード情報キャッシュ
 
-    def collect(self) -> List[Dict[str, Any]]:
+    def _collect_feeds(self, updates: PendingFeedUpdates) -> List[Dict[str, Any]]:
         """dアニメストア特有の収集処理"""
         self.logger.info("dアニメストア情報収集を開始...")
 
@@ -1394,6 +1878,7 @@ class DAnimeRSSCollector(MangaRSSCollector):
                 }
             ]
 
+        danime_feeds = self._select_due_feeds(danime_feeds)
         all_items = []
 
         for feed_info in danime_feeds:
@@ -1401,7 +1886,7 @@ class DAnimeRSSCollector(MangaRSSCollector):
             feed_url = feed_info.get("url")
 
             try:
-                items = self._collect_danime_feed_enhanced(feed_url, feed_name)
+                items = self._collect_danime_feed_enhanced(feed_url, feed_name, updates)
                 if items:
                     all_items.extend(items)
             except Exception as e:
@@ -1410,10 +1895,12 @@ class DAnimeRSSCollector(MangaRSSCollector):
 
         return all_items
 
-    def _collect_danime_feed_enhanced(self, feed_url: str, feed_name: str) -> List[Dict[str, Any]]:
+    def _collect_danime_feed_enhanced(
+        self, feed_url: str, feed_name: str, updates: Optional[PendingFeedUpdates] = None
+    ) -> List[Dict[str, Any]]:
         """dアニメストア専用の強化収集処理"""
         # 基本のRSS収集を使用
-        items = self._collect_from_feed_enhanced(feed_url, feed_name)
+        items = self._collect_from_feed_enhanced(feed_url, feed_name, updates)
 
         # dアニメストア用の後処理
         processed_items = []
@@ -1500,53 +1987,6 @@ class DAnimeRSSCollector(MangaRSSCollector):
 
         return str(date_info)
 
-    def get_health_report(self) -> Dict[str, Any]:
-        """Get comprehensive health monitoring report."""
-        healthy_feeds = sum(1 for health in self.feed_health.values() if health.is_healthy)
-        unhealthy_feeds = len(self.feed_health) - healthy_feeds
-
-        total_requests = sum(health.total_requests for health in self.feed_health.values())
-        total_failures = sum(health.total_failures for health in self.feed_health.values())
-
-        avg_response_time = 0
-        if self.feed_health:
-            response_times = [
-                health.average_response_time
-                for health in self.feed_health.values()
-                if health.average_response_time > 0
-            ]
-            if response_times:
-                avg_response_time = sum(response_times) / len(response_times)
-
-        return {
-            "total_feeds": len(self.enabled_feeds),
-            "monitored_feeds": len(self.feed_health),
-            "healthy_feeds": healthy_feeds,
-            "unhealthy_feeds": unhealthy_feeds,
-            "total_requests": total_requests,
-            "total_failures": total_failures,
-            "success_rate": (
-                (total_requests - total_failures) / total_requests if total_requests > 0 else 0
-            ),
-            "average_response_time": avg_response_time,
-            "feed_details": {
-                url: {
-                    "is_healthy": health.is_healthy,
-                    "consecutive_failures": health.consecutive_failures,
-                    "last_success": (
-                        health.last_success.isoformat() if health.last_success else None
-                    ),
-                    "last_failure": (
-                        health.last_failure.isoformat() if health.last_failure else None
-                    ),
-                    "total_requests": health.total_requests,
-                    "total_failures": health.total_failures,
-                    "average_response_time": health.average_response_time,
-                }
-                for url, health in self.feed_health.items()
-            },
-        }
-
 
 # モジュールレベルのfetch_and_store関数（collect_all_data.pyから呼び出される）
 def fetch_and_store() -> dict:
@@ -1567,15 +2007,17 @@ def fetch_and_store() -> dict:
         collector = MangaRSSCollector(config_manager)
 
         # データ収集
-        items = collector.collect()
+        items, updates = collector.collect_with_updates()
 
         if not items:
+            collector.commit_feed_updates(updates)
             logger.info("マンガRSSから収集されたアイテムはありません")
             return {"success": True, "collected": 0, "stored": 0}
 
         # データベースに保存
         db = get_db()
         stored_count = 0
+        failed_count = 0
 
         for item in items:
             try:
@@ -1610,8 +2052,12 @@ def fetch_and_store() -> dict:
 
             except Exception as e:
                 logger.warning(f"アイテム保存エラー: {item.get('title', 'Unknown')} - {e}")
+                failed_count += 1
                 continue
 
+        # 保存に失敗したアイテムがあれば取り込み済みにせず、次回に再取得する
+        if not failed_count:
+            collector.commit_feed_updates(updates)
         logger.info(f"マンガRSS収集完了: {len(items)}件収集, {stored_count}件保存")
         return {"success": True, "collected": len(items), "stored": stored_count}
 
@@ -0,0 +1,143 @@
+"""
+キーセット（カーソル）ページネーション
+
+一覧APIで LIMIT/OFFSET の代わりに「前ページ最終行のソートキー」を起点に
+次ページを取得するためのヘルパー。
+
+- encode_cursor / decode_cursor: ソートキーの値を不透明なカーソル文字列に変換
+- keyset_condition: ORDER BY と同じ順序で「カーソルより後ろ」を表す WHERE 条件
+- cached_total: 絞り込み条件ごとの総件数を短時間キャッシュ（COUNT(*) を毎回実行しない）。
+  データバージョンを渡すとバージョンが変わった時点で数え直す
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+from modules.cache import MemoryCache
+
+# 総件数キャッシュの有効期間（秒）。UI のページ数表示用なので多少古くてよい
+TOTAL_CACHE_TTL = 60
+
+_total_cache = MemoryCache(max_size=256, default_ttl=TOTAL_CACHE_TTL)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    ソートキーの値をカーソル文字列に変換
+
+    Args:
+        values: 最終行のソートキー（ORDER BY の列順）
+
+    Returns:
+        str: URL セーフな不透明カーソル
+    """
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """
+    カーソル文字列をソートキーの値に戻す
+
+    Args:
+        cursor: encode_cursor が返した文字列（空なら先頭ページ）
+        size: 期待するソートキーの個数
+
+    Returns:
+        Optional[List[Any]]: ソートキーの値。cursor が空なら None
+
+    Raises:
+        ValueError: カーソルが壊れている、または形式が合わない場合
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def keyset_condition(
+    keys: Sequence[Tuple[str, bool]], values: Sequence[Any]
+) -> Tuple[str, List[Any]]:
+    """
+    カーソル位置より後ろの行を表す WHERE 条件を組み立てる
+
+    ORDER BY k1, k2, ... の辞書式順序で (v1, v2, ...) より後ろ、つまり
+    ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...`` を方向と NULL を考慮して生成する。
+    SQLite は NULL を最小値として並べる（ASC で先頭、DESC で末尾）ため、
+    NULL を含むキーでも ORDER BY と同じ順序になる。最後のキーは一意な列
+    （id など）にすること。
+
+    Args:
+        keys: (SQL式, 降順ならTrue) のリスト。ORDER BY と同じ並び
+        values: decode_cursor で得たソートキーの値
+
+    Returns:
+        Tuple[str, List[Any]]: 括弧付きの条件式とパラメータ
+    """
+    branches = []
+    params: List[Any] = []
+    equal_sql: List[str] = []
+    equal_params: List[Any] = []
+
+    for (expression, descending), value in zip(keys, values):
+        # このキーで「後ろ」になる条件
+        if value is None:
+            after_sql = None if descending else f"{expression} IS NOT NULL"
+            after_params: List[Any] = []
+        elif descending:
+            after_sql = f"({expression} < ? OR {expression} IS NULL)"
+            after_params = [value]
+        else:
+            after_sql = f"{expression} > ?"
+            after_params = [value]
+
+        if after_sql is not None:
+            branches.append(" AND ".join(equal_sql + [after_sql]))
+            params.extend(equal_params + after_params)
+
+        if value is None:
+            equal_sql.append(f"{expression} IS NULL")
+        else:
+            equal_sql.append(f"{expression} = ?")
+            equal_params.append(value)
+
+    if not branches:
+        return "(0)", []
+    return "(" + " OR ".join(f"({branch})" for branch in branches) + ")", params
+
+
+def cached_total(key: Hashable, count: Callable[[], int], version: Optional[int] = None) -> int:
+    """
+    絞り込み条件ごとの総件数をキャッシュ付きで取得
+
+    データバージョン単位でキャッシュするレスポンスに総件数を含める場合は
+    version を渡すこと。渡さないと古い件数が新しいバージョンのレスポンスに残る。
+
+    Args:
+        key: 絞り込み条件を表すキー（エンドポイント名と条件のタプルなど）
+        count: キャッシュが無い場合に総件数を数える関数
+        version: データバージョン（modules.db.read_data_version）。
+            キャッシュ時と異なれば数え直す
+
+    Returns:
+        int: 総件数（version を省略した場合は最大 TOTAL_CACHE_TTL 秒前の値）
+    """
+    cached = _total_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    total = count()
+    _total_cache.set(key, (version, total))
+    return total
+
+
+def clear_total_cache():
+    """総件数キャッシュを破棄（データ更新直後に正確な件数が必要な場合）"""
+    _total_cache.clear()
@@ -6,10 +6,11 @@
 """
 
 import logging
-import sqlite3
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 
+from .db import get_request_connection
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = "db.sqlite3"
@@ -22,10 +23,8 @@ class WatchlistNotifier:
         self.db_path = db_path
 
     def get_db_connection(self):
-        """データベース接続を取得"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """データベース接続を取得（リクエスト中はプール接続を共有）"""
+        return get_request_connection(self.db_path)
 
     def get_new_releases_for_watchlist(self, days_back: int = 7) -> Dict[str, List[Dict]]:
         """
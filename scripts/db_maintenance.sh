@@ -47,6 +47,7 @@ OPTIONS:
     --analyze       ANALYZE（統計情報更新）を実行
     --backup        バックアップを作成
     --check         整合性チェックを実行
+    --rebuild-stats ダッシュボード集計カウンタ（stats_counters）を再集計
     --all           全メンテナンスを実行（推奨）
     --help, -h      このヘルプを表示
 
@@ -151,6 +152,21 @@ run_check() {
     log "整合性チェック完了"
 }
 
+# ダッシュボード集計カウンタ再構築（ずれが疑われる場合に実行）
+run_rebuild_stats() {
+    log "集計カウンタ再構築開始..."
+    (cd "$PROJECT_ROOT" && python3 -c "
+import sys
+from modules.db import DatabaseManager
+counts = DatabaseManager(sys.argv[1]).rebuild_stats_counters()
+for name, value in counts.items():
+    print(f'{name}={value}')
+" "$DB_PATH") | while read line; do
+        log "  $line"
+    done
+    log "集計カウンタ再構築完了"
+}
+
 # 統計情報表示
 show_stats() {
     log "データベース統計情報:"
@@ -225,6 +241,9 @@ main() {
         --stats)
             show_stats
             ;;
+        --rebuild-stats)
+            run_rebuild_stats
+            ;;
         --all)
             run_all
             ;;
@@ -1,8 +1,10 @@
 from modules.anime_anilist import AniListCollector
+from modules.http_client import HttpResponse, SharedHttpClient
 import pytest
 import asyncio
 import aiohttp
-from unittest.mock import patch, MagicMock
+import json
+from unittest.mock import patch, AsyncMock
 import sys
 import os
 
@@ -44,16 +46,10 @@ class TestAniListAPI:
             }
         }
 
-        with patch("aiohttp.ClientSession.post") as mock_post:
-            mock_response = MagicMock()
-            mock_response.status = 200
-
-            async def mock_json():
-                return mock_response_data
-
-            mock_response.json = mock_json
-            mock_post.return_value.__aenter__.return_value = mock_response
-
+        response = HttpResponse(
+            200, {}, json.dumps(mock_response_data).encode(), "https://graphql.anilist.co"
+        )
+        with patch.object(SharedHttpClient, "request", AsyncMock(return_value=response)):
             result = await api.fetch_seasonal_anime(2024, "WINTER")
 
             assert result is not None
@@ -65,8 +61,8 @@ class TestAniListAPI:
         """API エラー時のテスト"""
         api = AniListCollector({})
 
-        with patch("aiohttp.ClientSession.post") as mock_post:
-            mock_post.side_effect = aiohttp.ClientError("API Error")
+        request = AsyncMock(side_effect=aiohttp.ClientError("API Error"))
+        with patch.object(SharedHttpClient, "request", request):
 
             result = await api.fetch_seasonal_anime(2024, "WINTER")
 
@@ -34,6 +34,7 @@ try:
         CircuitBreakerConfig,
         CircuitState,
     )
+    from modules.http_client import HttpResponse, SharedHttpClient, get_rate_limiter
     from modules.models import AniListWork, WorkType, DataSource
 except ImportError as e:
     pytest.skip(f"anime_anilist module not found: {e}", allow_module_level=True)
@@ -547,27 +548,15 @@ class TestCircuitBreakerFunctionality:
 class TestAdaptiveRateLimiting:
     """アダプティブレート制限のテスト"""
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_enforcement(self):
-        """レート制限が適切に強制される"""
+    def test_rate_limit_uses_shared_host_bucket(self):
+        """レート制限は共有 HTTP クライアントのホスト単位バケットで行う"""
         client = AniListClient()
 
-        # 複数リクエストのタイムスタンプを記録
-        import time
-        start_time = time.time()
-
-        for _ in range(3):
-            await client._enforce_rate_limit()
-
-        elapsed = time.time() - start_time
-
-        # タイムスタンプが記録されている
-        assert len(client.request_timestamps) == 3
-        # 極端に速すぎない（バースト保護）
-        assert elapsed >= 0  # 少なくとも処理時間がかかる
+        bucket = get_rate_limiter(AniListClient.API_URL)
+        assert bucket is client.rate_limiter
+        assert bucket.requests_per_minute == AniListClient.RATE_LIMIT
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_cleanup(self):
+    def test_request_time_cleanup(self):
         """古いタイムスタンプのクリーンアップ"""
         client = AniListClient()
 
@@ -576,10 +565,11 @@ class TestAdaptiveRateLimiting:
         old_timestamp = time.time() - 100  # 100秒前
         client.request_timestamps = [old_timestamp]
 
-        await client._enforce_rate_limit()
+        client._record_request_time()
 
         # 古いタイムスタンプは削除されている
         assert old_timestamp not in client.request_timestamps
+        assert len(client.request_timestamps) == 1
 
     def test_rate_limit_adjustment_on_errors(self):
         """エラー発生時のレート制限調整"""
@@ -594,9 +584,11 @@ class TestAdaptiveRateLimiting:
         client.last_rate_adjustment = time.time() - 100  # 過去に調整したことにする
         client._adjust_rate_limit_if_needed()
 
-        # レート制限が下がっている
+        # レート制限が下がり、共有バケットにも反映される
         assert client.current_rate_limit < original_rate
         assert client.current_rate_limit >= AniListClient.MIN_RATE_LIMIT
+        bucket = get_rate_limiter(AniListClient.API_URL)
+        assert bucket.requests_per_minute == client.current_rate_limit
 
     def test_rate_limit_recovery_on_success(self):
         """成功時のレート制限回復"""
@@ -616,6 +608,11 @@ class TestAdaptiveRateLimiting:
         assert client.current_rate_limit <= AniListClient.RATE_LIMIT
 
 
+def _anilist_response(status, data):
+    """共有 HTTP クライアントが返す AniList の応答"""
+    return HttpResponse(status, {}, json.dumps(data).encode(), AniListClient.API_URL)
+
+
 class TestAniListClientRequests:
     """AniListClient リクエストのテスト"""
 
@@ -631,31 +628,23 @@ class TestAniListClientRequests:
                 }
             }
         }
+        request = AsyncMock(return_value=_anilist_response(200, mock_response_data))
 
-        # Create mock response
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=mock_response_data)
-
-        # Create mock post that returns the response
-        mock_post = MagicMock()
-        mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_post.__aexit__ = AsyncMock(return_value=None)
-
-        # Create mock session
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post = MagicMock(return_value=mock_post)
+        with patch.object(SharedHttpClient, "request", request):
+            result = await client._make_request("query { test }", {"page": 1})
+            await client.close()
 
-        # Mock the ClientSession context manager
-        with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session_class.return_value.__aenter__.return_value = mock_session_instance
-            mock_session_class.return_value.__aexit__.return_value = None
-
-            result = await client._make_request("query { test }")
+        assert result == mock_response_data["data"]
+        assert client.request_count == 1
+        assert client.error_count == 0
 
-            assert result == mock_response_data["data"]
-            assert client.request_count == 1
-            assert client.error_count == 0
+        method, url = request.call_args.args
+        assert (method, url) == ("POST", AniListClient.API_URL)
+        assert request.call_args.kwargs["json"] == {
+            "query": "query { test }",
+            "variables": {"page": 1},
+        }
+        assert request.call_args.kwargs["retry"] is client.retry_policy
 
     @pytest.mark.asyncio
     async def test_make_request_circuit_breaker_open(self):
@@ -672,29 +661,14 @@ class TestAniListClientRequests:
 
     @pytest.mark.asyncio
     async def test_make_request_rate_limit_error(self):
-        """レート制限エラーのハンドリング"""
+        """再試行しきった 429 は RateLimitExceeded になる"""
         client = AniListClient()
+        response = _anilist_response(429, {"error": "Rate limited"})
 
-        # Create mock response
-        mock_resp = AsyncMock()
-        mock_resp.status = 429
-        mock_resp.json = AsyncMock(return_value={"error": "Rate limited"})
-
-        # Create mock post
-        mock_post = MagicMock()
-        mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_post.__aexit__ = AsyncMock(return_value=None)
-
-        # Create mock session
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post = MagicMock(return_value=mock_post)
-
-        with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session_class.return_value.__aenter__.return_value = mock_session_instance
-            mock_session_class.return_value.__aexit__.return_value = None
-
+        with patch.object(SharedHttpClient, "request", AsyncMock(return_value=response)):
             with pytest.raises(RateLimitExceeded):
                 await client._make_request("query { test }")
+            await client.close()
 
     @pytest.mark.asyncio
     async def test_make_request_graphql_error(self):
@@ -705,56 +679,257 @@ class TestAniListClientRequests:
             "data": None,
             "errors": [{"message": "Invalid query"}]
         }
+        response = _anilist_response(200, error_response)
 
-        # Create mock response
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value=error_response)
+        with patch.object(SharedHttpClient, "request", AsyncMock(return_value=response)):
+            with pytest.raises(AniListAPIError) as exc_info:
+                await client._make_request("query { test }")
+            await client.close()
+
+        assert "GraphQL errors" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_make_request_with_retry(self):
+        """5xx は共有クライアントが再試行し、最後の応答でエラーになる"""
+        client = AniListClient(retry_attempts=3, retry_delay=0.01)
+        assert client.retry_policy.max_retries == 2
+
+        server_error = MagicMock()
+        server_error.__aenter__ = AsyncMock(return_value=MagicMock(
+            status=500,
+            headers={},
+            url=AniListClient.API_URL,
+            charset="utf-8",
+            read=AsyncMock(return_value=b'{"error": "Server error"}'),
+        ))
+        server_error.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock(closed=False)
+        session.request = MagicMock(return_value=server_error)
+        session.close = AsyncMock()
+
+        with patch.object(SharedHttpClient, "get_session", return_value=session):
+            with pytest.raises(AniListAPIError) as exc_info:
+                await client._make_request("query { test }")
+            await client.close()
 
-        # Create mock post
-        mock_post = MagicMock()
-        mock_post.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_post.__aexit__ = AsyncMock(return_value=None)
+        assert "HTTP 500" in str(exc_info.value)
+        assert session.request.call_count == 3
 
-        # Create mock session
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post = MagicMock(return_value=mock_post)
+    @pytest.mark.asyncio
+    async def test_make_request_connection_error(self):
+        """接続エラーは AniListAPIError になり、エラー数に数える"""
+        import aiohttp
 
-        with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session_class.return_value.__aenter__.return_value = mock_session_instance
-            mock_session_class.return_value.__aexit__.return_value = None
+        client = AniListClient()
+        request = AsyncMock(side_effect=aiohttp.ClientError("connection reset"))
 
-            with pytest.raises(AniListAPIError) as exc_info:
+        with patch.object(SharedHttpClient, "request", request):
+            with pytest.raises(AniListAPIError):
                 await client._make_request("query { test }")
+            await client.close()
+
+        assert client.error_count == 1
+        assert client.consecutive_errors == 1
+
+
+class TestAniListClientSession:
+    """共有 HTTP クライアントのセッション（keep-alive）のテスト"""
+
+    @staticmethod
+    def _mock_session_class(mock_session_class, response_data):
+        mock_resp = MagicMock()
+        mock_resp.status = 200
+        mock_resp.headers = {}
+        mock_resp.url = AniListClient.API_URL
+        mock_resp.charset = "utf-8"
+        mock_resp.read = AsyncMock(return_value=json.dumps(response_data).encode())
+
+        mock_request = MagicMock()
+        mock_request.__aenter__ = AsyncMock(return_value=mock_resp)
+        mock_request.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session_instance = MagicMock()
+        mock_session_instance.closed = False
+        mock_session_instance.request = MagicMock(return_value=mock_request)
+        mock_session_instance.close = AsyncMock()
 
-            assert "GraphQL errors" in str(exc_info.value)
+        mock_session_class.return_value = mock_session_instance
+        return mock_session_instance
 
     @pytest.mark.asyncio
-    async def test_make_request_with_retry(self):
-        """リトライ機能のテスト"""
-        client = AniListClient(retry_attempts=3, retry_delay=0.1)
+    async def test_session_is_reused_across_requests(self):
+        """複数リクエストで同じセッションを再利用する"""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            session = self._mock_session_class(mock_session_class, {"data": {"ok": True}})
+
+            async with AniListClient() as client:
+                await client._make_request("query { a }")
+                await client._make_request("query { b }")
+                assert client.http.open_sessions() == 1
+
+            assert mock_session_class.call_count == 1
+            assert session.request.call_count == 2
+            session.close.assert_awaited_once()
+            assert client.http.open_sessions() == 0
 
-        # Create mock response for failure
-        mock_resp_fail = AsyncMock()
-        mock_resp_fail.status = 500
-        mock_resp_fail.json = AsyncMock(return_value={"error": "Server error"})
+    @pytest.mark.asyncio
+    async def test_close_without_session_is_noop(self):
+        """セッション未作成でも close() は安全"""
+        client = AniListClient()
+
+        await client.close()
+        await client.close()
 
-        # Create mock post
-        mock_post = MagicMock()
-        mock_post.__aenter__ = AsyncMock(return_value=mock_resp_fail)
-        mock_post.__aexit__ = AsyncMock(return_value=None)
+        assert client.http.open_sessions() == 0
 
-        # Create mock session
-        mock_session_instance = AsyncMock()
-        mock_session_instance.post = MagicMock(return_value=mock_post)
+    def test_new_event_loop_opens_new_session(self):
+        """asyncio.run() をまたいで再利用する場合は新しいセッションを開く"""
+        client = AniListClient()
 
-        with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session_class.return_value.__aenter__.return_value = mock_session_instance
-            mock_session_class.return_value.__aexit__.return_value = None
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            self._mock_session_class(mock_session_class, {"data": {}})
 
-            # Note: This test verifies error handling, not successful retry
-            with pytest.raises(AniListAPIError):
-                await client._make_request("query { test }")
+            asyncio.run(client._make_request("query { a }"))
+            asyncio.run(client._make_request("query { b }"))
+
+        assert mock_session_class.call_count == 2
+
+    def test_requests_are_counted_in_http_stats(self):
+        """AniList へのリクエストは共有クライアントの統計に載る"""
+        from modules.http_client import get_http_stats, reset_http_stats
+
+        reset_http_stats()
+
+        async def run():
+            async with AniListClient() as client:
+                await client._make_request("query { a }")
+
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            self._mock_session_class(mock_session_class, {"data": {}})
+            asyncio.run(run())
+
+        stats = get_http_stats()
+        assert stats["hosts"]["graphql.anilist.co"]["requests"] == 1
+        assert stats["rate_limits"]["graphql.anilist.co"] == AniListClient.RATE_LIMIT
+
+
+class TestAniListClientPaging:
+    """並行ページ取得のテスト"""
+
+    @staticmethod
+    def _paged_request(pages, delay=0.05, in_flight=None, fail_pages=()):
+        """page 番号に応じて pages[page] を返す疑似 _make_request"""
+        requested = []
+
+        async def make_request(query, variables=None):
+            page = variables["page"]
+            requested.append(page)
+            if in_flight is not None:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            try:
+                await asyncio.sleep(delay)
+                if page in fail_pages:
+                    raise AniListAPIError(f"page {page} failed")
+                media, has_next = pages.get(page, ([], False))
+                return {"Page": {"pageInfo": {"hasNextPage": has_next}, "media": media}}
+            finally:
+                if in_flight is not None:
+                    in_flight["now"] -= 1
+
+        return make_request, requested
+
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_concurrently_and_merged_in_order(self):
+        client = AniListClient()
+        pages = {n: ([{"id": n}], n < 5) for n in range(1, 6)}
+        in_flight = {"now": 0, "max": 0}
+        make_request, requested = self._paged_request(pages, in_flight=in_flight)
+
+        with patch.object(client, "_make_request", new=make_request):
+            media = await client._fetch_pages("query", max_pages=5)
+
+        assert [m["id"] for m in media] == [1, 2, 3, 4, 5]
+        assert sorted(requested) == [1, 2, 3, 4, 5]
+        assert 1 < in_flight["max"] <= client.PAGE_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_stops_at_has_next_page_false(self):
+        client = AniListClient()
+        pages = {1: ([{"id": 1}], True), 2: ([{"id": 2}], False), 3: ([{"id": 3}], True)}
+        make_request, requested = self._paged_request(pages)
+
+        with patch.object(client, "_make_request", new=make_request):
+            media = await client._fetch_pages("query", max_pages=5)
+
+        assert [m["id"] for m in media] == [1, 2]
+        # Page 5 is still queued behind the semaphore when page 2 reports the end
+        assert 5 not in requested
+
+    @pytest.mark.asyncio
+    async def test_single_page_when_first_page_is_last(self):
+        client = AniListClient()
+        make_request, requested = self._paged_request({1: ([{"id": 1}], False)})
+
+        with patch.object(client, "_make_request", new=make_request):
+            media = await client._fetch_pages("query", max_pages=5)
+
+        assert media == [{"id": 1}]
+        assert requested == [1]
+
+    @pytest.mark.asyncio
+    async def test_failed_page_keeps_earlier_pages(self):
+        client = AniListClient()
+        pages = {n: ([{"id": n}], True) for n in range(1, 6)}
+        make_request, _ = self._paged_request(pages, fail_pages={3})
+
+        with patch.object(client, "_make_request", new=make_request):
+            media = await client._fetch_pages("query", max_pages=5)
+
+        assert [m["id"] for m in media] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_upcoming_releases_uses_all_pages(self):
+        client = AniListClient()
+        soon = int(datetime.now().timestamp()) + 3600
+        pages = {
+            n: (
+                [
+                    {
+                        "id": n,
+                        "title": {"romaji": f"A{n}"},
+                        "nextAiringEpisode": {"episode": 1, "airingAt": soon + n},
+                    }
+                ],
+                n < 3,
+            )
+            for n in range(1, 4)
+        }
+        make_request, _ = self._paged_request(pages)
+
+        with patch.object(client, "_make_request", new=make_request):
+            releases = await client.get_upcoming_releases(days_ahead=1)
+
+        assert [r["anilist_id"] for r in releases] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_get_genre_anime_pages_beyond_fifty(self):
+        client = AniListClient()
+
+        def media_page(n):
+            return [
+                {"id": n * 100 + i, "title": {"romaji": f"T{n}-{i}"}, "genres": ["Action"]}
+                for i in range(50)
+            ]
+
+        pages = {1: (media_page(1), True), 2: (media_page(2), True)}
+        make_request, requested = self._paged_request(pages, delay=0)
+
+        with patch.object(client, "_make_request", new=make_request):
+            results = await client.get_genre_anime("Action", limit=60)
+
+        assert len(results) == 60
+        assert sorted(requested) == [1, 2]
 
 
 class TestAniListClientSearchAnime:
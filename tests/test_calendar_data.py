@@ -0,0 +1,100 @@
+"""
+カレンダー用月別データのテスト
+modules/calendar_data.py を検証
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules import calendar_data
+from modules.calendar_data import clear_month_cache, get_month_releases, month_range
+from modules.db import DatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    db_manager = DatabaseManager(db_path=str(tmp_path / "calendar.sqlite3"))
+    clear_month_cache()
+    yield db_manager
+    db_manager.close_connections()
+
+
+class TestMonthRange:
+    @pytest.mark.parametrize(
+        "year, month, expected",
+        [
+            (2025, 1, ("2025-01-01", "2025-02-01")),
+            (2024, 2, ("2024-02-01", "2024-03-01")),
+            (2025, 12, ("2025-12-01", "2026-01-01")),
+        ],
+    )
+    def test_half_open_bounds(self, year, month, expected):
+        assert month_range(year, month) == expected
+
+    def test_query_uses_date_index(self, manager):
+        with manager.get_connection() as conn:
+            plans = [
+                " ".join(str(col) for col in row)
+                for query in (calendar_data._RELEASES_QUERY, calendar_data._CALENDAR_EVENTS_QUERY)
+                for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", month_range(2025, 1))
+            ]
+
+        assert any("idx_releases_date" in plan for plan in plans)
+        assert any("idx_calendar_events_date" in plan for plan in plans)
+
+
+class TestMonthReleases:
+    def test_groups_by_date_within_month(self, manager):
+        work_id = manager.create_work(title="月別作品", work_type="anime")
+        manager.create_release(work_id, "episode", "1", "Netflix", "2024-12-31")
+        manager.create_release(work_id, "episode", "2", "Netflix", "2025-01-01")
+        manager.create_release(work_id, "episode", "3", "Netflix", "2025-01-31")
+        manager.create_release(work_id, "episode", "4", "Netflix", "2025-02-01")
+
+        with manager.get_connection() as conn:
+            data = get_month_releases(conn, 2025, 1)
+
+        assert data["source"] == "releases"
+        assert data["total"] == 2
+        assert sorted(data["releases_by_date"]) == ["2025-01-01", "2025-01-31"]
+
+    def test_calendar_events_take_precedence(self, manager):
+        work_id = manager.create_work(title="同期作品", work_type="manga")
+        manager.create_release(work_id, "volume", "1", "BookWalker", "2025-01-10")
+        with manager.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO calendar_events (work_id, event_title, event_date) "
+                "VALUES (?, '同期作品 第1巻', '2025-01-10')",
+                (work_id,),
+            )
+
+        with manager.get_connection() as conn:
+            data = get_month_releases(conn, 2025, 1)
+
+        assert data["source"] == "calendar_events"
+        assert data["releases_by_date"]["2025-01-10"][0]["title"] == "同期作品 第1巻"
+
+    def test_cache_reused_until_data_changes(self, manager):
+        work_id = manager.create_work(title="キャッシュ作品", work_type="anime")
+        manager.create_release(work_id, "episode", "1", "Netflix", "2025-01-05")
+
+        with patch.object(
+            calendar_data, "load_month_releases", wraps=calendar_data.load_month_releases
+        ) as load:
+            with manager.get_connection() as conn:
+                first = get_month_releases(conn, 2025, 1)
+                assert get_month_releases(conn, 2025, 1) is first
+            assert load.call_count == 1
+
+            # 別の接続（収集処理）からの書き込みでキャッシュが無効になる
+            manager.create_release(work_id, "episode", "2", "Netflix", "2025-01-12")
+            with manager.get_connection() as conn:
+                refreshed = get_month_releases(conn, 2025, 1)
+
+        assert load.call_count == 2
+        assert refreshed["total"] == 2
@@ -0,0 +1,106 @@
+"""
+Tests for bulk duplicate detection in modules/data_normalizer_enhanced.py
+"""
+
+import random
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("jellyfish")
+
+from modules.data_normalizer_enhanced import (
+    EnhancedDataMerger,
+    EnhancedDuplicateDetector,
+    MatchAlgorithm,
+)
+from modules.models import Work, WorkType
+
+
+def _random_works(seed, count=40):
+    rng = random.Random(seed)
+    alphabet = list("abcde あいう進撃巨人")
+    bases = ["".join(rng.choices(alphabet, k=rng.randint(1, 12))) for _ in range(8)]
+
+    def mutate(text):
+        chars = list(text)
+        for _ in range(rng.randint(0, 3)):
+            position = rng.randrange(len(chars) + 1)
+            if position < len(chars) and rng.random() < 0.5:
+                chars[position] = rng.choice(alphabet)
+            else:
+                chars.insert(position, rng.choice(alphabet))
+        return "".join(chars).strip() or "x"
+
+    return [
+        Work(
+            title=mutate(rng.choice(bases)),
+            work_type=rng.choice([WorkType.ANIME, WorkType.MANGA]),
+            id=i + 1,
+            title_en=mutate(rng.choice(bases)) if rng.random() < 0.3 else None,
+            official_url=rng.choice([None, "https://a.example", "https://b.example"]),
+            metadata=rng.choice([{}, {"status": "ongoing"}, {"status": "finished"}]),
+        )
+        for i in range(count)
+    ]
+
+
+class TestBulkDuplicateDetection:
+    """Bulk mode must return exactly what the all-pairs scan returns."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.8, 0.85, 0.95])
+    @pytest.mark.parametrize("algorithm", list(MatchAlgorithm))
+    def test_matches_all_pairs_scan(self, threshold, algorithm):
+        detector = EnhancedDuplicateDetector(fuzzy_threshold=threshold)
+
+        for seed in range(5):
+            works = _random_works(seed)
+            expected = detector.find_duplicates_in_list(works, algorithm, bulk=False)
+
+            assert detector.find_duplicates_in_list(works, algorithm) == expected
+
+    def test_titles_are_normalized_once_per_work(self):
+        detector = EnhancedDuplicateDetector()
+        works = _random_works(0)
+
+        with patch.object(
+            detector.title_normalizer,
+            "normalize_title",
+            wraps=detector.title_normalizer.normalize_title,
+        ) as normalize:
+            detector.find_duplicates_in_list(works)
+
+        titled_fields = sum(
+            1 for work in works for title in (work.title, work.title_en, work.title_kana) if title
+        )
+        assert normalize.call_count == titled_fields
+
+    def test_process_pool_scoring(self):
+        detector = EnhancedDuplicateDetector()
+        detector.PROCESS_POOL_MIN_PAIRS = 1
+        works = [
+            Work(title="鬼滅の刃", work_type=WorkType.ANIME, id=1),
+            Work(title="鬼滅の刃", work_type=WorkType.ANIME, id=2),
+            Work(title="呪術廻戦", work_type=WorkType.ANIME, id=3),
+            Work(title="呪術廻戦", work_type=WorkType.ANIME, id=4),
+        ]
+
+        duplicates = detector.find_duplicates_in_list(works, processes=2)
+
+        assert [(dup.work1_id, dup.work2_id) for dup in duplicates] == [(1, 2), (3, 4)]
+
+    def test_deduplicate_works_uses_bulk_mode(self):
+        detector = EnhancedDuplicateDetector()
+        works = [
+            Work(title="鬼滅の刃", work_type=WorkType.ANIME, id=1),
+            Work(title="呪術廻戦", work_type=WorkType.ANIME, id=2),
+        ]
+
+        with patch.object(detector, "detect_duplicate") as detect:
+            EnhancedDataMerger().deduplicate_works(works, detector)
+
+        detect.assert_not_called()
@@ -8,11 +8,23 @@ import os
 import sys
 from datetime import datetime, date
 from pathlib import Path
+from unittest.mock import patch
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from modules.db import DatabaseManager
+from modules.db import (
+    ConnectionPool,
+    DatabaseManager,
+    SnapshotReader,
+    build_title_search,
+    close_request_connections,
+    configure_reader,
+    get_reader_connection,
+    get_request_connection,
+    read_data_version,
+    read_stats_counters,
+)
 
 
 @pytest.fixture
@@ -246,6 +258,393 @@ class TestReleaseOperations:
         assert result[0] == 1
 
 
+class TestBulkUpsert:
+    """一括登録（bulk_upsert_works_and_releases）のテスト"""
+
+    def test_bulk_upsert_creates_works_and_releases(self, db_manager):
+        """作品とリリースを一括作成し、新規リリースIDを返す"""
+        existing_id = db_manager.create_work(title="既存作品", work_type="anime")
+        items = [
+            {"title": "既存作品", "type": "anime", "number": "1", "release_date": "2025-12-15"},
+            {"title": "新規マンガ", "type": "manga", "number": 3, "platform": "BookWalker"},
+            {"title": "新規マンガ", "type": "manga", "number": 4, "platform": "BookWalker"},
+        ]
+
+        created = db_manager.bulk_upsert_works_and_releases(items)
+
+        assert [entry["index"] for entry in created] == [0, 1, 2]
+        assert created[0]["work_id"] == existing_id
+        assert created[1]["work_id"] == created[2]["work_id"]
+
+        conn = sqlite3.connect(db_manager.db_path)
+        release_types = [
+            row[0]
+            for row in conn.execute("SELECT release_type FROM releases ORDER BY id").fetchall()
+        ]
+        work_count = conn.execute("SELECT COUNT(*) FROM works").fetchone()[0]
+        conn.close()
+
+        assert release_types == ["episode", "volume", "volume"]
+        assert work_count == 2
+
+    def test_bulk_upsert_skips_duplicates(self, db_manager):
+        """既存・バッチ内重複のリリースは新規として返さない"""
+        item = {
+            "title": "重複一括テスト",
+            "type": "anime",
+            "number": "1",
+            "platform": "Netflix",
+            "release_date": "2025-12-15",
+        }
+        first = db_manager.bulk_upsert_works_and_releases([item])
+        second = db_manager.bulk_upsert_works_and_releases([item, dict(item)])
+
+        assert len(first) == 1
+        assert second == []
+
+    def test_bulk_upsert_ignores_invalid_items(self, db_manager):
+        """不正な作品タイプ・空タイトルはスキップ"""
+        items = [
+            {"title": "", "type": "anime"},
+            {"title": "タイプ不明", "type": "unknown"},
+            {"title": "有効", "type": "anime", "number": "1"},
+        ]
+
+        created = db_manager.bulk_upsert_works_and_releases(items)
+
+        assert [entry["index"] for entry in created] == [2]
+
+    def test_bulk_upsert_empty(self, db_manager):
+        """空リストでは何もしない"""
+        assert db_manager.bulk_upsert_works_and_releases([]) == []
+
+
+class TestWorkIdCache:
+    """作品IDキャッシュのテスト"""
+
+    def test_get_or_create_work_uses_cache_after_warm(self, db_manager):
+        """ウォーム後は SELECT を発行せずに作品IDを返す"""
+        work_id = db_manager.create_work(title="キャッシュ作品", work_type="anime")
+        assert db_manager.warm_work_cache() == 1
+
+        with patch.object(db_manager, "get_work_by_title") as get_work:
+            assert db_manager.get_or_create_work("キャッシュ作品", "anime") == work_id
+        get_work.assert_not_called()
+
+        stats = db_manager.get_performance_stats()["work_cache"]
+        assert stats["hits"] == 1
+        assert stats["warmed"] is True
+
+    def test_cache_state_does_not_change_resolution(self, test_db_path, db_manager):
+        """表記揺れの解決はキャッシュの状態（コールド・ウォーム）に左右されない"""
+        existing_id = db_manager.create_work(title="Ｆｏｏ Bar", work_type="anime")
+
+        cold = DatabaseManager(db_path=test_db_path)
+        warm = DatabaseManager(db_path=test_db_path)
+        warm.warm_work_cache()
+
+        variant_id = cold.get_or_create_work("foo bar", "anime")
+        assert variant_id != existing_id
+        assert warm.get_or_create_work("foo bar", "anime") == variant_id
+        assert warm.get_or_create_work("Ｆｏｏ Bar", "anime") == existing_id
+
+        created = warm.bulk_upsert_works_and_releases(
+            [
+                {"title": "foo bar", "type": "anime", "number": "1"},
+                {"title": "FOO BAR", "type": "anime", "number": "1"},
+            ]
+        )
+        assert created[0]["work_id"] == variant_id
+        assert created[1]["work_id"] not in (existing_id, variant_id)
+
+        # 未知のタイトルはミス1回として数える
+        misses = cold.get_performance_stats()["work_cache"]["misses"]
+        cold.get_or_create_work("unknown title", "anime")
+        assert cold.get_performance_stats()["work_cache"]["misses"] == misses + 1
+
+        cold.close_connections()
+        warm.close_connections()
+
+    def test_create_work_writes_through(self, db_manager):
+        """create_work の結果がキャッシュに書き込まれる"""
+        work_id = db_manager.get_or_create_work("ライトスルー", "manga")
+
+        with patch.object(db_manager, "get_work_by_title") as get_work:
+            assert db_manager.get_or_create_work("ライトスルー", "manga") == work_id
+        get_work.assert_not_called()
+
+    def test_cache_is_keyed_by_type(self, db_manager):
+        """同名でも種別が違えば別作品"""
+        anime_id = db_manager.get_or_create_work("同名作品", "anime")
+        manga_id = db_manager.get_or_create_work("同名作品", "manga")
+
+        assert anime_id != manga_id
+
+    def test_cache_is_bounded(self, test_db_path):
+        """最大件数を超えると古いエントリから追い出される"""
+        manager = DatabaseManager(db_path=test_db_path, work_cache_size=2)
+        for i in range(3):
+            manager.create_work(title=f"作品{i}", work_type="anime")
+
+        stats = manager.get_performance_stats()["work_cache"]
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        manager.close_connections()
+
+    def test_invalidate_work_cache(self, db_manager):
+        """外部で削除された作品をキャッシュから除去できる"""
+        work_id = db_manager.create_work(title="削除予定", work_type="anime")
+        with db_manager.get_connection() as conn:
+            conn.execute("DELETE FROM works WHERE id = ?", (work_id,))
+        db_manager.invalidate_work_cache(work_id)
+
+        assert db_manager.get_or_create_work("削除予定", "anime") != work_id
+
+
+class TestTitleSearch:
+    """作品タイトル全文検索（works_fts）のテスト"""
+
+    @pytest.fixture
+    def catalog(self, db_manager):
+        ids = {
+            "shingeki": db_manager.create_work(
+                title="進撃の巨人", work_type="anime", title_kana="しんげきのきょじん",
+                title_en="Attack on Titan",
+            ),
+            "kyojin": db_manager.create_work(title="巨人の星", work_type="anime"),
+            "onepiece": db_manager.create_work(
+                title="ワンピース", work_type="manga", title_en="One Piece"
+            ),
+        }
+        return ids
+
+    def test_index_created_and_backfilled(self, test_db_path):
+        """既存データベースでも初期化時にインデックスが構築される"""
+        conn = sqlite3.connect(test_db_path)
+        conn.execute(
+            "CREATE TABLE works (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+            "title_kana TEXT, title_en TEXT, type TEXT, official_url TEXT, "
+            "created_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("INSERT INTO works (title, type) VALUES ('既存の作品タイトル', 'anime')")
+        conn.commit()
+        conn.close()
+
+        manager = DatabaseManager(db_path=test_db_path)
+        results = manager.search_works("作品タイ")
+        manager.close_connections()
+
+        assert [work["title"] for work in results] == ["既存の作品タイトル"]
+
+    def test_search_all_title_columns(self, db_manager, catalog):
+        """title / title_kana / title_en のいずれでも部分一致する"""
+        assert [w["id"] for w in db_manager.search_works("きょじん")] == [catalog["shingeki"]]
+        assert [w["id"] for w in db_manager.search_works("titan")] == [catalog["shingeki"]]
+        assert [w["id"] for w in db_manager.search_works("one piece")] == [catalog["onepiece"]]
+        assert db_manager.search_works("存在しない作品") == []
+
+    def test_short_query_falls_back_to_like(self, db_manager, catalog):
+        """トライグラム未満の短い検索語は LIKE で検索する"""
+        results = db_manager.search_works("巨人")
+
+        assert {w["id"] for w in results} == {catalog["shingeki"], catalog["kyojin"]}
+        assert [w["id"] for w in db_manager.search_works("巨人", work_type="manga")] == []
+
+    def test_triggers_follow_updates_and_deletes(self, db_manager, catalog):
+        """works の更新・削除がインデックスに反映される"""
+        with db_manager.get_connection() as conn:
+            conn.execute(
+                "UPDATE works SET title_en = 'Pirate King' WHERE id = ?", (catalog["onepiece"],)
+            )
+            conn.execute("DELETE FROM works WHERE id = ?", (catalog["shingeki"],))
+            conn.commit()
+
+        assert db_manager.search_works("one piece") == []
+        assert [w["id"] for w in db_manager.search_works("pirate")] == [catalog["onepiece"]]
+        assert db_manager.search_works("titan") == []
+
+    def test_columns_apply_to_fts_and_like(self, db_manager, catalog):
+        """columns の指定は FTS と LIKE のどちらの検索にも効く"""
+
+        def search_ids(query):
+            with db_manager.get_connection() as conn:
+                search = build_title_search(conn, query, columns=("title", "title_kana"))
+                sql = f"SELECT w.id FROM works w{search['join']} WHERE 1=1{search['where']}"
+                return [row[0] for row in conn.execute(sql, search["params"]).fetchall()]
+
+        assert search_ids("きょじん") == [catalog["shingeki"]]
+        assert search_ids("titan") == []
+        assert search_ids("ti") == []
+
+    def test_fts_query_is_quoted(self, db_manager, catalog):
+        """FTS5 の構文文字を含む検索語でもエラーにならない"""
+        assert db_manager.search_works('"on" OR ti*') == []
+
+    def test_build_title_search_without_index(self, tmp_path):
+        """インデックスの無いデータベースでは LIKE 句を返す"""
+        conn = sqlite3.connect(str(tmp_path / "plain.sqlite3"))
+
+        search = build_title_search(conn, "進撃の巨人", columns=("title",))
+        conn.close()
+
+        assert search == {
+            "join": "",
+            "where": " AND (w.title LIKE ?)",
+            "params": ["%進撃の巨人%"],
+            "rank": None,
+        }
+
+
+class TestConnectionPool:
+    """Web 層向け接続プールのテスト"""
+
+    def test_connections_are_tuned_and_reused(self, test_db_path):
+        pool = ConnectionPool(test_db_path)
+
+        conn = pool.acquire()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        pool.release(conn)
+
+        assert pool.acquire() is conn
+        assert pool.get_stats()["hits"] == 1
+
+    def test_release_rolls_back_uncommitted_work(self, test_db_path):
+        pool = ConnectionPool(test_db_path)
+        conn = pool.acquire()
+        conn.execute("CREATE TABLE items (id INTEGER)")
+        conn.commit()
+
+        conn.execute("INSERT INTO items VALUES (1)")
+        conn.row_factory = None
+        pool.release(conn)
+
+        conn = pool.acquire()
+        assert conn.row_factory is sqlite3.Row
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    def test_replaced_database_file_is_not_reused(self, test_db_path):
+        pool = ConnectionPool(test_db_path)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        os.remove(test_db_path)
+        sqlite3.connect(test_db_path).close()
+
+        assert pool.acquire() is not conn
+        assert pool.get_stats()["discarded"] == 1
+
+    def test_request_scoped_connection(self, test_db_path):
+        flask = pytest.importorskip("flask")
+        app = flask.Flask(__name__)
+        app.teardown_appcontext(close_request_connections)
+
+        with app.app_context():
+            conn = get_request_connection(test_db_path)
+            conn.close()  # リクエスト中は何もしない
+            assert get_request_connection(test_db_path) is conn
+            assert conn.execute("SELECT 1").fetchone()[0] == 1
+            raw = conn._conn
+
+        # アプリコンテキスト終了時にプールへ返却される
+        assert conn._conn is None
+        with app.app_context():
+            assert get_request_connection(test_db_path)._conn is raw
+
+    def test_connection_outside_request_returns_to_pool(self, test_db_path):
+        conn = get_request_connection(test_db_path)
+        raw = conn._conn
+        conn.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert get_request_connection(test_db_path)._conn is raw
+
+
+class TestReaderConnections:
+    """読み取り専用接続・スナップショットのテスト"""
+
+    @pytest.fixture(autouse=True)
+    def reset_reader(self):
+        yield
+        configure_reader("shared")
+
+    def test_read_only_pool_rejects_writes(self, db_manager, test_db_path):
+        db_manager.create_work(title="読み取りテスト", work_type="anime")
+        pool = ConnectionPool(test_db_path, read_only=True)
+
+        conn = pool.acquire()
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM works").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM works")
+        pool.release(conn)
+
+        # 書き込み側のコミットはそのまま見える
+        db_manager.create_work(title="読み取りテスト2", work_type="anime")
+        conn = pool.acquire()
+        assert conn.execute("SELECT COUNT(*) FROM works").fetchone()[0] == 2
+        pool.release(conn)
+
+    def test_shared_mode_uses_request_connection(self, db_manager, test_db_path):
+        flask = pytest.importorskip("flask")
+        app = flask.Flask(__name__)
+        app.teardown_appcontext(close_request_connections)
+
+        with app.app_context():
+            assert get_reader_connection(test_db_path) is get_request_connection(test_db_path)
+
+    def test_readonly_mode_is_request_scoped(self, db_manager, test_db_path):
+        flask = pytest.importorskip("flask")
+        app = flask.Flask(__name__)
+        app.teardown_appcontext(close_request_connections)
+        configure_reader("readonly")
+
+        with app.app_context():
+            conn = get_reader_connection(test_db_path)
+            assert get_reader_connection(test_db_path) is conn
+            assert conn is not get_request_connection(test_db_path)
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM works")
+        assert conn._conn is None
+
+    def test_snapshot_refreshes_after_interval(self, db_manager, test_db_path, tmp_path):
+        snapshot = SnapshotReader(test_db_path, str(tmp_path / "snap.sqlite3"), refresh_seconds=60)
+        db_manager.create_work(title="スナップショット1", work_type="anime")
+
+        path = snapshot.ensure_fresh()
+        assert path == snapshot.snapshot_path
+        assert not os.path.exists(f"{path}-wal")
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM works").fetchone()[0] == 1
+        conn.close()
+
+        # 更新間隔内は書き込みがあってもコピーし直さない
+        db_manager.create_work(title="スナップショット2", work_type="anime")
+        snapshot.ensure_fresh()
+        assert snapshot.refreshes == 1
+
+        snapshot.refreshed_at -= 60
+        snapshot.ensure_fresh()
+        assert snapshot.refreshes == 2
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM works").fetchone()[0] == 2
+        assert read_data_version(conn) == read_data_version(sqlite3.connect(test_db_path))
+        conn.close()
+
+    def test_snapshot_mode_falls_back_to_live_file(self, tmp_path):
+        missing = str(tmp_path / "missing.sqlite3")
+        snapshot = SnapshotReader(missing)
+
+        assert snapshot.ensure_fresh() == missing
+        assert snapshot.failures == 1
+        assert not os.path.exists(snapshot.snapshot_path)
+
+    def test_configure_reader_rejects_unknown_mode(self):
+        with pytest.raises(ValueError):
+            configure_reader("replica")
+
+
 class TestWorkStats:
     """統計情報のテスト"""
 
@@ -265,6 +664,93 @@ class TestWorkStats:
             assert stats['manga_works'] >= 1
 
 
+class TestStatsCounters:
+    """ダッシュボード集計カウンタのテスト"""
+
+    @staticmethod
+    def _counted(manager):
+        with manager.get_connection() as conn:
+            return {
+                "anime_works": conn.execute(
+                    "SELECT COUNT(*) FROM works WHERE type = 'anime'"
+                ).fetchone()[0],
+                "manga_works": conn.execute(
+                    "SELECT COUNT(*) FROM works WHERE type = 'manga'"
+                ).fetchone()[0],
+                "total_works": conn.execute("SELECT COUNT(*) FROM works").fetchone()[0],
+                "total_releases": conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0],
+                "unnotified_releases": conn.execute(
+                    "SELECT COUNT(*) FROM releases WHERE notified = 0"
+                ).fetchone()[0],
+            }
+
+    def test_counters_follow_writes(self, db_manager):
+        """挿入・更新・削除（CASCADE含む）がカウンタに反映される"""
+        anime = db_manager.create_work(title="集計アニメ", work_type="anime")
+        manga = db_manager.create_work(title="集計マンガ", work_type="manga")
+        first = db_manager.create_release(anime, "episode", "1", "Netflix", "2025-01-01")
+        db_manager.create_release(anime, "episode", "2", "Netflix", "2025-01-08")
+        db_manager.create_release(manga, "volume", "1", "BookWalker", "2025-01-10")
+        # 重複は INSERT OR IGNORE で無視されカウントされない
+        db_manager.create_release(anime, "episode", "2", "Netflix", "2025-01-08")
+        assert db_manager.get_work_stats() == self._counted(db_manager)
+
+        db_manager.mark_release_notified(first)
+        with db_manager.get_connection() as conn:
+            conn.execute("UPDATE works SET type = 'manga' WHERE id = ?", (anime,))
+            conn.execute("DELETE FROM works WHERE id = ?", (manga,))
+
+        stats = db_manager.get_work_stats()
+        assert stats == self._counted(db_manager)
+        assert stats == {
+            "anime_works": 0,
+            "manga_works": 1,
+            "total_works": 1,
+            "total_releases": 2,
+            "unnotified_releases": 1,
+        }
+
+    def test_rebuild_fixes_drift(self, db_manager):
+        """rebuild_stats_counters でずれたカウンタを再集計できる"""
+        db_manager.create_work(title="再集計", work_type="anime")
+        with db_manager.get_connection() as conn:
+            conn.execute("UPDATE stats_counters SET value = 999")
+
+        counts = db_manager.rebuild_stats_counters()
+
+        assert counts["works_total"] == 1
+        assert db_manager.get_work_stats() == self._counted(db_manager)
+
+    def test_counters_backfilled_on_existing_database(self, test_db_path):
+        """カウンタ導入前のデータベースは初期化時に集計される"""
+        manager = DatabaseManager(db_path=test_db_path)
+        manager.create_work(title="既存作品", work_type="manga")
+        with manager.get_connection() as conn:
+            conn.execute("DROP TABLE stats_counters")
+        manager.close_connections()
+
+        manager = DatabaseManager(db_path=test_db_path)
+        stats = manager.get_work_stats()
+        manager.close_connections()
+
+        assert stats["manga_works"] == 1
+        assert stats["total_works"] == 1
+
+    def test_read_counters_without_table(self, tmp_path):
+        """カウンタ表が無いデータベースでは COUNT にフォールバックする"""
+        conn = sqlite3.connect(str(tmp_path / "plain.sqlite3"))
+        conn.execute("CREATE TABLE works (id INTEGER PRIMARY KEY, type TEXT)")
+        conn.execute("CREATE TABLE releases (id INTEGER PRIMARY KEY, notified INTEGER)")
+        conn.execute("INSERT INTO works (type) VALUES ('anime')")
+        conn.execute("INSERT INTO releases (notified) VALUES (0)")
+
+        counts = read_stats_counters(conn)
+        conn.close()
+
+        assert counts["works_anime"] == 1
+        assert counts["releases_unnotified"] == 1
+
+
 class TestDatabaseConnection:
     """データベース接続のテスト"""
 
@@ -368,6 +854,33 @@ class TestOptimization:
         assert result is None or result is True or isinstance(result, dict)
 
 
+class TestWalCheckpoint:
+    """WAL チェックポイントのテスト"""
+
+    def test_small_wal_gets_passive_checkpoint(self, db_manager):
+        db_manager.create_work(title="チェックポイント", work_type="anime")
+
+        result = db_manager.maybe_checkpoint_wal()
+
+        assert result["mode"] == "PASSIVE"
+        assert result["success"] is True
+        assert result["wal_bytes"] > 0
+
+    def test_large_wal_is_truncated(self, db_manager, test_db_path):
+        db_manager.create_work(title="チェックポイント", work_type="anime")
+
+        result = db_manager.maybe_checkpoint_wal(truncate_threshold_bytes=1)
+
+        assert result["mode"] == "TRUNCATE"
+        assert result["success"] is True
+        assert os.path.getsize(f"{test_db_path}-wal") == 0
+        assert db_manager.maybe_checkpoint_wal()["skipped"] is True
+
+    def test_invalid_mode_is_rejected(self, db_manager):
+        with pytest.raises(ValueError):
+            db_manager.execute_wal_checkpoint("NOW")
+
+
 class TestCleanup:
     """クリーンアップ機能のテスト"""
 
@@ -0,0 +1,80 @@
+"""
+プロセス内イベントバスのテスト
+modules/event_bus.py を検証
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.event_bus import EventBus, format_sse
+
+
+class TestEventBus:
+    def test_fan_out_to_all_subscribers(self):
+        bus = EventBus()
+        first = bus.subscribe()
+        second = bus.subscribe()
+
+        event = bus.publish("collection.progress", {"progress": 0.5})
+
+        assert first.get(timeout=1) == event
+        assert second.get(timeout=1) == event
+        assert first.get(timeout=0.01) is None
+
+    def test_unsubscribe(self):
+        bus = EventBus()
+        with bus.subscribe() as subscription:
+            assert bus.get_stats()["subscribers"] == 1
+
+        bus.publish("collection.progress")
+
+        assert bus.get_stats()["subscribers"] == 0
+        assert subscription.get(timeout=0.01) is None
+
+    def test_slow_subscriber_drops_oldest(self):
+        bus = EventBus()
+        subscription = bus.subscribe(max_queue=2)
+
+        for i in range(5):
+            bus.publish("collection.progress", {"step": i})
+
+        assert [subscription.get(timeout=1)["data"]["step"] for _ in range(2)] == [3, 4]
+        assert subscription.dropped == 3
+
+    def test_replay_after_last_event_id(self):
+        bus = EventBus(history_size=3)
+        events = [bus.publish("collection.progress", {"step": i}) for i in range(5)]
+
+        subscription = bus.subscribe(last_event_id=events[2]["id"])
+
+        assert [subscription.get(timeout=1)["data"]["step"] for _ in range(2)] == [3, 4]
+
+    def test_publish_from_threads(self):
+        bus = EventBus()
+        subscription = bus.subscribe(max_queue=1000)
+        threads = [
+            threading.Thread(target=lambda: [bus.publish("tick") for _ in range(50)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [subscription.get(timeout=1)["id"] for _ in range(200)]
+        assert sorted(ids) == list(range(1, 201))
+
+
+def test_format_sse():
+    event = {"id": 7, "type": "releases.saved", "timestamp": 1.5, "data": {"new_releases": 2}}
+
+    message = format_sse(event)
+
+    lines = message.split("\n")
+    assert lines[:2] == ["id: 7", "event: releases.saved"]
+    assert json.loads(lines[2][len("data: ") :]) == {"timestamp": 1.5, "new_releases": 2}
+    assert message.endswith("\n\n")
@@ -0,0 +1,150 @@
+"""
+modules/feed_state.py のテスト
+RSS フィードの検証子（ETag / Last-Modified）・健全性の保存と条件付きGETヘッダー
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.feed_state import FeedStateStore, SeenEntryIndex, entry_fingerprint
+
+FEED_URL = "https://example.com/feed.rss"
+
+
+class TestFeedStateStore:
+    def test_memory_only_store(self):
+        store = FeedStateStore()
+
+        assert store.conditional_headers(FEED_URL) == {}
+        assert store.save_validators(FEED_URL, '"a"', "Mon, 01 Dec 2025 00:00:00 GMT") is True
+        assert store.conditional_headers(FEED_URL) == {
+            "If-None-Match": '"a"',
+            "If-Modified-Since": "Mon, 01 Dec 2025 00:00:00 GMT",
+        }
+
+    def test_persisted_and_unchanged_values_not_rewritten(self, tmp_path):
+        db_path = str(tmp_path / "state.sqlite3")
+        store = FeedStateStore(db_path)
+
+        assert store.save_validators(FEED_URL, '"a"', None) is True
+        assert store.save_validators(FEED_URL, '"a"', None) is False
+
+        reloaded = FeedStateStore(db_path)
+        assert reloaded.get_validators(FEED_URL) == {"etag": '"a"', "last_modified": None}
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM rss_feed_state").fetchone()[0] == 1
+        conn.close()
+
+    def test_not_modified_keeps_omitted_validators(self):
+        store = FeedStateStore()
+        store.save_validators(FEED_URL, '"a"', "Mon, 01 Dec 2025 00:00:00 GMT")
+
+        store.update_from_response(FEED_URL, {"ETag": '"b"'}, not_modified=True)
+        assert store.get_validators(FEED_URL) == {
+            "etag": '"b"',
+            "last_modified": "Mon, 01 Dec 2025 00:00:00 GMT",
+        }
+
+        # 200 で検証子が返らなければ消す（次回は無条件で取得）
+        store.update_from_response(FEED_URL, {})
+        assert store.conditional_headers(FEED_URL) == {}
+
+    def test_non_string_headers_are_ignored(self):
+        store = FeedStateStore()
+
+        store.update_from_response(FEED_URL, Mock())
+
+        assert store.conditional_headers(FEED_URL) == {}
+
+    def test_health_persisted_alongside_validators(self, tmp_path):
+        db_path = str(tmp_path / "state.sqlite3")
+        store = FeedStateStore(db_path)
+        store.save_validators(FEED_URL, '"a"', None)
+
+        store.save_health(
+            FEED_URL,
+            {"success_count": 3, "consecutive_failures": 1, "next_poll_at": "2025-12-01T12:00:00"},
+        )
+
+        reloaded = FeedStateStore(db_path)
+        health = reloaded.get_health(FEED_URL)
+        assert health["success_count"] == 3
+        assert health["consecutive_failures"] == 1
+        assert health["next_poll_at"] == "2025-12-01T12:00:00"
+        assert reloaded.get_validators(FEED_URL)["etag"] == '"a"'
+        assert reloaded.get_health("https://example.com/other.rss") is None
+
+    def test_adds_health_columns_to_existing_table(self, tmp_path):
+        db_path = str(tmp_path / "state.sqlite3")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE rss_feed_state (feed_url TEXT PRIMARY KEY, etag TEXT,"
+            " last_modified TEXT, updated_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("INSERT INTO rss_feed_state (feed_url, etag) VALUES (?, ?)", (FEED_URL, '"a"'))
+        conn.commit()
+        conn.close()
+
+        store = FeedStateStore(db_path)
+
+        assert store.get_validators(FEED_URL)["etag"] == '"a"'
+        assert store.get_health(FEED_URL)["success_count"] == 0
+        store.save_health(FEED_URL, {"failure_count": 2})
+        assert FeedStateStore(db_path).get_health(FEED_URL)["failure_count"] == 2
+
+
+class TestSeenEntryIndex:
+    ENTRIES = [
+        {"id": "guid-1", "title": "作品A 第1巻", "link": "https://example.com/a"},
+        {"link": "https://example.com/b", "title": "作品B 第2巻"},
+        {"title": "作品C 第3巻", "summary": "リンクなし"},
+    ]
+
+    def test_filters_entries_only_after_mark_seen(self, tmp_path):
+        db_path = str(tmp_path / "state.sqlite3")
+        index = SeenEntryIndex(db_path)
+
+        entries, marks = index.filter_new(FEED_URL, self.ENTRIES)
+        assert len(entries) == 3
+        # 記録するまでは次の呼び出しでも新規扱い
+        assert len(index.filter_new(FEED_URL, self.ENTRIES)[0]) == 3
+
+        assert index.mark_seen(marks) == 3
+        assert index.filter_new(FEED_URL, self.ENTRIES) == ([], [])
+        # 別のフィードのエントリーとは区別する
+        assert len(index.filter_new("https://example.com/other.rss", self.ENTRIES)[0]) == 3
+
+        reloaded = SeenEntryIndex(db_path)
+        assert reloaded.filter_new(FEED_URL, self.ENTRIES) == ([], [])
+
+    def test_changed_content_is_new_again(self):
+        index = SeenEntryIndex()
+        index.mark_seen(index.filter_new(FEED_URL, self.ENTRIES)[1])
+
+        updated = dict(self.ENTRIES[0], title="作品A 第1巻（発売日変更）")
+        entries, marks = index.filter_new(FEED_URL, [updated, self.ENTRIES[1]])
+
+        assert entries == [updated]
+        assert marks[0][1] == "guid-1"
+
+    def test_fingerprint_key_fallbacks(self):
+        assert entry_fingerprint(self.ENTRIES[0])[0] == "guid-1"
+        assert entry_fingerprint(self.ENTRIES[1])[0] == "https://example.com/b"
+        key, content_hash = entry_fingerprint(self.ENTRIES[2])
+        assert key == f"sha1:{content_hash}"
+
+    def test_prune_removes_old_records(self, tmp_path):
+        db_path = str(tmp_path / "state.sqlite3")
+        index = SeenEntryIndex(db_path)
+        index.mark_seen(index.filter_new(FEED_URL, self.ENTRIES)[1])
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE rss_seen_entries SET seen_at = datetime('now', '-400 days')")
+        conn.commit()
+        conn.close()
+
+        assert index.prune() == 3
+        assert len(index.filter_new(FEED_URL, self.ENTRIES)[0]) == 3
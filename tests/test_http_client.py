@@ -0,0 +1,235 @@
+"""
+modules/http_client.py のテスト
+ローカルの aiohttp サーバーに対して接続の再利用・レート制限・再試行を検証
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules import http_client
+from modules.anime_kitsu import KitsuAPIClient, KitsuAPIError
+from modules.http_client import (
+    RetryPolicy,
+    SharedHttpClient,
+    TokenBucket,
+    configure_rate_limit,
+    get_http_stats,
+    get_rate_limiter,
+    reset_http_stats,
+)
+
+
+@asynccontextmanager
+async def serve(routes):
+    """routes（パス -> ハンドラー）を返すローカルサーバーを起動し、ベースURLを返す"""
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    reset_http_stats()
+    yield
+    with http_client._rate_limiters_lock:
+        http_client._rate_limiters.pop("127.0.0.1", None)
+
+
+async def _ok(request):
+    return web.json_response({"path": request.path})
+
+
+class TestSharedHttpClient:
+    def test_connections_are_reused_within_scope(self):
+        client = SharedHttpClient()
+
+        async def run(base):
+            async with client:
+                responses = await asyncio.gather(*(client.get(f"{base}/ok") for _ in range(3)))
+                for _ in range(3):
+                    responses.append(await client.get(f"{base}/ok"))
+                assert client.open_sessions() == 1
+            return responses
+
+        async def main():
+            async with serve({"/ok": _ok}) as base:
+                return await run(base)
+
+        responses = asyncio.run(main())
+
+        assert [response.json() for response in responses] == [{"path": "/ok"}] * 6
+        stats = get_http_stats()
+        assert stats["hosts"]["127.0.0.1"]["requests"] == 6
+        assert stats["connections"]["created"] <= 3
+        assert stats["connections"]["reused"] >= 3
+        assert client.open_sessions() == 0
+
+    def test_nested_scopes_share_one_session(self):
+        client = SharedHttpClient()
+
+        async def main():
+            async with client:
+                outer = client.get_session()
+                async with client:
+                    assert client.get_session() is outer
+                assert not outer.closed
+            return outer
+
+        assert asyncio.run(main()).closed
+
+    def test_retries_retryable_status(self):
+        calls = []
+
+        async def flaky(request):
+            calls.append(time.monotonic())
+            if len(calls) < 3:
+                return web.Response(status=503, headers={"Retry-After": "0"})
+            return web.Response(text="done")
+
+        async def main():
+            async with serve({"/flaky": flaky}) as base:
+                return await SharedHttpClient().get(
+                    f"{base}/flaky", retry=RetryPolicy(max_retries=3)
+                )
+
+        response = asyncio.run(main())
+
+        assert response.status == 200
+        assert response.text() == "done"
+        assert len(calls) == 3
+        assert get_http_stats()["hosts"]["127.0.0.1"]["retries"] == 2
+
+    def test_gives_up_after_max_retries(self):
+        async def broken(request):
+            return web.Response(status=500)
+
+        async def missing(request):
+            return web.Response(status=404)
+
+        async def main():
+            async with serve({"/broken": broken, "/missing": missing}) as base:
+                client = SharedHttpClient()
+                policy = RetryPolicy(max_retries=1, backoff=0)
+                return (
+                    await client.get(f"{base}/broken", retry=policy),
+                    await client.get(f"{base}/missing", retry=policy),
+                )
+
+        broken_response, missing_response = asyncio.run(main())
+
+        assert broken_response.status == 500
+        assert missing_response.status == 404
+        assert get_http_stats()["hosts"]["127.0.0.1"]["statuses"] == {500: 2, 404: 1}
+
+    def test_rate_limit_spaces_requests(self):
+        async def main():
+            async with serve({"/ok": _ok}) as base:
+                configure_rate_limit(base, requests_per_minute=600)
+                client = SharedHttpClient()
+                start = time.monotonic()
+                async with client:
+                    await asyncio.gather(*(client.get(f"{base}/ok") for _ in range(3)))
+                return time.monotonic() - start
+
+        # 1分あたり600回 = 0.1秒間隔
+        assert asyncio.run(main()) >= 0.19
+        assert get_http_stats()["rate_limits"]["127.0.0.1"] == 600
+
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self):
+        bucket = TokenBucket(requests_per_minute=60, burst=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(1.0, abs=0.05)
+        assert waits[3] == pytest.approx(2.0, abs=0.05)
+
+    def test_defer_delays_next_request(self):
+        bucket = TokenBucket(requests_per_minute=60)
+
+        bucket.defer(5)
+
+        assert bucket.reserve() == pytest.approx(6.0, abs=0.05)
+
+    def test_same_settings_reuse_bucket(self):
+        first = configure_rate_limit("http://127.0.0.1/api", 30)
+
+        assert configure_rate_limit("127.0.0.1", 30) is first
+        assert configure_rate_limit("127.0.0.1", 60) is first
+        assert get_rate_limiter("http://127.0.0.1/other").requests_per_minute == 60
+
+    def test_reconfigure_keeps_retry_after_debt(self):
+        bucket = configure_rate_limit("127.0.0.1", 90, burst=10)
+        bucket.defer(30)
+
+        assert configure_rate_limit("127.0.0.1", 72, burst=5) is bucket
+        assert bucket.capacity == 5
+        assert bucket.reserve() == pytest.approx(30 + 1 / 1.2, abs=0.05)
+
+    def test_reconfigure_clamps_tokens_to_new_capacity(self):
+        bucket = TokenBucket(requests_per_minute=60, burst=10)
+
+        bucket.reconfigure(60, burst=2)
+
+        assert [bucket.reserve() for _ in range(3)][:2] == [0.0, 0.0]
+        assert bucket.tokens < 0
+
+
+class TestRetryPolicy:
+    def test_exponential_backoff_with_cap(self):
+        policy = RetryPolicy(backoff=2, max_backoff=10)
+
+        assert [policy.delay(attempt) for attempt in range(4)] == [2, 4, 8, 10]
+
+    def test_retry_after_header(self):
+        policy = RetryPolicy(max_backoff=60)
+
+        assert policy.delay(0, "7") == 7
+        assert policy.delay(0, "120") == 60
+        assert policy.delay(3, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert policy.delay(1, "soon") == 2
+
+
+class TestCollectorIntegration:
+    def test_kitsu_uses_shared_client(self):
+        async def anime(request):
+            return web.json_response(
+                {"data": [{"id": "1", "attributes": {"canonicalTitle": "テスト"}}]}
+            )
+
+        async def error(request):
+            return web.Response(status=400, text="bad request")
+
+        async def main():
+            async with serve({"/anime": anime, "/manga": error}) as base:
+                config = {"base_url": base, "rate_limit": {"requests_per_minute": 6000}}
+                async with KitsuAPIClient(config) as client:
+                    assert client.rate_limiter is get_rate_limiter(base)
+                    anime_list = await client.get_seasonal_anime("fall", 2025)
+                    with pytest.raises(KitsuAPIError):
+                        await client.get_manga_updates()
+                    return anime_list
+
+        anime_list = asyncio.run(main())
+
+        assert [item["title"] for item in anime_list] == ["テスト"]
+        assert get_http_stats()["hosts"]["127.0.0.1"]["requests"] == 2
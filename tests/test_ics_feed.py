@@ -0,0 +1,106 @@
+"""
+iCalendar フィード生成のテスト
+modules/ics_feed.py を検証
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.db import DatabaseManager
+from modules.ics_feed import (
+    FeedFilter,
+    escape_text,
+    fold_line,
+    iter_feed,
+    release_uid,
+    render_event,
+)
+
+RELEASE = {
+    "release_id": 42,
+    "title": "進撃の巨人",
+    "type": "anime",
+    "release_type": "episode",
+    "number": "5",
+    "platform": "Netflix, Inc.",
+    "release_date": "2025-01-31",
+    "source_url": "https://example.com/a;b",
+    "created_at": "2025-01-02 03:04:05",
+}
+
+
+def _unfold(text):
+    return text.replace("\r\n ", "")
+
+
+class TestFormatting:
+    def test_escape_text(self):
+        assert escape_text("a,b;c\\d\ne") == r"a\,b\;c\\d\ne"
+
+    @pytest.mark.parametrize("line", ["SUMMARY:" + "進撃の巨人" * 20, "X:" + "a" * 300, "SHORT:ok"])
+    def test_fold_line(self, line):
+        folded = fold_line(line)
+
+        assert all(len(part.encode("utf-8")) <= 75 for part in folded.split("\r\n"))
+        assert _unfold(folded) == line
+
+    def test_render_event(self):
+        event = _unfold(render_event(RELEASE))
+
+        assert "UID:release-42@mangaanime-info\r\n" in event
+        assert "DTSTAMP:20250102T030405Z\r\n" in event
+        assert "DTSTART;VALUE=DATE:20250131\r\n" in event
+        assert "DTEND;VALUE=DATE:20250201\r\n" in event
+        assert "LOCATION:Netflix\\, Inc.\r\n" in event
+        assert r"ソースURL: https://example.com/a\;b" in event
+
+    def test_uid_without_release_id_is_stable(self):
+        release = {key: value for key, value in RELEASE.items() if key != "release_id"}
+
+        uid = release_uid(release)
+
+        assert uid == release_uid(dict(release))
+        assert uid != release_uid({**release, "number": "6"})
+        assert uid.endswith("@mangaanime-info")
+
+
+class TestFeedFilter:
+    def test_from_args(self):
+        feed_filter = FeedFilter.from_args(
+            MultiDict([("type", "manga"), ("work_id", "3"), ("work_id", "1"), ("days_ahead", "7")])
+        )
+
+        assert feed_filter == FeedFilter(work_type="manga", work_ids=(1, 3), days_ahead=7)
+
+    @pytest.mark.parametrize(
+        "args", [{"type": "drama"}, {"work_id": "x"}, {"days_back": "-1"}, {"days_ahead": "9999"}]
+    )
+    def test_invalid_args(self, args):
+        with pytest.raises(ValueError):
+            FeedFilter.from_args(MultiDict(args))
+
+    def test_iter_feed_applies_filter(self, tmp_path):
+        from datetime import date, timedelta
+
+        manager = DatabaseManager(db_path=str(tmp_path / "feed.sqlite3"))
+        soon = (date.today() + timedelta(days=3)).isoformat()
+        later = (date.today() + timedelta(days=200)).isoformat()
+        anime = manager.create_work(title="フィード作品", work_type="anime")
+        manga = manager.create_work(title="フィード漫画", work_type="manga")
+        near = manager.create_release(anime, "episode", "1", "Netflix", soon)
+        manager.create_release(anime, "episode", "2", "Netflix", later)
+        manager.create_release(manga, "volume", "1", "BookWalker", soon)
+
+        with manager.get_connection() as conn:
+            feed = "".join(iter_feed(conn, FeedFilter(work_type="anime")))
+        manager.close_connections()
+
+        assert feed.startswith("BEGIN:VCALENDAR\r\n")
+        assert feed.endswith("END:VCALENDAR\r\n")
+        assert feed.count("BEGIN:VEVENT") == 1
+        assert f"UID:release-{near}@mangaanime-info" in feed
@@ -0,0 +1,218 @@
+"""
+NGキーワード照合モジュールのテスト
+modules/keyword_matcher.py と ContentFilter への組み込みを検証
+"""
+
+import difflib
+import random
+import re
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.filter_logic import ContentFilter
+from modules.keyword_matcher import FuzzyKeywordIndex, KeywordAutomaton
+
+KEYWORDS = ["エロ", "r18", "r-18", "18+", "成人向け", "bl", "百合", "adult", "#nsfw", "a_b", "i̇"]
+
+TEXTS = [
+    "",
+    "普通のファンタジーアニメ",
+    "エロ漫画",
+    "これは エロ です",
+    "「エロ」作品",
+    "R18 指定",
+    "r18作品",
+    "R-18版",
+    "nr-18",
+    "18+ only",
+    "18+x",
+    "成人向け作品",
+    "BL漫画",
+    "BL 作品",
+    "blue lock",
+    "百合 漫画",
+    "Adult Only",
+    "adults",
+    "tag #nsfw here",
+    "tag#nsfw",
+    "a_b c",
+    "a_bc",
+    "İ test",
+]
+
+
+def _regex_matches(keywords, text):
+    """従来実装（キーワードごとの \\b 正規表現）による照合結果"""
+    matched = []
+    for keyword in keywords:
+        pattern = re.compile(f"\\b{re.escape(keyword)}\\b", re.IGNORECASE | re.UNICODE)
+        if pattern.search(text):
+            matched.append(keyword)
+    return matched
+
+
+def _difflib_matches(keywords, words, threshold):
+    """従来実装（全組み合わせの SequenceMatcher）による照合結果"""
+    matched = []
+    for keyword in keywords:
+        for word in words:
+            if len(word) >= 3:
+                similarity = difflib.SequenceMatcher(None, word, keyword).ratio()
+                if similarity >= threshold:
+                    matched.append((keyword, word, similarity))
+                    break
+    return matched
+
+
+def _make_filter(keywords, **kwargs):
+    config = Mock()
+    config.get_ng_keywords.return_value = keywords
+    config.get_ng_genres.return_value = []
+    config.get_exclude_tags.return_value = []
+    kwargs.setdefault("enable_fuzzy_matching", False)
+    return ContentFilter(config, **kwargs)
+
+
+class TestKeywordAutomaton:
+    """Aho-Corasick 照合器のテスト"""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_regex_word_boundaries(self, text):
+        automaton = KeywordAutomaton(KEYWORDS)
+
+        assert automaton.find_all(text) == _regex_matches(KEYWORDS, text)
+
+    def test_overlapping_keywords(self):
+        automaton = KeywordAutomaton(["he", "she", "hers", "his"])
+
+        assert automaton.find_all("she hers his") == ["she", "hers", "his"]
+        assert automaton.find_all("ushers") == []
+
+    def test_incremental_add_and_remove(self):
+        automaton = KeywordAutomaton(["r18"])
+        assert automaton.find_all("BL r18") == ["r18"]
+
+        assert automaton.add("BL") is True
+        assert automaton.add("bl") is False
+        assert automaton.find_all("BL r18") == ["r18", "bl"]
+
+        assert automaton.remove("r18") is True
+        assert automaton.remove("r18") is False
+        assert automaton.find_all("BL r18") == ["bl"]
+        assert "bl" in automaton
+        assert len(automaton) == 1
+
+    def test_rebuild_after_many_removals(self):
+        words = [f"keyword{i}" for i in range(50)]
+        automaton = KeywordAutomaton(words)
+
+        for word in words[:-1]:
+            automaton.remove(word)
+
+        assert automaton.keywords == ["keyword49"]
+        assert automaton.find_all("keyword1 keyword49") == ["keyword49"]
+
+
+class TestFuzzyKeywordIndex:
+    """ファジィマッチング候補絞り込みのテスト"""
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.5, 0.8, 0.9, 1.0])
+    def test_matches_exhaustive_difflib(self, threshold):
+        rng = random.Random(5)
+        alphabet = "abcdeエロ漫画"
+        keywords = ["".join(rng.choices(alphabet, k=rng.randint(2, 8))) for _ in range(40)]
+        words = ["".join(rng.choices(alphabet, k=rng.randint(1, 9))) for _ in range(60)]
+        index = FuzzyKeywordIndex(keywords)
+
+        expected = _difflib_matches(list(dict.fromkeys(keywords)), words, threshold)
+
+        assert index.find_matches(words, threshold) == expected
+
+    def test_prunes_unrelated_keywords(self):
+        index = FuzzyKeywordIndex(["hentai", "adult"])
+
+        with patch("modules.keyword_matcher.SequenceMatcher") as matcher:
+            assert index.find_matches(["fantasy", "xyzzy", "a" * 40], 0.8) == []
+
+        matcher.assert_not_called()
+
+
+class TestContentFilterKeywordMatching:
+    """ContentFilter でのオートマトン利用のテスト"""
+
+    def test_dynamic_keywords_update_automaton(self):
+        content_filter = _make_filter(["R18"])
+        assert content_filter._check_text_content("百合 漫画", "タイトル").is_filtered is False
+
+        content_filter.add_dynamic_keyword("百合")
+        result = content_filter._check_text_content("百合 漫画", "タイトル")
+        assert result.is_filtered is True
+        assert result.matched_keywords == ["百合"]
+
+        content_filter.remove_dynamic_keyword("百合")
+        assert content_filter._check_text_content("百合 漫画", "タイトル").is_filtered is False
+
+    def test_set_ng_keywords_rebuilds_automaton(self):
+        content_filter = _make_filter(["R18"])
+
+        content_filter.set_ng_keywords(["BL"])
+
+        assert content_filter.keyword_automaton.keywords == ["bl"]
+        assert content_filter.get_filter_statistics()["automaton_keywords_count"] == 1
+
+    def test_fuzzy_matching_follows_dynamic_keywords(self):
+        content_filter = _make_filter(["hentai"], enable_fuzzy_matching=True)
+        assert content_filter._fuzzy_keyword_matching("hentay anime") == ["hentai (fuzzy: 0.83)"]
+
+        content_filter.add_dynamic_keyword("gravure")
+        assert content_filter._fuzzy_keyword_matching("gravurre") == ["gravure (fuzzy: 0.93)"]
+
+        content_filter.remove_dynamic_keyword("gravure")
+        assert content_filter._fuzzy_keyword_matching("gravurre") == []
+
+
+class TestContentFilterResultCache:
+    """判定結果キャッシュのテスト"""
+
+    def test_cache_is_bounded_lru(self):
+        content_filter = _make_filter(["R18"], result_cache_size=2)
+
+        content_filter._check_text_content_optimized("作品A", "タイトル")
+        content_filter._check_text_content_optimized("作品B", "タイトル")
+        content_filter._check_text_content_optimized("作品A", "タイトル")
+        content_filter._check_text_content_optimized("作品C", "タイトル")
+
+        stats = content_filter.get_filter_statistics()["performance"]
+        assert stats["cache_size"] == 2
+        assert stats["cache_hits"] == 1
+        assert stats["result_cache"]["evictions"] == 1
+        # 最も古く使われた 作品B が追い出されている
+        assert content_filter._filter_cache.get(("タイトル", "作品A")) is not None
+        assert content_filter._filter_cache.get(("タイトル", "作品B")) is None
+
+    def test_cache_entries_expire(self):
+        content_filter = _make_filter(["R18"], result_cache_ttl=10)
+
+        with patch("modules.cache.time.time", return_value=1000.0):
+            content_filter._check_text_content_optimized("作品A", "タイトル")
+        with patch("modules.cache.time.time", return_value=1011.0):
+            content_filter._check_text_content_optimized("作品A", "タイトル")
+
+        assert content_filter.cache_hits == 0
+
+    def test_keyword_change_invalidates_cache(self):
+        content_filter = _make_filter(["R18"])
+        assert (
+            content_filter._check_text_content_optimized("BL 作品", "タイトル").is_filtered is False
+        )
+
+        content_filter.add_dynamic_keyword("BL")
+
+        assert (
+            content_filter._check_text_content_optimized("BL 作品", "タイトル").is_filtered is True
+        )
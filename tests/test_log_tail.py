@@ -0,0 +1,159 @@
+"""
+ログ末尾読み取りのテスト
+modules/log_tail.py を検証
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules import log_tail
+from modules.log_tail import (
+    LogTailReader,
+    decode_log_cursor,
+    encode_log_cursor,
+    parse_log_line,
+    read_since,
+    read_tail,
+)
+
+
+def _line(second, level="INFO", message="message"):
+    return f"2025-01-01 00:00:{second:02d} - app - {level} - {message}\n"
+
+
+class TestReadTail:
+    @pytest.mark.parametrize("block_size", [1, 7, 64, 4096])
+    @pytest.mark.parametrize("count", [0, 1, 5, 100])
+    def test_matches_readlines(self, tmp_path, block_size, count):
+        rng = random.Random(count * 31 + block_size)
+        path = tmp_path / "app.log"
+        lines = [
+            "".join(rng.choices("abcあい ", k=rng.randint(0, 20)))
+            for _ in range(rng.randint(0, 40))
+        ]
+        path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+
+        tail, offset = read_tail(str(path), count, block_size=block_size)
+
+        expected = [line.strip() for line in lines if line.strip()]
+        assert tail == (expected[-count:] if count else [])
+        assert offset == path.stat().st_size
+
+    @pytest.mark.parametrize("block_size", [1, 16, 4096])
+    def test_blank_lines_are_not_counted(self, tmp_path, block_size):
+        path = tmp_path / "app.log"
+        path.write_text("".join(f"line {i}\n\n  \n" for i in range(12)), encoding="utf-8")
+
+        tail, _ = read_tail(str(path), 10, block_size=block_size)
+
+        assert tail == [f"line {i}" for i in range(2, 12)]
+
+    def test_incomplete_last_line_is_skipped(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"first\nsecond\nthird-partial")
+
+        tail, offset = read_tail(str(path), 10, block_size=4)
+
+        assert tail == ["first", "second"]
+        assert offset == len(b"first\nsecond\n")
+
+    def test_read_since(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text("old\n", encoding="utf-8")
+        _, offset = read_tail(str(path), 10)
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("new 1\nnew 2\npartial")
+
+        assert read_since(str(path), offset) == (["new 1", "new 2"], len("old\nnew 1\nnew 2\n"))
+
+
+class TestParseLogLine:
+    @pytest.mark.parametrize(
+        "line, level, message",
+        [
+            ("2025-01-01 10:00:00 - app - ERROR - failed", "ERROR", "failed"),
+            ("[2025-01-01 10:00:00] warning: slow", "WARNING", "slow"),
+            ("2025-01-01 10:00:00,123 collector INFO: done", "INFO", "done"),
+        ],
+    )
+    def test_known_formats(self, line, level, message):
+        entry = parse_log_line(line)
+
+        assert entry["timestamp"] == "2025-01-01 10:00:00"
+        assert entry["level"] == level
+        assert entry["message"] == message
+
+    def test_unknown_format(self):
+        assert parse_log_line("Traceback (most recent call last):")["level"] == "INFO"
+
+
+class TestLogTailReader:
+    def test_merges_files_by_timestamp(self, tmp_path):
+        app_log = tmp_path / "app.log"
+        system_log = tmp_path / "system.log"
+        app_log.write_text(_line(1) + _line(4) + _line(5), encoding="utf-8")
+        system_log.write_text(_line(2) + _line(3, "ERROR") + _line(6), encoding="utf-8")
+        reader = LogTailReader([str(app_log), str(tmp_path / "missing.log"), str(system_log)])
+
+        entries, positions = reader.read(limit=4)
+
+        assert [entry["timestamp"][-2:] for entry in entries] == ["06", "05", "04", "03"]
+        assert positions[1] is None
+        assert [e["level"] for e in reader.read(level="error")[0]] == ["ERROR"]
+
+    def test_only_appended_lines_are_parsed(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text("".join(_line(i) for i in range(50)), encoding="utf-8")
+        reader = LogTailReader([str(path)], max_entries=10)
+
+        with patch.object(log_tail, "parse_log_line", wraps=log_tail.parse_log_line) as parse:
+            reader.read()
+            reader.read()
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(_line(50) + _line(51))
+            entries, _ = reader.read(limit=3)
+
+        assert parse.call_count == 12
+        assert [entry["timestamp"][-2:] for entry in entries] == ["51", "50", "49"]
+
+    def test_since_returns_new_lines_only(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text(_line(1), encoding="utf-8")
+        reader = LogTailReader([str(path)])
+        _, positions = reader.read()
+        cursor = encode_log_cursor(positions)
+
+        assert reader.read(since=decode_log_cursor(cursor, 1))[0] == []
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(_line(2, message="appended"))
+        entries, _ = reader.read(since=decode_log_cursor(cursor, 1))
+
+        assert [entry["message"] for entry in entries] == ["appended"]
+
+    def test_rotation_rereads_from_tail(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text(_line(1, message="before"), encoding="utf-8")
+        reader = LogTailReader([str(path)])
+        _, positions = reader.read()
+
+        os.rename(path, tmp_path / "app.log.1")
+        path.write_text(_line(2, message="after"), encoding="utf-8")
+        entries, _ = reader.read(since=positions)
+
+        assert [entry["message"] for entry in entries] == ["after"]
+
+    @pytest.mark.parametrize(
+        "cursor", ["broken", encode_log_cursor([[1]]), encode_log_cursor(["x"])]
+    )
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            decode_log_cursor(cursor, 1)
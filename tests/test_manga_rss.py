@@ -5,8 +5,8 @@ modules/manga_rss.py のテストカバレッジ向上
 import pytest
 import sys
 from pathlib import Path
-from datetime import datetime, date
-from unittest.mock import Mock, patch, MagicMock
+from datetime import datetime, date, timedelta
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import xml.etree.ElementTree as ET
 
 # プロジェクトルートをパスに追加
@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     from modules import manga_rss
+    from modules.http_client import HttpResponse, SharedHttpClient
 except ImportError:
     pytest.skip("manga_rss module not found", allow_module_level=True)
 
@@ -513,3 +514,310 @@ class TestLogging:
                 # エラーログが記録される
                 if hasattr(manga_rss, 'logger'):
                     assert mock_logger.error.called or mock_logger.warning.called
+
+
+class TestDuplicateDetector:
+    """類似タイトル重複検出のテスト"""
+
+    @staticmethod
+    def _exhaustive_is_duplicate(detector, title):
+        normalized = detector._normalize_title(title.strip().lower())
+        return any(
+            detector._calculate_title_similarity(normalized, existing) > 0.85
+            for existing in detector.title_variations
+        )
+
+    def test_indexed_check_matches_exhaustive_scan(self):
+        import random
+
+        rng = random.Random(7)
+        alphabet = "あいうえおかきくabc"
+        bases = ["".join(rng.choices(alphabet, k=rng.randint(1, 20))) for _ in range(20)]
+        detector = manga_rss.DuplicateDetector()
+
+        for _ in range(400):
+            chars = list(rng.choice(bases))
+            for _ in range(rng.randint(0, 3)):
+                position = rng.randrange(len(chars) + 1)
+                if position < len(chars) and rng.random() < 0.5:
+                    chars[position] = rng.choice(alphabet)
+                else:
+                    chars.insert(position, rng.choice(alphabet))
+            title = "".join(chars)
+
+            expected = self._exhaustive_is_duplicate(detector, title)
+            assert detector._is_similar_title_duplicate({"title": title}) == expected
+            if not expected:
+                detector._update_title_variations({"title": title})
+
+    def test_remove_duplicates_drops_near_duplicate_titles(self):
+        detector = manga_rss.DuplicateDetector()
+        items = [
+            {"title": "転生したらスライムだった件 第10巻", "source": "a"},
+            {"title": "転生したらスライムだった件　第10巻", "source": "b"},
+            {"title": "転生したらスライムだった件 第1O巻", "source": "c"},
+            {"title": "ワンピース 第107巻", "source": "a"},
+        ]
+
+        unique = detector.remove_duplicates(items)
+
+        assert [item["source"] for item in unique] == ["a", "a"]
+
+    def test_banded_edit_distance(self):
+        within = manga_rss.DuplicateDetector._within_edit_distance
+
+        assert within("kitten", "sitting", 3) is True
+        assert within("kitten", "sitting", 2) is False
+        assert within("abc", "abc", 0) is True
+        assert within("abcdef", "abc", 2) is False
+
+
+class TestConditionalGet:
+    """ETag / Last-Modified による条件付きGETのテスト"""
+
+    FEED_URL = "https://example.com/manga.rss"
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        config = Mock()
+        config.get_rss_config.return_value = {}
+        config.get_enabled_rss_feeds.return_value = [
+            {"name": "テストフィード", "url": self.FEED_URL, "category": "manga", "retry_count": 1}
+        ]
+        config.get_db_path.return_value = str(tmp_path / "state.sqlite3")
+        return manga_rss.MangaRSSCollector(config)
+
+    @classmethod
+    def _response(cls, status, content=b"", headers=None):
+        return HttpResponse(status, headers or {}, content, cls.FEED_URL)
+
+    def test_sync_not_modified_skips_parsing(self, collector, sample_rss_feed):
+        headers = {"ETag": '"v1"', "Last-Modified": "Fri, 15 Dec 2025 00:00:00 GMT"}
+        updates = manga_rss.PendingFeedUpdates()
+        request = AsyncMock(return_value=self._response(200, sample_rss_feed.encode(), headers))
+        with patch.object(SharedHttpClient, "request", request):
+            items = collector._collect_from_feed_enhanced(self.FEED_URL, "テストフィード", updates)
+
+            assert items
+            assert "Cache-Control" not in request.call_args.kwargs["headers"]
+            collector.commit_feed_updates(updates)
+
+            request.return_value = self._response(304)
+            with patch.object(manga_rss.feedparser, "parse") as mock_parse:
+                assert collector._collect_from_feed_enhanced(self.FEED_URL, "テストフィード") == []
+                mock_parse.assert_not_called()
+
+        assert request.call_args.args == ("GET", self.FEED_URL)
+        sent = request.call_args.kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Fri, 15 Dec 2025 00:00:00 GMT"
+        assert collector.feed_health[self.FEED_URL].not_modified_count == 1
+
+    def test_validators_survive_restart(self, collector, tmp_path, sample_rss_feed):
+        updates = manga_rss.PendingFeedUpdates()
+        response = self._response(200, sample_rss_feed.encode(), {"ETag": '"v2"'})
+        with patch.object(SharedHttpClient, "request", AsyncMock(return_value=response)):
+            collector._collect_from_feed_enhanced(self.FEED_URL, "テストフィード", updates)
+        collector.commit_feed_updates(updates)
+
+        store = manga_rss.FeedStateStore(str(tmp_path / "state.sqlite3"))
+        assert store.conditional_headers(self.FEED_URL) == {"If-None-Match": '"v2"'}
+
+    def test_validators_wait_for_commit(self, collector, sample_rss_feed):
+        """保存していない収集の検証子は送らない（304 で未保存のエントリーを失わない）"""
+        request = AsyncMock(
+            return_value=self._response(200, sample_rss_feed.encode(), {"ETag": '"v4"'})
+        )
+        with patch.object(SharedHttpClient, "request", request):
+            updates = manga_rss.PendingFeedUpdates()
+            assert collector._collect_from_feed_enhanced(self.FEED_URL, "テストフィード", updates)
+            assert collector._collect_from_feed_enhanced(self.FEED_URL, "テストフィード")
+
+        assert "If-None-Match" not in request.call_args.kwargs["headers"]
+        assert collector.feed_state.get_validators(self.FEED_URL)["etag"] is None
+
+    def test_async_not_modified_skips_parsing(self, collector):
+        import asyncio
+
+        collector.feed_state.save_validators(self.FEED_URL, '"v3"', None)
+
+        http = Mock()
+        http.get = AsyncMock(return_value=HttpResponse(304, {}, b"", self.FEED_URL))
+        feed = {"name": "テストフィード", "url": self.FEED_URL}
+
+        with patch.object(manga_rss.feedparser, "parse") as mock_parse:
+            items = asyncio.run(collector._collect_from_feed_async(http, feed))
+
+        assert items == []
+        mock_parse.assert_not_called()
+        headers = http.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v3"'
+        assert "If-Modified-Since" not in headers
+
+
+class TestParseOffload:
+    """非同期収集での解析スレッドプールのテスト"""
+
+    def test_parsing_runs_outside_event_loop(self, sample_rss_feed):
+        import asyncio
+        import threading
+
+        feeds = [
+            {"name": f"フィード{i}", "url": f"https://example.com/{i}.rss", "category": "manga"}
+            for i in range(3)
+        ]
+        config = Mock()
+        config.get_rss_config.return_value = {"parse_workers": 2}
+        config.get_enabled_rss_feeds.return_value = feeds
+        config.get_db_path.return_value = None
+        collector = manga_rss.MangaRSSCollector(config)
+
+        parse_threads = []
+        parse = collector._parse_feed_content
+
+        def recording_parse(*args):
+            parse_threads.append(threading.current_thread().name)
+            return parse(*args)
+
+        response = HttpResponse(200, {}, sample_rss_feed.encode(), "https://example.com/")
+        with patch.object(SharedHttpClient, "request", AsyncMock(return_value=response)), \
+                patch.object(collector, "_parse_feed_content", side_effect=recording_parse):
+            items = asyncio.run(collector._collect_async(feeds))
+
+        assert len(parse_threads) == 3
+        assert all(name.startswith("rss-parse") for name in parse_threads)
+        assert len(items) == 3 * len(parse(sample_rss_feed.encode(), "フィード0"))
+
+
+class TestIncrementalIngestion:
+    """取り込み済みエントリーのスキップのテスト"""
+
+    FEED_URL = "https://example.com/manga.rss"
+
+    def test_known_entries_skip_normalization(self, tmp_path, sample_rss_feed):
+        config = Mock()
+        config.get_rss_config.return_value = {}
+        config.get_enabled_rss_feeds.return_value = []
+        config.get_db_path.return_value = str(tmp_path / "state.sqlite3")
+        collector = manga_rss.MangaRSSCollector(config)
+        content = sample_rss_feed.encode()
+
+        first_updates = manga_rss.PendingFeedUpdates()
+        first = collector._parse_feed_content(content, "テスト", self.FEED_URL, first_updates)
+        titles = [item["title"] for item in first]
+        assert len(titles) == 2
+        # 保存完了を記録するまでは次回も同じエントリーを返す
+        updates = manga_rss.PendingFeedUpdates()
+        again = collector._parse_feed_content(content, "テスト", self.FEED_URL, updates)
+        assert [item["title"] for item in again] == titles
+        assert collector.commit_feed_updates(updates) == 2
+
+        restarted = manga_rss.MangaRSSCollector(config)
+        with patch.object(restarted, "_parse_feed_entry_enhanced") as mock_parse_entry:
+            assert restarted._parse_feed_content(content, "テスト", self.FEED_URL) == []
+            mock_parse_entry.assert_not_called()
+
+        updated = content.replace("テストマンガの第5巻".encode(), "発売日が変更されました".encode())
+        items = restarted._parse_feed_content(updated, "テスト", self.FEED_URL)
+        assert [item["title"] for item in items] == titles[:1]
+
+
+class TestAdaptivePolling:
+    """フィードの健全性の永続化と適応ポーリングのテスト"""
+
+    FEED_URL = "https://example.com/manga.rss"
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        config = Mock()
+        config.get_rss_config.return_value = {}
+        config.get_enabled_rss_feeds.return_value = [
+            {"name": "テストフィード", "url": self.FEED_URL, "category": "manga", "retry_count": 1}
+        ]
+        config.get_db_path.return_value = str(tmp_path / "state.sqlite3")
+        return config
+
+    def test_failures_back_off_exponentially(self):
+        health = manga_rss.FeedHealth(url=self.FEED_URL)
+        now = datetime(2025, 12, 1, 12, 0)
+        delays = []
+        for _ in range(7):
+            health.record_failure()
+            next_poll = health.schedule_next_poll(3600, 43200, 86400, now=now)
+            delays.append((next_poll - now).total_seconds())
+
+        assert delays == [3600, 7200, 14400, 28800, 57600, 86400, 86400]
+        assert health.total_requests == 7
+        assert health.total_failures == 7
+
+    def test_quiet_feed_interval_grows(self):
+        health = manga_rss.FeedHealth(url=self.FEED_URL)
+        changed = datetime(2025, 12, 1, 0, 0)
+        health.record_change(changed)
+        health.record_change(changed.replace(hour=6))
+        assert health.change_interval == 6 * 3600
+
+        # 直後は観測した更新間隔の半分
+        soon = changed.replace(hour=6, minute=1)
+        assert (health.schedule_next_poll(3600, 43200, now=soon) - soon).total_seconds() == 3 * 3600
+
+        # 更新が無いまま時間が経つほど間隔が延びる（上限あり）
+        later = changed.replace(day=3)
+        assert health.schedule_next_poll(3600, 43200, now=later) - later == timedelta(hours=12)
+        assert not health.is_due(now=later)
+        assert health.is_due(now=later + timedelta(hours=12))
+
+    def test_health_survives_restart_and_skips_feeds_not_due(self, config):
+        collector = manga_rss.MangaRSSCollector(config)
+        for _ in range(2):
+            updates = manga_rss.PendingFeedUpdates()
+            collector._record_feed_failure(self.FEED_URL, updates)
+            collector.commit_feed_updates(updates)
+
+        restarted = manga_rss.MangaRSSCollector(config)
+        health = restarted.feed_health[self.FEED_URL]
+        assert health.consecutive_failures == 2
+        assert health.next_poll_at > datetime.now() + timedelta(hours=1)
+
+        with patch.object(restarted, "_collect_async") as mock_collect:
+            assert restarted.collect() == []
+            mock_collect.assert_not_called()
+
+        report = restarted.get_health_report()
+        assert report["total_requests"] == 2
+        assert report["feed_details"][self.FEED_URL]["next_poll_at"] is not None
+
+    def test_due_and_disabled_polling(self, config, sample_rss_feed):
+        collector = manga_rss.MangaRSSCollector(config)
+        feeds = config.get_enabled_rss_feeds()
+        assert collector._select_due_feeds(feeds) == feeds
+
+        updates = manga_rss.PendingFeedUpdates()
+        content = sample_rss_feed.encode()
+        collector._parse_feed_content(content, "テストフィード", self.FEED_URL, updates)
+        collector._record_feed_success(self.FEED_URL, 0.2, updates)
+        health = collector.feed_health[self.FEED_URL]
+        # 保存前（コミット前）の収集ではポーリング予定も更新間隔も変えない
+        assert health.last_changed is None
+        assert collector._select_due_feeds(feeds) == feeds
+
+        collector.commit_feed_updates(updates)
+        assert health.last_changed is not None
+        assert collector._select_due_feeds(feeds) == []
+
+        config.get_rss_config.return_value = {"adaptive_polling": False}
+        assert manga_rss.MangaRSSCollector(config)._select_due_feeds(feeds) == feeds
+
+    def test_uncommitted_collect_keeps_schedule(self, config, sample_rss_feed):
+        """保存しない収集（ダッシュボードなど）は保存済みの予定と更新間隔を変えない"""
+        collector = manga_rss.MangaRSSCollector(config)
+        response = HttpResponse(200, {}, sample_rss_feed.encode(), self.FEED_URL)
+        with patch.object(SharedHttpClient, "request", AsyncMock(return_value=response)):
+            assert collector.collect()
+            assert collector.collect()
+
+        health = collector.feed_health[self.FEED_URL]
+        assert health.success_count == 2
+        assert health.next_poll_at is None
+        assert health.last_changed is None
+        assert collector.feed_state.get_health(self.FEED_URL) is None
@@ -0,0 +1,136 @@
+"""
+キーセットページネーションのテスト
+modules/pagination.py を検証
+"""
+
+import random
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.audit_log import AuditEventType, AuditLogger
+from modules.pagination import (
+    cached_total,
+    clear_total_cache,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+
+def _walk(conn, keys, page_size):
+    """カーソルを使って全ページを辿り、取得順の id を返す"""
+    order_by = ", ".join(f"{key} {'DESC' if desc else 'ASC'}" for key, desc in keys)
+    columns = ", ".join(key for key, _ in keys)
+    seen = []
+    cursor = None
+    while True:
+        where, params = "", []
+        values = decode_cursor(cursor, len(keys))
+        if values is not None:
+            condition, params = keyset_condition(keys, values)
+            where = f"WHERE {condition}"
+        rows = conn.execute(
+            f"SELECT {columns} FROM items {where} ORDER BY {order_by} LIMIT ?",
+            params + [page_size],
+        ).fetchall()
+        if not rows:
+            return seen
+        seen.extend(row[-1] for row in rows)
+        cursor = encode_cursor(list(rows[-1]))
+
+
+class TestCursorEncoding:
+    def test_round_trip(self):
+        values = ["2025-01-01", 42, None, -1.5, "進撃の巨人"]
+
+        cursor = encode_cursor(values)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, len(values)) == values
+
+    def test_empty_cursor_means_first_page(self):
+        assert decode_cursor(None, 2) is None
+        assert decode_cursor("", 2) is None
+
+    @pytest.mark.parametrize("cursor", ["not-base64!!", encode_cursor([1]), "e30"])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 2)
+
+
+class TestKeysetCondition:
+    @pytest.fixture
+    def conn(self):
+        rng = random.Random(3)
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, day TEXT, title TEXT)")
+        conn.executemany(
+            "INSERT INTO items (id, day, title) VALUES (?, ?, ?)",
+            [
+                (
+                    i,
+                    rng.choice([None, "2025-01-01", "2025-01-02", "2025-01-03"]),
+                    rng.choice([None, "a", "b"]),
+                )
+                for i in range(1, 80)
+            ],
+        )
+        yield conn
+        conn.close()
+
+    @pytest.mark.parametrize("day_desc", [True, False])
+    @pytest.mark.parametrize("title_desc", [True, False])
+    @pytest.mark.parametrize("page_size", [1, 7, 100])
+    def test_walk_matches_offset_order(self, conn, day_desc, title_desc, page_size):
+        """NULL を含むキーでも ORDER BY と同じ順で漏れ・重複なく辿れる"""
+        keys = [("day", day_desc), ("title", title_desc), ("id", day_desc)]
+        order_by = ", ".join(f"{key} {'DESC' if desc else 'ASC'}" for key, desc in keys)
+        expected = [row[0] for row in conn.execute(f"SELECT id FROM items ORDER BY {order_by}")]
+
+        assert _walk(conn, keys, page_size) == expected
+
+
+class TestCachedTotal:
+    def test_count_runs_once_per_key(self):
+        clear_total_cache()
+        calls = []
+
+        def count():
+            calls.append(1)
+            return 10
+
+        assert cached_total(("test", "a"), count) == 10
+        assert cached_total(("test", "a"), count) == 10
+        assert cached_total(("test", "b"), count) == 10
+        assert len(calls) == 2
+
+    def test_version_change_recounts(self):
+        clear_total_cache()
+        totals = iter([1, 3])
+
+        assert cached_total(("test", "v"), lambda: next(totals), version=1) == 1
+        assert cached_total(("test", "v"), lambda: next(totals), version=1) == 1
+        assert cached_total(("test", "v"), lambda: next(totals), version=2) == 3
+
+
+class TestAuditLogCursor:
+    def test_before_pages_through_logs(self):
+        audit_logger = AuditLogger()
+        for i in range(5):
+            audit_logger.log_event(AuditEventType.API_CALL, user_id=f"user-{i}")
+        # 同時刻のログは ID で順序付けされる
+        same_time = datetime(2025, 1, 1)
+        for log in audit_logger._logs:
+            log.timestamp = same_time if log.id > 2 else same_time - timedelta(seconds=1)
+
+        first = audit_logger.get_logs(limit=2)
+        rest = audit_logger.get_logs(limit=10, before=(first[-1].timestamp, first[-1].id))
+
+        assert [log.id for log in first] == [5, 4]
+        assert [log.id for log in rest] == [3, 2, 1]
@@ -0,0 +1,277 @@
+"""
+ReleaseNotifierSystem の収集・保存ステージのテスト
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.release_notifier import ReleaseNotifierSystem
+
+
+class _FakeCollector:
+    """collect() 呼び出しを記録する疑似コレクター"""
+
+    def __init__(self, items=None, delay=0.0, error=None, barrier=None):
+        self.items = items or []
+        self.delay = delay
+        self.error = error
+        self.barrier = barrier
+        self.calls = 0
+
+    def collect(self):
+        self.calls += 1
+        if self.barrier is not None:
+            self.barrier.wait(timeout=2)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return list(self.items)
+
+
+def _make_system(collectors, config_values=None):
+    """__init__ を通さずに収集ステージだけを持つシステムを構築"""
+    values = config_values or {}
+    system = ReleaseNotifierSystem.__new__(ReleaseNotifierSystem)
+    system.logger = logging.getLogger("test_release_notifier")
+    system.config = Mock()
+    system.config.get_value.side_effect = lambda key, default=None: values.get(key, default)
+    system._collectors = collectors
+    system._pending_feed_updates = {}
+    system.statistics = {"processed_sources": 0, "errors": 0}
+    return system
+
+
+class _FakeFeedCollector(_FakeCollector):
+    """collect_with_updates() / commit_feed_updates() を持つ疑似 RSS コレクター"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.committed = []
+
+    def collect_with_updates(self):
+        items = self.collect()
+        return items, f"updates-{self.calls}"
+
+    def commit_feed_updates(self, updates):
+        self.committed.append(updates)
+
+
+@pytest.fixture(autouse=True)
+def _mock_monitoring():
+    with (
+        patch("modules.monitoring.record_api_performance") as record,
+        patch("modules.monitoring.add_monitoring_alert"),
+    ):
+        yield record
+
+
+class TestConcurrentCollection:
+    """並行収集モードのテスト"""
+
+    def test_sources_run_concurrently(self, _mock_monitoring):
+        # 全ソースが同時に走っていなければ barrier で待ち合わせられない
+        barrier = threading.Barrier(3)
+        collectors = {
+            "anilist": _FakeCollector([{"title": "A"}], barrier=barrier),
+            "manga_rss": _FakeCollector([{"title": "B"}], barrier=barrier),
+            "danime": _FakeCollector([{"title": "C"}], barrier=barrier),
+        }
+        system = _make_system(collectors)
+
+        items = system.collect_information()
+
+        assert [item["title"] for item in items] == ["A", "B", "C"]
+        assert system.statistics["processed_sources"] == 3
+        assert system.statistics["errors"] == 0
+        recorded = {call.args[0] for call in _mock_monitoring.call_args_list}
+        assert recorded == {"anilist", "mangarss", "danime"}
+
+    def test_source_timeout_does_not_block_others(self, _mock_monitoring):
+        collectors = {
+            "anilist": _FakeCollector([{"title": "slow"}], delay=1.0),
+            "manga_rss": _FakeCollector([{"title": "fast"}]),
+        }
+        system = _make_system(collectors, {"collection.sources.anilist": {"timeout_seconds": 0.2}})
+
+        start = time.time()
+        items = system.collect_information()
+
+        assert time.time() - start < 0.9
+        assert [item["title"] for item in items] == ["fast"]
+        assert system.statistics["errors"] == 1
+        failures = [call for call in _mock_monitoring.call_args_list if call.args[2] is False]
+        assert [call.args[0] for call in failures] == ["anilist"]
+
+    def test_source_error_is_isolated(self):
+        collectors = {
+            "anilist": _FakeCollector(error=RuntimeError("boom")),
+            "manga_rss": _FakeCollector([{"title": "ok"}]),
+        }
+        system = _make_system(collectors)
+
+        items = system.collect_information()
+
+        assert items == [{"title": "ok"}]
+        assert system.statistics["errors"] == 1
+        assert system.statistics["processed_sources"] == 1
+
+    def test_sequential_mode(self):
+        collectors = {
+            "anilist": _FakeCollector([{"title": "A"}]),
+            "manga_rss": _FakeCollector([{"title": "B"}]),
+        }
+        system = _make_system(collectors, {"collection.concurrent": False})
+
+        with patch.object(system, "_collect_concurrently") as concurrent:
+            items = system.collect_information()
+
+        concurrent.assert_not_called()
+        assert [item["title"] for item in items] == ["A", "B"]
+
+    def test_source_timings_are_published(self):
+        collectors = {
+            "anilist": _FakeCollector([{"title": "A"}]),
+            "danime": _FakeCollector(error=RuntimeError("boom")),
+        }
+        system = _make_system(collectors)
+
+        with patch("app.release_notifier.publish_event") as publish:
+            system.collect_information()
+
+        events = {
+            call.args[1]["source"]: call.args[1]
+            for call in publish.call_args_list
+            if call.args[0] == "collection.source_completed"
+        }
+        assert events["anilist"]["items"] == 1
+        assert events["anilist"]["error"] is None
+        assert events["danime"]["error"] == "boom"
+
+    def test_disabled_source_settings(self):
+        system = _make_system({}, {"collection.sources.bookwalker": {"enabled": False}})
+
+        assert system._get_source_settings("bookwalker")["enabled"] is False
+        assert system._get_source_settings("danime")["enabled"] is True
+
+
+class TestSaveToDatabase:
+    """一括保存ステージのテスト"""
+
+    def test_uses_bulk_upsert_and_returns_new_releases(self):
+        system = _make_system({})
+        system.statistics.update({"new_releases": 0, "new_works": 0})
+        system.db = Mock()
+        system.db.bulk_upsert_works_and_releases.return_value = [
+            {"index": 1, "work_id": 7, "release_id": 42}
+        ]
+        items = [
+            {"title": "既存", "type": "anime"},
+            {"title": "新規", "type": "anime", "is_new_work": True},
+        ]
+
+        new_releases = system.save_to_database(items)
+
+        system.db.bulk_upsert_works_and_releases.assert_called_once_with(items)
+        assert new_releases == [
+            {"title": "新規", "type": "anime", "is_new_work": True, "release_id": 42, "work_id": 7}
+        ]
+        assert system.statistics["new_releases"] == 1
+        assert system.statistics["new_works"] == 1
+
+    def test_seen_entries_committed_only_after_save(self):
+        rss = _FakeFeedCollector([{"title": "新規", "type": "manga"}])
+        system = _make_system({"manga_rss": rss, "anilist": _FakeCollector()})
+        system.statistics.update({"new_releases": 0, "new_works": 0})
+        system.db = Mock()
+        system.db.bulk_upsert_works_and_releases.side_effect = RuntimeError("locked")
+
+        system.save_to_database(system.collect_information())
+        assert rss.committed == []
+
+        # 失敗した実行の分は次回の保存でも記録しない
+        system.db.bulk_upsert_works_and_releases.side_effect = None
+        system.db.bulk_upsert_works_and_releases.return_value = []
+        system.save_to_database([])
+        assert rss.committed == []
+
+        system.save_to_database(system.collect_information())
+        assert rss.committed == ["updates-2"]
+
+    def test_timed_out_source_is_not_committed(self):
+        slow = _FakeFeedCollector([{"title": "遅延", "type": "manga"}], delay=0.5)
+        fast = _FakeFeedCollector([{"title": "即時", "type": "manga"}])
+        system = _make_system(
+            {"manga_rss": slow, "danime": fast},
+            {"collection.sources.manga_rss": {"timeout_seconds": 0.1}},
+        )
+        system.statistics.update({"new_releases": 0, "new_works": 0})
+        system.db = Mock()
+        system.db.bulk_upsert_works_and_releases.return_value = []
+
+        system.save_to_database(system.collect_information())
+        time.sleep(0.6)  # タイムアウトしたスレッドが最後まで走り終える
+
+        assert fast.committed == ["updates-1"]
+        assert slow.calls == 1
+        assert slow.committed == []
+
+    def test_failed_save_refetches_feed_instead_of_304(self, tmp_path):
+        """保存に失敗した実行の検証子は送らず、次回も同じエントリーを取得する"""
+        from modules.http_client import HttpResponse, SharedHttpClient
+        from modules.manga_rss import MangaRSSCollector
+
+        feed_url = "https://example.com/manga.rss"
+        body = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>新刊</title>
+<item><title>テストマンガ 第5巻</title><link>https://example.com/5</link>
+<pubDate>Fri, 15 Dec 2025 00:00:00 +0900</pubDate></item>
+</channel></rss>""".encode()
+        sent_etags = []
+
+        async def server(self, method, url, headers=None, **kwargs):
+            # ETag を尊重するサーバー: 一致すれば 304
+            sent_etags.append((headers or {}).get("If-None-Match"))
+            if sent_etags[-1] == '"v1"':
+                return HttpResponse(304, {"ETag": '"v1"'}, b"", url)
+            return HttpResponse(200, {"ETag": '"v1"'}, body, url)
+
+        config = Mock()
+        config.get_rss_config.return_value = {"adaptive_polling": False}
+        config.get_enabled_rss_feeds.return_value = [
+            {"name": "テストフィード", "url": feed_url, "category": "manga", "retry_count": 1}
+        ]
+        config.get_db_path.return_value = str(tmp_path / "state.sqlite3")
+
+        system = _make_system(
+            {"manga_rss": MangaRSSCollector(config)}, {"collection.concurrent": False}
+        )
+        system.statistics.update({"new_releases": 0, "new_works": 0})
+        system.db = Mock()
+        system.db.bulk_upsert_works_and_releases.side_effect = RuntimeError("locked")
+
+        with patch.object(SharedHttpClient, "request", server):
+            first = system.collect_information()
+            system.save_to_database(first)
+
+            # 再起動後も含め、保存に失敗した実行の ETag は送らない
+            system._collectors["manga_rss"] = MangaRSSCollector(config)
+            system.db.bulk_upsert_works_and_releases.side_effect = None
+            system.db.bulk_upsert_works_and_releases.return_value = []
+            second = system.collect_information()
+            system.save_to_database(second)
+
+            third = system.collect_information()
+
+        assert len(first) == 1
+        assert [item["title"] for item in second] == [item["title"] for item in first]
+        assert third == []
+        assert sent_etags == [None, None, '"v1"']
@@ -0,0 +1,459 @@
+"""
+app/web_app.py のデータ参照エンドポイントのテスト
+一時データベースに対して検索・絞り込みの結果を検証
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-web-app-queries-0000")
+os.environ.setdefault("GMAIL_ADDRESS", "test@example.com")
+os.environ.setdefault("GMAIL_APP_PASSWORD", "test-app-password")
+os.environ.setdefault("DEFAULT_ADMIN_PASSWORD", "TestAdminPassword123")
+
+from app import web_app
+from app.utils.http_cache import clear_response_cache
+from modules.db import DatabaseManager, configure_reader, get_snapshot_reader
+from modules.pagination import clear_total_cache
+
+
+@pytest.fixture
+def catalog_db(tmp_path):
+    """作品とリリースを登録した一時データベース"""
+    db_path = str(tmp_path / "web_app.sqlite3")
+    manager = DatabaseManager(db_path=db_path)
+
+    shingeki = manager.create_work(
+        title="進撃の巨人", work_type="anime", title_en="Attack on Titan"
+    )
+    kyojin = manager.create_work(title="巨人の星", work_type="anime")
+    onepiece = manager.create_work(title="ワンピース", work_type="manga", title_en="One Piece")
+    manager.create_release(shingeki, "episode", "1", "Netflix", "2025-01-01")
+    manager.create_release(kyojin, "episode", "2", "dアニメストア", "2025-02-01")
+    manager.create_release(onepiece, "volume", "108", "BookWalker", "2025-03-01")
+    for i in range(30):
+        work_id = manager.create_work(title=f"追加作品{i:02d}", work_type="manga")
+        manager.create_release(work_id, "volume", "1", "BookWalker", "2024-12-01")
+    manager.close_connections()
+
+    clear_total_cache()
+    clear_response_cache()
+    with patch.object(web_app, "DATABASE_PATH", db_path):
+        yield db_path
+
+
+@pytest.fixture
+def client(catalog_db):
+    web_app.app.config["TESTING"] = True
+    with web_app.app.test_client() as client:
+        yield client
+
+
+class TestTitleSearch:
+    """作品タイトル検索のテスト"""
+
+    def test_api_works_full_text_search(self, client):
+        data = client.get("/api/works", query_string={"search": "titan"}).get_json()
+
+        assert [work["title"] for work in data["works"]] == ["進撃の巨人"]
+        assert data["total"] == 1
+
+    def test_api_works_short_query(self, client):
+        data = client.get("/api/works", query_string={"search": "巨人"}).get_json()
+
+        assert sorted(work["title"] for work in data["works"]) == ["巨人の星", "進撃の巨人"]
+        assert data["total"] == 2
+
+    def test_api_works_search_with_filters(self, client):
+        data = client.get(
+            "/api/works",
+            query_string={"search": "巨人の", "platform": "dアニメストア", "sort": "title_asc"},
+        ).get_json()
+
+        assert [work["title"] for work in data["works"]] == ["巨人の星"]
+        assert data["total"] == 1
+
+    def test_releases_search(self, client):
+        response = client.get("/releases", query_string={"search": "ワンピース"})
+
+        assert response.status_code == 200
+        body = response.get_data(as_text=True)
+        assert "ワンピース" in body
+        assert "巨人の星" not in body
+
+
+class TestCursorPagination:
+    """カーソル方式ページネーションのテスト"""
+
+    @pytest.mark.parametrize("sort", ["newest", "oldest", "title_asc", "title_desc"])
+    def test_api_works_cursor_walk_matches_pages(self, client, sort):
+        by_page = []
+        for page in (1, 2):
+            data = client.get("/api/works", query_string={"sort": sort, "page": page}).get_json()
+            by_page.extend(work["id"] for work in data["works"])
+
+        by_cursor = []
+        cursor = None
+        while True:
+            query = {"sort": sort}
+            if cursor:
+                query["cursor"] = cursor
+            data = client.get("/api/works", query_string=query).get_json()
+            by_cursor.extend(work["id"] for work in data["works"])
+            assert data["total"] == 33
+            assert "sort_key_0" not in data["works"][0]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(by_cursor) == 33
+        assert by_cursor == by_page
+
+    def test_api_works_invalid_cursor(self, client):
+        response = client.get("/api/works", query_string={"cursor": "broken"})
+
+        assert response.status_code == 400
+
+    def test_releases_next_link_uses_cursor(self, client):
+        first = client.get("/releases").get_data(as_text=True)
+        assert "cursor=" in first
+
+        cursor = first.split("cursor=", 1)[1].split("&", 1)[0].split('"', 1)[0]
+        second = client.get("/releases", query_string={"page": 2, "cursor": cursor})
+
+        assert second.status_code == 200
+        body = second.get_data(as_text=True)
+        # 1ページ目（日付の新しい順）に載った作品は2ページ目に出ない
+        assert "ワンピース" not in body
+        assert len(set(re.findall(r"追加作品\d\d", body))) == 8
+
+
+class TestDashboardStats:
+    """集計カウンタを使う統計エンドポイントのテスト"""
+
+    def test_api_stats(self, client):
+        data = client.get("/api/stats").get_json()
+
+        assert data["total_works"] == 33
+        assert data["total_releases"] == 33
+        assert data["pending_notifications"] == 33
+        assert data["today_releases"] == 0
+
+    def test_dashboard_renders(self, client):
+        assert client.get("/").status_code == 200
+
+
+class TestCalendar:
+    """カレンダー画面・月別APIのテスト"""
+
+    def test_calendar_shows_only_requested_month(self, client):
+        body = client.get("/calendar", query_string={"year": 2025, "month": 1}).get_data(
+            as_text=True
+        )
+
+        assert "進撃の巨人" in body
+        assert "巨人の星" not in body
+        assert "追加作品" not in body
+
+    def test_monthly_api_lists_upcoming_events(self, client, catalog_db):
+        from datetime import date, timedelta
+
+        from modules.calendar_data import clear_month_cache
+
+        upcoming = (date.today() + timedelta(days=1)).isoformat()
+        manager = DatabaseManager(db_path=catalog_db)
+        with manager.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO calendar_events (work_id, event_title, event_date) "
+                "VALUES (1, '進撃の巨人 特番', ?)",
+                (upcoming,),
+            )
+        manager.close_connections()
+        clear_month_cache()
+
+        data = client.get("/api/calendar/monthly", query_string={"months": 2}).get_json()
+
+        assert data["success"] is True
+        assert len(data["months"]) == 2
+        assert data["total_events"] == 1
+        event = next(e for m in data["months"] for e in m["events"])
+        assert event["date"] == upcoming
+        assert event["work_title"] == "進撃の巨人"
+
+
+class TestConditionalGet:
+    """読み取り専用APIの ETag / 304 応答のテスト"""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/stats",
+            "/api/works",
+            "/api/releases/recent",
+            "/api/releases/upcoming",
+            "/api/calendar/events",
+            "/api/calendar/stats",
+        ],
+    )
+    def test_if_none_match_returns_304(self, client, url):
+        first = client.get(url)
+        assert first.status_code == 200
+        assert first.headers["X-Cache"] == "MISS"
+        etag = first.headers["ETag"]
+
+        again = client.get(url)
+        assert again.headers["X-Cache"] == "HIT"
+        assert again.get_data() == first.get_data()
+
+        revalidated = client.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["ETag"] == etag
+
+    def test_query_args_are_part_of_key(self, client):
+        newest = client.get("/api/works", query_string={"sort": "newest"})
+        oldest = client.get("/api/works", query_string={"sort": "oldest"})
+
+        assert oldest.headers["X-Cache"] == "MISS"
+        assert newest.headers["ETag"] != oldest.headers["ETag"]
+
+    def test_ingest_invalidates(self, client, catalog_db):
+        first = client.get("/api/stats")
+
+        manager = DatabaseManager(db_path=catalog_db)
+        work_id = manager.create_work(title="新作", work_type="anime")
+        manager.create_release(work_id, "episode", "1", "Netflix", "2025-04-01")
+        manager.close_connections()
+
+        response = client.get("/api/stats", headers={"If-None-Match": first.headers["ETag"]})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != first.headers["ETag"]
+        assert response.get_json()["total_works"] == 34
+
+    def test_ingest_refreshes_cached_total(self, client, catalog_db):
+        """総件数キャッシュもデータバージョンで無効になり、新しいレスポンスに古い件数が載らない"""
+        before = client.get("/api/works").get_json()["total"]
+
+        manager = DatabaseManager(db_path=catalog_db)
+        manager.create_work(title="新作", work_type="anime")
+        manager.close_connections()
+
+        response = client.get("/api/works")
+        assert response.headers["X-Cache"] == "MISS"
+        assert response.get_json()["total"] == before + 1
+
+    def test_errors_are_not_cached(self, client):
+        response = client.get("/api/works", query_string={"cursor": "broken"})
+
+        assert response.status_code == 400
+        assert "ETag" not in response.headers
+
+
+class TestReaderModes:
+    """読み取り専用接続・スナップショットからの参照のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def reset_reader(self):
+        yield
+        configure_reader("shared")
+
+    @pytest.mark.parametrize("url", ["/", "/releases", "/calendar", "/api/works", "/api/stats"])
+    def test_readonly_mode_serves_pages(self, client, url):
+        configure_reader("readonly")
+
+        assert client.get(url).status_code == 200
+
+    def test_snapshot_mode_lags_until_refresh(self, client, catalog_db, tmp_path):
+        configure_reader("snapshot", snapshot_path=str(tmp_path / "snap.sqlite3"))
+        first = client.get("/api/stats")
+        assert first.get_json()["total_works"] == 33
+
+        manager = DatabaseManager(db_path=catalog_db)
+        manager.create_work(title="新作", work_type="anime")
+        manager.close_connections()
+
+        # 更新間隔内はスナップショットのまま（ETag も変わらない）
+        cached = client.get("/api/stats", headers={"If-None-Match": first.headers["ETag"]})
+        assert cached.status_code == 304
+
+        get_snapshot_reader(catalog_db).refreshed_at -= 3600
+        refreshed = client.get("/api/stats")
+        assert refreshed.get_json()["total_works"] == 34
+        assert refreshed.headers["ETag"] != first.headers["ETag"]
+
+
+class TestRealtimeLogs:
+    """ログ末尾読み取りAPIのテスト"""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, monkeypatch):
+        (tmp_path / "logs").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(web_app, "_realtime_log_reader", None)
+        return tmp_path / "logs"
+
+    def test_incremental_polling(self, client, log_dir):
+        app_log = log_dir / "app.log"
+        app_log.write_text(
+            "2025-01-01 10:00:00 - app - INFO - started\n"
+            "2025-01-01 10:00:02 - app - ERROR - failed\n",
+            encoding="utf-8",
+        )
+        (log_dir / "system.log").write_text(
+            "[2025-01-01 10:00:01] INFO: system ok\n", encoding="utf-8"
+        )
+
+        first = client.get("/api/realtime-logs", query_string={"limit": 2})
+        assert [entry["message"] for entry in first.get_json()] == ["failed", "system ok"]
+        cursor = first.headers["X-Log-Cursor"]
+
+        unchanged = client.get("/api/realtime-logs", query_string={"since": cursor})
+        assert unchanged.get_json() == []
+
+        with open(app_log, "a", encoding="utf-8") as f:
+            f.write("2025-01-01 10:00:03 - app - INFO - appended\n")
+        appended = client.get("/api/realtime-logs", query_string={"since": cursor})
+        assert [entry["message"] for entry in appended.get_json()] == ["appended"]
+
+    def test_invalid_cursor(self, client, log_dir):
+        response = client.get("/api/realtime-logs", query_string={"since": "broken"})
+
+        assert response.status_code == 400
+
+    def test_logs_page_shows_tail(self, client, log_dir):
+        (log_dir / "system.log").write_text(
+            "".join(f"line {i:03d}\n" for i in range(150)), encoding="utf-8"
+        )
+
+        body = client.get("/logs").get_data(as_text=True)
+
+        assert "line 149" in body
+        assert "line 050" in body
+        assert "line 049" not in body
+
+
+class TestCollectionEvents:
+    """収集状況の SSE ストリームのテスト"""
+
+    def test_stream_delivers_published_events(self, client):
+        from modules.event_bus import get_event_bus
+
+        response = client.get("/ws/collection-status", buffered=False)
+        assert response.mimetype == "text/event-stream"
+        chunks = iter(response.response)
+        assert next(chunks).startswith(b"retry:")
+
+        # 購読はジェネレータ内で始まるため、最初のチャンク取得後に発行する
+        event = get_event_bus().publish("releases.saved", {"new_releases": 3})
+        message = next(chunks).decode("utf-8")
+        response.close()
+
+        assert f"id: {event['id']}" in message
+        assert "event: releases.saved" in message
+        assert '"new_releases": 3' in message
+        assert get_event_bus().get_stats()["subscribers"] == 0
+
+    def test_stream_replays_after_last_event_id(self, client):
+        from modules.event_bus import get_event_bus
+
+        missed = get_event_bus().publish("collection.progress", {"progress": 0.5})
+        response = client.get(
+            "/api/collection-events",
+            headers={"Last-Event-ID": str(missed["id"] - 1)},
+            buffered=False,
+        )
+        chunks = iter(response.response)
+        next(chunks)
+        message = next(chunks).decode("utf-8")
+        response.close()
+
+        assert f"id: {missed['id']}" in message
+
+
+class TestCalendarFeed:
+    """購読用 iCalendar フィードのテスト"""
+
+    @pytest.fixture
+    def feed_client(self, client, catalog_db):
+        from datetime import date, timedelta
+
+        from modules.ics_feed import clear_feed_cache
+
+        manager = DatabaseManager(db_path=catalog_db)
+        work_id = manager.create_work(title="配信予定作品", work_type="anime")
+        self.release_id = manager.create_release(
+            work_id, "episode", "1", "Netflix", (date.today() + timedelta(days=2)).isoformat()
+        )
+        manager.close_connections()
+        clear_feed_cache()
+        return client
+
+    def test_feed_streams_stable_events(self, feed_client):
+        response = feed_client.get("/calendar/feed.ics", buffered=False)
+        assert response.is_streamed
+        body = response.get_data(as_text=True)
+
+        assert response.mimetype == "text/calendar"
+        assert body.count("BEGIN:VEVENT") == 1
+        assert f"UID:release-{self.release_id}@mangaanime-info" in body
+
+    def test_conditional_get_and_cache(self, feed_client):
+        from modules import ics_feed
+
+        first = feed_client.get("/calendar/feed.ics")
+        etag = first.headers["ETag"]
+        body = first.get_data()
+
+        with patch.object(ics_feed, "iter_feed", side_effect=AssertionError("regenerated")):
+            cached = feed_client.get("/calendar/feed.ics")
+            not_modified = feed_client.get("/calendar/feed.ics", headers={"If-None-Match": etag})
+
+        assert cached.get_data() == body
+        assert not_modified.status_code == 304
+
+    def test_data_change_invalidates(self, feed_client, catalog_db):
+        etag = feed_client.get("/calendar/feed.ics").headers["ETag"]
+
+        manager = DatabaseManager(db_path=catalog_db)
+        with manager.get_connection() as conn:
+            conn.execute("UPDATE releases SET platform = 'Hulu' WHERE id = ?", (self.release_id,))
+        manager.close_connections()
+        response = feed_client.get("/calendar/feed.ics", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert "LOCATION:Hulu" in response.get_data(as_text=True)
+
+    def test_filters(self, feed_client):
+        manga = feed_client.get("/calendar/feed.ics", query_string={"type": "manga"})
+        invalid = feed_client.get("/calendar/feed.ics", query_string={"days_ahead": "x"})
+
+        assert "BEGIN:VEVENT" not in manga.get_data(as_text=True)
+        assert invalid.status_code == 400
+
+    def test_generate_ics_uses_stable_uids(self, client):
+        release = {
+            "title": "進撃の巨人",
+            "type": "anime",
+            "release_type": "episode",
+            "number": "1",
+            "platform": "Netflix",
+            "release_date": "2025-01-01",
+        }
+
+        with patch.dict(web_app.app.config, {"WTF_CSRF_ENABLED": False}):
+            bodies = [
+                client.post("/api/generate-ics", json={"releases": [release]}).get_data(
+                    as_text=True
+                )
+                for _ in range(2)
+            ]
+
+        uids = [line for body in bodies for line in body.split("\r\n") if line.startswith("UID:")]
+        assert len(uids) == 2
+        assert uids[0] == uids[1]